@@ -0,0 +1,170 @@
+"""Initial schema (tables as created by the former Base.metadata.create_all).
+
+Revision ID: 0001
+Revises: 
+Create Date: 2026-10-19 00:18:21.171261
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0001'
+down_revision: Union[str, None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('cases',
+    sa.Column('id', sa.UUID(), nullable=False),
+    sa.Column('status', sa.Enum('OPEN', 'INVESTIGATING', 'ESCALATED', 'RESOLVED', name='casestatus'), nullable=False),
+    sa.Column('priority', sa.Enum('LOW', 'MEDIUM', 'HIGH', 'CRITICAL', name='alertpriority'), nullable=False),
+    sa.Column('disposition', sa.Enum('FRAUD', 'NOT_FRAUD', 'INCONCLUSIVE', name='disposition'), nullable=True),
+    sa.Column('disposition_confidence', sa.Float(), nullable=True),
+    sa.Column('disposition_notes', sa.Text(), nullable=True),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=False),
+    sa.Column('resolved_at', sa.DateTime(), nullable=True),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('id')
+    )
+    with op.batch_alter_table('cases', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_cases_created_at'), ['created_at'], unique=False)
+        batch_op.create_index(batch_op.f('ix_cases_priority'), ['priority'], unique=False)
+        batch_op.create_index(batch_op.f('ix_cases_status'), ['status'], unique=False)
+
+    op.create_table('entities',
+    sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+    sa.Column('name', sa.String(length=100), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.PrimaryKeyConstraint('id')
+    )
+    with op.batch_alter_table('entities', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_entities_name'), ['name'], unique=True)
+
+    op.create_table('entity_aggregates',
+    sa.Column('entity_id', sa.Integer(), nullable=False),
+    sa.Column('sent_count', sa.Integer(), nullable=False),
+    sa.Column('sent_amount', sa.Float(), nullable=False),
+    sa.Column('received_count', sa.Integer(), nullable=False),
+    sa.Column('received_amount', sa.Float(), nullable=False),
+    sa.Column('max_amount', sa.Float(), nullable=False),
+    sa.Column('type_counts', sa.JSON(), nullable=False),
+    sa.Column('fraud_count', sa.Integer(), nullable=False),
+    sa.Column('alert_count', sa.Integer(), nullable=False),
+    sa.Column('case_count', sa.Integer(), nullable=False),
+    sa.Column('first_step', sa.Integer(), nullable=True),
+    sa.Column('last_step', sa.Integer(), nullable=True),
+    sa.Column('counterparties', sa.JSON(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=False),
+    sa.ForeignKeyConstraint(['entity_id'], ['entities.id'], ),
+    sa.PrimaryKeyConstraint('entity_id')
+    )
+    op.create_table('transactions',
+    sa.Column('id', sa.UUID(), nullable=False),
+    sa.Column('step', sa.Integer(), nullable=False),
+    sa.Column('type', sa.Enum('CASH_IN', 'CASH_OUT', 'DEBIT', 'PAYMENT', 'TRANSFER', name='transactiontype'), nullable=False),
+    sa.Column('amount', sa.Numeric(precision=15, scale=2), nullable=False),
+    sa.Column('nameOrig', sa.String(length=100), nullable=False),
+    sa.Column('nameDest', sa.String(length=100), nullable=False),
+    sa.Column('orig_id', sa.Integer(), nullable=True),
+    sa.Column('dest_id', sa.Integer(), nullable=True),
+    sa.Column('oldbalanceOrg', sa.Numeric(precision=15, scale=2), nullable=True),
+    sa.Column('newbalanceOrig', sa.Numeric(precision=15, scale=2), nullable=True),
+    sa.Column('oldbalanceDest', sa.Numeric(precision=15, scale=2), nullable=True),
+    sa.Column('newbalanceDest', sa.Numeric(precision=15, scale=2), nullable=True),
+    sa.Column('isFraud', sa.Boolean(), nullable=False),
+    sa.Column('isFlaggedFraud', sa.Boolean(), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.ForeignKeyConstraint(['dest_id'], ['entities.id'], ),
+    sa.ForeignKeyConstraint(['orig_id'], ['entities.id'], ),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('id')
+    )
+    with op.batch_alter_table('transactions', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_transactions_amount'), ['amount'], unique=False)
+        batch_op.create_index(batch_op.f('ix_transactions_created_at'), ['created_at'], unique=False)
+        batch_op.create_index(batch_op.f('ix_transactions_dest_id'), ['dest_id'], unique=False)
+        batch_op.create_index(batch_op.f('ix_transactions_isFlaggedFraud'), ['isFlaggedFraud'], unique=False)
+        batch_op.create_index(batch_op.f('ix_transactions_isFraud'), ['isFraud'], unique=False)
+        batch_op.create_index(batch_op.f('ix_transactions_nameDest'), ['nameDest'], unique=False)
+        batch_op.create_index(batch_op.f('ix_transactions_nameOrig'), ['nameOrig'], unique=False)
+        batch_op.create_index(batch_op.f('ix_transactions_orig_id'), ['orig_id'], unique=False)
+        batch_op.create_index(batch_op.f('ix_transactions_step'), ['step'], unique=False)
+        batch_op.create_index(batch_op.f('ix_transactions_type'), ['type'], unique=False)
+
+    op.create_table('alerts',
+    sa.Column('id', sa.UUID(), nullable=False),
+    sa.Column('transaction_id', sa.UUID(), nullable=False),
+    sa.Column('status', sa.Enum('NEW', 'IN_REVIEW', 'PENDING_INFO', 'ESCALATED', 'CLOSED', name='alertstatus'), nullable=False),
+    sa.Column('priority', sa.Enum('LOW', 'MEDIUM', 'HIGH', 'CRITICAL', name='alertpriority'), nullable=False),
+    sa.Column('ml_score', sa.Float(), nullable=False),
+    sa.Column('ml_risk_band', sa.Enum('LOW', 'MEDIUM', 'HIGH', 'CRITICAL', name='riskband'), nullable=False),
+    sa.Column('ml_reason_codes', sa.JSON(), nullable=False),
+    sa.Column('shap_values', sa.JSON(), nullable=True),
+    sa.Column('rules_triggered', sa.JSON(), nullable=False),
+    sa.Column('assigned_to', sa.String(length=100), nullable=True),
+    sa.Column('notes', sa.Text(), nullable=True),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=False),
+    sa.ForeignKeyConstraint(['transaction_id'], ['transactions.id'], ),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('id')
+    )
+    with op.batch_alter_table('alerts', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_alerts_assigned_to'), ['assigned_to'], unique=False)
+        batch_op.create_index(batch_op.f('ix_alerts_created_at'), ['created_at'], unique=False)
+        batch_op.create_index(batch_op.f('ix_alerts_ml_risk_band'), ['ml_risk_band'], unique=False)
+        batch_op.create_index(batch_op.f('ix_alerts_priority'), ['priority'], unique=False)
+        batch_op.create_index(batch_op.f('ix_alerts_status'), ['status'], unique=False)
+        batch_op.create_index(batch_op.f('ix_alerts_transaction_id'), ['transaction_id'], unique=False)
+
+    op.create_table('case_alerts',
+    sa.Column('case_id', sa.UUID(), nullable=False),
+    sa.Column('alert_id', sa.UUID(), nullable=False),
+    sa.Column('added_at', sa.DateTime(), nullable=False),
+    sa.ForeignKeyConstraint(['alert_id'], ['alerts.id'], ),
+    sa.ForeignKeyConstraint(['case_id'], ['cases.id'], ),
+    sa.PrimaryKeyConstraint('case_id', 'alert_id')
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('case_alerts')
+    with op.batch_alter_table('alerts', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_alerts_transaction_id'))
+        batch_op.drop_index(batch_op.f('ix_alerts_status'))
+        batch_op.drop_index(batch_op.f('ix_alerts_priority'))
+        batch_op.drop_index(batch_op.f('ix_alerts_ml_risk_band'))
+        batch_op.drop_index(batch_op.f('ix_alerts_created_at'))
+        batch_op.drop_index(batch_op.f('ix_alerts_assigned_to'))
+
+    op.drop_table('alerts')
+    with op.batch_alter_table('transactions', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_transactions_type'))
+        batch_op.drop_index(batch_op.f('ix_transactions_step'))
+        batch_op.drop_index(batch_op.f('ix_transactions_orig_id'))
+        batch_op.drop_index(batch_op.f('ix_transactions_nameOrig'))
+        batch_op.drop_index(batch_op.f('ix_transactions_nameDest'))
+        batch_op.drop_index(batch_op.f('ix_transactions_isFraud'))
+        batch_op.drop_index(batch_op.f('ix_transactions_isFlaggedFraud'))
+        batch_op.drop_index(batch_op.f('ix_transactions_dest_id'))
+        batch_op.drop_index(batch_op.f('ix_transactions_created_at'))
+        batch_op.drop_index(batch_op.f('ix_transactions_amount'))
+
+    op.drop_table('transactions')
+    op.drop_table('entity_aggregates')
+    with op.batch_alter_table('entities', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_entities_name'))
+
+    op.drop_table('entities')
+    with op.batch_alter_table('cases', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_cases_status'))
+        batch_op.drop_index(batch_op.f('ix_cases_priority'))
+        batch_op.drop_index(batch_op.f('ix_cases_created_at'))
+
+    op.drop_table('cases')
@@ -0,0 +1,30 @@
+"""Composite indexes for the alert queue and per-sender history.
+
+Built online (CREATE INDEX CONCURRENTLY on PostgreSQL) so the deploy
+does not lock the transactions table.
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-19 00:30:00.000000
+
+"""
+from typing import Sequence, Union
+
+from app.utils.schema import create_index_online, drop_index_online
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0002'
+down_revision: Union[str, None] = '0001'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    create_index_online('ix_alerts_status_created_at', 'alerts', ['status', 'created_at'])
+    create_index_online('ix_transactions_nameOrig_step', 'transactions', ['nameOrig', 'step'])
+
+
+def downgrade() -> None:
+    drop_index_online('ix_transactions_nameOrig_step', 'transactions')
+    drop_index_online('ix_alerts_status_created_at', 'alerts')
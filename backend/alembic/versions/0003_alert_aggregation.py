@@ -0,0 +1,47 @@
+"""Alert aggregation: sender burst columns and alert_transactions links.
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-19 01:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from app.utils.schema import create_index_online, drop_index_online
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0003'
+down_revision: Union[str, None] = '0002'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('alert_transactions',
+    sa.Column('alert_id', sa.UUID(), nullable=False),
+    sa.Column('transaction_id', sa.UUID(), nullable=False),
+    sa.Column('added_at', sa.DateTime(), nullable=False),
+    sa.ForeignKeyConstraint(['alert_id'], ['alerts.id'], ),
+    sa.ForeignKeyConstraint(['transaction_id'], ['transactions.id'], ),
+    sa.PrimaryKeyConstraint('alert_id', 'transaction_id')
+    )
+    # Nullable / server-defaulted columns: no table rewrite on PostgreSQL
+    op.add_column('alerts', sa.Column('name_orig', sa.String(length=100), nullable=True))
+    op.add_column('alerts', sa.Column('first_step', sa.Integer(), nullable=True))
+    op.add_column('alerts', sa.Column('last_step', sa.Integer(), nullable=True))
+    op.add_column('alerts', sa.Column('transaction_count', sa.Integer(), server_default='1', nullable=False))
+    create_index_online('ix_alerts_name_orig', 'alerts', ['name_orig'])
+
+
+def downgrade() -> None:
+    drop_index_online('ix_alerts_name_orig', 'alerts')
+    with op.batch_alter_table('alerts', schema=None) as batch_op:
+        batch_op.drop_column('transaction_count')
+        batch_op.drop_column('last_step')
+        batch_op.drop_column('first_step')
+        batch_op.drop_column('name_orig')
+    op.drop_table('alert_transactions')
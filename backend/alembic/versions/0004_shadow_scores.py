@@ -0,0 +1,34 @@
+"""Shadow scores: challenger model scores for champion/challenger comparison.
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-19 02:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0004'
+down_revision: Union[str, None] = '0003'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('shadow_scores',
+    sa.Column('transaction_id', sa.UUID(), nullable=False),
+    sa.Column('model_version', sa.String(length=100), nullable=False),
+    sa.Column('step', sa.Integer(), nullable=False),
+    sa.Column('champion_score', sa.Float(), nullable=False),
+    sa.Column('challenger_score', sa.Float(), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.PrimaryKeyConstraint('transaction_id', 'model_version')
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('shadow_scores')
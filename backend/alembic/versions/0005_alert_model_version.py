@@ -0,0 +1,28 @@
+"""Alert model version: which model produced ml_score.
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-19 03:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0005'
+down_revision: Union[str, None] = '0004'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Nullable: no table rewrite on PostgreSQL; existing alerts keep NULL (version unknown)
+    op.add_column('alerts', sa.Column('model_version', sa.String(length=100), nullable=True))
+
+
+def downgrade() -> None:
+    with op.batch_alter_table('alerts', schema=None) as batch_op:
+        batch_op.drop_column('model_version')
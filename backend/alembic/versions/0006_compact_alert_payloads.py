@@ -0,0 +1,144 @@
+"""Compact alert payloads: rules bitmask, reason code ids, float32 SHAP array.
+
+Replaces the rules_triggered, ml_reason_codes and shap_values JSON
+columns (see app.utils.alert_payload). Existing rows are converted in
+keyset-paginated batches; entries missing from the catalogues are
+dropped and counted.
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2026-10-19 04:00:00.000000
+
+"""
+import logging
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from app.utils.alert_payload import (
+    RULE_IDS,
+    SHAP_INDEX,
+    ReasonCode,
+    decode_reason_codes,
+    decode_rules,
+    decode_shap,
+    encode_reason_codes,
+    encode_rules,
+    encode_shap,
+)
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0006'
+down_revision: Union[str, None] = '0005'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+BATCH_SIZE = 5_000
+
+logger = logging.getLogger("alembic.runtime.migration")
+
+alerts = sa.table(
+    'alerts',
+    sa.column('id', sa.String()),
+    sa.column('rules_triggered', sa.JSON()),
+    sa.column('ml_reason_codes', sa.JSON()),
+    sa.column('shap_values', sa.JSON()),
+    sa.column('rules_mask', sa.Integer()),
+    sa.column('reason_code_ids', sa.LargeBinary()),
+    sa.column('shap', sa.LargeBinary()),
+)
+
+
+def _batches(columns):
+    """Rows of ``columns`` (after id) in id order, BATCH_SIZE at a time."""
+    bind = op.get_bind()
+    last = None
+    while True:
+        query = sa.select(alerts.c.id, *columns).order_by(alerts.c.id).limit(BATCH_SIZE)
+        if last is not None:
+            query = query.where(alerts.c.id > last)
+        rows = bind.execute(query).all()
+        if not rows:
+            return
+        yield rows
+        last = rows[-1][0]
+
+
+def upgrade() -> None:
+    op.add_column('alerts', sa.Column('rules_mask', sa.Integer(), server_default='0', nullable=False))
+    op.add_column('alerts', sa.Column('reason_code_ids', sa.LargeBinary(), nullable=True))
+    op.add_column('alerts', sa.Column('shap', sa.LargeBinary(), nullable=True))
+
+    bind = op.get_bind()
+    dropped = 0
+    update = (
+        alerts.update()
+        .where(alerts.c.id == sa.bindparam('_id'))
+        .values(
+            rules_mask=sa.bindparam('_rules'),
+            reason_code_ids=sa.bindparam('_codes'),
+            shap=sa.bindparam('_shap'),
+        )
+    )
+    for rows in _batches([alerts.c.rules_triggered, alerts.c.ml_reason_codes, alerts.c.shap_values]):
+        params = []
+        for alert_id, rules, codes, shap_values in rows:
+            rules, codes = rules or [], codes or []
+            kept_rules = [r for r in rules if r.get('rule_id') in RULE_IDS]
+            kept_codes = [c for c in codes if c in ReasonCode.__members__]
+            kept_shap = None
+            if shap_values is not None:
+                kept_shap = [v for v in shap_values if v.get('feature') in SHAP_INDEX]
+                dropped += len(shap_values) - len(kept_shap)
+            dropped += len(rules) - len(kept_rules) + len(codes) - len(kept_codes)
+            params.append({
+                '_id': alert_id,
+                '_rules': encode_rules(kept_rules),
+                '_codes': encode_reason_codes(kept_codes),
+                '_shap': encode_shap(kept_shap),
+            })
+        bind.execute(update, params)
+    if dropped:
+        logger.warning("Dropped %d rule/reason/SHAP entries not in the catalogues", dropped)
+
+    with op.batch_alter_table('alerts', schema=None) as batch_op:
+        batch_op.alter_column('reason_code_ids', existing_type=sa.LargeBinary(), nullable=False)
+        batch_op.drop_column('shap_values')
+        batch_op.drop_column('ml_reason_codes')
+        batch_op.drop_column('rules_triggered')
+
+
+def downgrade() -> None:
+    op.add_column('alerts', sa.Column('rules_triggered', sa.JSON(), nullable=True))
+    op.add_column('alerts', sa.Column('ml_reason_codes', sa.JSON(), nullable=True))
+    op.add_column('alerts', sa.Column('shap_values', sa.JSON(), nullable=True))
+
+    bind = op.get_bind()
+    update = (
+        alerts.update()
+        .where(alerts.c.id == sa.bindparam('_id'))
+        .values(
+            rules_triggered=sa.bindparam('_rules'),
+            ml_reason_codes=sa.bindparam('_codes'),
+            shap_values=sa.bindparam('_shap'),
+        )
+    )
+    for rows in _batches([alerts.c.rules_mask, alerts.c.reason_code_ids, alerts.c.shap]):
+        bind.execute(update, [
+            {
+                '_id': alert_id,
+                '_rules': decode_rules(mask or 0),
+                '_codes': decode_reason_codes(codes),
+                '_shap': decode_shap(shap),
+            }
+            for alert_id, mask, codes, shap in rows
+        ])
+
+    with op.batch_alter_table('alerts', schema=None) as batch_op:
+        batch_op.alter_column('rules_triggered', existing_type=sa.JSON(), nullable=False)
+        batch_op.alter_column('ml_reason_codes', existing_type=sa.JSON(), nullable=False)
+        batch_op.drop_column('shap')
+        batch_op.drop_column('reason_code_ids')
+        batch_op.drop_column('rules_mask')
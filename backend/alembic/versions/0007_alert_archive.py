@@ -0,0 +1,52 @@
+"""Alert archive: cold table for closed alerts moved out of alerts.
+
+Revision ID: 0007
+Revises: 0006
+Create Date: 2026-10-19 05:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0007'
+down_revision: Union[str, None] = '0006'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _existing_enum(*values: str, name: str) -> sa.Enum:
+    """Enum type created by an earlier revision (not created again on PostgreSQL)."""
+    return sa.Enum(*values, name=name).with_variant(
+        postgresql.ENUM(*values, name=name, create_type=False), 'postgresql'
+    )
+
+
+def upgrade() -> None:
+    op.create_table('alerts_archive',
+    sa.Column('id', sa.UUID(), nullable=False),
+    sa.Column('transaction_id', sa.UUID(), nullable=False),
+    sa.Column('status', _existing_enum('NEW', 'IN_REVIEW', 'PENDING_INFO', 'ESCALATED', 'CLOSED', name='alertstatus'), nullable=False),
+    sa.Column('priority', _existing_enum('LOW', 'MEDIUM', 'HIGH', 'CRITICAL', name='alertpriority'), nullable=False),
+    sa.Column('ml_score', sa.Float(), nullable=False),
+    sa.Column('ml_risk_band', _existing_enum('LOW', 'MEDIUM', 'HIGH', 'CRITICAL', name='riskband'), nullable=False),
+    sa.Column('name_orig', sa.String(length=100), nullable=True),
+    sa.Column('assigned_to', sa.String(length=100), nullable=True),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=False),
+    sa.Column('archived_at', sa.DateTime(), nullable=False),
+    sa.Column('payload', sa.LargeBinary(), nullable=False),
+    sa.ForeignKeyConstraint(['transaction_id'], ['transactions.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_alerts_archive_created_at'), 'alerts_archive', ['created_at'], unique=False)
+
+
+def downgrade() -> None:
+    # Archived alerts are lost; restore them (PATCH each alert) before downgrading
+    op.drop_index(op.f('ix_alerts_archive_created_at'), table_name='alerts_archive')
+    op.drop_table('alerts_archive')
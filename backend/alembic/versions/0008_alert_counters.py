@@ -0,0 +1,47 @@
+"""Alert counters: materialized dashboard counts, backfilled from existing alerts.
+
+Revision ID: 0008
+Revises: 0007
+Create Date: 2026-10-19 06:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0008'
+down_revision: Union[str, None] = '0007'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Dimension -> column; enums are stored by name, counters by value (the lower-cased name)
+DIMENSIONS = [
+    ('status', 'lower(CAST(status AS VARCHAR))'),
+    ('priority', 'lower(CAST(priority AS VARCHAR))'),
+    ('risk_band', 'lower(CAST(ml_risk_band AS VARCHAR))'),
+    ('assignee', "coalesce(assigned_to, '')"),
+]
+
+
+def upgrade() -> None:
+    op.create_table('alert_counters',
+    sa.Column('dimension', sa.String(length=20), nullable=False),
+    sa.Column('value', sa.String(length=100), nullable=False),
+    sa.Column('count', sa.Integer(), nullable=False),
+    sa.PrimaryKeyConstraint('dimension', 'value')
+    )
+    for dimension, expression in DIMENSIONS:
+        op.execute(
+            f"INSERT INTO alert_counters (dimension, value, count) "
+            f"SELECT '{dimension}', value, count(*) FROM ("
+            f"SELECT {expression} AS value FROM alerts "
+            f"UNION ALL SELECT {expression} AS value FROM alerts_archive"
+            f") AS alert_values GROUP BY value"
+        )
+
+
+def downgrade() -> None:
+    op.drop_table('alert_counters')
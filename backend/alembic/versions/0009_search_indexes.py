@@ -0,0 +1,81 @@
+"""Search indexes: full-text over alert notes, trigrams over account names.
+
+FTS5 tables and triggers on SQLite; a generated tsvector column and
+pg_trgm GIN index on PostgreSQL. Existing rows are indexed by the upgrade.
+The DDL is the layout as of this revision (0010 re-keys the notes index;
+app.models.search holds the current one). On SQLite, a later batch migration that
+recreates alerts or entities drops the triggers and must re-create them.
+
+Revision ID: 0009
+Revises: 0008
+Create Date: 2026-10-19 07:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0009'
+down_revision: Union[str, None] = '0008'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+SQLITE_UPGRADE = [
+    "CREATE VIRTUAL TABLE alert_notes_fts USING fts5("
+    "notes, content='alerts', content_rowid='rowid', tokenize='porter unicode61 remove_diacritics 2')",
+    "CREATE TRIGGER alerts_notes_fts_insert AFTER INSERT ON alerts BEGIN "
+    "INSERT INTO alert_notes_fts(rowid, notes) VALUES (new.rowid, new.notes); END",
+    "CREATE TRIGGER alerts_notes_fts_delete AFTER DELETE ON alerts BEGIN "
+    "INSERT INTO alert_notes_fts(alert_notes_fts, rowid, notes) VALUES ('delete', old.rowid, old.notes); END",
+    "CREATE TRIGGER alerts_notes_fts_update AFTER UPDATE OF notes ON alerts BEGIN "
+    "INSERT INTO alert_notes_fts(alert_notes_fts, rowid, notes) VALUES ('delete', old.rowid, old.notes); "
+    "INSERT INTO alert_notes_fts(rowid, notes) VALUES (new.rowid, new.notes); END",
+    "CREATE VIRTUAL TABLE entity_names_fts USING fts5("
+    "name, content='entities', content_rowid='id', tokenize='trigram')",
+    "CREATE TRIGGER entities_name_fts_insert AFTER INSERT ON entities BEGIN "
+    "INSERT INTO entity_names_fts(rowid, name) VALUES (new.id, new.name); END",
+    "CREATE TRIGGER entities_name_fts_delete AFTER DELETE ON entities BEGIN "
+    "INSERT INTO entity_names_fts(entity_names_fts, rowid, name) VALUES ('delete', old.id, old.name); END",
+    "INSERT INTO alert_notes_fts(alert_notes_fts) VALUES ('rebuild')",
+    "INSERT INTO entity_names_fts(entity_names_fts) VALUES ('rebuild')",
+]
+
+SQLITE_DOWNGRADE = [
+    "DROP TRIGGER IF EXISTS alerts_notes_fts_update",
+    "DROP TRIGGER IF EXISTS alerts_notes_fts_delete",
+    "DROP TRIGGER IF EXISTS alerts_notes_fts_insert",
+    "DROP TABLE IF EXISTS alert_notes_fts",
+    "DROP TRIGGER IF EXISTS entities_name_fts_delete",
+    "DROP TRIGGER IF EXISTS entities_name_fts_insert",
+    "DROP TABLE IF EXISTS entity_names_fts",
+]
+
+POSTGRES_UPGRADE = [
+    "ALTER TABLE alerts ADD COLUMN notes_tsv tsvector "
+    "GENERATED ALWAYS AS (to_tsvector('english', coalesce(notes, ''))) STORED",
+    "CREATE INDEX ix_alerts_notes_tsv ON alerts USING gin (notes_tsv)",
+    "CREATE EXTENSION IF NOT EXISTS pg_trgm",
+    "CREATE INDEX ix_entities_name_trgm ON entities USING gin (name gin_trgm_ops)",
+]
+
+POSTGRES_DOWNGRADE = [
+    "DROP INDEX IF EXISTS ix_alerts_notes_tsv",
+    "ALTER TABLE alerts DROP COLUMN IF EXISTS notes_tsv",
+    "DROP INDEX IF EXISTS ix_entities_name_trgm",
+]
+
+UPGRADE = {'sqlite': SQLITE_UPGRADE, 'postgresql': POSTGRES_UPGRADE}
+DOWNGRADE = {'sqlite': SQLITE_DOWNGRADE, 'postgresql': POSTGRES_DOWNGRADE}
+
+
+def upgrade() -> None:
+    for statement in UPGRADE.get(op.get_bind().dialect.name, []):
+        op.execute(statement)
+
+
+def downgrade() -> None:
+    for statement in DOWNGRADE.get(op.get_bind().dialect.name, []):
+        op.execute(statement)
@@ -0,0 +1,77 @@
+"""Stable search keys: notes indexed by alerts.search_id, lower-cased name index.
+
+The 0009 notes index was keyed on the implicit alerts.rowid, which VACUUM
+may renumber. SQLite alerts gain an unmapped INTEGER search_id (existing
+rows keep their rowid as theirs, new rows are numbered by the insert
+trigger) and the FTS table is rebuilt over it. Both dialects gain an
+index on lower(entities.name) for case-insensitive prefix search.
+
+Revision ID: 0010
+Revises: 0009
+Create Date: 2026-10-19 08:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0010'
+down_revision: Union[str, None] = '0009'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+DROP_NOTES_INDEX = [
+    "DROP TRIGGER IF EXISTS alerts_notes_fts_update",
+    "DROP TRIGGER IF EXISTS alerts_notes_fts_delete",
+    "DROP TRIGGER IF EXISTS alerts_notes_fts_insert",
+    "DROP TABLE IF EXISTS alert_notes_fts",
+]
+
+SQLITE_UPGRADE = DROP_NOTES_INDEX + [
+    "ALTER TABLE alerts ADD COLUMN search_id INTEGER",
+    "UPDATE alerts SET search_id = rowid",
+    "CREATE UNIQUE INDEX ix_alerts_search_id ON alerts (search_id)",
+    "CREATE VIRTUAL TABLE alert_notes_fts USING fts5("
+    "notes, content='alerts', content_rowid='search_id', tokenize='porter unicode61 remove_diacritics 2')",
+    "CREATE TRIGGER alerts_notes_fts_insert AFTER INSERT ON alerts BEGIN "
+    "UPDATE alerts SET search_id = (SELECT coalesce(max(search_id), 0) + 1 FROM alerts) "
+    "WHERE rowid = new.rowid AND search_id IS NULL; "
+    "INSERT INTO alert_notes_fts(rowid, notes) SELECT search_id, notes FROM alerts WHERE rowid = new.rowid; END",
+    "CREATE TRIGGER alerts_notes_fts_delete AFTER DELETE ON alerts BEGIN "
+    "INSERT INTO alert_notes_fts(alert_notes_fts, rowid, notes) VALUES ('delete', old.search_id, old.notes); END",
+    "CREATE TRIGGER alerts_notes_fts_update AFTER UPDATE OF notes ON alerts BEGIN "
+    "INSERT INTO alert_notes_fts(alert_notes_fts, rowid, notes) VALUES ('delete', old.search_id, old.notes); "
+    "INSERT INTO alert_notes_fts(rowid, notes) VALUES (new.search_id, new.notes); END",
+    "INSERT INTO alert_notes_fts(alert_notes_fts) VALUES ('rebuild')",
+]
+
+SQLITE_DOWNGRADE = DROP_NOTES_INDEX + [
+    "DROP INDEX IF EXISTS ix_alerts_search_id",
+    "ALTER TABLE alerts DROP COLUMN search_id",
+    "CREATE VIRTUAL TABLE alert_notes_fts USING fts5("
+    "notes, content='alerts', content_rowid='rowid', tokenize='porter unicode61 remove_diacritics 2')",
+    "CREATE TRIGGER alerts_notes_fts_insert AFTER INSERT ON alerts BEGIN "
+    "INSERT INTO alert_notes_fts(rowid, notes) VALUES (new.rowid, new.notes); END",
+    "CREATE TRIGGER alerts_notes_fts_delete AFTER DELETE ON alerts BEGIN "
+    "INSERT INTO alert_notes_fts(alert_notes_fts, rowid, notes) VALUES ('delete', old.rowid, old.notes); END",
+    "CREATE TRIGGER alerts_notes_fts_update AFTER UPDATE OF notes ON alerts BEGIN "
+    "INSERT INTO alert_notes_fts(alert_notes_fts, rowid, notes) VALUES ('delete', old.rowid, old.notes); "
+    "INSERT INTO alert_notes_fts(rowid, notes) VALUES (new.rowid, new.notes); END",
+    "INSERT INTO alert_notes_fts(alert_notes_fts) VALUES ('rebuild')",
+]
+
+
+def upgrade() -> None:
+    if op.get_bind().dialect.name == 'sqlite':
+        for statement in SQLITE_UPGRADE:
+            op.execute(statement)
+    op.execute("CREATE INDEX ix_entities_name_lower ON entities (lower(name))")
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS ix_entities_name_lower")
+    if op.get_bind().dialect.name == 'sqlite':
+        for statement in SQLITE_DOWNGRADE:
+            op.execute(statement)
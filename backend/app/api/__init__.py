@@ -1,10 +1,12 @@
 """API routers package."""
 
 # Import routers here as they are created
-# from app.api.alerts import router as alerts_router
+from app.api.admin import router as admin_router
+from app.api.alerts import router as alerts_router
 # from app.api.cases import router as cases_router
-# from app.api.entities import router as entities_router
-# from app.api.transactions import router as transactions_router
+from app.api.entities import router as entities_router
+from app.api.transactions import router as transactions_router
 # from app.api.scoring import router as scoring_router
+from app.api.stream import router as stream_router
 
-__all__ = []
+__all__ = ["admin_router", "alerts_router", "entities_router", "stream_router", "transactions_router"]
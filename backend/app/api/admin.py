@@ -0,0 +1,266 @@
+"""Admin-only diagnostics endpoints (profiling, model registry, shadow scoring, alert archive, counters)."""
+
+import asyncio
+from datetime import datetime
+from typing import Optional
+
+from fastapi import APIRouter, Depends, Header, HTTPException, Query
+from fastapi.responses import JSONResponse, PlainTextResponse, Response
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.database import get_db
+from app.models.alert import Alert
+from app.models.archived_alert import ArchivedAlert
+from app.services.alert_archive import get_alert_archiver
+from app.services.alert_counters import AlertCounters
+from app.services.model_registry import UnknownModelVersionError, get_model_manager
+from app.services.scoring import get_champion
+from app.services.search import SearchService
+from app.services.shadow import compare_models, get_shadow_scorer
+from app.utils.profiler import SamplingProfiler, is_admin_token, request_profiles
+
+router = APIRouter()
+
+
+def require_admin(x_admin_token: Optional[str] = Header(None)) -> None:
+    """Reject requests without a valid X-Admin-Token (all requests when ADMIN_API_KEY is unset)."""
+    if not is_admin_token(x_admin_token):
+        raise HTTPException(status_code=403, detail="Admin token required")
+
+
+@router.get("/profile", dependencies=[Depends(require_admin)])
+async def sample_profile(
+    seconds: float = Query(10.0, gt=0, le=settings.PROFILE_MAX_SECONDS),
+    interval_ms: float = Query(5.0, ge=1.0, le=1000.0),
+    format: str = Query("collapsed", pattern="^(collapsed|json)$"),
+):
+    """
+    Sample every thread of this worker process for ``seconds``.
+
+    **Formats:**
+    - collapsed: `frame;frame;frame count` lines (flamegraph.pl, speedscope)
+    - json: hottest functions by self and total samples
+    """
+    profiler = SamplingProfiler(interval=interval_ms / 1000)
+    try:
+        await asyncio.to_thread(profiler.run, seconds)
+    except RuntimeError as e:
+        raise HTTPException(status_code=409, detail=str(e))
+
+    if format == "collapsed":
+        return PlainTextResponse(
+            profiler.collapsed(),
+            headers={"Content-Disposition": 'attachment; filename="profile.collapsed"'},
+        )
+
+    return {
+        "status": "success",
+        "data": {
+            "samples": profiler.samples,
+            "duration_s": round(profiler.duration, 3),
+            "top_functions": [
+                {"function": fn, "self_samples": own, "total_samples": total}
+                for fn, own, total in profiler.top_functions()
+            ],
+        },
+        "metadata": {
+            "request_id": None,
+            "timestamp": datetime.utcnow().isoformat(),
+            "version": "v1",
+        },
+    }
+
+
+@router.get("/profiles", dependencies=[Depends(require_admin)])
+async def list_request_profiles():
+    """List stored per-request cProfile captures, newest first."""
+    return {
+        "status": "success",
+        "data": request_profiles.list(),
+        "metadata": {
+            "request_id": None,
+            "timestamp": datetime.utcnow().isoformat(),
+            "version": "v1",
+        },
+    }
+
+
+@router.get("/profiles/{profile_id}", dependencies=[Depends(require_admin)])
+async def get_request_profile(
+    profile_id: str,
+    format: str = Query("text", pattern="^(text|pstats)$"),
+):
+    """
+    Get a per-request cProfile capture.
+
+    **Formats:**
+    - text: top 50 functions by cumulative time
+    - pstats: binary stats file for `pstats`, snakeviz or gprof2dot
+    """
+    profile = request_profiles.get(profile_id)
+    if not profile:
+        raise HTTPException(
+            status_code=404,
+            detail=f"Profile {profile_id} not found"
+        )
+
+    if format == "pstats":
+        return Response(
+            profile["pstats"],
+            media_type="application/octet-stream",
+            headers={"Content-Disposition": f'attachment; filename="{profile_id}.prof"'},
+        )
+    return PlainTextResponse(profile["text"])
+
+
+@router.get("/models", dependencies=[Depends(require_admin)])
+async def list_models():
+    """List registered model versions, the active one and the loaded champion."""
+    manager = get_model_manager()
+    return {
+        "status": "success",
+        "data": {
+            "registry": str(manager.registry.root),
+            "active": manager.registry.active(),
+            "champion": manager.status(),
+            "versions": manager.registry.versions(),
+        },
+        "metadata": {
+            "request_id": None,
+            "timestamp": datetime.utcnow().isoformat(),
+            "version": "v1",
+        },
+    }
+
+
+@router.post("/models/{version}/activate", dependencies=[Depends(require_admin)])
+async def activate_model(version: str):
+    """
+    Activate a registered model version.
+
+    The version is loaded and warmed in the background while the current
+    champion keeps scoring, then made active in the registry and swapped
+    in; a version that fails to load never becomes active. Other workers
+    follow via the registry watcher. Poll `GET /models` for progress.
+    """
+    manager = get_model_manager()
+    try:
+        manager.activate(version)
+    except UnknownModelVersionError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    except RuntimeError as e:
+        raise HTTPException(status_code=409, detail=str(e))
+
+    return JSONResponse(
+        status_code=202,
+        content={
+            "status": "success",
+            "data": {"activating": version, "champion": manager.status()},
+            "metadata": {
+                "request_id": None,
+                "timestamp": datetime.utcnow().isoformat(),
+                "version": "v1",
+            },
+        },
+    )
+
+
+@router.get("/shadow", dependencies=[Depends(require_admin)])
+def shadow_comparison(
+    threshold: float = Query(settings.ALERT_SCORE_THRESHOLD, ge=0.0, le=1.0),
+    db: Session = Depends(get_db),
+):
+    """
+    Compare the champion with challenger models on shadow-scored live traffic.
+
+    Per challenger version: agreement on the alert decision at `threshold`,
+    mean absolute score difference, and precision/recall against `isFraud`.
+    Also reports the shadow queue (depth, scored, shed and failed batches).
+    """
+    return {
+        "status": "success",
+        "data": {
+            "champion_version": get_champion().version,
+            "threshold": threshold,
+            "shadow": get_shadow_scorer().status(),
+            "models": compare_models(db, threshold),
+        },
+        "metadata": {
+            "request_id": None,
+            "timestamp": datetime.utcnow().isoformat(),
+            "version": "v1",
+        },
+    }
+
+
+@router.get("/archive", dependencies=[Depends(require_admin)])
+def archive_status(db: Session = Depends(get_db)):
+    """Hot and archived alert counts and the archiver's last run."""
+    return {
+        "status": "success",
+        "data": {
+            "hot_alerts": db.query(func.count(Alert.id)).scalar(),
+            "archived_alerts": db.query(func.count(ArchivedAlert.id)).scalar(),
+            "archiver": get_alert_archiver().status(),
+        },
+        "metadata": {
+            "request_id": None,
+            "timestamp": datetime.utcnow().isoformat(),
+            "version": "v1",
+        },
+    }
+
+
+@router.post("/archive", dependencies=[Depends(require_admin)])
+async def run_archive():
+    """
+    Archive alerts closed more than ALERT_ARCHIVE_AFTER_DAYS ago now.
+
+    Runs in batches of ALERT_ARCHIVE_BATCH_SIZE, one transaction each.
+    """
+    archiver = get_alert_archiver()
+    if not archiver.enabled:
+        raise HTTPException(status_code=409, detail="Alert archival is disabled (ALERT_ARCHIVE_AFTER_DAYS=0)")
+    archived = await asyncio.to_thread(archiver.run_once)
+
+    return {
+        "status": "success",
+        "data": {"archived": archived, "archiver": archiver.status()},
+        "metadata": {
+            "request_id": None,
+            "timestamp": datetime.utcnow().isoformat(),
+            "version": "v1",
+        },
+    }
+
+
+@router.post("/counters/reconcile", dependencies=[Depends(require_admin)])
+def reconcile_counters(db: Session = Depends(get_db)):
+    """Recount alerts, correct the dashboard counters and report the drift found."""
+    drift = AlertCounters.reconcile(db)
+    return {
+        "status": "success",
+        "data": {"drift": drift, "summary": AlertCounters.summary(db)},
+        "metadata": {
+            "request_id": None,
+            "timestamp": datetime.utcnow().isoformat(),
+            "version": "v1",
+        },
+    }
+
+
+@router.post("/search/rebuild", dependencies=[Depends(require_admin)])
+def rebuild_search_index(db: Session = Depends(get_db)):
+    """Rebuild the SQLite full-text indexes from the alert and entity tables (e.g. after a bulk load that bypassed the triggers)."""
+    SearchService.rebuild(db)
+    return {
+        "status": "success",
+        "data": {"rebuilt": db.get_bind().dialect.name == "sqlite"},
+        "metadata": {
+            "request_id": None,
+            "timestamp": datetime.utcnow().isoformat(),
+            "version": "v1",
+        },
+    }
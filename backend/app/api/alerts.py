@@ -0,0 +1,270 @@
+"""Alert management API endpoints."""
+
+from datetime import datetime
+from typing import List, Optional, Union
+from uuid import UUID
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import StreamingResponse
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.database import get_db
+from app.models.alert import Alert, AlertPriority, AlertStatus, RiskBand
+from app.models.archived_alert import ArchivedAlert
+from app.schemas.alert import (
+    AlertDetail,
+    AlertFilter,
+    AlertList,
+    AlertListResponse,
+    AlertResponse,
+    AlertUpdate,
+    BulkAlertUpdate,
+    PaginatedAlerts,
+)
+from app.services.alert_counters import AlertCounters
+from app.services.alert_export import decode_cursor, stream_alert_export
+from app.services.alert_service import AlertService
+
+router = APIRouter()
+
+EXPORT_MEDIA_TYPES = {"csv": "text/csv", "jsonl": "application/x-ndjson"}
+
+
+def _metadata() -> dict:
+    return {
+        "request_id": None,
+        "timestamp": datetime.utcnow().isoformat(),
+        "version": "v1",
+    }
+
+
+def to_alert_list(alert: Union[Alert, ArchivedAlert]) -> AlertList:
+    """Build the list-view schema for a hot or archived alert with its transaction loaded."""
+    return AlertList(
+        id=alert.id,
+        transaction_id=alert.transaction_id,
+        status=alert.status,
+        priority=alert.priority,
+        ml_score=alert.ml_score,
+        ml_risk_band=alert.ml_risk_band,
+        created_at=alert.created_at,
+        updated_at=alert.updated_at,
+        archived=alert.archived,
+        transaction_type=alert.transaction.type.value,
+        transaction_amount=float(alert.transaction.amount),
+        assigned_to=alert.assigned_to,
+        rules_count=alert.rules_count,
+        transaction_count=alert.transaction_count or 1,
+    )
+
+
+@router.get("", response_model=AlertListResponse)
+async def list_alerts(
+    # Filters
+    status: Optional[List[AlertStatus]] = Query(None),
+    priority: Optional[List[AlertPriority]] = Query(None),
+    risk_band: Optional[List[RiskBand]] = Query(None),
+    assigned_to: Optional[str] = None,
+    min_score: Optional[float] = Query(None, ge=0.0, le=1.0),
+    max_score: Optional[float] = Query(None, ge=0.0, le=1.0),
+    # Pagination
+    page: int = Query(1, ge=1),
+    page_size: int = Query(settings.DEFAULT_PAGE_SIZE, ge=1, le=settings.MAX_PAGE_SIZE),
+    # Sorting
+    sort_by: str = "created_at",
+    sort_desc: bool = True,
+    db: Session = Depends(get_db),
+):
+    """
+    List alerts with filtering, pagination, and sorting.
+
+    **Filters:**
+    - status: Filter by alert status (new, in_review, etc.)
+    - priority: Filter by priority (low, medium, high, critical)
+    - risk_band: Filter by ML risk band
+    - assigned_to: Filter by assigned analyst
+    - min_score/max_score: Filter by ML score range
+
+    **Pagination:**
+    - page: Page number (starts at 1)
+    - page_size: Items per page (default 25, max 100)
+
+    Archived (closed) alerts are included unless `status` excludes `closed`.
+    """
+    filters = AlertFilter(
+        status=status,
+        priority=priority,
+        risk_band=risk_band,
+        assigned_to=assigned_to,
+        min_score=min_score,
+        max_score=max_score,
+    )
+
+    alerts, total = AlertService.list_alerts(
+        db=db,
+        filters=filters,
+        page=page,
+        page_size=page_size,
+        sort_by=sort_by,
+        sort_desc=sort_desc,
+    )
+
+    return AlertListResponse(
+        status="success",
+        data=PaginatedAlerts(
+            items=[to_alert_list(alert) for alert in alerts],
+            total=total,
+            page=page,
+            page_size=page_size,
+            total_pages=(total + page_size - 1) // page_size,
+        ),
+        metadata=_metadata(),
+    )
+
+
+@router.get("/summary")
+async def alert_summary(db: Session = Depends(get_db)):
+    """
+    Dashboard counts over all alerts (including archived ones).
+
+    Counts by status, priority, risk band and assignee (analyst workload),
+    read from counters maintained on every alert write.
+    """
+    return {
+        "status": "success",
+        "data": AlertCounters.summary(db),
+        "metadata": _metadata(),
+    }
+
+
+@router.get("/export")
+def export_alerts(
+    format: str = Query("csv", pattern="^(csv|jsonl)$"),
+    gzip: bool = False,
+    created_from: Optional[datetime] = None,
+    created_to: Optional[datetime] = None,
+    cursor: Optional[str] = None,
+    db: Session = Depends(get_db),
+):
+    """
+    Stream every alert created in ``[created_from, created_to)`` with its transactions.
+
+    **Formats:**
+    - csv: one row per (alert, transaction), header first
+    - jsonl: one object per alert with a nested `transactions` list
+    - gzip: compress on the fly (`.csv.gz` / `.jsonl.gz`)
+
+    Hot and archived alerts are included, oldest first. Each alert carries
+    a `cursor`; pass the cursor of the last alert fully received to resume.
+    """
+    try:
+        after = decode_cursor(cursor) if cursor else None
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    chunks = stream_alert_export(
+        db,
+        fmt=format,
+        compress=gzip,
+        created_from=created_from,
+        created_to=created_to,
+        after=after,
+        batch_size=settings.EXPORT_BATCH_SIZE,
+    )
+
+    def body():
+        try:
+            yield from chunks
+        finally:
+            db.close()
+
+    filename = f"alerts.{format}" + (".gz" if gzip else "")
+    media_type = "application/gzip" if gzip else EXPORT_MEDIA_TYPES[format]
+    return StreamingResponse(
+        body(),
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
+
+
+@router.post("/bulk-update")
+async def bulk_update_alerts(
+    bulk_update: BulkAlertUpdate,
+    db: Session = Depends(get_db),
+):
+    """
+    Update status, priority or assignment of up to 100 alerts at once.
+    """
+    update = AlertUpdate(
+        status=bulk_update.status,
+        priority=bulk_update.priority,
+        assigned_to=bulk_update.assigned_to,
+    )
+
+    count = AlertService.bulk_update_alerts(db, bulk_update.alert_ids, update)
+
+    return {
+        "status": "success",
+        "data": {
+            "updated_count": count,
+            "requested_count": len(bulk_update.alert_ids),
+        },
+        "metadata": _metadata(),
+    }
+
+
+@router.get("/{alert_id}", response_model=AlertResponse)
+async def get_alert(
+    alert_id: UUID,
+    db: Session = Depends(get_db),
+):
+    """
+    Get detailed information about a specific alert.
+
+    Includes:
+    - Transaction details
+    - ML score and risk band
+    - SHAP feature explanations
+    - Triggered rules
+    - Status and notes
+    """
+    alert = AlertService.get_alert(db, alert_id)
+
+    if not alert:
+        raise HTTPException(
+            status_code=404,
+            detail=f"Alert {alert_id} not found"
+        )
+
+    return AlertResponse(
+        status="success",
+        data=AlertDetail.model_validate(alert),
+        metadata=_metadata(),
+    )
+
+
+@router.patch("/{alert_id}", response_model=AlertResponse)
+async def update_alert(
+    alert_id: UUID,
+    update: AlertUpdate,
+    db: Session = Depends(get_db),
+):
+    """
+    Update an alert's status, priority, assignment, or notes.
+
+    Updating an archived alert moves it back to the hot table.
+    """
+    alert = AlertService.update_alert(db, alert_id, update)
+
+    if not alert:
+        raise HTTPException(
+            status_code=404,
+            detail=f"Alert {alert_id} not found"
+        )
+
+    return AlertResponse(
+        status="success",
+        data=AlertDetail.model_validate(alert),
+        metadata=_metadata(),
+    )
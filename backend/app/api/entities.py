@@ -0,0 +1,117 @@
+"""Entity profile and network API endpoints."""
+
+from datetime import datetime
+from typing import Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.database import get_db
+from app.schemas.entity import EntityNetwork, EntityNetworkResponse, EntityProfileResponse, NetworkNode
+from app.services.entity_dictionary import get_entity_dictionary
+from app.services.entity_service import EntityService
+from app.services.graph_index import get_transaction_graph
+
+router = APIRouter()
+
+
+@router.get("/{entity_id}", response_model=EntityProfileResponse)
+async def get_entity_profile(
+    entity_id: str,
+    top_n: int = Query(10, ge=1, le=50),
+    db: Session = Depends(get_db),
+):
+    """
+    Get the profile of an account (nameOrig or nameDest).
+
+    Served from precomputed aggregates:
+    - Transaction totals and type distribution
+    - Fraud, alert and case history
+    - Top counterparties by transaction count
+    """
+    profile = EntityService.get_profile(db, entity_id, top_n=top_n)
+
+    if not profile:
+        raise HTTPException(
+            status_code=404,
+            detail=f"Entity {entity_id} not found"
+        )
+
+    return EntityProfileResponse(
+        status="success",
+        data=profile,
+        metadata={
+            "request_id": None,
+            "timestamp": datetime.utcnow().isoformat(),
+            "version": "v1",
+        },
+    )
+
+
+@router.get("/{entity_id}/network", response_model=EntityNetworkResponse)
+def get_entity_network(
+    entity_id: str,
+    hops: int = Query(2, ge=1, le=3),
+    direction: str = Query("both", pattern="^(in|out|both)$"),
+    min_step: Optional[int] = Query(None, ge=0),
+    max_step: Optional[int] = Query(None, ge=0),
+    db: Session = Depends(get_db),
+):
+    """
+    Expand the counterparty network around an account.
+
+    Served from the in-memory transaction graph (the last GRAPH_WINDOW_STEPS
+    steps):
+    - direction=in: who paid this account (and who paid them)
+    - direction=out: who this account paid
+    - min_step/max_step: only follow transactions in this step window
+
+    Each worker keeps its own graph; with WORKERS > 1 committed edges are
+    forwarded to every worker, so the answer does not depend on which
+    worker serves the request.
+    """
+    entities = get_entity_dictionary()
+    node = entities.lookup(db, entity_id)
+    if node is None:
+        raise HTTPException(
+            status_code=404,
+            detail=f"Entity {entity_id} not found"
+        )
+
+    graph = get_transaction_graph(db)
+    reached = graph.expand(
+        node,
+        hops=hops,
+        direction=direction,
+        min_step=min_step,
+        max_step=max_step,
+        max_nodes=settings.GRAPH_MAX_NODES,
+    )
+    reached.pop(node, None)
+    names = entities.names_of(db, reached)
+
+    network = EntityNetwork(
+        entity_id=entity_id,
+        hops=hops,
+        direction=direction,
+        min_step=min_step,
+        max_step=max_step,
+        fan_in=graph.fan_in(node, min_step, max_step),
+        fan_out=graph.fan_out(node, min_step, max_step),
+        nodes=[
+            NetworkNode(entity=names.get(other, str(other)), hops=distance)
+            for other, distance in sorted(reached.items(), key=lambda item: (item[1], item[0]))
+        ],
+        truncated=len(reached) + 1 >= settings.GRAPH_MAX_NODES,
+    )
+
+    return EntityNetworkResponse(
+        status="success",
+        data=network,
+        metadata={
+            "request_id": None,
+            "timestamp": datetime.utcnow().isoformat(),
+            "version": "v1",
+        },
+    )
@@ -0,0 +1,100 @@
+"""Search API endpoints (alert notes and account names)."""
+
+from datetime import datetime
+
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.orm import Session
+
+from app.api.alerts import to_alert_list
+from app.config import settings
+from app.database import get_db
+from app.schemas.search import (
+    AccountSearchResponse,
+    AlertNoteMatch,
+    AlertSearchResponse,
+    PaginatedAccountMatches,
+    PaginatedAlertNoteMatches,
+)
+from app.services.search import SearchService
+
+router = APIRouter()
+
+
+def _metadata() -> dict:
+    return {
+        "request_id": None,
+        "timestamp": datetime.utcnow().isoformat(),
+        "version": "v1",
+    }
+
+
+@router.get("/alerts", response_model=AlertSearchResponse)
+async def search_alerts(
+    q: str = Query(..., min_length=1, max_length=200),
+    page: int = Query(1, ge=1),
+    page_size: int = Query(settings.DEFAULT_PAGE_SIZE, ge=1, le=settings.MAX_PAGE_SIZE),
+    db: Session = Depends(get_db),
+):
+    """
+    Search alert notes by words, most relevant first.
+
+    - Every word must appear; the last word also matches as a prefix
+    - Words are stemmed ("structuring" finds "structured")
+    - Snippets mark matched terms in [brackets]
+
+    Archived alerts are not searched.
+    """
+    hits, total, truncated = SearchService.search_alert_notes(
+        db, q, page=page, page_size=page_size, max_matches=settings.SEARCH_MAX_MATCHES
+    )
+
+    return AlertSearchResponse(
+        status="success",
+        data=PaginatedAlertNoteMatches(
+            items=[
+                AlertNoteMatch(alert=to_alert_list(alert), score=score, snippet=snippet)
+                for alert, score, snippet in hits
+            ],
+            total=total,
+            page=page,
+            page_size=page_size,
+            total_pages=(total + page_size - 1) // page_size,
+            truncated=truncated,
+        ),
+        metadata=_metadata(),
+    )
+
+
+@router.get("/accounts", response_model=AccountSearchResponse)
+async def search_accounts(
+    q: str = Query(..., min_length=1, max_length=100),
+    page: int = Query(1, ge=1),
+    page_size: int = Query(settings.DEFAULT_PAGE_SIZE, ge=1, le=settings.MAX_PAGE_SIZE),
+    db: Session = Depends(get_db),
+):
+    """
+    Search accounts (nameOrig/nameDest) by partial id.
+
+    - Any substring of 3+ characters matches, case-insensitively
+    - Shorter queries match name prefixes only
+    - Exact matches first, then prefix, then substring matches
+
+    Each match carries the account's transaction, alert and fraud counts;
+    open the full profile with /api/entities/{name}.
+    """
+    matches, total, truncated = SearchService.search_accounts(
+        db, q, page=page, page_size=page_size, max_matches=settings.SEARCH_MAX_MATCHES
+    )
+
+    return AccountSearchResponse(
+        status="success",
+        data=PaginatedAccountMatches(
+            items=matches,
+            total=total,
+            page=page,
+            page_size=page_size,
+            total_pages=(total + page_size - 1) // page_size,
+            truncated=truncated,
+        ),
+        metadata=_metadata(),
+    )
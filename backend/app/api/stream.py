@@ -0,0 +1,123 @@
+"""Real-time alert stream endpoints (WebSocket and Server-Sent Events)."""
+
+import json
+from typing import AsyncIterator, List, Optional
+
+from fastapi import APIRouter, HTTPException, Query, Request, WebSocket, WebSocketDisconnect
+from fastapi.responses import StreamingResponse
+
+from app.config import settings
+from app.models.alert import AlertPriority, AlertStatus, RiskBand
+from app.schemas.alert import AlertFilter
+from app.services.alert_broker import Subscription, get_alert_broker
+
+router = APIRouter()
+
+
+def build_filter(
+    status: Optional[List[AlertStatus]],
+    priority: Optional[List[AlertPriority]],
+    risk_band: Optional[List[RiskBand]],
+    assigned_to: Optional[str],
+    min_score: Optional[float],
+) -> AlertFilter:
+    """Build subscriber filters from query parameters."""
+    return AlertFilter(
+        status=status,
+        priority=priority,
+        risk_band=risk_band,
+        assigned_to=assigned_to,
+        min_score=min_score,
+    )
+
+
+async def sse_events(
+    subscription: Subscription,
+    heartbeat_seconds: float,
+    request: Optional[Request] = None,
+) -> AsyncIterator[str]:
+    """
+    Encode subscription events as an SSE stream.
+
+    Emits a comment line every ``heartbeat_seconds`` while idle so proxies
+    keep the connection open and disconnects are noticed.
+    """
+    yield "retry: 3000\n\n"
+    while True:
+        if request is not None and await request.is_disconnected():
+            break
+        payload = await subscription.get(timeout=heartbeat_seconds)
+        if payload is None:
+            yield ": keep-alive\n\n"
+            continue
+        yield f"event: {payload['event']}\nid: {payload['id']}\ndata: {json.dumps(payload)}\n\n"
+
+
+@router.get("/alerts")
+async def stream_alerts_sse(
+    request: Request,
+    status: Optional[List[AlertStatus]] = Query(None),
+    priority: Optional[List[AlertPriority]] = Query(None),
+    risk_band: Optional[List[RiskBand]] = Query(None),
+    assigned_to: Optional[str] = None,
+    min_score: Optional[float] = Query(None, ge=0.0, le=1.0),
+):
+    """
+    Stream new alerts as Server-Sent Events.
+
+    **Filters** (evaluated server-side, same semantics as the alert list):
+    - status, priority, risk_band: repeatable
+    - assigned_to: analyst name
+    - min_score: minimum ML score
+    """
+    broker = get_alert_broker()
+    filters = build_filter(status, priority, risk_band, assigned_to, min_score)
+    try:
+        subscription = broker.subscribe(filters)
+    except RuntimeError as e:
+        raise HTTPException(status_code=503, detail=str(e))
+
+    async def body() -> AsyncIterator[str]:
+        try:
+            async for chunk in sse_events(subscription, settings.STREAM_HEARTBEAT_SECONDS, request):
+                yield chunk
+        finally:
+            broker.unsubscribe(subscription)
+
+    return StreamingResponse(
+        body(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@router.websocket("/alerts/ws")
+async def stream_alerts_ws(
+    websocket: WebSocket,
+    status: Optional[List[AlertStatus]] = Query(None),
+    priority: Optional[List[AlertPriority]] = Query(None),
+    risk_band: Optional[List[RiskBand]] = Query(None),
+    assigned_to: Optional[str] = None,
+    min_score: Optional[float] = Query(None, ge=0.0, le=1.0),
+):
+    """Stream new alerts over a WebSocket (one JSON message per alert)."""
+    broker = get_alert_broker()
+    filters = build_filter(status, priority, risk_band, assigned_to, min_score)
+    try:
+        subscription = broker.subscribe(filters)
+    except RuntimeError:
+        await websocket.close(code=1013)  # Try again later
+        return
+
+    await websocket.accept()
+    try:
+        while True:
+            payload = await subscription.get(timeout=settings.STREAM_HEARTBEAT_SECONDS)
+            if payload is None:
+                await websocket.send_json({"event": "keep-alive"})
+                continue
+            await websocket.send_json(payload)
+    except WebSocketDisconnect:
+        pass
+    finally:
+        broker.unsubscribe(subscription)
@@ -0,0 +1,134 @@
+"""Transaction ingestion API endpoints."""
+
+import os
+from datetime import datetime
+
+from fastapi import APIRouter, Depends, File, HTTPException, Query, UploadFile
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.database import get_db
+from app.schemas.transaction import (
+    BatchScoringResponse,
+    BatchScoringResult,
+    TransactionBatchCreate,
+    TransactionCreate,
+    TransactionIngested,
+    TransactionIngestResponse,
+)
+from app.services.batch_scoring import BatchScoringError, score_file
+from app.services.sharding import ShardUnavailableError
+from app.services.transaction_service import TransactionService
+
+router = APIRouter()
+
+
+def _ingest(db: Session, items) -> TransactionIngestResponse:
+    try:
+        result = TransactionService.ingest(db, items)
+    except ShardUnavailableError as e:
+        raise HTTPException(status_code=503, detail=str(e))
+
+    return TransactionIngestResponse(
+        status="success",
+        data=TransactionIngested(
+            ingested=len(result.ids),
+            ids=result.ids,
+            features=result.features,
+            scores=result.scores,
+            alerts_created=result.alerts_created,
+            alerts_merged=result.alerts_merged,
+        ),
+        metadata={
+            "request_id": None,
+            "timestamp": datetime.utcnow().isoformat(),
+            "version": "v1",
+        },
+    )
+
+
+@router.post("", response_model=TransactionIngestResponse, status_code=201)
+def ingest_transaction(
+    transaction: TransactionCreate,
+    db: Session = Depends(get_db),
+):
+    """
+    Ingest a single transaction.
+
+    **Validation:**
+    - step >= 1, amount >= 0
+    - type: CASH_IN, CASH_OUT, DEBIT, PAYMENT, TRANSFER (CASH-OUT spelling accepted)
+    """
+    return _ingest(db, [transaction])
+
+
+@router.post("/batch", response_model=TransactionIngestResponse, status_code=201)
+def ingest_transaction_batch(
+    batch: TransactionBatchCreate,
+    db: Session = Depends(get_db),
+):
+    """
+    Ingest a micro-batch of up to 1000 transactions in one database transaction.
+    """
+    return _ingest(db, batch.transactions)
+
+
+@router.post("/upload", response_model=BatchScoringResponse, status_code=201)
+def upload_transactions(
+    file: UploadFile = File(..., description="PaySim-layout CSV, ordered by step"),
+    start_line: int = Query(2, ge=2, description="First file line to score (the header is line 1)"),
+    db: Session = Depends(get_db),
+):
+    """
+    Score and store a CSV of transactions through the batch pipeline.
+
+    Files are limited to MAX_UPLOAD_SIZE_MB; score larger ones from disk
+    with `scripts/score_file.py`. Invalid rows are rejected with reasons
+    and the rest are stored chunk by chunk. Per-stage throughput shows
+    the bottleneck.
+
+    Chunks stored before a failure stay stored: the error detail carries
+    the partial report, and re-uploading with `start_line` set to its
+    `resume_line` carries on from the first chunk not stored.
+    """
+    file.file.seek(0, os.SEEK_END)
+    size = file.file.tell()
+    file.file.seek(0)
+    if size > settings.MAX_UPLOAD_SIZE_MB * 1024 * 1024:
+        raise HTTPException(
+            status_code=413,
+            detail=f"File exceeds {settings.MAX_UPLOAD_SIZE_MB} MB; use scripts/score_file.py for larger files",
+        )
+
+    try:
+        report = score_file(
+            db,
+            file.file,
+            chunk_size=settings.BATCH_SCORING_CHUNK_SIZE,
+            queue_size=settings.BATCH_SCORING_QUEUE_SIZE,
+            first_line=start_line,
+        )
+    except BatchScoringError as e:
+        if isinstance(e.cause, ValueError):
+            status_code = 400
+        elif isinstance(e.cause, ShardUnavailableError):
+            status_code = 503
+        else:
+            status_code = 500
+        raise HTTPException(
+            status_code=status_code,
+            detail={
+                "message": str(e),
+                "report": BatchScoringResult.model_validate(e.report).model_dump(),
+            },
+        )
+
+    return BatchScoringResponse(
+        status="success",
+        data=BatchScoringResult.model_validate(report),
+        metadata={
+            "request_id": None,
+            "timestamp": datetime.utcnow().isoformat(),
+            "version": "v1",
+        },
+    )
@@ -0,0 +1,164 @@
+"""
+Multi-worker server: ``python -m app.cluster``.
+
+The supervisor binds the listening socket and loads the model once,
+then forks ``settings.WORKERS`` uvicorn workers that share both. Worker
+``i`` owns shard ``i`` of the per-account state (see
+app.services.sharding); the kernel spreads connections across workers
+and each worker forwards rows for other senders to their owner.
+
+Workers talk over Unix sockets in a private 0700 directory and
+authenticate with a random key the supervisor generates per run; both
+reach the workers through the environment (SHARD_SOCKET_DIR,
+SHARD_AUTHKEY).
+"""
+
+import logging
+import os
+import secrets
+import shutil
+import signal
+import socket
+import sys
+import tempfile
+import time
+from typing import Dict
+
+from app.config import settings
+
+logger = logging.getLogger("app.cluster")
+
+
+def bind_socket(host: str, port: int) -> socket.socket:
+    """Bind the shared listening socket (inherited by forked workers)."""
+    family = socket.AF_INET6 if ":" in host else socket.AF_INET
+    sock = socket.socket(family, socket.SOCK_STREAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    sock.bind((host, port))
+    sock.listen(2048)
+    sock.set_inheritable(True)
+    return sock
+
+
+def prepare_shard_channel() -> bool:
+    """
+    Generate the cluster's shard authkey and its private socket directory.
+
+    A configured SHARD_SOCKET_DIR is created 0700 or checked to be owned by
+    this user and private; otherwise a fresh one is made under
+    XDG_RUNTIME_DIR (or the temp dir). Both values are exported so forked
+    workers (and anything they exec) inherit them.
+
+    Returns:
+        bool: True when the directory was created here (removed on exit)
+
+    Raises:
+        ShardSetupError: The configured directory is not private to this user
+    """
+    from app.services.sharding import ensure_private_dir
+
+    created = not settings.SHARD_SOCKET_DIR
+    if created:
+        settings.SHARD_SOCKET_DIR = tempfile.mkdtemp(
+            prefix="fraud-detection-shards-", dir=os.environ.get("XDG_RUNTIME_DIR") or None
+        )
+    else:
+        ensure_private_dir(settings.SHARD_SOCKET_DIR)
+    settings.SHARD_AUTHKEY = secrets.token_hex(32)
+    os.environ["SHARD_SOCKET_DIR"] = settings.SHARD_SOCKET_DIR
+    os.environ["SHARD_AUTHKEY"] = settings.SHARD_AUTHKEY
+    return created
+
+
+def preload() -> None:
+    """Load read-only state in the supervisor so workers share its pages."""
+    from app.services.model_registry import get_model_manager
+
+    get_model_manager().load_initial()
+
+
+def run_worker(index: int, sock: socket.socket) -> None:
+    """Serve the app in a forked worker that owns shard ``index``."""
+    import uvicorn
+
+    settings.SHARD_INDEX = index
+    config = uvicorn.Config(
+        "app.main:app",
+        log_level=settings.LOG_LEVEL.lower(),
+        log_config=None,
+    )
+    uvicorn.Server(config).run(sockets=[sock])
+
+
+def spawn(index: int, sock: socket.socket) -> int:
+    pid = os.fork()
+    if pid == 0:
+        signal.signal(signal.SIGINT, signal.SIG_DFL)
+        signal.signal(signal.SIGTERM, signal.SIG_DFL)
+        code = 0
+        try:
+            run_worker(index, sock)
+        except BaseException:
+            logger.exception("Worker %d crashed", index)
+            code = 1
+        finally:
+            os._exit(code)
+    return pid
+
+
+def run(workers: int, host: str, port: int) -> None:
+    """
+    Run the supervisor until SIGINT/SIGTERM.
+
+    A worker that dies is restarted with the same shard index; its
+    in-memory windows restart empty, as after a deploy.
+    """
+    if sys.platform == "win32":
+        raise RuntimeError("app.cluster needs fork(); run a single worker on Windows")
+
+    sock = bind_socket(host, port)
+    created_dir = prepare_shard_channel()
+    preload()
+
+    children: Dict[int, int] = {spawn(i, sock): i for i in range(workers)}
+    logger.info("Started %d workers on %s:%d", workers, host, port)
+
+    stopping = False
+
+    def shutdown(signum, frame):
+        nonlocal stopping
+        stopping = True
+        for pid in list(children):
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+
+    signal.signal(signal.SIGINT, shutdown)
+    signal.signal(signal.SIGTERM, shutdown)
+
+    while children:
+        try:
+            pid, status = os.wait()
+        except ChildProcessError:
+            break
+        except InterruptedError:
+            continue
+        index = children.pop(pid, None)
+        if index is None or stopping:
+            continue
+        logger.warning("Worker %d (pid %d) exited with status %d; restarting", index, pid, status)
+        time.sleep(1)
+        children[spawn(index, sock)] = index
+
+    sock.close()
+    if created_dir:
+        shutil.rmtree(settings.SHARD_SOCKET_DIR, ignore_errors=True)
+    logger.info("All workers stopped")
+
+
+if __name__ == "__main__":
+    from app.utils.logging_config import configure_logging
+
+    configure_logging(settings.LOG_LEVEL, settings.LOG_FORMAT)
+    run(settings.WORKERS, settings.HOST, settings.PORT)
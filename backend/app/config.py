@@ -1,7 +1,7 @@
 """Application configuration and settings."""
 
 from functools import lru_cache
-from typing import List
+from typing import List, Optional
 
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -14,9 +14,22 @@ class Settings(BaseSettings):
     VERSION: str = "1.0.0"
     API_V1_PREFIX: str = "/api"
     DEBUG: bool = False
+    HOST: str = "0.0.0.0"
+    PORT: int = 8000
+
+    # Workers (per-account state is sharded by nameOrig hash across processes)
+    WORKERS: int = 1
+    SHARD_INDEX: int = 0  # Set per worker by app.cluster
+    # Private (0700) directory for the cross-shard Unix sockets; app.cluster
+    # creates one under XDG_RUNTIME_DIR (or the temp dir) when unset
+    SHARD_SOCKET_DIR: str = ""
+    SHARD_AUTHKEY: str = ""  # Random per cluster, set by app.cluster; authenticates shard sockets
+    SHARD_TIMEOUT: float = 5.0  # Seconds to wait for a peer shard
 
     # Database
     DATABASE_URL: str = "sqlite:///./fraud_detection.db"
+    # Startup schema check: verify (revision must match), migrate (alembic upgrade head), off
+    DB_SCHEMA_CHECK: str = "verify"
 
     # CORS
     ALLOWED_ORIGINS: str = "http://localhost:3000"
@@ -35,13 +48,76 @@ class Settings(BaseSettings):
     ML_MODEL_PATH: str = "../models/fraud_detector_v1.pkl"
     SCORING_TIMEOUT: int = 30
     USE_MOCK_SCORING: bool = True
+    ALERT_SCORE_THRESHOLD: float = 0.75  # Champion score that raises an alert without a rule hit
+
+    # Model Registry (versioned artifacts; the active version is hot-swapped without restart)
+    MODEL_REGISTRY_DIR: str = "../models/registry"  # <version>/model.pkl + metadata.json, CURRENT; ML_MODEL_PATH if empty
+    MODEL_REGISTRY_POLL_SECONDS: float = 10.0  # Check the active version this often; 0 disables the watcher
+
+    # Shadow Scoring (challenger model scored off the ingestion path)
+    CHALLENGER_MODEL_PATH: Optional[str] = None  # Challenger artifact ("mock" for the mock model); disabled when unset
+    SHADOW_QUEUE_SIZE: int = 100  # Micro-batches waiting for the challenger before new ones are shed
+
+    # Alert Aggregation (one parent alert per sender burst)
+    ALERT_AGGREGATION_WINDOW_STEPS: int = 24  # Merge a sender's alerts within this many steps; 0 disables
+    ALERT_AGGREGATION_MAX_ACCOUNTS: int = 100_000  # Senders held in the in-memory window index
+
+    # Alert Archival (closed alerts move to the compressed alerts_archive table)
+    ALERT_ARCHIVE_AFTER_DAYS: int = 90  # Archive alerts closed this many days ago; 0 disables archival
+    ALERT_ARCHIVE_BATCH_SIZE: int = 1000  # Alerts moved per transaction
+    ALERT_ARCHIVE_INTERVAL_SECONDS: float = 3600.0  # Archiver period (first worker only); 0 runs it on demand only
+
+    # Export (alerts with transactions streamed as CSV/JSONL)
+    EXPORT_BATCH_SIZE: int = 1000  # Alerts read per server-side cursor fetch
+
+    # Search (full-text over alert notes, n-grams over account names)
+    SEARCH_MAX_MATCHES: int = 1000  # Matches counted per search; larger totals are reported as truncated
+
+    # Entity Dictionary
+    ENTITY_CACHE_SIZE: int = 100_000
+    ENTITY_COUNTERPARTY_CAPACITY: int = 50  # Counterparties tracked per entity profile
+
+    # Feature Cache (sender window summaries keyed by (sender, step))
+    FEATURE_CACHE_SIZE: int = 100_000  # Senders in the per-process LRU; 0 disables the cache
+    FEATURE_CACHE_TTL_STEPS: int = 2  # Steps a sender's summaries are kept after a newer step is cached
+    FEATURE_CACHE_BACKEND: Optional[str] = None  # Shared tier: unset, "memory" or a redis:// URL
+    FEATURE_CACHE_SHARED_TTL_SECONDS: int = 7 * 24 * 3600  # Shared-tier key expiry (the 168-step window); 0 keeps keys
+
+    # Transaction Graph
+    GRAPH_WINDOW_STEPS: int = 168  # Recent steps (hours) held in the in-memory graph
+    GRAPH_MAX_NODES: int = 10_000  # Cap on nodes returned by one expansion
+
+    # Real-time Alert Stream (WebSocket/SSE)
+    STREAM_CLIENT_BUFFER_SIZE: int = 100  # Events buffered per client before dropping oldest
+    STREAM_MAX_SUBSCRIBERS: int = 500
+    STREAM_HEARTBEAT_SECONDS: float = 15.0
 
     # File Upload
     MAX_UPLOAD_SIZE_MB: int = 10
 
+    # Batch Scoring (whole files: parse → features → rules → score → store, one thread per stage)
+    BATCH_SCORING_CHUNK_SIZE: int = 2000  # Rows per chunk; each chunk is stored in one database transaction
+    BATCH_SCORING_QUEUE_SIZE: int = 4  # Chunks buffered between two stages before the upstream one waits
+
     # Logging
     LOG_LEVEL: str = "INFO"
-    LOG_FORMAT: str = "json"
+    LOG_FORMAT: str = "json"  # "json" for structured logs, "text" for plain
+
+    # Metrics (Prometheus text format on /metrics)
+    METRICS_ENABLED: bool = True
+
+    # Query Diagnostics
+    SLOW_QUERY_MS: float = 200.0  # Log statements slower than this with their EXPLAIN plan
+    SLOW_QUERY_EXPLAIN: bool = True
+    N_PLUS_ONE_THRESHOLD: int = 10  # Identical statement shapes per request before reporting
+    N_PLUS_ONE_RAISE: bool = False  # Raise instead of logging (enabled in tests)
+
+    # Startup Warm-up (background tasks gating /health/ready)
+    WARMUP_TRANSACTION_GRAPH: bool = True  # Build the in-memory graph at startup instead of on first use
+
+    # Admin / Profiling
+    ADMIN_API_KEY: Optional[str] = None  # X-Admin-Token for /api/admin; admin disabled when unset
+    PROFILE_MAX_SECONDS: float = 60.0
 
     # Security (Phase 2)
     SECRET_KEY: str = "dev-secret-key-change-in-production"
@@ -51,6 +127,7 @@ class Settings(BaseSettings):
 
     # Dataset
     DATASET_PATH: str = "../dataset/Synthetic_Financial_datasets_log.csv"
+    PARQUET_DATASET_PATH: str = "../dataset/parquet/transactions"
 
     model_config = SettingsConfigDict(
         env_file=".env",
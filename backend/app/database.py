@@ -7,6 +7,8 @@ from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import Session, sessionmaker
 
 from app.config import settings
+from app.utils.metrics import instrument_engine
+from app.utils.query_diagnostics import get_query_diagnostics
 
 # Create database engine
 engine = create_engine(
@@ -14,6 +16,8 @@ engine = create_engine(
     connect_args={"check_same_thread": False} if "sqlite" in settings.DATABASE_URL else {},
     echo=settings.DEBUG,
 )
+instrument_engine(engine)
+get_query_diagnostics().install(engine)
 
 # Create session factory
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
@@ -42,5 +46,22 @@ def get_db() -> Generator[Session, None, None]:
 
 
 def init_db() -> None:
-    """Initialize database by creating all tables."""
-    Base.metadata.create_all(bind=engine)
+    """Bring the database schema up to date by applying Alembic migrations."""
+    from app.utils.schema import upgrade_database
+
+    upgrade_database(engine)
+
+
+def check_schema() -> None:
+    """
+    Startup schema check according to ``settings.DB_SCHEMA_CHECK``.
+
+    ``verify`` costs a single query and fails fast on a stale schema;
+    ``migrate`` applies pending migrations (single-process development only).
+    """
+    from app.utils.schema import verify_schema
+
+    if settings.DB_SCHEMA_CHECK == "migrate":
+        init_db()
+    elif settings.DB_SCHEMA_CHECK == "verify":
+        verify_schema(engine)
@@ -1,27 +1,95 @@
 """Main FastAPI application entry point."""
 
+import logging
 from contextlib import asynccontextmanager
 from datetime import datetime
 from typing import Dict
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response
+from prometheus_client import CONTENT_TYPE_LATEST
+from sqlalchemy import text
 
+from app.api import admin, alerts, entities, search, stream, transactions
 from app.config import settings
-from app.database import init_db
+from app.database import SessionLocal, check_schema, engine
+from app.services.alert_archive import get_alert_archiver
+from app.services.graph_index import get_transaction_graph
+from app.services.model_registry import get_model_manager
+from app.services.shadow import get_shadow_scorer
+from app.services.sharding import get_shard_router
+from app.services.warmup import get_warmup
+from app.utils.logging_config import configure_logging
+from app.utils.metrics import MetricsMiddleware, render_metrics
+from app.utils.profiler import ProfilingMiddleware
+from app.utils.query_diagnostics import QueryDiagnosticsMiddleware
+
+configure_logging(settings.LOG_LEVEL, settings.LOG_FORMAT)
+logger = logging.getLogger("app")
+
+
+def _check_database() -> None:
+    """Warm-up: open a pooled connection and round-trip to the database."""
+    with engine.connect() as conn:
+        conn.execute(text("SELECT 1"))
+
+
+def _build_transaction_graph() -> None:
+    """Warm-up: build the in-memory transaction graph before the first network query."""
+    db = SessionLocal()
+    try:
+        get_transaction_graph(db)
+    finally:
+        db.close()
+
+
+def _start_shadow_scoring() -> None:
+    """Warm-up: load the challenger model and start the shadow scorer."""
+    shadow = get_shadow_scorer()
+    shadow.load(settings.CHALLENGER_MODEL_PATH)
+    shadow.start()
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Application lifespan manager for startup and shutdown events."""
     # Startup
-    print(f"🚀 Starting {settings.PROJECT_NAME} v{settings.VERSION}")
-    init_db()
-    print("✅ Database initialized")
+    logger.info("Starting %s v%s", settings.PROJECT_NAME, settings.VERSION)
+    # Migrations run as a deploy step (`alembic upgrade head`), not per worker
+    check_schema()
+    logger.info("Database schema checked (%s)", settings.DB_SCHEMA_CHECK)
+
+    # Answer peer workers for the accounts this worker owns (multi-worker mode)
+    shard_router = get_shard_router()
+    shard_router.serve()
+
+    # Heavy subsystems load in the background; /health/ready reports progress
+    warmup = get_warmup()
+    warmup.clear()
+    warmup.register("database", _check_database)
+    model_manager = get_model_manager()
+    warmup.register("champion_model", model_manager.load_initial)
+    if settings.CHALLENGER_MODEL_PATH:
+        # Optional: ingestion never waits for the challenger
+        warmup.register("challenger_model", _start_shadow_scoring, required=False)
+    if settings.WARMUP_TRANSACTION_GRAPH:
+        warmup.register("transaction_graph", _build_transaction_graph, required=False)
+    warmup.start()
+    # Follow the registry's active version (hot swap, no restart)
+    model_manager.watch(settings.MODEL_REGISTRY_POLL_SECONDS)
+    # One worker moves old closed alerts to the archive
+    archiver = get_alert_archiver()
+    if settings.SHARD_INDEX == 0:
+        archiver.start(settings.ALERT_ARCHIVE_INTERVAL_SECONDS)
     yield
     # Shutdown
-    print("👋 Shutting down application")
+    await warmup.stop()
+    model_manager.stop()
+    archiver.stop()
+    get_shadow_scorer().stop()
+    shard_router.close()
+    logger.info("Shutting down application")
 
 
 # Create FastAPI app
@@ -44,24 +112,85 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Request latency, in-flight and per-request SQL metrics
+if settings.METRICS_ENABLED:
+    app.add_middleware(MetricsMiddleware)
+
+# Slow-query log and N+1 detection per request
+app.add_middleware(QueryDiagnosticsMiddleware)
+
+# Per-request cProfile capture (X-Profile: 1 with an admin token)
+app.add_middleware(ProfilingMiddleware)
+
 
 # Health check endpoint
 @app.get("/health", tags=["Health"])
 async def health_check() -> Dict:
     """
-    Check if the API is running and healthy.
+    Check if the API is running and healthy (liveness).
     
     Returns:
         Dict: Health status information
     """
     return {
         "status": "healthy",
+        "ready": get_warmup().ready,
         "service": settings.PROJECT_NAME,
         "version": settings.VERSION,
         "timestamp": datetime.utcnow().isoformat(),
     }
 
 
+@app.get("/health/live", tags=["Health"])
+async def liveness() -> Dict:
+    """
+    Liveness probe: the process is up and serving requests.
+    
+    Returns:
+        Dict: Liveness status
+    """
+    return {"status": "alive"}
+
+
+@app.get("/health/ready", tags=["Health"])
+async def readiness() -> JSONResponse:
+    """
+    Readiness probe: every required warm-up task has finished.
+    
+    Returns:
+        JSONResponse: 200 when ready, 503 while warming up or after a failure
+    """
+    warmup = get_warmup()
+    tasks = warmup.status()
+    if warmup.ready:
+        status_code, status = 200, "ready"
+    elif any(t["state"] == "failed" and t["required"] for t in tasks.values()):
+        status_code, status = 503, "failed"
+    else:
+        status_code, status = 503, "starting"
+
+    return JSONResponse(
+        status_code=status_code,
+        content={
+            "status": status,
+            "tasks": tasks,
+            "timestamp": datetime.utcnow().isoformat(),
+        },
+    )
+
+
+# Metrics endpoint
+@app.get("/metrics", tags=["Health"], include_in_schema=False)
+async def metrics() -> Response:
+    """
+    Expose application metrics in Prometheus text format.
+
+    Returns:
+        Response: Latency histograms, in-flight gauge, SQL and scoring metrics
+    """
+    return Response(content=render_metrics(), media_type=CONTENT_TYPE_LATEST)
+
+
 # Root endpoint
 @app.get("/", tags=["Root"])
 async def root() -> Dict:
@@ -80,21 +209,29 @@ async def root() -> Dict:
 
 
 # Import and include routers (will be created in subsequent tasks)
-# from app.api import alerts, cases, entities, transactions, scoring
-# app.include_router(alerts.router, prefix=f"{settings.API_V1_PREFIX}/alerts", tags=["Alerts"])
+# from app.api import cases, scoring
+app.include_router(admin.router, prefix=f"{settings.API_V1_PREFIX}/admin", tags=["Admin"])
+app.include_router(alerts.router, prefix=f"{settings.API_V1_PREFIX}/alerts", tags=["Alerts"])
 # app.include_router(cases.router, prefix=f"{settings.API_V1_PREFIX}/cases", tags=["Cases"])
-# app.include_router(entities.router, prefix=f"{settings.API_V1_PREFIX}/entities", tags=["Entities"])
-# app.include_router(transactions.router, prefix=f"{settings.API_V1_PREFIX}/transactions", tags=["Transactions"])
+app.include_router(entities.router, prefix=f"{settings.API_V1_PREFIX}/entities", tags=["Entities"])
+app.include_router(search.router, prefix=f"{settings.API_V1_PREFIX}/search", tags=["Search"])
+app.include_router(stream.router, prefix=f"{settings.API_V1_PREFIX}/stream", tags=["Streaming"])
+app.include_router(transactions.router, prefix=f"{settings.API_V1_PREFIX}/transactions", tags=["Transactions"])
 # app.include_router(scoring.router, prefix=f"{settings.API_V1_PREFIX}/score", tags=["Scoring"])
 
 
 if __name__ == "__main__":
-    import uvicorn
-
-    uvicorn.run(
-        "app.main:app",
-        host="0.0.0.0",
-        port=8000,
-        reload=settings.DEBUG,
-        log_level=settings.LOG_LEVEL.lower(),
-    )
+    if settings.WORKERS > 1:
+        from app.cluster import run
+
+        run(settings.WORKERS, settings.HOST, settings.PORT)
+    else:
+        import uvicorn
+
+        uvicorn.run(
+            "app.main:app",
+            host=settings.HOST,
+            port=settings.PORT,
+            reload=settings.DEBUG,
+            log_level=settings.LOG_LEVEL.lower(),
+        )
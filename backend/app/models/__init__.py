@@ -1,9 +1,13 @@
 """SQLAlchemy ORM models."""
 
 # Import all models here for Alembic auto-discovery
-# from app.models.transaction import Transaction
-# from app.models.alert import Alert
-# from app.models.case import Case
-# from app.models.entity import Entity
+from app.models.transaction import Transaction
+from app.models.alert import Alert
+from app.models.alert_counter import AlertCounter
+from app.models.archived_alert import ArchivedAlert
+from app.models.case import Case
+from app.models.entity import Entity, EntityAggregate
+from app.models.shadow_score import ShadowScore
+from app.models import search  # noqa: F401  (search index DDL on create_all)
 
-__all__ = []  # Will be populated as models are created
+__all__ = ["Alert", "AlertCounter", "ArchivedAlert", "Case", "Entity", "EntityAggregate", "ShadowScore", "Transaction"]
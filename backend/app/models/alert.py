@@ -3,13 +3,22 @@
 import enum
 import uuid
 from datetime import datetime
-from typing import Optional
+from typing import List, Optional
 
-from sqlalchemy import JSON, Column, DateTime, Enum, Float, ForeignKey, String, Text
+from sqlalchemy import Column, DateTime, Enum, Float, ForeignKey, Index, Integer, LargeBinary, String, Table, Text
 from sqlalchemy.dialects.postgresql import UUID
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import column_property, relationship
 
 from app.database import Base
+from app.utils.alert_payload import (
+    decode_reason_codes,
+    decode_rules,
+    decode_shap,
+    encode_reason_codes,
+    encode_rules,
+    encode_shap,
+    rule_count,
+)
 
 
 class AlertStatus(str, enum.Enum):
@@ -40,6 +49,16 @@ class RiskBand(str, enum.Enum):
     CRITICAL = "critical"
 
 
+# Junction table linking an aggregated alert to every transaction it covers
+alert_transactions = Table(
+    "alert_transactions",
+    Base.metadata,
+    Column("alert_id", UUID(as_uuid=True), ForeignKey("alerts.id"), primary_key=True),
+    Column("transaction_id", UUID(as_uuid=True), ForeignKey("transactions.id"), primary_key=True),
+    Column("added_at", DateTime, default=datetime.utcnow, nullable=False),
+)
+
+
 class Alert(Base):
     """
     Alert model representing a fraud detection alert.
@@ -49,12 +68,16 @@ class Alert(Base):
     """
 
     __tablename__ = "alerts"
+    __table_args__ = (
+        # Alert queue: filter by status, newest first
+        Index("ix_alerts_status_created_at", "status", "created_at"),
+    )
 
     # Primary Key
     id = Column(
         UUID(as_uuid=True) if "postgresql" else String(36),
         primary_key=True,
-        default=lambda: str(uuid.uuid4()),
+        default=uuid.uuid4,
         unique=True,
         nullable=False,
     )
@@ -68,31 +91,37 @@ class Alert(Base):
     )
 
     # Alert Status
-    status = Column(
-        Enum(AlertStatus),
-        default=AlertStatus.NEW,
-        nullable=False,
-        index=True,
+    # Dashboard dimensions use active_history so a change to an unloaded value
+    # still reports the old one (see app.services.alert_counters)
+    status = column_property(
+        Column(Enum(AlertStatus), default=AlertStatus.NEW, nullable=False, index=True),
+        active_history=True,
     )
 
-    priority = Column(
-        Enum(AlertPriority),
-        default=AlertPriority.MEDIUM,
-        nullable=False,
-        index=True,
+    priority = column_property(
+        Column(Enum(AlertPriority), default=AlertPriority.MEDIUM, nullable=False, index=True),
+        active_history=True,
     )
 
     # ML Scoring Information
     ml_score = Column(Float, nullable=False)  # 0.0 to 1.0
-    ml_risk_band = Column(Enum(RiskBand), nullable=False, index=True)
-    ml_reason_codes = Column(JSON, nullable=False, default=list)  # ["high_amount", "new_counterparty"]
-    shap_values = Column(JSON, nullable=True)  # [{"feature": "amount_zscore", "value": 0.45}]
+    ml_risk_band = column_property(Column(Enum(RiskBand), nullable=False, index=True), active_history=True)
+    # Compact payloads (see app.utils.alert_payload); decoded by the properties below
+    reason_code_ids = Column(LargeBinary, nullable=False, default=b"")  # One ReasonCode id per byte
+    shap = Column(LargeBinary, nullable=True)  # float32 per SHAP_FEATURES slot
+    model_version = Column(String(100), nullable=True)  # Model that produced ml_score (see app.services.model_registry)
 
     # Rule-based Detection
-    rules_triggered = Column(JSON, nullable=False, default=list)  # [{"rule_id": "R001", "rule_name": "...", "reason": "..."}]
+    rules_mask = Column(Integer, nullable=False, default=0, server_default="0")  # Bit i = RULE_IDS[i]
+
+    # Aggregation (one alert per sender burst; see app.services.alert_aggregator)
+    name_orig = Column(String(100), nullable=True, index=True)
+    first_step = Column(Integer, nullable=True)
+    last_step = Column(Integer, nullable=True)
+    transaction_count = Column(Integer, default=1, server_default="1", nullable=False)
 
     # Assignment and Notes
-    assigned_to = Column(String(100), nullable=True, index=True)
+    assigned_to = column_property(Column(String(100), nullable=True, index=True), active_history=True)
     notes = Column(Text, nullable=True)
 
     # Timestamps
@@ -102,10 +131,46 @@ class Alert(Base):
     # Relationships
     transaction = relationship("Transaction", back_populates="alerts")
     cases = relationship("Case", secondary="case_alerts", back_populates="alerts")
+    linked_transactions = relationship("Transaction", secondary=alert_transactions)
+
+    # Hot row (see app.models.archived_alert for closed alerts moved to cold storage)
+    archived = False
 
     def __repr__(self) -> str:
         return f"<Alert(id={self.id}, status={self.status}, priority={self.priority}, ml_score={self.ml_score})>"
 
+    @property
+    def ml_reason_codes(self) -> List[str]:
+        """Reason codes, e.g. ["high_ml_score", "new_recipient"]."""
+        return decode_reason_codes(self.reason_code_ids)
+
+    @ml_reason_codes.setter
+    def ml_reason_codes(self, codes: List[str]) -> None:
+        self.reason_code_ids = encode_reason_codes(codes)
+
+    @property
+    def shap_values(self) -> Optional[List[dict]]:
+        """SHAP contributions, e.g. [{"feature": "amount_zscore", "value": 0.45}]."""
+        return decode_shap(self.shap)
+
+    @shap_values.setter
+    def shap_values(self, values: Optional[List[dict]]) -> None:
+        self.shap = encode_shap(values)
+
+    @property
+    def rules_triggered(self) -> List[dict]:
+        """RuleTrigger dicts, e.g. [{"rule_id": "R001", "rule_name": "...", "reason": "..."}]."""
+        return decode_rules(self.rules_mask or 0)
+
+    @rules_triggered.setter
+    def rules_triggered(self, rules: List[dict]) -> None:
+        self.rules_mask = encode_rules(rules)
+
+    @property
+    def rules_count(self) -> int:
+        """Number of rules triggered (without decoding them)."""
+        return rule_count(self.rules_mask)
+
     @property
     def is_closed(self) -> bool:
         """Check if alert is closed."""
@@ -119,7 +184,12 @@ class Alert(Base):
     @property
     def has_rules_triggered(self) -> bool:
         """Check if any rules were triggered."""
-        return len(self.rules_triggered) > 0
+        return bool(self.rules_mask)
+
+    @property
+    def linked_transaction_ids(self) -> List:
+        """IDs of every transaction coalesced into this alert."""
+        return [tx.id for tx in self.linked_transactions]
 
     @property
     def combined_detection(self) -> bool:
@@ -0,0 +1,25 @@
+"""Alert counter model - materialized alert counts for the dashboard."""
+
+from sqlalchemy import Column, Integer, String
+
+from app.database import Base
+
+
+class AlertCounter(Base):
+    """
+    Number of alerts per value of one dashboard dimension.
+
+    Maintained on write by app.services.alert_counters (same transaction
+    as the alert change) and corrected by its reconciliation job. Counts
+    cover hot and archived alerts. Dimensions: ``status``, ``priority``,
+    ``risk_band`` and ``assignee`` (``""`` for unassigned).
+    """
+
+    __tablename__ = "alert_counters"
+
+    dimension = Column(String(20), primary_key=True)
+    value = Column(String(100), primary_key=True)
+    count = Column(Integer, nullable=False, default=0)
+
+    def __repr__(self) -> str:
+        return f"<AlertCounter(dimension={self.dimension}, value={self.value!r}, count={self.count})>"
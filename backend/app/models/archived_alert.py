@@ -0,0 +1,147 @@
+"""Archived alert model - closed alerts moved out of the hot alerts table."""
+
+import base64
+import json
+import zlib
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+from uuid import UUID as PyUUID
+
+from sqlalchemy import Column, DateTime, Enum, Float, ForeignKey, LargeBinary, String
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import relationship
+
+from app.database import Base
+from app.models.alert import AlertPriority, AlertStatus, RiskBand
+from app.utils.alert_payload import decode_reason_codes, decode_rules, decode_shap, rule_count
+
+
+class ArchivedAlert(Base):
+    """
+    Cold copy of a closed alert (see app.services.alert_archive).
+
+    Only the columns the alert list filters and sorts on are kept as
+    columns; everything else (reason codes, SHAP values, rules, notes,
+    linked transactions) is one zlib-compressed JSON ``payload``. The
+    read-only properties mirror ``Alert``, so API schemas serialize
+    either model. Indexed on ``created_at`` only, keeping inserts cheap.
+    """
+
+    __tablename__ = "alerts_archive"
+
+    id = Column(UUID(as_uuid=True), primary_key=True)
+    transaction_id = Column(UUID(as_uuid=True), ForeignKey("transactions.id"), nullable=False)
+
+    status = Column(Enum(AlertStatus), nullable=False)
+    priority = Column(Enum(AlertPriority), nullable=False)
+    ml_score = Column(Float, nullable=False)
+    ml_risk_band = Column(Enum(RiskBand), nullable=False)
+    name_orig = Column(String(100), nullable=True)
+    assigned_to = Column(String(100), nullable=True)
+
+    created_at = Column(DateTime, nullable=False, index=True)
+    updated_at = Column(DateTime, nullable=False)  # Last change before archival (closing time)
+    archived_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+
+    payload = Column(LargeBinary, nullable=False)
+
+    transaction = relationship("Transaction")
+
+    archived = True
+
+    def __repr__(self) -> str:
+        return f"<ArchivedAlert(id={self.id}, status={self.status}, archived_at={self.archived_at})>"
+
+    @staticmethod
+    def pack(alert, linked_transaction_ids: List[PyUUID]) -> bytes:
+        """Compress the non-column fields of a hot ``Alert``."""
+        return zlib.compress(json.dumps({
+            "reason_code_ids": list(alert.reason_code_ids or b""),
+            "shap": base64.b64encode(alert.shap).decode() if alert.shap is not None else None,
+            "rules_mask": alert.rules_mask or 0,
+            "model_version": alert.model_version,
+            "first_step": alert.first_step,
+            "last_step": alert.last_step,
+            "transaction_count": alert.transaction_count or 1,
+            "notes": alert.notes,
+            "linked_transaction_ids": [str(tx_id) for tx_id in linked_transaction_ids],
+        }, separators=(",", ":")).encode())
+
+    @property
+    def fields(self) -> Dict[str, Any]:
+        """Decompressed payload (decoded once per instance)."""
+        fields = self.__dict__.get("_fields")
+        if fields is None:
+            fields = json.loads(zlib.decompress(self.payload))
+            self.__dict__["_fields"] = fields
+        return fields
+
+    def alert_values(self) -> Dict[str, Any]:
+        """Column values of the equivalent hot ``alerts`` row (for restoring)."""
+        fields = self.fields
+        shap = fields["shap"]
+        return {
+            "id": self.id,
+            "transaction_id": self.transaction_id,
+            "status": self.status,
+            "priority": self.priority,
+            "ml_score": self.ml_score,
+            "ml_risk_band": self.ml_risk_band,
+            "reason_code_ids": bytes(fields["reason_code_ids"]),
+            "shap": base64.b64decode(shap) if shap is not None else None,
+            "model_version": fields["model_version"],
+            "rules_mask": fields["rules_mask"],
+            "name_orig": self.name_orig,
+            "first_step": fields["first_step"],
+            "last_step": fields["last_step"],
+            "transaction_count": fields["transaction_count"],
+            "assigned_to": self.assigned_to,
+            "notes": fields["notes"],
+            "created_at": self.created_at,
+            "updated_at": self.updated_at,
+        }
+
+    @property
+    def ml_reason_codes(self) -> List[str]:
+        return decode_reason_codes(bytes(self.fields["reason_code_ids"]))
+
+    @property
+    def shap_values(self) -> Optional[List[dict]]:
+        shap = self.fields["shap"]
+        return decode_shap(base64.b64decode(shap)) if shap is not None else None
+
+    @property
+    def rules_triggered(self) -> List[dict]:
+        return decode_rules(self.fields["rules_mask"])
+
+    @property
+    def rules_count(self) -> int:
+        return rule_count(self.fields["rules_mask"])
+
+    @property
+    def model_version(self) -> Optional[str]:
+        return self.fields["model_version"]
+
+    @property
+    def first_step(self) -> Optional[int]:
+        return self.fields["first_step"]
+
+    @property
+    def last_step(self) -> Optional[int]:
+        return self.fields["last_step"]
+
+    @property
+    def transaction_count(self) -> int:
+        return self.fields["transaction_count"]
+
+    @property
+    def notes(self) -> Optional[str]:
+        return self.fields["notes"]
+
+    @property
+    def linked_transaction_ids(self) -> List[PyUUID]:
+        return [PyUUID(tx_id) for tx_id in self.fields["linked_transaction_ids"]]
+
+    @property
+    def is_closed(self) -> bool:
+        return self.status == AlertStatus.CLOSED
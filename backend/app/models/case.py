@@ -0,0 +1,75 @@
+"""Case model - groups related alerts for investigation."""
+
+import enum
+import uuid
+from datetime import datetime
+
+from sqlalchemy import Column, DateTime, Enum, Float, ForeignKey, String, Table, Text
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import relationship
+
+from app.database import Base
+from app.models.alert import AlertPriority
+
+
+class CaseStatus(str, enum.Enum):
+    """Case status enumeration."""
+
+    OPEN = "open"
+    INVESTIGATING = "investigating"
+    ESCALATED = "escalated"
+    RESOLVED = "resolved"
+
+
+class Disposition(str, enum.Enum):
+    """Case disposition enumeration."""
+
+    FRAUD = "fraud"
+    NOT_FRAUD = "not_fraud"
+    INCONCLUSIVE = "inconclusive"
+
+
+# Junction table linking cases and alerts
+case_alerts = Table(
+    "case_alerts",
+    Base.metadata,
+    Column("case_id", UUID(as_uuid=True), ForeignKey("cases.id"), primary_key=True),
+    Column("alert_id", UUID(as_uuid=True), ForeignKey("alerts.id"), primary_key=True),
+    Column("added_at", DateTime, default=datetime.utcnow, nullable=False),
+)
+
+
+class Case(Base):
+    """
+    Case model representing an investigation over one or more alerts.
+    """
+
+    __tablename__ = "cases"
+
+    # Primary Key
+    id = Column(
+        UUID(as_uuid=True) if "postgresql" else String(36),
+        primary_key=True,
+        default=uuid.uuid4,
+        unique=True,
+        nullable=False,
+    )
+
+    status = Column(Enum(CaseStatus), default=CaseStatus.OPEN, nullable=False, index=True)
+    priority = Column(Enum(AlertPriority), default=AlertPriority.MEDIUM, nullable=False, index=True)
+
+    # Disposition
+    disposition = Column(Enum(Disposition), nullable=True)
+    disposition_confidence = Column(Float, nullable=True)
+    disposition_notes = Column(Text, nullable=True)
+
+    # Timestamps
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False, index=True)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+    resolved_at = Column(DateTime, nullable=True)
+
+    # Relationships
+    alerts = relationship("Alert", secondary=case_alerts, back_populates="cases")
+
+    def __repr__(self) -> str:
+        return f"<Case(id={self.id}, status={self.status}, disposition={self.disposition})>"
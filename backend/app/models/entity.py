@@ -0,0 +1,95 @@
+"""Entity models - account name dictionary and precomputed profile aggregates."""
+
+from datetime import datetime
+
+from sqlalchemy import JSON, Column, DateTime, Float, ForeignKey, Integer, String
+
+from app.database import Base
+
+
+class Entity(Base):
+    """
+    Entity model mapping an account name (nameOrig/nameDest) to an id.
+
+    Transactions and feature state reference entities by ``id`` so account
+    strings are stored and hashed once.
+    """
+
+    __tablename__ = "entities"
+
+    # Primary Key (dense, assigned in insertion order)
+    id = Column(Integer, primary_key=True, autoincrement=True)
+
+    # Account name, e.g. "C1231006815" (customer) or "M1979787155" (merchant)
+    name = Column(String(100), nullable=False, unique=True, index=True)
+
+    # Metadata
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+
+    def __repr__(self) -> str:
+        return f"<Entity(id={self.id}, name={self.name})>"
+
+    @property
+    def is_merchant(self) -> bool:
+        """Check if entity is a merchant account (PaySim 'M' prefix)."""
+        return self.name.startswith("M")
+
+
+class EntityAggregate(Base):
+    """
+    Precomputed per-entity profile statistics.
+
+    Maintained incrementally in batches during ingestion (see
+    ``EntityService.update_aggregates``) so profile reads are a single
+    primary-key lookup instead of scans over ``transactions``.
+    """
+
+    __tablename__ = "entity_aggregates"
+
+    # Primary Key (one row per entity)
+    entity_id = Column(Integer, ForeignKey("entities.id"), primary_key=True)
+
+    # Activity as sender (nameOrig)
+    sent_count = Column(Integer, default=0, nullable=False)
+    sent_amount = Column(Float, default=0.0, nullable=False)
+
+    # Activity as receiver (nameDest)
+    received_count = Column(Integer, default=0, nullable=False)
+    received_amount = Column(Float, default=0.0, nullable=False)
+
+    max_amount = Column(Float, default=0.0, nullable=False)
+    type_counts = Column(JSON, nullable=False, default=dict)  # {"TRANSFER": 3, "CASH_OUT": 1}
+
+    # Risk history
+    fraud_count = Column(Integer, default=0, nullable=False)  # Transactions labelled isFraud
+    alert_count = Column(Integer, default=0, nullable=False)
+    case_count = Column(Integer, default=0, nullable=False)
+
+    # Activity window (PaySim steps)
+    first_step = Column(Integer, nullable=True)
+    last_step = Column(Integer, nullable=True)
+
+    # Bounded counterparty summary: {"<entity_id>": [count, amount]}
+    counterparties = Column(JSON, nullable=False, default=dict)
+
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+
+    def __repr__(self) -> str:
+        return f"<EntityAggregate(entity_id={self.entity_id}, transactions={self.total_transactions})>"
+
+    @property
+    def total_transactions(self) -> int:
+        """Total transactions sent and received."""
+        return self.sent_count + self.received_count
+
+    @property
+    def total_amount(self) -> float:
+        """Total amount sent and received."""
+        return self.sent_amount + self.received_amount
+
+    @property
+    def role(self) -> str:
+        """Role of the entity: sender, receiver or both."""
+        if self.sent_count and self.received_count:
+            return "both"
+        return "sender" if self.sent_count else "receiver"
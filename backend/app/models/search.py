@@ -0,0 +1,160 @@
+"""Search indexes - full-text over alert notes and n-grams over account names.
+
+The indexes are not mapped tables: they are created alongside the tables
+they cover (on ``create_all`` through DDL events, and by migrations 0009
+and 0010) and kept current by the database itself on every write.
+
+- SQLite: FTS5 external-content tables fed by triggers. Notes use the
+  porter/unicode61 tokenizer (ranked with bm25); account names use the
+  trigram tokenizer, so any substring of 3+ characters is an index lookup.
+  Alerts have no INTEGER primary key, so notes are keyed on an unmapped
+  ``alerts.search_id`` column numbered by the insert trigger rather than
+  on the implicit rowid, which VACUUM may renumber.
+- PostgreSQL: a generated ``tsvector`` column with a GIN index for notes
+  and a ``pg_trgm`` GIN index on ``entities.name``.
+
+Both dialects index ``lower(entities.name)`` for case-insensitive prefixes.
+"""
+
+from typing import Dict, List, Optional, Sequence
+
+from sqlalchemy import event
+
+from app.models.alert import Alert
+from app.models.entity import Entity
+
+NOTES_FTS = "alert_notes_fts"
+NAMES_FTS = "entity_names_fts"
+
+# Objects outside Base.metadata (skipped by autogenerate)
+SEARCH_TABLE_PREFIXES = (NOTES_FTS, NAMES_FTS)  # FTS5 virtual tables and their shadow tables
+SEARCH_COLUMNS = {("alerts", "notes_tsv"), ("alerts", "search_id")}
+SEARCH_INDEXES = {"ix_alerts_notes_tsv", "ix_alerts_search_id", "ix_entities_name_trgm", "ix_entities_name_lower"}
+
+NAME_LOWER_INDEX = "CREATE INDEX ix_entities_name_lower ON entities (lower(name))"
+
+# Existing rows keep their current rowid as search_id; new rows take the
+# next number after the largest (an index lookup on ix_alerts_search_id)
+_SQLITE_CREATE: Dict[str, List[str]] = {
+    "alerts": [
+        "ALTER TABLE alerts ADD COLUMN search_id INTEGER",
+        "UPDATE alerts SET search_id = rowid WHERE search_id IS NULL",
+        "CREATE UNIQUE INDEX ix_alerts_search_id ON alerts (search_id)",
+        f"CREATE VIRTUAL TABLE {NOTES_FTS} USING fts5("
+        f"notes, content='alerts', content_rowid='search_id', tokenize='porter unicode61 remove_diacritics 2')",
+        f"CREATE TRIGGER alerts_notes_fts_insert AFTER INSERT ON alerts BEGIN "
+        f"UPDATE alerts SET search_id = (SELECT coalesce(max(search_id), 0) + 1 FROM alerts) "
+        f"WHERE rowid = new.rowid AND search_id IS NULL; "
+        f"INSERT INTO {NOTES_FTS}(rowid, notes) SELECT search_id, notes FROM alerts WHERE rowid = new.rowid; END",
+        f"CREATE TRIGGER alerts_notes_fts_delete AFTER DELETE ON alerts BEGIN "
+        f"INSERT INTO {NOTES_FTS}({NOTES_FTS}, rowid, notes) VALUES ('delete', old.search_id, old.notes); END",
+        f"CREATE TRIGGER alerts_notes_fts_update AFTER UPDATE OF notes ON alerts BEGIN "
+        f"INSERT INTO {NOTES_FTS}({NOTES_FTS}, rowid, notes) VALUES ('delete', old.search_id, old.notes); "
+        f"INSERT INTO {NOTES_FTS}(rowid, notes) VALUES (new.search_id, new.notes); END",
+    ],
+    "entities": [
+        NAME_LOWER_INDEX,
+        f"CREATE VIRTUAL TABLE {NAMES_FTS} USING fts5("
+        f"name, content='entities', content_rowid='id', tokenize='trigram')",
+        f"CREATE TRIGGER entities_name_fts_insert AFTER INSERT ON entities BEGIN "
+        f"INSERT INTO {NAMES_FTS}(rowid, name) VALUES (new.id, new.name); END",
+        f"CREATE TRIGGER entities_name_fts_delete AFTER DELETE ON entities BEGIN "
+        f"INSERT INTO {NAMES_FTS}({NAMES_FTS}, rowid, name) VALUES ('delete', old.id, old.name); END",
+    ],
+}
+
+# Triggers and indexes are dropped with their table; the virtual tables are
+# not. alerts.search_id is left to the table (migration 0010 drops it)
+_SQLITE_DROP: Dict[str, List[str]] = {
+    "alerts": [
+        "DROP TRIGGER IF EXISTS alerts_notes_fts_update",
+        "DROP TRIGGER IF EXISTS alerts_notes_fts_delete",
+        "DROP TRIGGER IF EXISTS alerts_notes_fts_insert",
+        f"DROP TABLE IF EXISTS {NOTES_FTS}",
+        "DROP INDEX IF EXISTS ix_alerts_search_id",
+    ],
+    "entities": [
+        "DROP INDEX IF EXISTS ix_entities_name_lower",
+        "DROP TRIGGER IF EXISTS entities_name_fts_delete",
+        "DROP TRIGGER IF EXISTS entities_name_fts_insert",
+        f"DROP TABLE IF EXISTS {NAMES_FTS}",
+    ],
+}
+
+_POSTGRES_CREATE: Dict[str, List[str]] = {
+    "alerts": [
+        "ALTER TABLE alerts ADD COLUMN notes_tsv tsvector "
+        "GENERATED ALWAYS AS (to_tsvector('english', coalesce(notes, ''))) STORED",
+        "CREATE INDEX ix_alerts_notes_tsv ON alerts USING gin (notes_tsv)",
+    ],
+    "entities": [
+        "CREATE EXTENSION IF NOT EXISTS pg_trgm",
+        "CREATE INDEX ix_entities_name_trgm ON entities USING gin (name gin_trgm_ops)",
+        NAME_LOWER_INDEX,
+    ],
+}
+
+_POSTGRES_DROP: Dict[str, List[str]] = {
+    "alerts": [
+        "DROP INDEX IF EXISTS ix_alerts_notes_tsv",
+        "ALTER TABLE alerts DROP COLUMN IF EXISTS notes_tsv",
+    ],
+    "entities": [
+        "DROP INDEX IF EXISTS ix_entities_name_lower",
+        "DROP INDEX IF EXISTS ix_entities_name_trgm",
+    ],
+}
+
+_CREATE = {"sqlite": _SQLITE_CREATE, "postgresql": _POSTGRES_CREATE}
+_DROP = {"sqlite": _SQLITE_DROP, "postgresql": _POSTGRES_DROP}
+
+
+def create_statements(table: str, dialect: str) -> List[str]:
+    """DDL creating the search index over ``table`` (empty for unsupported dialects)."""
+    return _CREATE.get(dialect, {}).get(table, [])
+
+
+def drop_statements(table: str, dialect: str) -> List[str]:
+    """DDL dropping the search index over ``table``."""
+    return _DROP.get(dialect, {}).get(table, [])
+
+
+def rebuild_statements(dialect: str) -> List[str]:
+    """DDL repopulating the SQLite FTS tables from their content tables."""
+    if dialect != "sqlite":
+        return []  # PostgreSQL indexes are always derived from the rows
+    return [f"INSERT INTO {name}({name}) VALUES ('rebuild')" for name in (NOTES_FTS, NAMES_FTS)]
+
+
+def include_in_autogenerate(name: Optional[str], type_: str, parent_names: Dict) -> bool:
+    """
+    Alembic ``include_name`` hook: skip the search objects.
+
+    They are managed here rather than declared on the models, so
+    autogenerate would otherwise propose dropping them.
+    """
+    if name is None:
+        return True
+    if type_ == "table":
+        return not name.startswith(SEARCH_TABLE_PREFIXES)
+    if type_ == "column":
+        return (parent_names.get("table_name"), name) not in SEARCH_COLUMNS
+    if type_ == "index":
+        return name not in SEARCH_INDEXES
+    return True
+
+
+def _run(connection, statements: Sequence[str]) -> None:
+    for statement in statements:
+        connection.exec_driver_sql(statement)
+
+
+for _table in (Alert.__table__, Entity.__table__):
+    event.listen(
+        _table, "after_create",
+        lambda target, connection, **kw: _run(connection, create_statements(target.name, connection.dialect.name)),
+    )
+    event.listen(
+        _table, "before_drop",
+        lambda target, connection, **kw: _run(connection, drop_statements(target.name, connection.dialect.name)),
+    )
@@ -0,0 +1,35 @@
+"""Shadow score model - challenger scores recorded next to the champion's."""
+
+from datetime import datetime
+
+from sqlalchemy import Column, DateTime, Float, Integer, String
+from sqlalchemy.dialects.postgresql import UUID
+
+from app.database import Base
+
+
+class ShadowScore(Base):
+    """
+    One challenger score for a live transaction.
+
+    Written in bulk by the shadow scorer, off the ingestion path. Kept
+    narrow (no foreign key, no JSON) so inserts stay cheap; joined to
+    ``transactions`` only when models are compared.
+    """
+
+    __tablename__ = "shadow_scores"
+
+    transaction_id = Column(UUID(as_uuid=True), primary_key=True)
+    model_version = Column(String(100), primary_key=True)
+
+    step = Column(Integer, nullable=False)
+    champion_score = Column(Float, nullable=False)
+    challenger_score = Column(Float, nullable=False)
+
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+
+    def __repr__(self) -> str:
+        return (
+            f"<ShadowScore(transaction_id={self.transaction_id}, model_version={self.model_version}, "
+            f"challenger_score={self.challenger_score})>"
+        )
@@ -6,7 +6,7 @@ from datetime import datetime
 from decimal import Decimal
 from typing import Optional
 
-from sqlalchemy import Boolean, Column, DateTime, Enum, Integer, Numeric, String
+from sqlalchemy import Boolean, Column, DateTime, Enum, ForeignKey, Index, Integer, Numeric, String
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 
@@ -33,12 +33,16 @@ class Transaction(Base):
     """
 
     __tablename__ = "transactions"
+    __table_args__ = (
+        # Sender history in step order (features, replay, graph build)
+        Index("ix_transactions_nameOrig_step", "nameOrig", "step"),
+    )
 
     # Primary Key
     id = Column(
         UUID(as_uuid=True) if "postgresql" else String(36),
         primary_key=True,
-        default=lambda: str(uuid.uuid4()),
+        default=uuid.uuid4,
         unique=True,
         nullable=False,
     )
@@ -52,6 +56,10 @@ class Transaction(Base):
     nameOrig = Column(String(100), nullable=False, index=True)  # Sender
     nameDest = Column(String(100), nullable=False, index=True)  # Receiver
 
+    # Interned entity ids (see app.services.entity_dictionary)
+    orig_id = Column(Integer, ForeignKey("entities.id"), nullable=True, index=True)
+    dest_id = Column(Integer, ForeignKey("entities.id"), nullable=True, index=True)
+
     # Balance Information (DO NOT USE FOR FEATURES)
     # These columns are unreliable for fraud detection
     oldbalanceOrg = Column(Numeric(precision=15, scale=2), nullable=True)
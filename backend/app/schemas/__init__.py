@@ -3,6 +3,6 @@
 # Import schemas here as they are created
 # from app.schemas.alert import AlertDetail, AlertList
 # from app.schemas.case import CaseDetail, CaseList
-# from app.schemas.entity import EntityProfile
+from app.schemas.entity import EntityProfile, EntityProfileResponse
 
-__all__ = []
+__all__ = ["EntityProfile", "EntityProfileResponse"]
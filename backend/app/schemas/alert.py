@@ -77,6 +77,7 @@ class AlertBase(BaseModel):
     ml_risk_band: RiskBand
     created_at: datetime
     updated_at: datetime
+    archived: bool = False  # Served from the alert archive (closed alerts past retention in the hot table)
 
     class Config:
         from_attributes = True
@@ -89,11 +90,14 @@ class AlertList(AlertBase):
     transaction_amount: float
     assigned_to: Optional[str] = None
     rules_count: int = 0
+    transaction_count: int = 1  # Transactions coalesced into this alert
 
     @field_validator("rules_count", mode="before")
     @classmethod
     def count_rules(cls, v, info):
         """Calculate number of triggered rules."""
+        if isinstance(v, int):
+            return v
         if "rules_triggered" in info.data:
             return len(info.data["rules_triggered"])
         return 0
@@ -104,13 +108,17 @@ class AlertDetail(AlertBase):
 
     ml_reason_codes: List[str]
     shap_values: Optional[List[ShapValue]] = None
+    model_version: Optional[str] = None  # Model that produced ml_score
     rules_triggered: List[RuleTrigger]
     assigned_to: Optional[str] = None
     notes: Optional[str] = None
     transaction: TransactionSummary
+    transaction_count: int = 1
+    linked_transaction_ids: List[UUID] = []
 
     class Config:
         from_attributes = True
+        protected_namespaces = ()  # Allow the model_version field
 
 
 # Filter schema
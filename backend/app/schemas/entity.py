@@ -0,0 +1,84 @@
+"""Pydantic schemas for Entity API responses."""
+
+from typing import List, Optional
+
+from pydantic import BaseModel
+
+
+class TransactionTypeCount(BaseModel):
+    """Transaction count for one type."""
+
+    type: str
+    count: int
+
+
+class Counterparty(BaseModel):
+    """Counterparty summary for an entity profile."""
+
+    entity: str
+    count: int
+    total_amount: float
+
+
+class EntityProfile(BaseModel):
+    """Entity profile with precomputed statistics."""
+
+    entity_id: str
+    role: str
+
+    # Statistics
+    total_transactions: int
+    total_amount: float
+    avg_amount: float
+    max_amount: float
+    sent_count: int
+    received_count: int
+    transaction_types: List[TransactionTypeCount]
+    first_step: Optional[int] = None
+    last_step: Optional[int] = None
+
+    # Risk history
+    fraud_transactions: int
+    prior_alerts: int
+    prior_cases: int
+
+    # Top counterparties
+    top_counterparties: List[Counterparty]
+
+
+class NetworkNode(BaseModel):
+    """Entity reached by a k-hop expansion."""
+
+    entity: str
+    hops: int
+
+
+class EntityNetwork(BaseModel):
+    """K-hop counterparty network around an entity."""
+
+    entity_id: str
+    hops: int
+    direction: str
+    min_step: Optional[int] = None
+    max_step: Optional[int] = None
+    fan_in: int
+    fan_out: int
+    nodes: List[NetworkNode]
+    truncated: bool = False
+
+
+# API Response wrapper
+class EntityProfileResponse(BaseModel):
+    """Standard API response for an entity profile."""
+
+    status: str = "success"
+    data: EntityProfile
+    metadata: dict = {"request_id": None, "timestamp": None, "version": "v1"}
+
+
+class EntityNetworkResponse(BaseModel):
+    """Standard API response for an entity network."""
+
+    status: str = "success"
+    data: EntityNetwork
+    metadata: dict = {"request_id": None, "timestamp": None, "version": "v1"}
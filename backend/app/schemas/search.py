@@ -0,0 +1,65 @@
+"""Pydantic schemas for Search API responses."""
+
+from typing import List
+
+from pydantic import BaseModel
+
+from app.schemas.alert import AlertList
+
+
+class AlertNoteMatch(BaseModel):
+    """Alert whose notes match a full-text query."""
+
+    alert: AlertList
+    score: float  # Higher is more relevant
+    snippet: str  # Notes excerpt with matched terms in [brackets]
+
+
+class AccountMatch(BaseModel):
+    """Account whose name contains the query."""
+
+    name: str
+    match: str  # exact, prefix or substring
+    is_merchant: bool
+    total_transactions: int = 0
+    alert_count: int = 0
+    fraud_count: int = 0
+
+
+class PaginatedAlertNoteMatches(BaseModel):
+    """Paginated alert note search results."""
+
+    items: List[AlertNoteMatch]
+    total: int
+    page: int
+    page_size: int
+    total_pages: int
+    truncated: bool = False  # total stopped at SEARCH_MAX_MATCHES
+
+
+class PaginatedAccountMatches(BaseModel):
+    """Paginated account name search results."""
+
+    items: List[AccountMatch]
+    total: int
+    page: int
+    page_size: int
+    total_pages: int
+    truncated: bool = False  # total stopped at SEARCH_MAX_MATCHES
+
+
+# API Response wrapper
+class AlertSearchResponse(BaseModel):
+    """Standard API response for an alert note search."""
+
+    status: str = "success"
+    data: PaginatedAlertNoteMatches
+    metadata: dict = {"request_id": None, "timestamp": None, "version": "v1"}
+
+
+class AccountSearchResponse(BaseModel):
+    """Standard API response for an account name search."""
+
+    status: str = "success"
+    data: PaginatedAccountMatches
+    metadata: dict = {"request_id": None, "timestamp": None, "version": "v1"}
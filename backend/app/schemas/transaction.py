@@ -0,0 +1,114 @@
+"""Pydantic schemas for Transaction API requests and responses."""
+
+from datetime import datetime
+from typing import Dict, List, Optional
+from uuid import UUID
+
+from pydantic import BaseModel, Field, field_validator
+
+from app.models.transaction import TransactionType
+
+
+# Request schemas
+class TransactionCreate(BaseModel):
+    """Schema for ingesting a single transaction."""
+
+    eventId: Optional[str] = None
+    step: int = Field(..., ge=1)
+    type: TransactionType
+    amount: float = Field(..., ge=0)
+    nameOrig: str = Field(..., min_length=1, max_length=100)
+    nameDest: str = Field(..., min_length=1, max_length=100)
+    timestamp: Optional[datetime] = None
+
+    # Labels (present when replaying historical data)
+    isFraud: bool = False
+    isFlaggedFraud: bool = False
+
+    @field_validator("type", mode="before")
+    @classmethod
+    def normalize_type(cls, v):
+        """Accept both CASH-OUT and CASH_OUT spellings."""
+        if isinstance(v, str):
+            return v.upper().replace("-", "_")
+        return v
+
+
+class TransactionBatchCreate(BaseModel):
+    """Schema for ingesting a micro-batch of transactions."""
+
+    transactions: List[TransactionCreate] = Field(..., min_length=1, max_length=1000)
+
+
+# Response schemas
+class TransactionIngested(BaseModel):
+    """Result of ingesting transactions."""
+
+    ingested: int
+    ids: List[UUID]
+    features: List[Dict[str, float]] = []  # Sliding-window features, aligned with ids
+    scores: List[float] = []  # Champion model scores, aligned with ids
+    alerts_created: int = 0
+    alerts_merged: int = 0  # Existing alerts this batch was coalesced into
+
+
+class TransactionIngestResponse(BaseModel):
+    """Standard API response for transaction ingestion."""
+
+    status: str = "success"
+    data: TransactionIngested
+    metadata: dict = {"request_id": None, "timestamp": None, "version": "v1"}
+
+
+class RejectedRow(BaseModel):
+    """A file row rejected by validation (the header is line 1)."""
+
+    line: int
+    reason: str
+
+    class Config:
+        from_attributes = True
+
+
+class BatchScoringStage(BaseModel):
+    """Work and wait time of one batch scoring stage."""
+
+    name: str
+    chunks: int
+    rows: int
+    busy_seconds: float
+    starved_seconds: float  # Waiting for the previous stage
+    blocked_seconds: float  # Waiting for room in the next stage's queue
+    rows_per_second: float
+
+    class Config:
+        from_attributes = True
+
+
+class BatchScoringResult(BaseModel):
+    """Result of scoring a transaction file."""
+
+    rows_read: int
+    rows_stored: int
+    rows_rejected: int
+    errors: List[RejectedRow] = []  # First rejected rows with reasons
+    alerts_created: int = 0
+    alerts_merged: int = 0
+    model_version: str
+    elapsed_seconds: float
+    stages: List[BatchScoringStage]
+    bottleneck: str  # Stage with the most busy time
+    last_line_stored: int  # Last file line committed (the header is line 1)
+    resume_line: int  # First line not yet stored; start_line to carry on after a failure
+
+    class Config:
+        from_attributes = True
+        protected_namespaces = ()  # Allow the model_version field
+
+
+class BatchScoringResponse(BaseModel):
+    """Standard API response for batch scoring."""
+
+    status: str = "success"
+    data: BatchScoringResult
+    metadata: dict = {"request_id": None, "timestamp": None, "version": "v1"}
@@ -1,8 +1,9 @@
 """Service layer for business logic."""
 
 # Import services here as they are created
-# from app.services.alert_service import AlertService
+from app.services.alert_service import AlertService
 # from app.services.case_service import CaseService
 # from app.services.entity_service import EntityService
+from app.services.entity_dictionary import EntityDictionary, get_entity_dictionary
 
-__all__ = []
+__all__ = ["AlertService", "EntityDictionary", "get_entity_dictionary"]
@@ -0,0 +1,200 @@
+"""Alert aggregator - coalesces bursts of alerts per sender into one parent alert."""
+
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Dict, Iterable, List, NamedTuple, Optional, Sequence, Tuple
+from uuid import UUID
+
+from sqlalchemy import or_
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.models.alert import Alert, AlertPriority, AlertStatus, RiskBand, alert_transactions
+from app.models.transaction import Transaction
+from app.utils.alert_payload import encode_rules
+
+PRIORITY_RANK = {priority: rank for rank, priority in enumerate(AlertPriority)}
+
+
+class AlertCandidate(NamedTuple):
+    """A transaction that should raise (or join) an alert."""
+
+    transaction: Transaction
+    ml_score: float
+    ml_risk_band: RiskBand
+    priority: AlertPriority
+    rules_triggered: List[dict]
+    ml_reason_codes: List[str] = []
+    shap_values: Optional[List[dict]] = None
+    model_version: Optional[str] = None
+
+
+class _Window(NamedTuple):
+    alert_id: UUID
+    first_step: int
+
+
+class AlertAggregator:
+    """
+    Coalesces alerts for the same ``nameOrig`` within a step window.
+
+    The first alert of a burst becomes the parent; later candidates from
+    the same sender whose step falls within ``window_steps`` of the
+    parent's first step are merged into it (rules unioned, max
+    ``ml_score``, highest priority) and linked through
+    ``alert_transactions`` instead of creating new rows. Closed parents
+    are never reopened.
+
+    The in-memory index maps each sender to its open parent so merges are
+    a primary-key lookup. Senders missing from it (evicted, restarted or
+    handled by another worker) fall back to one batched query on
+    ``alerts.name_orig``, so the index is an accelerator, not the source
+    of truth.
+    """
+
+    def __init__(self, window_steps: int = 24, max_accounts: int = 100_000):
+        self.window_steps = window_steps
+        self.max_accounts = max_accounts
+        self._index: "OrderedDict[str, _Window]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def add(
+        self,
+        db: Session,
+        candidates: Sequence[AlertCandidate],
+    ) -> Tuple[List[Alert], List[Alert]]:
+        """
+        Create or merge alerts for step-ordered candidates.
+
+        Flushes but does not commit; the caller owns the transaction.
+
+        Returns:
+            Tuple[List[Alert], List[Alert]]: (new alerts, merged parents)
+        """
+        if not candidates:
+            return [], []
+
+        parents = self._open_parents(db, candidates) if self.window_steps > 0 else {}
+        created: List[Alert] = []
+        merged: Dict[str, Alert] = {}
+        links: List[Tuple[Alert, Transaction]] = []
+
+        for candidate in candidates:
+            tx = candidate.transaction
+            parent = parents.get(tx.nameOrig)
+            if parent is not None and 0 <= tx.step - parent.first_step < self.window_steps:
+                self._merge(parent, candidate)
+                merged.setdefault(tx.nameOrig, parent)
+            else:
+                parent = self._new_alert(candidate)
+                db.add(parent)
+                parents[tx.nameOrig] = parent
+                created.append(parent)
+            links.append((parent, tx))
+
+        db.flush()
+        db.execute(
+            alert_transactions.insert(),
+            [{"alert_id": alert.id, "transaction_id": tx.id} for alert, tx in links],
+        )
+        self._remember(parents.values(), max(c.transaction.step for c in candidates))
+
+        new_ids = {id(alert) for alert in created}
+        return created, [alert for alert in merged.values() if id(alert) not in new_ids]
+
+    def _open_parents(self, db: Session, candidates: Sequence[AlertCandidate]) -> Dict[str, Alert]:
+        """Load the open parent alert of every sender in one query."""
+        senders = {c.transaction.nameOrig for c in candidates}
+        with self._lock:
+            known = {name: self._index[name].alert_id for name in senders if name in self._index}
+        unknown = senders - known.keys()
+
+        conditions = []
+        if known:
+            conditions.append(Alert.id.in_(known.values()))
+        if unknown:
+            conditions.append(Alert.name_orig.in_(unknown))
+
+        oldest = min(c.transaction.step for c in candidates) - self.window_steps
+        rows = (
+            db.query(Alert)
+            .filter(or_(*conditions))
+            .filter(Alert.status != AlertStatus.CLOSED, Alert.first_step > oldest)
+            .order_by(Alert.first_step)
+            .all()
+        )
+        # Latest burst per sender wins
+        return {alert.name_orig: alert for alert in rows}
+
+    @staticmethod
+    def _new_alert(candidate: AlertCandidate) -> Alert:
+        tx = candidate.transaction
+        return Alert(
+            transaction=tx,
+            status=AlertStatus.NEW,
+            priority=candidate.priority,
+            ml_score=candidate.ml_score,
+            ml_risk_band=candidate.ml_risk_band,
+            ml_reason_codes=list(candidate.ml_reason_codes),
+            shap_values=candidate.shap_values,
+            model_version=candidate.model_version,
+            rules_triggered=list(candidate.rules_triggered),
+            name_orig=tx.nameOrig,
+            first_step=tx.step,
+            last_step=tx.step,
+            transaction_count=1,
+        )
+
+    @staticmethod
+    def _merge(parent: Alert, candidate: AlertCandidate) -> None:
+        parent.rules_mask = (parent.rules_mask or 0) | encode_rules(candidate.rules_triggered)
+        if candidate.ml_reason_codes:
+            parent.ml_reason_codes = parent.ml_reason_codes + list(candidate.ml_reason_codes)
+        if candidate.ml_score > parent.ml_score:
+            parent.ml_score = candidate.ml_score
+            parent.ml_risk_band = candidate.ml_risk_band
+            parent.model_version = candidate.model_version
+            if candidate.shap_values is not None:
+                parent.shap_values = candidate.shap_values
+        if PRIORITY_RANK[candidate.priority] > PRIORITY_RANK[parent.priority]:
+            parent.priority = candidate.priority
+        parent.last_step = max(parent.last_step or 0, candidate.transaction.step)
+        parent.transaction_count = (parent.transaction_count or 1) + 1
+
+    def _remember(self, parents, step: int) -> None:
+        """Index parents by sender and evict windows that have closed."""
+        with self._lock:
+            for alert in parents:
+                self._index[alert.name_orig] = _Window(alert.id, alert.first_step)
+                self._index.move_to_end(alert.name_orig)
+
+            # Oldest updates sit at the front; stop at the first live window
+            while self._index:
+                name, window = next(iter(self._index.items()))
+                if len(self._index) <= self.max_accounts and step - window.first_step < self.window_steps:
+                    break
+                del self._index[name]
+
+    def forget(self, names: Iterable[str]) -> None:
+        """Forget the windows of senders ``names`` (e.g. after their batch rolled back)."""
+        with self._lock:
+            for name in names:
+                self._index.pop(name, None)
+
+    def clear(self) -> None:
+        """Forget all windows."""
+        with self._lock:
+            self._index.clear()
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+
+@lru_cache()
+def get_alert_aggregator() -> AlertAggregator:
+    """Get the process-wide alert aggregator."""
+    return AlertAggregator(
+        window_steps=settings.ALERT_AGGREGATION_WINDOW_STEPS,
+        max_accounts=settings.ALERT_AGGREGATION_MAX_ACCOUNTS,
+    )
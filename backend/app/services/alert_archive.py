@@ -0,0 +1,223 @@
+"""Alert archive - moves closed alerts to cold storage and back."""
+
+import logging
+import threading
+from datetime import datetime, timedelta
+from functools import lru_cache
+from typing import Callable, Dict, List, Optional, Sequence
+from uuid import UUID
+
+from sqlalchemy import delete, exists, insert, select
+from sqlalchemy.orm import Session, joinedload
+
+from app.config import settings
+from app.models.alert import Alert, AlertStatus, alert_transactions
+from app.models.archived_alert import ArchivedAlert
+from app.models.case import case_alerts
+from app.utils.metrics import ALERT_ARCHIVE_MOVES
+
+logger = logging.getLogger("app.archive")
+
+
+def archive_closed_alerts(
+    db: Session,
+    older_than: datetime,
+    batch_size: int = 1000,
+) -> int:
+    """
+    Move alerts closed before ``older_than`` from ``alerts`` to ``alerts_archive``.
+
+    Closing time is ``updated_at`` (the last change to a closed alert).
+    Alerts attached to a case stay hot so case views keep working. Each
+    batch is copied, unlinked and deleted in one committed transaction.
+
+    Returns:
+        int: Number of alerts archived
+    """
+    archived = 0
+    while True:
+        alerts = db.scalars(
+            select(Alert)
+            .where(
+                Alert.status == AlertStatus.CLOSED,
+                Alert.updated_at < older_than,
+                ~exists().where(case_alerts.c.alert_id == Alert.id),
+            )
+            .order_by(Alert.updated_at, Alert.id)
+            .limit(batch_size)
+        ).all()
+        if not alerts:
+            return archived
+
+        ids = [alert.id for alert in alerts]
+        linked: Dict[UUID, List[UUID]] = {alert_id: [] for alert_id in ids}
+        for alert_id, tx_id in db.execute(
+            select(alert_transactions.c.alert_id, alert_transactions.c.transaction_id)
+            .where(alert_transactions.c.alert_id.in_(ids))
+        ):
+            linked[alert_id].append(tx_id)
+
+        now = datetime.utcnow()
+        db.execute(insert(ArchivedAlert), [
+            {
+                "id": alert.id,
+                "transaction_id": alert.transaction_id,
+                "status": alert.status,
+                "priority": alert.priority,
+                "ml_score": alert.ml_score,
+                "ml_risk_band": alert.ml_risk_band,
+                "name_orig": alert.name_orig,
+                "assigned_to": alert.assigned_to,
+                "created_at": alert.created_at,
+                "updated_at": alert.updated_at,
+                "archived_at": now,
+                "payload": ArchivedAlert.pack(alert, linked[alert.id]),
+            }
+            for alert in alerts
+        ])
+        db.execute(delete(alert_transactions).where(alert_transactions.c.alert_id.in_(ids)))
+        db.execute(delete(Alert).where(Alert.id.in_(ids)).execution_options(synchronize_session=False))
+        db.commit()
+        for alert in alerts:
+            db.expunge(alert)
+
+        archived += len(ids)
+        ALERT_ARCHIVE_MOVES.labels("archived").inc(len(ids))
+        if len(ids) < batch_size:
+            return archived
+
+
+def get_archived_alerts(db: Session, alert_ids: Sequence[UUID]) -> Dict[UUID, ArchivedAlert]:
+    """Archived alerts by id, with their transaction loaded."""
+    if not alert_ids:
+        return {}
+    rows = (
+        db.query(ArchivedAlert)
+        .options(joinedload(ArchivedAlert.transaction))
+        .filter(ArchivedAlert.id.in_(alert_ids))
+        .all()
+    )
+    return {row.id: row for row in rows}
+
+
+def restore_alerts(db: Session, alert_ids: Sequence[UUID]) -> int:
+    """
+    Move archived alerts back to the hot table (e.g. before they are edited).
+
+    Flushes but does not commit; restored alerts are not published as new.
+
+    Returns:
+        int: Number of alerts restored
+    """
+    archived = db.query(ArchivedAlert).filter(ArchivedAlert.id.in_(alert_ids)).all() if alert_ids else []
+    if not archived:
+        return 0
+
+    db.execute(insert(Alert), [row.alert_values() for row in archived])
+    links = [
+        {"alert_id": row.id, "transaction_id": tx_id}
+        for row in archived
+        for tx_id in row.linked_transaction_ids
+    ]
+    if links:
+        db.execute(alert_transactions.insert(), links)
+    db.execute(
+        delete(ArchivedAlert)
+        .where(ArchivedAlert.id.in_([row.id for row in archived]))
+        .execution_options(synchronize_session=False)
+    )
+    for row in archived:
+        db.expunge(row)
+
+    ALERT_ARCHIVE_MOVES.labels("restored").inc(len(archived))
+    return len(archived)
+
+
+class AlertArchiver:
+    """
+    Periodically archives alerts closed more than ``after_days`` ago.
+
+    Runs in a background thread of one worker (the first shard); the
+    archive is shared through the database, so other workers read it
+    without coordination.
+    """
+
+    def __init__(self, session_factory: Callable[[], Session], after_days: int = 90, batch_size: int = 1000):
+        self.session_factory = session_factory
+        self.after_days = after_days
+        self.batch_size = batch_size
+        self._thread: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+        self._run_lock = threading.Lock()
+        self.last_run: Optional[datetime] = None
+        self.last_archived = 0
+        self.last_error: Optional[str] = None
+
+    @property
+    def enabled(self) -> bool:
+        return self.after_days > 0
+
+    def run_once(self, now: Optional[datetime] = None) -> int:
+        """Archive everything currently due; returns the number of alerts moved."""
+        if not self.enabled:
+            return 0
+        cutoff = (now or datetime.utcnow()) - timedelta(days=self.after_days)
+        with self._run_lock:
+            db = self.session_factory()
+            try:
+                archived = archive_closed_alerts(db, cutoff, self.batch_size)
+            except Exception as e:
+                db.rollback()
+                self.last_error = f"{type(e).__name__}: {e}"
+                raise
+            finally:
+                db.close()
+            self.last_run = datetime.utcnow()
+            self.last_archived = archived
+            self.last_error = None
+        if archived:
+            logger.info("Archived %d closed alerts", archived, extra={"cutoff": cutoff.isoformat()})
+        return archived
+
+    def start(self, interval_seconds: float) -> None:
+        """Run every ``interval_seconds`` in a background thread (no-op if disabled or <= 0)."""
+        if not self.enabled or interval_seconds <= 0 or self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, args=(interval_seconds,), name="alert-archiver", daemon=True)
+        self._thread.start()
+
+    def _run(self, interval_seconds: float) -> None:
+        while not self._stop.wait(interval_seconds):
+            try:
+                self.run_once()
+            except Exception:
+                logger.exception("Alert archival failed")
+
+    def stop(self) -> None:
+        """Stop the background thread."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def status(self) -> Dict:
+        return {
+            "after_days": self.after_days,
+            "scheduled": self._thread is not None,
+            "last_run": self.last_run.isoformat() if self.last_run else None,
+            "last_archived": self.last_archived,
+            "last_error": self.last_error,
+        }
+
+
+@lru_cache()
+def get_alert_archiver() -> AlertArchiver:
+    """Get the process-wide alert archiver."""
+    from app.database import SessionLocal
+
+    return AlertArchiver(
+        SessionLocal,
+        after_days=settings.ALERT_ARCHIVE_AFTER_DAYS,
+        batch_size=settings.ALERT_ARCHIVE_BATCH_SIZE,
+    )
@@ -0,0 +1,203 @@
+"""
+Pub/sub broker pushing new alerts to live subscribers.
+
+Each worker holds its own broker and subscribers. Alerts committed on
+one worker are published to its broker and, with WORKERS > 1, forwarded
+to every other worker's broker over the shard sockets
+(``ShardRouter.publish_alerts``), so a client sees every alert whichever
+worker it is connected to.
+"""
+
+import asyncio
+import threading
+from collections import deque
+from functools import lru_cache
+from typing import Any, Deque, Dict, List, Optional
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.models.alert import Alert
+from app.schemas.alert import AlertFilter
+
+_PENDING_KEY = "pending_alert_events"
+
+
+def alert_event(alert: Alert) -> Dict[str, Any]:
+    """Build the JSON payload pushed for a new alert."""
+    return {
+        "event": "alert.created",
+        "id": str(alert.id),
+        "transaction_id": str(alert.transaction_id),
+        "status": alert.status.value if alert.status else None,
+        "priority": alert.priority.value if alert.priority else None,
+        "ml_score": alert.ml_score,
+        "ml_risk_band": alert.ml_risk_band.value if alert.ml_risk_band else None,
+        "model_version": alert.model_version,
+        "assigned_to": alert.assigned_to,
+        "rules_count": alert.rules_count,
+        "created_at": alert.created_at.isoformat() if alert.created_at else None,
+    }
+
+
+def matches(filters: Optional[AlertFilter], payload: Dict[str, Any]) -> bool:
+    """Evaluate subscriber filters (``AlertFilter`` semantics) against an event."""
+    if filters is None:
+        return True
+    if filters.status and payload["status"] not in {s.value for s in filters.status}:
+        return False
+    if filters.priority and payload["priority"] not in {p.value for p in filters.priority}:
+        return False
+    if filters.risk_band and payload["ml_risk_band"] not in {r.value for r in filters.risk_band}:
+        return False
+    if filters.assigned_to is not None and payload["assigned_to"] != filters.assigned_to:
+        return False
+    if filters.min_score is not None and payload["ml_score"] < filters.min_score:
+        return False
+    if filters.max_score is not None and payload["ml_score"] > filters.max_score:
+        return False
+    return True
+
+
+class Subscription:
+    """
+    One live client with a bounded buffer.
+
+    When the client falls behind, the oldest buffered events are dropped
+    and counted; the next delivered event carries ``dropped`` so the
+    client knows to refetch the queue instead of stalling other clients.
+    """
+
+    def __init__(self, filters: Optional[AlertFilter], maxsize: int, loop: asyncio.AbstractEventLoop):
+        self.filters = filters
+        self.maxsize = maxsize
+        self.dropped = 0
+        self.delivered = 0
+        self._loop = loop
+        self._buffer: Deque[Dict[str, Any]] = deque()
+        self._ready = asyncio.Event()
+        self._pending_dropped = 0
+
+    def _push(self, payload: Dict[str, Any]) -> None:
+        """Buffer an event (runs on the subscriber's event loop)."""
+        if len(self._buffer) >= self.maxsize:
+            self._buffer.popleft()
+            self.dropped += 1
+            self._pending_dropped += 1
+        self._buffer.append(payload)
+        self._ready.set()
+
+    def offer(self, payload: Dict[str, Any]) -> None:
+        """Hand an event to this subscription from any thread."""
+        try:
+            self._loop.call_soon_threadsafe(self._push, payload)
+        except RuntimeError:
+            # Subscriber's loop is closed; it will be unsubscribed on exit
+            pass
+
+    async def get(self, timeout: Optional[float] = None) -> Optional[Dict[str, Any]]:
+        """
+        Wait for the next event.
+
+        Returns:
+            Optional[dict]: Event payload, or None on timeout
+        """
+        if not self._buffer:
+            self._ready.clear()
+            try:
+                await asyncio.wait_for(self._ready.wait(), timeout)
+            except asyncio.TimeoutError:
+                return None
+        payload = self._buffer.popleft()
+        if self._pending_dropped:
+            payload = {**payload, "dropped": self._pending_dropped}
+            self._pending_dropped = 0
+        self.delivered += 1
+        return payload
+
+
+class AlertBroker:
+    """Fan-out of alert events to subscribers with server-side filtering."""
+
+    def __init__(self, buffer_size: int = 100, max_subscribers: int = 500):
+        self.buffer_size = buffer_size
+        self.max_subscribers = max_subscribers
+        self._subscribers: List[Subscription] = []
+        self._lock = threading.Lock()
+        self.published = 0
+
+    @property
+    def subscriber_count(self) -> int:
+        return len(self._subscribers)
+
+    def subscribe(self, filters: Optional[AlertFilter] = None) -> Subscription:
+        """
+        Register a subscriber on the running event loop.
+
+        Raises:
+            RuntimeError: If the subscriber limit is reached
+        """
+        subscription = Subscription(filters, self.buffer_size, asyncio.get_running_loop())
+        with self._lock:
+            if len(self._subscribers) >= self.max_subscribers:
+                raise RuntimeError("Too many alert stream subscribers")
+            self._subscribers = self._subscribers + [subscription]
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        """Remove a subscriber."""
+        with self._lock:
+            self._subscribers = [s for s in self._subscribers if s is not subscription]
+
+    def publish(self, payload: Dict[str, Any]) -> int:
+        """
+        Publish an event to matching subscribers (never blocks).
+
+        Returns:
+            int: Number of subscribers the event was offered to
+        """
+        self.published += 1
+        delivered = 0
+        for subscription in self._subscribers:  # copy-on-write list, no lock needed
+            if matches(subscription.filters, payload):
+                subscription.offer(payload)
+                delivered += 1
+        return delivered
+
+
+@lru_cache()
+def get_alert_broker() -> AlertBroker:
+    """Get the process-wide alert broker."""
+    return AlertBroker(
+        buffer_size=settings.STREAM_CLIENT_BUFFER_SIZE,
+        max_subscribers=settings.STREAM_MAX_SUBSCRIBERS,
+    )
+
+
+# Session hooks: collect new alerts at flush, publish (on every worker) only once committed
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_new_alerts(session: Session, flush_context) -> None:
+    new_alerts = [obj for obj in session.new if isinstance(obj, Alert)]
+    if new_alerts:
+        session.info.setdefault(_PENDING_KEY, []).extend(alert_event(a) for a in new_alerts)
+
+
+@event.listens_for(Session, "after_commit")
+def _publish_new_alerts(session: Session) -> None:
+    pending = session.info.pop(_PENDING_KEY, None)
+    if pending:
+        broker = get_alert_broker()
+        for payload in pending:
+            broker.publish(payload)
+        if settings.WORKERS > 1:
+            from app.services.sharding import get_shard_router  # sharding imports this module
+
+            get_shard_router().publish_alerts(pending)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_new_alerts(session: Session) -> None:
+    session.info.pop(_PENDING_KEY, None)
@@ -0,0 +1,221 @@
+"""Alert counters - dashboard counts maintained on write, with reconciliation."""
+
+import logging
+from collections import Counter
+from typing import Dict, Iterable, List, Sequence, Tuple
+from uuid import UUID
+
+from sqlalchemy import delete, event, func, inspect, select, text
+from sqlalchemy.engine import Connection
+from sqlalchemy.orm import Session
+
+from app.models.alert import Alert, AlertPriority, AlertStatus, RiskBand
+from app.models.alert_counter import AlertCounter
+from app.models.archived_alert import ArchivedAlert
+
+logger = logging.getLogger("app.counters")
+
+# Dashboard dimension -> Alert attribute
+DIMENSIONS = {
+    "status": "status",
+    "priority": "priority",
+    "risk_band": "ml_risk_band",
+    "assignee": "assigned_to",
+}
+
+# Enum dimensions are always reported in full (zero counts included)
+DIMENSION_VALUES = {
+    "status": [status.value for status in AlertStatus],
+    "priority": [priority.value for priority in AlertPriority],
+    "risk_band": [band.value for band in RiskBand],
+}
+
+UNASSIGNED = ""
+
+_PENDING_KEY = "alert_counter_deletes"
+
+Delta = Counter  # (dimension, value) -> change in count
+
+
+def counter_value(value) -> str:
+    """Stored form of a dimension value (enum value, "" for no assignee)."""
+    if value is None:
+        return UNASSIGNED
+    return getattr(value, "value", value)
+
+
+def apply_deltas(conn: Connection, deltas: Delta) -> None:
+    """Add ``deltas`` to the counters in the caller's transaction (one upsert)."""
+    rows = [
+        {"dimension": dimension, "value": value, "count": change}
+        for (dimension, value), change in deltas.items()
+        if change
+    ]
+    if not rows:
+        return
+    if conn.dialect.name == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert
+    else:
+        from sqlalchemy.dialects.sqlite import insert
+
+    stmt = insert(AlertCounter.__table__)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=["dimension", "value"],
+        set_={"count": AlertCounter.__table__.c.count + stmt.excluded["count"]},
+    )
+    conn.execute(stmt, rows)
+
+
+def _alert_values(alert: Alert) -> Iterable[Tuple[str, str]]:
+    for dimension, attr in DIMENSIONS.items():
+        yield dimension, counter_value(getattr(alert, attr))
+
+
+class AlertCounters:
+    """Dashboard counters over all alerts (hot and archived)."""
+
+    @staticmethod
+    def summary(db: Session) -> Dict:
+        """
+        Alert counts by status, priority, risk band and assignee.
+
+        Reads the counters table only, so the cost does not grow with
+        the number of alerts.
+        """
+        stored: Dict[str, Dict[str, int]] = {dimension: {} for dimension in DIMENSIONS}
+        for dimension, value, count in db.execute(
+            select(AlertCounter.dimension, AlertCounter.value, AlertCounter.count)
+        ):
+            if dimension in stored:
+                stored[dimension][value] = count
+
+        by_assignee = {name: count for name, count in stored["assignee"].items() if count and name != UNASSIGNED}
+        return {
+            "total": sum(stored["status"].values()),
+            "by_status": {value: stored["status"].get(value, 0) for value in DIMENSION_VALUES["status"]},
+            "by_priority": {value: stored["priority"].get(value, 0) for value in DIMENSION_VALUES["priority"]},
+            "by_risk_band": {value: stored["risk_band"].get(value, 0) for value in DIMENSION_VALUES["risk_band"]},
+            "by_assignee": dict(sorted(by_assignee.items(), key=lambda item: (-item[1], item[0]))),
+            "unassigned": stored["assignee"].get(UNASSIGNED, 0),
+        }
+
+    @staticmethod
+    def record_bulk_update(db: Session, alert_ids: Sequence[UUID], update_data: Dict) -> None:
+        """
+        Apply the counter changes of a bulk UPDATE (which bypasses flush events).
+
+        Call in the same transaction, before the UPDATE is executed.
+        """
+        deltas: Delta = Counter()
+        for dimension, attr in DIMENSIONS.items():
+            if attr not in update_data:
+                continue
+            new_value = counter_value(update_data[attr])
+            column = getattr(Alert, attr)
+            for old, count in db.execute(
+                select(column, func.count()).where(Alert.id.in_(alert_ids)).group_by(column)
+            ):
+                deltas[(dimension, counter_value(old))] -= count
+                deltas[(dimension, new_value)] += count
+        apply_deltas(db.connection(), deltas)
+
+    @staticmethod
+    def actual_counts(db: Session) -> Delta:
+        """Recount every dimension from the alert tables (hot and archived)."""
+        counts: Delta = Counter()
+        for model in (Alert, ArchivedAlert):
+            for dimension, attr in DIMENSIONS.items():
+                column = getattr(model, attr)
+                for value, count in db.execute(select(column, func.count()).group_by(column)):
+                    counts[(dimension, counter_value(value))] += count
+        return counts
+
+    @staticmethod
+    def reconcile(db: Session) -> Dict[str, Dict[str, int]]:
+        """
+        Recount alerts and overwrite the counters, committing the result.
+
+        On PostgreSQL the counters table is locked for the recount, so
+        writers that raise or change alerts meanwhile wait and nothing is
+        lost. Elsewhere, changes committed during the recount may leave
+        drift that the next run corrects.
+
+        Returns:
+            Dict[str, Dict[str, int]]: Drift found (stored minus actual) per dimension
+        """
+        if db.get_bind().dialect.name == "postgresql":
+            db.execute(text("LOCK TABLE alert_counters IN EXCLUSIVE MODE"))
+
+        stored: Delta = Counter({
+            (dimension, value): count
+            for dimension, value, count in db.execute(
+                select(AlertCounter.dimension, AlertCounter.value, AlertCounter.count)
+            )
+        })
+        actual = AlertCounters.actual_counts(db)
+
+        drift: Dict[str, Dict[str, int]] = {}
+        for key in stored.keys() | actual.keys():
+            difference = stored[key] - actual[key]
+            if difference:
+                dimension, value = key
+                drift.setdefault(dimension, {})[value] = difference
+
+        if drift:
+            rows = [
+                {"dimension": dimension, "value": value, "count": count}
+                for (dimension, value), count in actual.items()
+                if count
+            ]
+            db.execute(delete(AlertCounter))
+            if rows:
+                db.execute(AlertCounter.__table__.insert(), rows)
+            logger.warning("Alert counters drifted; reconciled", extra={"drift": drift})
+        db.commit()
+        return drift
+
+
+# Session hooks: counter changes are written in the flush that changes the alerts
+
+
+@event.listens_for(Session, "before_flush")
+def _collect_deleted_alerts(session: Session, flush_context, instances) -> None:
+    # Values of deleted alerts must be read while their rows still exist
+    deleted: List[Tuple[str, str]] = [
+        key for obj in session.deleted if isinstance(obj, Alert) for key in _alert_values(obj)
+    ]
+    if deleted:
+        session.info.setdefault(_PENDING_KEY, []).extend(deleted)
+
+
+@event.listens_for(Session, "after_flush")
+def _count_alert_changes(session: Session, flush_context) -> None:
+    deltas: Delta = Counter()
+    for key in session.info.pop(_PENDING_KEY, ()):
+        deltas[key] -= 1
+
+    for obj in session.new:
+        if isinstance(obj, Alert):
+            for key in _alert_values(obj):
+                deltas[key] += 1
+
+    for obj in session.dirty:
+        if not isinstance(obj, Alert):
+            continue
+        state = inspect(obj)
+        for dimension, attr in DIMENSIONS.items():
+            history = state.attrs[attr].history
+            if not history.added:
+                continue
+            # active_history loads the old value; an old NULL shows no deleted entry
+            old = history.deleted[0] if history.deleted else None
+            deltas[(dimension, counter_value(old))] -= 1
+            deltas[(dimension, counter_value(history.added[0]))] += 1
+
+    if deltas:
+        apply_deltas(session.connection(), deltas)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_deleted_alerts(session: Session) -> None:
+    session.info.pop(_PENDING_KEY, None)
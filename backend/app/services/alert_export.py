@@ -0,0 +1,287 @@
+"""Alert export - streams alerts with their transactions as CSV or JSON Lines.
+
+Rows are read through a server-side cursor (``yield_per``) and encoded
+as they arrive, so memory stays constant whatever the size of the range.
+Every alert carries a ``cursor``; passing the last one received resumes
+an interrupted export right after that alert.
+"""
+
+import base64
+import csv
+import io
+import json
+import zlib
+from datetime import datetime
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, Optional, Sequence, Tuple
+from uuid import UUID
+
+from sqlalchemy import and_, literal, or_, select, union_all
+from sqlalchemy.orm import Session
+
+from app.models.alert import Alert, alert_transactions
+from app.models.archived_alert import ArchivedAlert
+from app.models.transaction import Transaction
+from app.utils.alert_payload import decode_reason_codes, decode_rules
+
+EXPORT_FORMATS = ("csv", "jsonl")
+
+ALERT_FIELDS = [
+    "alert_id", "created_at", "updated_at", "status", "priority", "ml_score", "ml_risk_band",
+    "model_version", "ml_reason_codes", "rules_triggered", "assigned_to", "notes", "archived",
+    "transaction_count", "cursor",
+]
+TRANSACTION_FIELDS = [
+    "transaction_id", "step", "type", "amount", "nameOrig", "nameDest",
+    "oldbalanceOrg", "newbalanceOrig", "oldbalanceDest", "newbalanceDest", "isFraud", "isFlaggedFraud",
+]
+
+# CSV has one row per (alert, transaction); list-valued alert fields are joined
+CSV_FIELDS = ALERT_FIELDS + TRANSACTION_FIELDS
+CSV_LIST_SEPARATOR = ";"
+
+# Encoded text is flushed to the client in chunks of about this size
+FLUSH_BYTES = 64 * 1024
+
+# Stay below SQLite's bound-parameter limit for IN (...) lookups
+_LOOKUP_CHUNK_SIZE = 500
+
+Cursor = Tuple[datetime, UUID]
+
+# Columns read for hot alerts (the keys of ArchivedAlert.alert_values() used by _alert_record)
+_HOT_COLUMNS = (
+    Alert.id, Alert.transaction_id, Alert.status, Alert.priority, Alert.ml_score, Alert.ml_risk_band,
+    Alert.model_version, Alert.reason_code_ids, Alert.rules_mask, Alert.assigned_to, Alert.notes,
+    Alert.transaction_count, Alert.created_at, Alert.updated_at,
+)
+_TRANSACTION_COLUMNS = (
+    Transaction.id, Transaction.step, Transaction.type, Transaction.amount, Transaction.nameOrig,
+    Transaction.nameDest, Transaction.oldbalanceOrg, Transaction.newbalanceOrig, Transaction.oldbalanceDest,
+    Transaction.newbalanceDest, Transaction.isFraud, Transaction.isFlaggedFraud,
+)
+
+
+def encode_cursor(created_at: datetime, alert_id: UUID) -> str:
+    """Opaque resume token for the export position after this alert."""
+    return base64.urlsafe_b64encode(f"{created_at.isoformat()}|{alert_id.hex}".encode()).decode()
+
+
+def decode_cursor(token: str) -> Cursor:
+    """
+    Parse a resume token from :func:`encode_cursor`.
+
+    Raises:
+        ValueError: Malformed token
+    """
+    try:
+        created_at, alert_id = base64.urlsafe_b64decode(token.encode()).decode().split("|")
+        return datetime.fromisoformat(created_at), UUID(alert_id)
+    except (ValueError, UnicodeDecodeError) as e:
+        raise ValueError(f"Invalid export cursor: {token!r}") from e
+
+
+def _chunks(items: Sequence, size: int = _LOOKUP_CHUNK_SIZE) -> Iterator[Sequence]:
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
+
+def _transaction_record(tx) -> Dict[str, Any]:
+    return {
+        "transaction_id": str(tx.id),
+        "step": tx.step,
+        "type": tx.type.value,
+        "amount": float(tx.amount),
+        "nameOrig": tx.nameOrig,
+        "nameDest": tx.nameDest,
+        "oldbalanceOrg": float(tx.oldbalanceOrg) if tx.oldbalanceOrg is not None else None,
+        "newbalanceOrig": float(tx.newbalanceOrig) if tx.newbalanceOrig is not None else None,
+        "oldbalanceDest": float(tx.oldbalanceDest) if tx.oldbalanceDest is not None else None,
+        "newbalanceDest": float(tx.newbalanceDest) if tx.newbalanceDest is not None else None,
+        "isFraud": tx.isFraud,
+        "isFlaggedFraud": tx.isFlaggedFraud,
+    }
+
+
+def _alert_record(values: Mapping[str, Any], archived: bool, transactions: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Record from hot ``alerts`` column values (``ArchivedAlert.alert_values()`` for archived rows)."""
+    return {
+        "alert_id": str(values["id"]),
+        "created_at": values["created_at"].isoformat(),
+        "updated_at": values["updated_at"].isoformat(),
+        "status": values["status"].value,
+        "priority": values["priority"].value,
+        "ml_score": values["ml_score"],
+        "ml_risk_band": values["ml_risk_band"].value,
+        "model_version": values["model_version"],
+        "ml_reason_codes": decode_reason_codes(values["reason_code_ids"]),
+        "rules_triggered": [rule["rule_id"] for rule in decode_rules(values["rules_mask"])],
+        "assigned_to": values["assigned_to"],
+        "notes": values["notes"],
+        "archived": archived,
+        "transaction_count": values["transaction_count"] or 1,
+        "cursor": encode_cursor(values["created_at"], values["id"]),
+        "transactions": transactions,
+    }
+
+
+def _load_batch(db: Session, keys: Sequence) -> Iterator[Dict[str, Any]]:
+    """
+    Records for one batch of (id, archived) keys, in key order.
+
+    Hot alerts and transactions are read as plain rows (no ORM
+    instances); archived alerts are unpacked from their payload.
+    """
+    hot_ids = [key.id for key in keys if not key.archived]
+    archived_ids = [key.id for key in keys if key.archived]
+
+    alerts: Dict[UUID, Mapping[str, Any]] = {}
+    linked: Dict[UUID, List[UUID]] = {}
+    for chunk in _chunks(hot_ids):
+        alerts.update((row.id, row._mapping) for row in db.execute(select(*_HOT_COLUMNS).where(Alert.id.in_(chunk))))
+        for alert_id, tx_id in db.execute(
+            select(alert_transactions.c.alert_id, alert_transactions.c.transaction_id)
+            .where(alert_transactions.c.alert_id.in_(chunk))
+        ):
+            linked.setdefault(alert_id, []).append(tx_id)
+    for chunk in _chunks(archived_ids):
+        for row in db.scalars(select(ArchivedAlert).where(ArchivedAlert.id.in_(chunk))):
+            alerts[row.id] = row.alert_values()
+            linked[row.id] = row.linked_transaction_ids
+
+    # Primary transaction first, then the others coalesced into the alert
+    tx_ids: Dict[UUID, List[UUID]] = {}
+    for alert_id, values in alerts.items():
+        primary = values["transaction_id"]
+        tx_ids[alert_id] = [primary] + [tx_id for tx_id in linked.get(alert_id, []) if tx_id != primary]
+    wanted = list({tx_id for ids in tx_ids.values() for tx_id in ids})
+    transactions: Dict[UUID, Dict[str, Any]] = {}
+    for chunk in _chunks(wanted):
+        transactions.update(
+            (row.id, _transaction_record(row))
+            for row in db.execute(select(*_TRANSACTION_COLUMNS).where(Transaction.id.in_(chunk)))
+        )
+
+    for key in keys:
+        values = alerts.get(key.id)
+        if values is None:
+            continue  # Archived or restored between the cursor read and the lookup
+        records = [transactions[tx_id] for tx_id in tx_ids[key.id] if tx_id in transactions]
+        yield _alert_record(values, key.archived, records)
+
+
+def _export_conditions(model, created_from: Optional[datetime], created_to: Optional[datetime], after: Optional[Cursor]):
+    """Date range and resume position on one alert table (applied inside each half of the union)."""
+    conditions = []
+    if created_from is not None:
+        conditions.append(model.created_at >= created_from)
+    if created_to is not None:
+        conditions.append(model.created_at < created_to)
+    if after is not None:
+        after_created, after_id = after
+        conditions.append(or_(
+            model.created_at > after_created,
+            and_(model.created_at == after_created, model.id > after_id),
+        ))
+    return conditions
+
+
+def iter_alert_records(
+    db: Session,
+    created_from: Optional[datetime] = None,
+    created_to: Optional[datetime] = None,
+    after: Optional[Cursor] = None,
+    batch_size: int = 1000,
+) -> Iterator[Dict[str, Any]]:
+    """
+    Alerts created in ``[created_from, created_to)``, hot and archived, oldest first.
+
+    Alert keys are read through one server-side cursor ordered by
+    ``(created_at, id)``; each batch of ``batch_size`` keys is then
+    loaded with its transactions. Resumes after ``after`` when given.
+
+    Yields:
+        dict: Alert fields, ``cursor`` and ``transactions`` (primary first)
+    """
+    keys = union_all(*(
+        select(model.id.label("id"), model.created_at.label("created_at"), literal(model.archived).label("archived"))
+        .where(*_export_conditions(model, created_from, created_to, after))
+        for model in (Alert, ArchivedAlert)
+    )).subquery()
+
+    stmt = select(keys.c.id, keys.c.archived).order_by(keys.c.created_at, keys.c.id)
+    # yield_per streams keys from a server-side cursor, batch_size at a time
+    result = db.execute(stmt.execution_options(yield_per=batch_size))
+    try:
+        for partition in result.partitions():
+            yield from _load_batch(db, partition)
+    finally:
+        result.close()
+
+
+def _csv_value(value: Any) -> Any:
+    if isinstance(value, list):
+        return CSV_LIST_SEPARATOR.join(value)
+    return "" if value is None else value
+
+
+def encode_csv(records: Iterable[Dict[str, Any]]) -> Iterator[str]:
+    """CSV text in chunks: a header, then one row per (alert, transaction)."""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(CSV_FIELDS)
+    for record in records:
+        alert_values = [_csv_value(record[field]) for field in ALERT_FIELDS]
+        for tx in record["transactions"] or [{}]:
+            writer.writerow(alert_values + [_csv_value(tx.get(field)) for field in TRANSACTION_FIELDS])
+        if buffer.tell() >= FLUSH_BYTES:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+    yield buffer.getvalue()
+
+
+def encode_jsonl(records: Iterable[Dict[str, Any]]) -> Iterator[str]:
+    """JSON Lines text in chunks: one object per alert with nested transactions."""
+    lines: List[str] = []
+    size = 0
+    for record in records:
+        line = json.dumps(record, separators=(",", ":")) + "\n"
+        lines.append(line)
+        size += len(line)
+        if size >= FLUSH_BYTES:
+            yield "".join(lines)
+            lines, size = [], 0
+    yield "".join(lines)
+
+
+def gzip_stream(chunks: Iterable[str]) -> Iterator[bytes]:
+    """Gzip-compress text chunks on the fly (a single gzip member)."""
+    compressor = zlib.compressobj(6, zlib.DEFLATED, 31)  # wbits 31: gzip header and trailer
+    for chunk in chunks:
+        data = compressor.compress(chunk.encode())
+        if data:
+            yield data
+    yield compressor.flush()
+
+
+def stream_alert_export(
+    db: Session,
+    fmt: str = "csv",
+    compress: bool = False,
+    created_from: Optional[datetime] = None,
+    created_to: Optional[datetime] = None,
+    after: Optional[Cursor] = None,
+    batch_size: int = 1000,
+) -> Iterator[bytes]:
+    """
+    Encoded export stream (CSV or JSON Lines, optionally gzipped).
+
+    Raises:
+        ValueError: Unknown format
+    """
+    if fmt not in EXPORT_FORMATS:
+        raise ValueError(f"Unknown export format {fmt!r}; expected one of {', '.join(EXPORT_FORMATS)}")
+    records = iter_alert_records(db, created_from, created_to, after, batch_size)
+    chunks = encode_csv(records) if fmt == "csv" else encode_jsonl(records)
+    if compress:
+        return gzip_stream(chunks)
+    return (chunk.encode() for chunk in chunks if chunk)
@@ -0,0 +1,214 @@
+"""Alert service - business logic for alert operations."""
+
+from typing import Dict, List, Optional, Sequence, Tuple, Type, Union
+from uuid import UUID
+
+from sqlalchemy import func, literal, select, union_all
+from sqlalchemy.orm import Session, joinedload, selectinload
+
+from app.models.alert import Alert, AlertStatus
+from app.models.archived_alert import ArchivedAlert
+from app.models.transaction import Transaction
+from app.schemas.alert import AlertFilter, AlertUpdate
+from app.services.alert_aggregator import AlertCandidate, get_alert_aggregator
+from app.services.alert_archive import get_archived_alerts, restore_alerts
+from app.services.alert_counters import AlertCounters
+
+# Either table's row; ArchivedAlert exposes the same read attributes
+AnyAlert = Union[Alert, ArchivedAlert]
+
+# Columns the list endpoint may sort by (present on both alert tables)
+SORTABLE_COLUMNS = ("created_at", "updated_at", "ml_score", "priority", "status")
+
+
+def _apply_filters(query, model: Type[AnyAlert], filters: Optional[AlertFilter]):
+    """Apply list filters to a Query or Select over ``model`` (Alert or ArchivedAlert)."""
+    if not filters:
+        return query
+    if filters.status:
+        query = query.filter(model.status.in_(filters.status))
+    if filters.priority:
+        query = query.filter(model.priority.in_(filters.priority))
+    if filters.risk_band:
+        query = query.filter(model.ml_risk_band.in_(filters.risk_band))
+    if filters.assigned_to:
+        query = query.filter(model.assigned_to == filters.assigned_to)
+    if filters.min_score is not None:
+        query = query.filter(model.ml_score >= filters.min_score)
+    if filters.max_score is not None:
+        query = query.filter(model.ml_score <= filters.max_score)
+    if filters.created_after:
+        query = query.filter(model.created_at >= filters.created_after)
+    if filters.created_before:
+        query = query.filter(model.created_at <= filters.created_before)
+    if filters.min_amount is not None or filters.max_amount is not None or filters.transaction_type:
+        query = query.join(model.transaction)
+        if filters.min_amount is not None:
+            query = query.filter(Transaction.amount >= filters.min_amount)
+        if filters.max_amount is not None:
+            query = query.filter(Transaction.amount <= filters.max_amount)
+        if filters.transaction_type:
+            query = query.filter(Transaction.type.in_(filters.transaction_type))
+    return query
+
+
+class AlertService:
+    """Business logic for alert operations."""
+
+    @staticmethod
+    def list_alerts(
+        db: Session,
+        filters: Optional[AlertFilter] = None,
+        page: int = 1,
+        page_size: int = 25,
+        sort_by: str = "created_at",
+        sort_desc: bool = True,
+    ) -> Tuple[List[AnyAlert], int]:
+        """
+        List alerts with filtering, pagination, and sorting.
+
+        Archived alerts are included unless the status filter excludes
+        CLOSED, so queue queries only touch the hot table.
+
+        Returns:
+            tuple: (alerts, total_count)
+        """
+        if filters and filters.status and AlertStatus.CLOSED not in filters.status:
+            query = _apply_filters(db.query(Alert), Alert, filters)
+
+            # Get total count before pagination
+            total = query.count()
+
+            sort_column = getattr(Alert, sort_by if sort_by in SORTABLE_COLUMNS else "created_at")
+            query = query.order_by(sort_column.desc() if sort_desc else sort_column.asc())
+
+            offset = (page - 1) * page_size
+            alerts = (
+                query.options(joinedload(Alert.transaction))
+                .offset(offset)
+                .limit(page_size)
+                .all()
+            )
+            return alerts, total
+
+        return AlertService._list_hot_and_archived(db, filters, page, page_size, sort_by, sort_desc)
+
+    @staticmethod
+    def _list_hot_and_archived(
+        db: Session,
+        filters: Optional[AlertFilter],
+        page: int,
+        page_size: int,
+        sort_by: str,
+        sort_desc: bool,
+    ) -> Tuple[List[AnyAlert], int]:
+        """Page over the union of hot and archived alerts (ids first, then one load per table)."""
+        sort_column = sort_by if sort_by in SORTABLE_COLUMNS else "created_at"
+        keys = union_all(*(
+            _apply_filters(
+                select(
+                    model.id.label("id"),
+                    getattr(model, sort_column).label("sort_key"),
+                    literal(model.archived).label("archived"),
+                ),
+                model,
+                filters,
+            )
+            for model in (Alert, ArchivedAlert)
+        )).subquery()
+
+        total = db.scalar(select(func.count()).select_from(keys))
+
+        order = (keys.c.sort_key.desc(), keys.c.id.desc()) if sort_desc else (keys.c.sort_key.asc(), keys.c.id.asc())
+        rows = db.execute(
+            select(keys.c.id, keys.c.archived)
+            .order_by(*order)
+            .offset((page - 1) * page_size)
+            .limit(page_size)
+        ).all()
+
+        hot_ids = [alert_id for alert_id, archived in rows if not archived]
+        loaded: Dict = get_archived_alerts(db, [alert_id for alert_id, archived in rows if archived])
+        if hot_ids:
+            loaded.update(
+                (alert.id, alert)
+                for alert in db.query(Alert).options(joinedload(Alert.transaction)).filter(Alert.id.in_(hot_ids))
+            )
+        return [loaded[alert_id] for alert_id, _ in rows], total
+
+    @staticmethod
+    def get_alert(db: Session, alert_id: UUID) -> Optional[AnyAlert]:
+        """Get alert by ID with related and linked transactions (hot table first, then the archive)."""
+        alert = AlertService._get_hot_alert(db, alert_id)
+        if alert is None:
+            alert = get_archived_alerts(db, [alert_id]).get(alert_id)
+        return alert
+
+    @staticmethod
+    def _get_hot_alert(db: Session, alert_id: UUID) -> Optional[Alert]:
+        return (
+            db.query(Alert)
+            .options(joinedload(Alert.transaction), selectinload(Alert.linked_transactions))
+            .filter(Alert.id == alert_id)
+            .first()
+        )
+
+    @staticmethod
+    def raise_alerts(
+        db: Session,
+        candidates: Sequence[AlertCandidate],
+    ) -> Tuple[List[Alert], List[Alert]]:
+        """
+        Create alerts for candidates, merging bursts from the same sender.
+
+        Runs in the caller's transaction (flushes, does not commit).
+
+        Returns:
+            Tuple[List[Alert], List[Alert]]: (new alerts, merged parent alerts)
+        """
+        return get_alert_aggregator().add(db, candidates)
+
+    @staticmethod
+    def update_alert(db: Session, alert_id: UUID, update: AlertUpdate) -> Optional[Alert]:
+        """Update alert fields (an archived alert is restored to the hot table first)."""
+        alert = AlertService._get_hot_alert(db, alert_id)
+        if alert is None and restore_alerts(db, [alert_id]):
+            alert = AlertService._get_hot_alert(db, alert_id)
+        if not alert:
+            return None
+
+        if update.status:
+            alert.status = update.status
+        if update.priority:
+            alert.priority = update.priority
+        if update.assigned_to is not None:
+            alert.assigned_to = update.assigned_to
+        if update.notes is not None:
+            alert.notes = update.notes
+
+        db.commit()
+        db.refresh(alert)
+        return alert
+
+    @staticmethod
+    def bulk_update_alerts(db: Session, alert_ids: List[UUID], update: AlertUpdate) -> int:
+        """Bulk update multiple alerts (archived ones are restored to the hot table first)."""
+        update_data = {}
+        if update.status:
+            update_data["status"] = update.status
+        if update.priority:
+            update_data["priority"] = update.priority
+        if update.assigned_to is not None:
+            update_data["assigned_to"] = update.assigned_to
+        if not update_data:
+            return 0
+
+        restore_alerts(db, alert_ids)
+        AlertCounters.record_bulk_update(db, alert_ids, update_data)
+        count = (
+            db.query(Alert)
+            .filter(Alert.id.in_(alert_ids))
+            .update(update_data, synchronize_session=False)
+        )
+        db.commit()
+        return count
@@ -0,0 +1,452 @@
+"""Batch scoring - pipelined scoring of whole transaction files.
+
+A PaySim-layout CSV is read in chunks of ``chunk_size`` rows and every
+chunk flows through five stages, each on its own thread, connected by
+bounded queues of ``queue_size`` chunks (a full queue makes the stage
+before it wait, so memory stays bounded whatever the file size):
+
+    parse → features → rules → score → store
+
+- parse: pandas reads the chunk; types, steps, amounts and names are
+  validated column-wise and invalid rows are rejected with a reason
+- features: sliding-window features through the shard router, staged
+  under the job's token; a chunk's rows enter the per-sender windows
+  (shared with live ingestion) only once the store stage commits it
+- rules: rule flags for the whole chunk as NumPy column tests
+- score: one champion ``score`` call per chunk
+- store: ``TransactionService.store_scored`` writes the chunk's
+  transactions, aggregates and alerts in one database transaction
+
+Stages are threads rather than processes: feature state must see chunks
+in file order and the store stage owns the caller's session. Pandas,
+NumPy and SQLite release the GIL for their heavy parts, and feature
+computation is spread over shard workers when FEATURE_SHARDS > 1.
+
+Each stage reports its busy time (excluding waits on its queues) and
+throughput; the stage with the most busy time is the bottleneck.
+
+Chunks are committed one at a time, so a failure part-way leaves the
+chunks before it stored: the job raises ``BatchScoringError`` with the
+partial report, whose ``resume_line`` is where to restart the file
+(``first_line``) once the cause is fixed.
+"""
+
+import queue
+import threading
+import time
+from pathlib import Path
+from typing import BinaryIO, Callable, Dict, Iterator, List, NamedTuple, Optional, Union
+from uuid import uuid4
+
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.models.transaction import TransactionType
+from app.services.rules import FEATURE_RULES, RULES
+from app.services.scoring import ModelScorer, get_champion
+from app.services.sharding import get_shard_router
+from app.services.transaction_service import TransactionRow, TransactionService, feature_rows
+from app.utils.metrics import BATCH_STAGE_ROWS, BATCH_STAGE_SECONDS, SCORING_BATCH_SIZE
+
+REQUIRED_COLUMNS = ["step", "type", "amount", "nameOrig", "nameDest"]
+LABEL_COLUMNS = ["isFraud", "isFlaggedFraud"]
+STAGES = ("parse", "features", "rules", "score", "store")
+
+# Rejected rows reported individually; the rest are only counted
+MAX_REPORTED_ERRORS = 100
+
+_TYPES = {t.value: t for t in TransactionType}
+_NAME_MAX_LENGTH = 100
+
+# How often a stage waiting on a queue checks whether the pipeline was aborted
+_POLL_SECONDS = 0.1
+
+# End-of-file marker passed down the pipeline
+_END = object()
+
+Source = Union[str, Path, BinaryIO]
+
+
+class RowError(NamedTuple):
+    """A rejected file row (``line`` counts the header as line 1)."""
+
+    line: int
+    reason: str
+
+
+class ScoringChunk(NamedTuple):
+    """Valid rows of one file chunk and what each stage added to them."""
+
+    rows: List[TransactionRow]
+    last_line: int  # File line of the chunk's last row, valid or not
+    features: Optional[List[Dict[str, float]]] = None
+    rules: Optional[List[List[Dict[str, str]]]] = None
+    scores: Optional[List[float]] = None
+
+
+class StageStats:
+    """Work and wait time of one pipeline stage."""
+
+    def __init__(self, name: str):
+        self.name = name
+        self.chunks = 0
+        self.rows = 0
+        self.busy_seconds = 0.0
+        self.starved_seconds = 0.0  # Waiting for the previous stage
+        self.blocked_seconds = 0.0  # Waiting for room in the next stage's queue
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.rows / self.busy_seconds if self.busy_seconds else 0.0
+
+    def record(self, rows: int, busy: float) -> None:
+        self.chunks += 1
+        self.rows += rows
+        self.busy_seconds += busy
+        BATCH_STAGE_ROWS.labels(self.name).inc(rows)
+        BATCH_STAGE_SECONDS.labels(self.name).inc(busy)
+
+
+class BatchScoringReport(NamedTuple):
+    """Outcome of scoring one file."""
+
+    rows_read: int
+    rows_stored: int
+    rows_rejected: int
+    errors: List[RowError]
+    alerts_created: int
+    alerts_merged: int
+    model_version: str
+    elapsed_seconds: float
+    stages: List[StageStats]
+    last_line_stored: int  # Last file line committed (first_line - 1 if none)
+
+    @property
+    def resume_line(self) -> int:
+        """First file line not yet stored (pass as ``first_line`` to carry on)."""
+        return self.last_line_stored + 1
+
+    @property
+    def bottleneck(self) -> str:
+        """Stage with the most busy time (the one to speed up first)."""
+        return max(self.stages, key=lambda stage: stage.busy_seconds).name
+
+
+class BatchScoringError(Exception):
+    """A stage failed after the chunks in ``report`` were stored."""
+
+    def __init__(self, cause: Exception, report: BatchScoringReport):
+        super().__init__(str(cause))
+        self.cause = cause
+        self.report = report
+
+
+class FileParser:
+    """Reads a transaction CSV in validated, step-ordered chunks, from ``first_line`` on."""
+
+    def __init__(self, source: Source, chunk_size: int, first_line: int = 2):
+        self.source = source
+        self.chunk_size = chunk_size
+        # Line 1 is the header
+        self.first_line = max(first_line, 2)
+        self.rows_read = 0
+        self.rows_rejected = 0
+        self.errors: List[RowError] = []
+        self._last_step = 0
+
+    def chunks(self) -> Iterator[ScoringChunk]:
+        """
+        Valid rows of each chunk (possibly none, when all are rejected).
+
+        Raises:
+            ValueError: Empty or malformed file, missing columns or rows not in step order
+        """
+        import pandas as pd
+
+        reader = pd.read_csv(
+            self.source,
+            chunksize=self.chunk_size,
+            usecols=lambda column: column in REQUIRED_COLUMNS or column in LABEL_COLUMNS,
+            dtype={"type": str, "nameOrig": str, "nameDest": str},
+            keep_default_na=False,
+            skiprows=range(1, self.first_line - 1),
+        )
+        with reader:
+            for frame in reader:
+                missing = [column for column in REQUIRED_COLUMNS if column not in frame.columns]
+                if missing:
+                    raise ValueError(f"Missing required columns: {', '.join(missing)}")
+                if frame.empty:
+                    continue
+                self.rows_read += len(frame)
+                yield ScoringChunk(self._validate(frame), int(frame.index[-1]) + self.first_line)
+
+    def _validate(self, frame) -> List[TransactionRow]:
+        """Reject invalid rows of a chunk with the first reason that applies; return the rest."""
+        import pandas as pd
+
+        types = frame["type"].str.upper().str.replace("-", "_", regex=False)
+        steps = pd.to_numeric(frame["step"], errors="coerce")
+        amounts = pd.to_numeric(frame["amount"], errors="coerce")
+        checks = [
+            (~types.isin(list(_TYPES)), f"type must be one of {', '.join(_TYPES)}"),
+            (~((steps >= 1) & (steps % 1 == 0)), "step must be an integer >= 1"),
+            (~(amounts >= 0), "amount must be a number >= 0"),
+        ]
+        for column in ("nameOrig", "nameDest"):
+            checks.append((
+                ~frame[column].str.len().between(1, _NAME_MAX_LENGTH),
+                f"{column} must be 1-{_NAME_MAX_LENGTH} characters",
+            ))
+
+        reasons = pd.Series(None, index=frame.index, dtype=object)
+        for failed, reason in checks:
+            reasons = reasons.mask(failed & reasons.isna(), reason)
+        invalid = reasons.notna()
+        if invalid.any():
+            self.rows_rejected += int(invalid.sum())
+            room = MAX_REPORTED_ERRORS - len(self.errors)
+            self.errors.extend(
+                RowError(int(index) + self.first_line, reason)
+                for index, reason in reasons[invalid].iloc[:room].items()
+            )
+        valid = ~invalid
+        if not valid.any():
+            return []
+
+        steps = steps[valid].astype("int64")
+        backwards = steps.lt(steps.shift(fill_value=self._last_step).cummax())
+        if backwards.any():
+            raise ValueError(f"Rows must be ordered by step (line {int(backwards.idxmax()) + self.first_line})")
+        self._last_step = int(steps.iloc[-1])
+
+        return list(map(
+            TransactionRow,
+            steps.tolist(),
+            [_TYPES[name] for name in types[valid].tolist()],
+            amounts[valid].astype(float).tolist(),
+            frame["nameOrig"][valid].tolist(),
+            frame["nameDest"][valid].tolist(),
+            _labels(frame, "isFraud", valid),
+            _labels(frame, "isFlaggedFraud", valid),
+        ))
+
+
+def _labels(frame, column: str, valid) -> List[bool]:
+    """A 0/1 or true/false label column (all False when absent or blank)."""
+    import pandas as pd
+
+    if column not in frame.columns:
+        return [False] * int(valid.sum())
+    values = frame[column][valid]
+    if values.dtype != bool:
+        numeric = pd.to_numeric(values, errors="coerce").fillna(0)
+        values = numeric.ne(0) | values.astype(str).str.lower().eq("true")
+    return values.tolist()
+
+
+class _Stopped(Exception):
+    """A stage downstream failed; stop without passing anything on."""
+
+
+class BatchScoringJob:
+    """
+    Scores one file through the staged pipeline (see module docstring).
+
+    Chunks stored before a stage fails stay committed: every chunk ahead
+    of the failing one finishes its remaining stages, later ones are
+    dropped (their staged features with them) and the stage's exception
+    is raised as ``BatchScoringError`` with the partial report.
+    """
+
+    def __init__(
+        self,
+        db: Session,
+        source: Source,
+        chunk_size: int = settings.BATCH_SCORING_CHUNK_SIZE,
+        queue_size: int = settings.BATCH_SCORING_QUEUE_SIZE,
+        champion: Optional[ModelScorer] = None,
+        first_line: int = 2,
+    ):
+        self.db = db
+        self.parser = FileParser(source, max(chunk_size, 1), first_line)
+        self.queue_size = max(queue_size, 1)
+        # One champion for the whole file, even if a new model is swapped in meanwhile
+        self.champion = champion or get_champion()
+        self.stats = [StageStats(name) for name in STAGES]
+        self.rows_stored = 0
+        self.last_line_stored = self.parser.first_line - 1
+        self.alerts_created = 0
+        self.alerts_merged = 0
+        self.token = uuid4().hex
+        self._failures: List[tuple] = []
+
+    def run(self) -> BatchScoringReport:
+        """
+        Run every stage to completion.
+
+        Raises:
+            BatchScoringError: A stage failed, e.g. with ValueError for a
+                malformed file (see FileParser.chunks) or
+                ShardUnavailableError for an unreachable shard worker
+        """
+        started = time.perf_counter()
+        chunks = self.parser.chunks()
+        works: List[Callable] = [
+            lambda _: next(chunks, _END), self._features, self._rules, self._score, self._store,
+        ]
+        queues = [queue.Queue(maxsize=self.queue_size) for _ in STAGES[1:]]
+        threads = [
+            threading.Thread(
+                target=self._run_stage,
+                args=(index, work, queues[index - 1] if index else None, queues[index] if index < len(queues) else None),
+                name=f"batch-scoring-{STAGES[index]}",
+                daemon=True,
+            )
+            for index, work in enumerate(works)
+        ]
+        try:
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        finally:
+            chunks.close()
+            # Chunks computed ahead of a failure were never stored
+            get_shard_router().discard(self.token)
+
+        report = self._report(time.perf_counter() - started)
+        if self._failures:
+            cause = min(self._failures, key=lambda failure: failure[0])[1]
+            raise BatchScoringError(cause, report) from cause
+        return report
+
+    def _report(self, elapsed: float) -> BatchScoringReport:
+        return BatchScoringReport(
+            rows_read=self.parser.rows_read,
+            rows_stored=self.rows_stored,
+            rows_rejected=self.parser.rows_rejected,
+            errors=self.parser.errors,
+            alerts_created=self.alerts_created,
+            alerts_merged=self.alerts_merged,
+            model_version=self.champion.version,
+            elapsed_seconds=elapsed,
+            stages=self.stats,
+            last_line_stored=self.last_line_stored,
+        )
+
+    # Stages
+
+    def _features(self, chunk: ScoringChunk) -> ScoringChunk:
+        if not chunk.rows:
+            return chunk._replace(features=[])
+        features = get_shard_router().compute_many(feature_rows(chunk.rows), self.token)
+        return chunk._replace(features=features)
+
+    def _rules(self, chunk: ScoringChunk) -> ScoringChunk:
+        import numpy as np
+
+        rules: List[List[Dict[str, str]]] = [[] for _ in chunk.rows]
+        for name, rule_id in FEATURE_RULES.items():
+            flags = np.fromiter((values.get(name, 0.0) for values in chunk.features), float, len(rules))
+            for i in np.flatnonzero(flags):
+                rules[i].append(RULES[rule_id])
+        return chunk._replace(rules=rules)
+
+    def _score(self, chunk: ScoringChunk) -> ScoringChunk:
+        if not chunk.rows:
+            return chunk._replace(scores=[])
+        SCORING_BATCH_SIZE.labels("batch").observe(len(chunk.rows))
+        return chunk._replace(scores=self.champion.score(chunk.features))
+
+    def _store(self, chunk: ScoringChunk) -> ScoringChunk:
+        if not chunk.rows:
+            self.last_line_stored = chunk.last_line
+            return chunk
+        result = TransactionService.store_scored(
+            self.db, chunk.rows, chunk.features, chunk.scores, chunk.rules, self.champion, self.token
+        )
+        self.rows_stored += len(result.ids)
+        self.alerts_created += result.alerts_created
+        self.alerts_merged += result.alerts_merged
+        self.last_line_stored = chunk.last_line
+        return chunk
+
+    # Plumbing
+
+    def _run_stage(self, index: int, work: Callable, inbox: Optional[queue.Queue], outbox: Optional[queue.Queue]):
+        """Take chunks from ``inbox`` (or the parser), process and pass them on until the end marker."""
+        stats = self.stats[index]
+        try:
+            while True:
+                if self._aborted(index):
+                    return
+                if inbox is not None:
+                    waited = time.perf_counter()
+                    chunk = self._get(index, inbox)
+                    stats.starved_seconds += time.perf_counter() - waited
+                    if chunk is _END:
+                        break
+                started = time.perf_counter()
+                chunk = work(chunk if inbox is not None else None)
+                if chunk is _END:
+                    stats.busy_seconds += time.perf_counter() - started
+                    break
+                stats.record(len(chunk.rows), time.perf_counter() - started)
+                if outbox is not None:
+                    waited = time.perf_counter()
+                    self._put(index, outbox, chunk)
+                    stats.blocked_seconds += time.perf_counter() - waited
+        except _Stopped:
+            return
+        except Exception as e:
+            self._failures.append((index, e))
+        # Let the stages downstream finish the chunks already handed to them
+        if outbox is not None:
+            try:
+                self._put(index, outbox, _END)
+            except _Stopped:
+                pass
+
+    def _aborted(self, index: int) -> bool:
+        """Whether a stage after ``index`` failed, so nothing more it produces will be used."""
+        return any(failed > index for failed, _ in self._failures)
+
+    def _get(self, index: int, inbox: queue.Queue):
+        while True:
+            try:
+                return inbox.get(timeout=_POLL_SECONDS)
+            except queue.Empty:
+                if self._aborted(index):
+                    raise _Stopped
+
+    def _put(self, index: int, outbox: queue.Queue, item) -> None:
+        while True:
+            try:
+                outbox.put(item, timeout=_POLL_SECONDS)
+                return
+            except queue.Full:
+                if self._aborted(index):
+                    raise _Stopped
+
+
+def score_file(
+    db: Session,
+    source: Source,
+    chunk_size: int = settings.BATCH_SCORING_CHUNK_SIZE,
+    queue_size: int = settings.BATCH_SCORING_QUEUE_SIZE,
+    first_line: int = 2,
+) -> BatchScoringReport:
+    """
+    Score and store every valid row of a transaction CSV (path or binary file).
+
+    Rows must be in step order; invalid rows are rejected and reported.
+    Scoring starts at file line ``first_line`` (the header is line 1),
+    e.g. the ``resume_line`` of a failed run.
+
+    Raises:
+        BatchScoringError: Malformed file, missing columns, rows not in
+            step order (ValueError cause) or an unreachable shard worker
+            (ShardUnavailableError cause); carries the partial report
+    """
+    return BatchScoringJob(db, source, chunk_size, queue_size, first_line=first_line).run()
@@ -0,0 +1,154 @@
+"""Entity dictionary service - interns account names to integer ids."""
+
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional
+
+from sqlalchemy import insert, select
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.models.entity import Entity
+from app.utils.cache import LRUCache
+
+# Stay below SQLite's bound-parameter limit for IN (...) lookups
+_LOOKUP_CHUNK_SIZE = 500
+
+
+class EntityDictionary:
+    """
+    Maps account names to dense integer ids.
+
+    Ids are persisted in the ``entities`` table and cached in-process in
+    bounded LRU caches (name → id and id → name). New names are inserted
+    inside the caller's transaction; the caller is responsible for
+    committing, and should ``forget()`` the names it interned after a
+    rollback so no uncommitted ids stay cached.
+    """
+
+    def __init__(self, cache_size: int = 100_000):
+        self._ids = LRUCache(cache_size)
+        self._names = LRUCache(cache_size)
+
+    def _remember(self, name: str, entity_id: int) -> None:
+        self._ids.put(name, entity_id)
+        self._names.put(entity_id, name)
+
+    def _fetch_ids(self, db: Session, names: List[str]) -> Dict[str, int]:
+        """Load ids for names from the database."""
+        found: Dict[str, int] = {}
+        for i in range(0, len(names), _LOOKUP_CHUNK_SIZE):
+            chunk = names[i:i + _LOOKUP_CHUNK_SIZE]
+            rows = db.execute(select(Entity.name, Entity.id).where(Entity.name.in_(chunk)))
+            found.update({name: entity_id for name, entity_id in rows})
+        return found
+
+    def _insert_missing(self, db: Session, names: List[str]) -> None:
+        """Insert names, ignoring ones created concurrently by another writer."""
+        dialect = db.get_bind().dialect.name
+        if dialect == "sqlite":
+            from sqlalchemy.dialects.sqlite import insert as dialect_insert
+        elif dialect == "postgresql":
+            from sqlalchemy.dialects.postgresql import insert as dialect_insert
+        else:
+            dialect_insert = None
+
+        if dialect_insert is not None:
+            stmt = dialect_insert(Entity).on_conflict_do_nothing(index_elements=["name"])
+        else:
+            stmt = insert(Entity)
+        db.execute(stmt, [{"name": name} for name in names])
+
+    def lookup(self, db: Session, name: str) -> Optional[int]:
+        """Get the id for a name without creating it."""
+        entity_id = self._ids.get(name)
+        if entity_id is None:
+            entity_id = self._fetch_ids(db, [name]).get(name)
+            if entity_id is not None:
+                self._remember(name, entity_id)
+        return entity_id
+
+    def intern(self, db: Session, name: str) -> int:
+        """Get the id for a name, creating the entity if needed."""
+        return self.intern_many(db, [name])[0]
+
+    def intern_many(self, db: Session, names: Iterable[str]) -> List[int]:
+        """
+        Get ids for many names, creating missing entities in bulk.
+
+        Args:
+            db: Database session
+            names: Account names (duplicates allowed)
+
+        Returns:
+            List[int]: Ids in the same order as ``names``
+        """
+        names = list(names)
+        resolved: Dict[str, int] = {}
+        missing = []
+        for name in dict.fromkeys(names):
+            entity_id = self._ids.get(name)
+            if entity_id is None:
+                missing.append(name)
+            else:
+                resolved[name] = entity_id
+
+        if missing:
+            found = self._fetch_ids(db, missing)
+            new_names = [name for name in missing if name not in found]
+            if new_names:
+                self._insert_missing(db, new_names)
+                found.update(self._fetch_ids(db, new_names))
+            for name, entity_id in found.items():
+                self._remember(name, entity_id)
+            resolved.update(found)
+
+        return [resolved[name] for name in names]
+
+    def name_of(self, db: Session, entity_id: int) -> Optional[str]:
+        """Get the account name for an id."""
+        name = self._names.get(entity_id)
+        if name is None:
+            name = db.execute(select(Entity.name).where(Entity.id == entity_id)).scalar()
+            if name is not None:
+                self._remember(name, entity_id)
+        return name
+
+    def names_of(self, db: Session, entity_ids: Iterable[int]) -> Dict[int, str]:
+        """Get account names for many ids (one query per chunk of cache misses)."""
+        names: Dict[int, str] = {}
+        missing = []
+        for entity_id in dict.fromkeys(entity_ids):
+            name = self._names.get(entity_id)
+            if name is None:
+                missing.append(entity_id)
+            else:
+                names[entity_id] = name
+
+        for i in range(0, len(missing), _LOOKUP_CHUNK_SIZE):
+            chunk = missing[i:i + _LOOKUP_CHUNK_SIZE]
+            for entity_id, name in db.execute(select(Entity.id, Entity.name).where(Entity.id.in_(chunk))):
+                self._remember(name, entity_id)
+                names[entity_id] = name
+        return names
+
+    def forget(self, names: Iterable[str]) -> None:
+        """Drop the cached mappings of ``names`` (e.g. interned by a rolled-back batch)."""
+        for name in names:
+            entity_id = self._ids.pop(name)
+            if entity_id is not None:
+                self._names.pop(entity_id)
+
+    def clear(self) -> None:
+        """Drop all cached mappings."""
+        self._ids.clear()
+        self._names.clear()
+
+    def stats(self) -> dict:
+        """Cache statistics."""
+        return {"ids": self._ids.stats(), "names": self._names.stats()}
+
+
+@lru_cache()
+def get_entity_dictionary() -> EntityDictionary:
+    """Get the process-wide entity dictionary."""
+    return EntityDictionary(cache_size=settings.ENTITY_CACHE_SIZE)
@@ -0,0 +1,357 @@
+"""Entity service - incrementally maintained entity profiles."""
+
+import heapq
+from collections import Counter, defaultdict
+from typing import Dict, Iterable, List, Optional
+
+from sqlalchemy import delete, func, insert, select, union_all, update
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.models.alert import Alert
+from app.models.archived_alert import ArchivedAlert
+from app.models.case import case_alerts
+from app.models.entity import EntityAggregate
+from app.models.transaction import Transaction
+from app.schemas.entity import Counterparty, EntityProfile, TransactionTypeCount
+from app.services.entity_dictionary import EntityDictionary, get_entity_dictionary
+
+# Stay below SQLite's bound-parameter limit for IN (...) lookups
+_LOOKUP_CHUNK_SIZE = 500
+
+
+class _Delta:
+    """Aggregate changes for one entity within a batch."""
+
+    __slots__ = (
+        "sent_count", "sent_amount", "received_count", "received_amount",
+        "max_amount", "type_counts", "fraud_count", "first_step", "last_step",
+        "counterparties",
+    )
+
+    def __init__(self):
+        self.sent_count = 0
+        self.sent_amount = 0.0
+        self.received_count = 0
+        self.received_amount = 0.0
+        self.max_amount = 0.0
+        self.type_counts: Dict[str, int] = defaultdict(int)
+        self.fraud_count = 0
+        self.first_step: Optional[int] = None
+        self.last_step: Optional[int] = None
+        self.counterparties: Dict[str, List[float]] = {}
+
+    def add(self, tx: Transaction, counterparty_id: int, amount: float, sent: bool) -> None:
+        if sent:
+            self.sent_count += 1
+            self.sent_amount += amount
+        else:
+            self.received_count += 1
+            self.received_amount += amount
+        self.max_amount = max(self.max_amount, amount)
+        tx_type = tx.type.value if hasattr(tx.type, "value") else str(tx.type)
+        self.type_counts[tx_type] += 1
+        if tx.isFraud:
+            self.fraud_count += 1
+        self.first_step = tx.step if self.first_step is None else min(self.first_step, tx.step)
+        self.last_step = tx.step if self.last_step is None else max(self.last_step, tx.step)
+
+        entry = self.counterparties.setdefault(str(counterparty_id), [0, 0.0])
+        entry[0] += 1
+        entry[1] += amount
+
+
+def merge_counterparties(
+    counters: Dict[str, List[float]],
+    updates: Dict[str, List[float]],
+    capacity: int,
+) -> Dict[str, List[float]]:
+    """
+    Merge counterparty counts into a bounded summary (Space-Saving).
+
+    At most ``capacity`` counterparties are kept. When full, a new
+    counterparty replaces the one with the smallest count and inherits
+    that count, so heavy counterparties are never evicted by a stream of
+    one-off ones and the summary stays O(capacity) per entity.
+    """
+    merged = {key: list(value) for key, value in counters.items()}
+    for key, (count, amount) in updates.items():
+        if key in merged:
+            merged[key][0] += count
+            merged[key][1] += amount
+        elif len(merged) < capacity:
+            merged[key] = [count, amount]
+        else:
+            victim = min(merged, key=lambda k: merged[k][0])
+            floor = merged.pop(victim)[0]
+            merged[key] = [floor + count, amount]
+    return merged
+
+
+def top_counterparties(counters: Dict[str, List[float]], n: int) -> List[tuple]:
+    """Top ``n`` counterparties by count (then amount) as (entity_id, count, amount)."""
+    top = heapq.nlargest(n, counters.items(), key=lambda kv: (kv[1][0], kv[1][1]))
+    return [(int(key), int(count), float(amount)) for key, (count, amount) in top]
+
+
+class EntityService:
+    """Business logic for entity profiles."""
+
+    @staticmethod
+    def update_aggregates(db: Session, transactions: Iterable[Transaction]) -> int:
+        """
+        Fold a batch of transactions into the entity aggregate table.
+
+        Transactions must have ``orig_id``/``dest_id`` set (see
+        ``EntityDictionary``). Changes are accumulated in memory and each
+        affected aggregate row is locked, loaded and written once per
+        batch. The caller commits.
+
+        Returns:
+            int: Number of entities updated
+        """
+        deltas: Dict[int, _Delta] = defaultdict(_Delta)
+        for tx in transactions:
+            if tx.orig_id is None or tx.dest_id is None:
+                continue
+            amount = float(tx.amount)
+            deltas[tx.orig_id].add(tx, tx.dest_id, amount, sent=True)
+            deltas[tx.dest_id].add(tx, tx.orig_id, amount, sent=False)
+
+        if not deltas:
+            return 0
+
+        # Rows are locked (FOR UPDATE, in id order so concurrent batches
+        # cannot deadlock) before their counters and JSON summaries are
+        # merged, so concurrent writers never overwrite each other's deltas.
+        # SQLite ignores the lock; it already serializes writers.
+        # Pending changes are flushed first so the reload cannot drop them.
+        db.flush()
+        entity_ids = sorted(deltas)
+        existing = EntityService._lock_aggregates(db, entity_ids)
+        missing = [entity_id for entity_id in entity_ids if entity_id not in existing]
+        if missing:
+            EntityService._insert_missing(db, missing)
+            existing.update(EntityService._lock_aggregates(db, missing))
+
+        capacity = settings.ENTITY_COUNTERPARTY_CAPACITY
+        for entity_id, delta in deltas.items():
+            aggregate = existing[entity_id]
+            aggregate.sent_count += delta.sent_count
+            aggregate.sent_amount += delta.sent_amount
+            aggregate.received_count += delta.received_count
+            aggregate.received_amount += delta.received_amount
+            aggregate.max_amount = max(aggregate.max_amount, delta.max_amount)
+            aggregate.fraud_count += delta.fraud_count
+
+            # JSON columns are replaced (not mutated) so changes are detected
+            type_counts = dict(aggregate.type_counts or {})
+            for tx_type, count in delta.type_counts.items():
+                type_counts[tx_type] = type_counts.get(tx_type, 0) + count
+            aggregate.type_counts = type_counts
+            aggregate.counterparties = merge_counterparties(
+                aggregate.counterparties or {}, delta.counterparties, capacity
+            )
+
+            if aggregate.first_step is None or delta.first_step < aggregate.first_step:
+                aggregate.first_step = delta.first_step
+            if aggregate.last_step is None or delta.last_step > aggregate.last_step:
+                aggregate.last_step = delta.last_step
+
+        return len(deltas)
+
+    @staticmethod
+    def _lock_aggregates(db: Session, entity_ids: List[int]) -> Dict[int, EntityAggregate]:
+        """Load aggregate rows locked for update, refreshing any already in the session."""
+        found: Dict[int, EntityAggregate] = {}
+        for i in range(0, len(entity_ids), _LOOKUP_CHUNK_SIZE):
+            chunk = entity_ids[i:i + _LOOKUP_CHUNK_SIZE]
+            query = (
+                db.query(EntityAggregate)
+                .filter(EntityAggregate.entity_id.in_(chunk))
+                .order_by(EntityAggregate.entity_id)
+                .with_for_update()
+                .populate_existing()
+            )
+            for aggregate in query:
+                found[aggregate.entity_id] = aggregate
+        return found
+
+    @staticmethod
+    def _insert_missing(db: Session, entity_ids: List[int]) -> None:
+        """Insert empty aggregates, ignoring ones created concurrently by another writer."""
+        dialect = db.get_bind().dialect.name
+        if dialect == "sqlite":
+            from sqlalchemy.dialects.sqlite import insert as dialect_insert
+        elif dialect == "postgresql":
+            from sqlalchemy.dialects.postgresql import insert as dialect_insert
+        else:
+            dialect_insert = None
+
+        if dialect_insert is not None:
+            stmt = dialect_insert(EntityAggregate).on_conflict_do_nothing(index_elements=["entity_id"])
+        else:
+            stmt = insert(EntityAggregate)
+        db.execute(stmt, [
+            {
+                "entity_id": entity_id,
+                "sent_count": 0,
+                "sent_amount": 0.0,
+                "received_count": 0,
+                "received_amount": 0.0,
+                "max_amount": 0.0,
+                "fraud_count": 0,
+                "alert_count": 0,
+                "case_count": 0,
+                "type_counts": {},
+                "counterparties": {},
+            }
+            for entity_id in entity_ids
+        ])
+
+    @staticmethod
+    def record_history(
+        db: Session,
+        entity_ids: Iterable[int],
+        alerts: int = 0,
+        cases: int = 0,
+    ) -> int:
+        """
+        Increment alert/case counters for entities.
+
+        ``entity_ids`` may repeat an entity once per alert/case; entities
+        sharing the same multiplicity are updated with a single UPDATE.
+
+        Returns:
+            int: Number of aggregate rows updated
+        """
+        multiplicity = Counter(entity_id for entity_id in entity_ids if entity_id is not None)
+        by_times: Dict[int, List[int]] = defaultdict(list)
+        for entity_id, times in multiplicity.items():
+            by_times[times].append(entity_id)
+
+        updated = 0
+        for times, ids in by_times.items():
+            for i in range(0, len(ids), _LOOKUP_CHUNK_SIZE):
+                result = db.execute(
+                    update(EntityAggregate)
+                    .where(EntityAggregate.entity_id.in_(ids[i:i + _LOOKUP_CHUNK_SIZE]))
+                    .values(
+                        alert_count=EntityAggregate.alert_count + alerts * times,
+                        case_count=EntityAggregate.case_count + cases * times,
+                    )
+                    .execution_options(synchronize_session=False)
+                )
+                updated += result.rowcount
+        return updated
+
+    @staticmethod
+    def rebuild_aggregates(db: Session, batch_size: int = 10_000) -> int:
+        """
+        Recompute all aggregates from the transactions table.
+
+        Alert counters are recounted from hot and archived alerts and case
+        counters from the cases linking them, each credited to the sender
+        of the alert's transaction (as ingestion does).
+
+        Returns:
+            int: Number of transactions processed
+        """
+        db.execute(delete(EntityAggregate))
+        processed = 0
+        query = (
+            db.query(Transaction)
+            .filter(Transaction.orig_id.isnot(None), Transaction.dest_id.isnot(None))
+            .order_by(Transaction.step)
+            .yield_per(batch_size)
+        )
+        batch = []
+        for tx in query:
+            batch.append(tx)
+            if len(batch) >= batch_size:
+                EntityService.update_aggregates(db, batch)
+                db.flush()
+                processed += len(batch)
+                batch = []
+        if batch:
+            EntityService.update_aggregates(db, batch)
+            processed += len(batch)
+        db.flush()
+
+        senders = union_all(*(
+            select(Transaction.orig_id).join(model, model.transaction_id == Transaction.id)
+            for model in (Alert, ArchivedAlert)
+        )).subquery()
+        alert_counts = Counter(dict(db.execute(
+            select(senders.c.orig_id, func.count()).group_by(senders.c.orig_id)
+        ).all()))
+        EntityService.record_history(db, alert_counts.elements(), alerts=1)
+
+        # Archival skips alerts linked to a case, so cases only reach hot alerts
+        case_senders = (
+            select(case_alerts.c.case_id, Transaction.orig_id)
+            .join(Alert, Alert.id == case_alerts.c.alert_id)
+            .join(Transaction, Transaction.id == Alert.transaction_id)
+            .distinct()
+            .subquery()
+        )
+        case_counts = Counter(dict(db.execute(
+            select(case_senders.c.orig_id, func.count()).group_by(case_senders.c.orig_id)
+        ).all()))
+        EntityService.record_history(db, case_counts.elements(), cases=1)
+        return processed
+
+    @staticmethod
+    def get_profile(
+        db: Session,
+        entity_name: str,
+        top_n: int = 10,
+        entities: Optional[EntityDictionary] = None,
+    ) -> Optional[EntityProfile]:
+        """
+        Get an entity profile from precomputed aggregates.
+
+        One dictionary lookup, one primary-key read and at most one bulk
+        name lookup for the counterparties, independent of how many
+        transactions the entity has.
+        """
+        entities = entities or get_entity_dictionary()
+        entity_id = entities.lookup(db, entity_name)
+        if entity_id is None:
+            return None
+
+        aggregate = db.get(EntityAggregate, entity_id)
+        if aggregate is None:
+            return None
+
+        top = top_counterparties(aggregate.counterparties, top_n)
+        names = entities.names_of(db, [counterparty_id for counterparty_id, _, _ in top])
+
+        total = aggregate.total_transactions
+        return EntityProfile(
+            entity_id=entity_name,
+            role=aggregate.role,
+            total_transactions=total,
+            total_amount=aggregate.total_amount,
+            avg_amount=aggregate.total_amount / total if total else 0.0,
+            max_amount=aggregate.max_amount,
+            sent_count=aggregate.sent_count,
+            received_count=aggregate.received_count,
+            transaction_types=[
+                TransactionTypeCount(type=tx_type, count=count)
+                for tx_type, count in sorted(aggregate.type_counts.items())
+            ],
+            first_step=aggregate.first_step,
+            last_step=aggregate.last_step,
+            fraud_transactions=aggregate.fraud_count,
+            prior_alerts=aggregate.alert_count,
+            prior_cases=aggregate.case_count,
+            top_counterparties=[
+                Counterparty(
+                    entity=names.get(counterparty_id, str(counterparty_id)),
+                    count=count,
+                    total_amount=amount,
+                )
+                for counterparty_id, count, amount in top
+            ],
+        )
@@ -0,0 +1,293 @@
+"""Feature cache - sender window summaries in front of the feature engine."""
+
+import json
+import threading
+from typing import Dict, Iterable, List, NamedTuple, Optional, Protocol, Sequence, Set, Tuple
+
+from app.utils.cache import LRUCache
+from app.utils.metrics import FEATURE_CACHE_REQUESTS
+
+
+class WindowSummary:
+    """
+    What a sender's recent history contributes to a transaction's features at one step.
+
+    Everything the feature engine reads from the history: same-step
+    count, 24-step amounts, a recent TRANSFER and the 7-day receivers.
+    """
+
+    __slots__ = ("velocity", "amounts", "recent_transfer", "dests")
+
+    def __init__(self, velocity: int = 0, amounts: Optional[List[float]] = None,
+                 recent_transfer: bool = False, dests: Optional[Set[str]] = None):
+        self.velocity = velocity
+        self.amounts = amounts if amounts is not None else []
+        self.recent_transfer = recent_transfer
+        self.dests = dests if dests is not None else set()
+
+    def copy(self) -> "WindowSummary":
+        return WindowSummary(self.velocity, list(self.amounts), self.recent_transfer, set(self.dests))
+
+    def to_dict(self) -> Dict:
+        return {
+            "v": self.velocity,
+            "a": self.amounts,
+            "t": self.recent_transfer,
+            "d": sorted(self.dests),
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "WindowSummary":
+        return cls(data["v"], list(data["a"]), data["t"], set(data["d"]))
+
+
+class FeatureBackend(Protocol):
+    """Shared (cross-process) tier: one JSON document per sender."""
+
+    def get_many(self, keys: Sequence[str]) -> List[Optional[str]]: ...
+
+    def write_many(self, writes: Dict[str, Optional[str]], ttl_seconds: Optional[int] = None) -> None:
+        """Set each key to its value (expiring after ``ttl_seconds``), or delete it for None."""
+
+    def clear(self) -> None: ...
+
+
+class MemoryFeatureBackend:
+    """In-process stand-in for the shared tier (tests, single-node setups)."""
+
+    def __init__(self):
+        self._data: Dict[str, str] = {}
+        self._lock = threading.Lock()
+
+    def get_many(self, keys: Sequence[str]) -> List[Optional[str]]:
+        return [self._data.get(key) for key in keys]
+
+    def write_many(self, writes: Dict[str, Optional[str]], ttl_seconds: Optional[int] = None) -> None:
+        # Entries never expire in-process; the step TTL still bounds each document
+        with self._lock:
+            for key, value in writes.items():
+                if value is None:
+                    self._data.pop(key, None)
+                else:
+                    self._data[key] = value
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class RedisFeatureBackend:
+    """Redis shared tier (requires the ``redis`` package)."""
+
+    def __init__(self, url: str, prefix: str = "features:"):
+        import redis
+
+        self.client = redis.Redis.from_url(url, decode_responses=True)
+        self.prefix = prefix
+
+    def get_many(self, keys: Sequence[str]) -> List[Optional[str]]:
+        return self.client.mget([self.prefix + key for key in keys]) if keys else []
+
+    def write_many(self, writes: Dict[str, Optional[str]], ttl_seconds: Optional[int] = None) -> None:
+        pipeline = self.client.pipeline(transaction=False)
+        for key, value in writes.items():
+            if value is None:
+                pipeline.delete(self.prefix + key)
+            else:
+                pipeline.set(self.prefix + key, value, ex=ttl_seconds or None)
+        pipeline.execute()
+
+    def clear(self) -> None:
+        for key in self.client.scan_iter(self.prefix + "*"):
+            self.client.delete(key)
+
+
+def make_backend(spec: Optional[str]) -> Optional[FeatureBackend]:
+    """Shared tier from FEATURE_CACHE_BACKEND: unset, ``memory`` or a ``redis://`` URL."""
+    if not spec:
+        return None
+    if spec == "memory":
+        return MemoryFeatureBackend()
+    if spec.startswith(("redis://", "rediss://", "unix://")):
+        return RedisFeatureBackend(spec)
+    raise ValueError(f"Unknown FEATURE_CACHE_BACKEND {spec!r}")
+
+
+class SharedFetch(NamedTuple):
+    """Shared-tier summaries read by :meth:`FeatureCache.fetch`, to install into tier 1."""
+
+    version: int
+    summaries: Dict[str, Dict[int, WindowSummary]]
+
+
+class FeatureCache:
+    """
+    Two-tier cache of ``WindowSummary`` keyed by (sender, step).
+
+    Tier 1 is a per-process bounded LRU of senders; tier 2 an optional
+    shared backend for tier-1 misses. Each sender keeps the summaries of
+    its last ``ttl_steps + 1`` steps; older steps expire, and shared
+    documents expire after ``shared_ttl_seconds`` of not being written.
+    A new transaction from a sender invalidates all of its steps in both
+    tiers (the feature engine then stores the updated summary for the
+    transaction's step).
+
+    ``get``/``put``/``invalidate`` only touch tier 1 and queue shared
+    writes, so they are cheap under the feature engine's lock; the
+    network round trips happen outside it, in :meth:`fetch` (read ahead
+    of the lock, then :meth:`install`) and :meth:`flush` (after it).
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 100_000,
+        ttl_steps: int = 2,
+        backend: Optional[FeatureBackend] = None,
+        shared_ttl_seconds: Optional[int] = None,
+    ):
+        self._local = LRUCache(maxsize=maxsize)
+        self.ttl_steps = ttl_steps
+        self.backend = backend
+        self.shared_ttl_seconds = shared_ttl_seconds
+        self.hits = {"local": 0, "shared": 0}
+        self.misses = {"local": 0, "shared": 0}
+        # Shared writes not yet flushed (None deletes) and the ones being flushed
+        self._pending: Dict[str, Optional[str]] = {}
+        self._flushing: Set[str] = set()
+        # Sender → version of its last write, so a fetch racing a write is not installed
+        self._changed = LRUCache(maxsize=maxsize)
+        self._version = 0
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+
+    def _count(self, tier: str, hit: bool) -> None:
+        if hit:
+            self.hits[tier] += 1
+        else:
+            self.misses[tier] += 1
+        FEATURE_CACHE_REQUESTS.labels(tier, "hit" if hit else "miss").inc()
+
+    def get(self, sender: str, step: int) -> Optional[WindowSummary]:
+        """Summary of ``sender``'s history as of ``step``, if in tier 1 (see :meth:`fetch`)."""
+        steps = self._local.get(sender)
+        if steps is not None and step in steps:
+            self._count("local", True)
+            return steps[step]
+        self._count("local", False)
+        return None
+
+    def fetch(self, keys: Iterable[Tuple[str, int]]) -> Optional[SharedFetch]:
+        """
+        Read the shared summaries of (sender, step) pairs missing from tier 1.
+
+        Does the shared-tier round trip, so call it before taking a lock;
+        pass the result to :meth:`install`. Senders with unflushed writes
+        are skipped (the shared tier is behind for them).
+        """
+        if self.backend is None:
+            return None
+        wanted: Dict[str, Set[int]] = {}
+        for sender, step in keys:
+            steps = self._local.get(sender)
+            if steps is None or step not in steps:
+                wanted.setdefault(sender, set()).add(step)
+        with self._lock:
+            version = self._version
+            senders = [sender for sender in wanted if sender not in self._pending and sender not in self._flushing]
+        if not senders:
+            return None
+
+        summaries = {}
+        for sender, raw in zip(senders, self.backend.get_many(senders)):
+            stored = json.loads(raw) if raw else {}
+            found = False
+            for step in wanted[sender]:
+                self._count("shared", str(step) in stored)
+                found = found or str(step) in stored
+            if found:
+                summaries[sender] = {int(s): WindowSummary.from_dict(d) for s, d in stored.items()}
+        return SharedFetch(version, summaries)
+
+    def install(self, fetched: Optional[SharedFetch]) -> None:
+        """Put fetched shared summaries into tier 1, unless the sender was written since."""
+        if fetched is None:
+            return
+        for sender, summaries in fetched.summaries.items():
+            if sender in self._local or self._changed.get(sender, 0) > fetched.version:
+                continue
+            self._local.put(sender, summaries)
+
+    def peek(self, sender: str, step: int) -> Optional[WindowSummary]:
+        """Local-tier summary without counting a lookup (for updating it in place of a rescan)."""
+        steps = self._local.get(sender)
+        return steps.get(step) if steps is not None else None
+
+    def put(self, sender: str, step: int, summary: WindowSummary) -> None:
+        """Store a summary, expiring the sender's steps older than ``step - ttl_steps``."""
+        steps = self._local.get(sender) or {}
+        for old in [s for s in steps if s < step - self.ttl_steps]:
+            del steps[old]
+        steps[step] = summary
+        self._local.put(sender, steps)
+        if self.backend is not None:
+            self._queue(sender, json.dumps({str(s): v.to_dict() for s, v in steps.items()}))
+
+    def invalidate(self, sender: str) -> None:
+        """Drop every cached step of ``sender`` from both tiers (shared on the next flush)."""
+        self._local.pop(sender)
+        if self.backend is not None:
+            self._queue(sender, None)
+
+    def _queue(self, sender: str, value: Optional[str]) -> None:
+        with self._lock:
+            self._pending[sender] = value
+            self._version += 1
+            self._changed.put(sender, self._version)
+
+    def flush(self) -> None:
+        """Send queued writes to the shared tier (outside any caller lock)."""
+        if self.backend is None:
+            return
+        with self._flush_lock:
+            with self._lock:
+                writes, self._pending = self._pending, {}
+                self._flushing.update(writes)
+            if not writes:
+                return
+            try:
+                self.backend.write_many(writes, self.shared_ttl_seconds)
+            finally:
+                with self._lock:
+                    self._flushing.difference_update(writes)
+                    self._version += 1
+                    for sender in writes:
+                        self._changed.put(sender, self._version)
+
+    def clear(self) -> None:
+        """Drop everything from both tiers."""
+        self._local.clear()
+        if self.backend is not None:
+            with self._lock:
+                self._pending.clear()
+            self.backend.clear()
+
+    def __len__(self) -> int:
+        return len(self._local)
+
+    def stats(self) -> Dict:
+        """Per-tier hits, misses and hit rate."""
+        def tier(name: str) -> Dict:
+            total = self.hits[name] + self.misses[name]
+            return {
+                "hits": self.hits[name],
+                "misses": self.misses[name],
+                "hit_rate": round(self.hits[name] / total, 4) if total else 0.0,
+            }
+
+        return {
+            "local": {**tier("local"), "senders": len(self._local), "evictions": self._local.evictions},
+            "shared": {**tier("shared"), "backend": type(self.backend).__name__ if self.backend else None},
+        }
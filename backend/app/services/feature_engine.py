@@ -0,0 +1,340 @@
+"""Feature engine - engineered per-transaction features over sliding windows."""
+
+import math
+import threading
+from collections import defaultdict, deque
+from functools import lru_cache
+from typing import Deque, Dict, Iterable, List, NamedTuple, Optional, Sequence, Set, Tuple
+
+from app.config import settings
+from app.models.transaction import Transaction
+from app.services.feature_cache import FeatureCache, WindowSummary, make_backend
+
+# One step is one hour of simulated time
+VELOCITY_WINDOW_STEPS = 1
+ZSCORE_WINDOW_STEPS = 24
+COUNTERPARTY_WINDOW_STEPS = 168
+CASHOUT_SEQUENCE_STEPS = 2
+HIGH_VALUE_THRESHOLD = 200_000
+
+# (step, type, amount, nameOrig, nameDest)
+FeatureRow = Tuple[int, str, float, str, str]
+
+FEATURE_NAMES = [
+    "velocity_1h",
+    "amount_zscore",
+    "new_counterparty_7d",
+    "high_value_transfer_rule",
+    "cashout_sequence_2h",
+]
+
+
+class _Event(NamedTuple):
+    step: int
+    type: str
+    amount: float
+    dest: str
+
+
+class _Staging:
+    """Rows computed under one token but not yet recorded, per sender."""
+
+    __slots__ = ("events", "current")
+
+    def __init__(self):
+        self.events: Dict[str, Deque[_Event]] = {}
+        # Sender → (step, summary including every staged event), reused within a step
+        self.current: Dict[str, Tuple[int, WindowSummary]] = {}
+
+    def pop(self, name_orig: str) -> None:
+        """Take the sender's oldest staged event off (it is being recorded)."""
+        events = self.events.get(name_orig)
+        if events:
+            events.popleft()
+        if not events:
+            self.events.pop(name_orig, None)
+            self.current.pop(name_orig, None)
+
+
+def _features(summary: WindowSummary, tx_type: str, amount: float, name_dest: str) -> Dict[str, float]:
+    zscore = 0.0
+    amounts = summary.amounts
+    if len(amounts) >= 2:
+        mean = sum(amounts) / len(amounts)
+        std = math.sqrt(sum((a - mean) ** 2 for a in amounts) / len(amounts))
+        if std > 0:
+            zscore = (amount - mean) / std
+
+    return {
+        "velocity_1h": float(summary.velocity),
+        "amount_zscore": round(zscore, 6),
+        "new_counterparty_7d": 0.0 if name_dest in summary.dests else 1.0,
+        "high_value_transfer_rule": float(tx_type == "TRANSFER" and amount > HIGH_VALUE_THRESHOLD),
+        "cashout_sequence_2h": float(tx_type == "CASH_OUT" and summary.recent_transfer),
+    }
+
+
+def _type_name(tx_type) -> str:
+    """Normalize TransactionType members and CSV spellings to enum values."""
+    return getattr(tx_type, "value", tx_type).replace("-", "_")
+
+
+class FeatureEngine:
+    """
+    Per-sender sliding-window state for the workplan's engineered features.
+
+    Each sender keeps a step-ordered deque of its recent transactions,
+    trimmed to the longest window (7 days), so computing a transaction's
+    features is a scan over that sender's recent history only. Whenever
+    recording advances the newest step, senders with nothing left in the
+    window are dropped, so memory follows the active senders.
+
+    Features:
+        velocity_1h: Prior transactions from the sender in the same step
+        amount_zscore: Amount vs the sender's 24-step mean/stddev
+        new_counterparty_7d: Receiver not paid by the sender in 168 steps
+        high_value_transfer_rule: TRANSFER with amount > 200,000
+        cashout_sequence_2h: CASH_OUT within 2 steps of a sender TRANSFER
+
+    With a ``FeatureCache`` the scan result is kept per (sender, step) as
+    a ``WindowSummary``, so repeat transactions from a hot sender in the
+    same step skip the scan; recording a transaction invalidates the
+    sender and re-caches the summary with the new event folded in.
+
+    Ingestion computes a batch with :meth:`compute_staged` and records it
+    with :meth:`record` only after the batch is committed, so a failed or
+    retried batch is never counted twice.
+    """
+
+    def __init__(self, window_steps: int = COUNTERPARTY_WINDOW_STEPS, cache: Optional[FeatureCache] = None):
+        self.window_steps = window_steps
+        self.cache = cache
+        self._history: Dict[str, Deque[_Event]] = defaultdict(deque)
+        self._staging: Dict[str, _Staging] = {}
+        # Step → senders recorded at it, to find the ones falling out of the window
+        self._senders_at: Dict[int, Set[str]] = defaultdict(set)
+        self._max_step = 0
+        self._lock = threading.Lock()
+
+    def _fold(self, summary: WindowSummary, event: _Event, step: int) -> bool:
+        """
+        Add one of the sender's events to its summary as seen from ``step``.
+
+        Returns:
+            bool: False once the event is older than the longest window
+        """
+        age = step - event.step
+        if age >= self.window_steps:
+            return False
+        if age < VELOCITY_WINDOW_STEPS:
+            summary.velocity += 1
+        if age < ZSCORE_WINDOW_STEPS:
+            summary.amounts.append(event.amount)
+        if age <= CASHOUT_SEQUENCE_STEPS and event.type == "TRANSFER":
+            summary.recent_transfer = True
+        summary.dests.add(event.dest)
+        return True
+
+    def _scan(self, name_orig: str, step: int) -> WindowSummary:
+        """Summarize the sender's history as seen from ``step``."""
+        summary = WindowSummary()
+        history = self._history.get(name_orig)
+        if history:
+            # Newest first; stop once past the longest window
+            for event in reversed(history):
+                if not self._fold(summary, event, step):
+                    break
+        return summary
+
+    def _summary(self, name_orig: str, step: int) -> WindowSummary:
+        """Recorded history of the sender as seen from ``step`` (cached; do not mutate)."""
+        summary = self.cache.get(name_orig, step) if self.cache is not None else None
+        if summary is None:
+            summary = self._scan(name_orig, step)
+            if self.cache is not None:
+                self.cache.put(name_orig, step, summary)
+        return summary
+
+    def compute(
+        self,
+        step: int,
+        tx_type,
+        amount: float,
+        name_orig: str,
+        name_dest: str,
+        update: bool = True,
+    ) -> Dict[str, float]:
+        """
+        Compute features for one transaction.
+
+        Args:
+            step: Transaction step
+            tx_type: TransactionType or its string value
+            amount: Transaction amount
+            name_orig: Sender account
+            name_dest: Receiver account
+            update: Record the transaction in the sender's history afterwards
+
+        Returns:
+            Dict[str, float]: Feature name → value (booleans as 0.0/1.0)
+        """
+        row = (step, tx_type, amount, name_orig, name_dest)
+        features = self.compute_staged([row])[0]
+        if update:
+            self.record([row])
+        return features
+
+    def compute_staged(self, rows: Sequence[FeatureRow], token: Optional[str] = None) -> List[Dict[str, float]]:
+        """
+        Compute features for step-ordered rows without recording them.
+
+        Each row sees the recorded history plus the rows staged before it
+        under ``token`` (earlier calls and this one). Staged rows only
+        enter the history through :meth:`record` once they are stored;
+        :meth:`discard` drops what is left, so a batch that fails to
+        commit leaves the windows untouched. Without a token, rows only
+        see the rows before them in this call.
+        """
+        results = []
+        # Shared-tier reads happen before taking the lock, writes after releasing it
+        fetched = self.cache.fetch((row[3], row[0]) for row in rows) if self.cache is not None else None
+        with self._lock:
+            if fetched is not None:
+                self.cache.install(fetched)
+            staging = self._staging.setdefault(token, _Staging()) if token is not None else _Staging()
+            for step, tx_type, amount, name_orig, name_dest in rows:
+                tx_type = _type_name(tx_type)
+                amount = float(amount)
+                current = staging.current.get(name_orig)
+                if current is not None and current[0] == step:
+                    summary = current[1]
+                else:
+                    summary = self._summary(name_orig, step).copy()
+                    for event in staging.events.get(name_orig, ()):
+                        self._fold(summary, event, step)
+
+                results.append(_features(summary, tx_type, amount, name_dest))
+
+                # Later rows of the sender see this one
+                event = _Event(step, tx_type, amount, name_dest)
+                staging.events.setdefault(name_orig, deque()).append(event)
+                self._fold(summary, event, step)
+                staging.current[name_orig] = (step, summary)
+        if self.cache is not None:
+            self.cache.flush()
+        return results
+
+    def record(self, rows: Sequence[FeatureRow], token: Optional[str] = None) -> None:
+        """
+        Add stored rows to their senders' history.
+
+        Rows staged under ``token`` are taken off the staging in order, so
+        later staged rows keep seeing them through the history instead.
+        """
+        with self._lock:
+            staging = self._staging.get(token) if token is not None else None
+            for step, tx_type, amount, name_orig, name_dest in rows:
+                event = _Event(step, _type_name(tx_type), float(amount), name_dest)
+                if staging is not None:
+                    staging.pop(name_orig)
+
+                history = self._history[name_orig]
+                history.append(event)
+                while history and step - history[0].step >= self.window_steps:
+                    history.popleft()
+                self._senders_at[step].add(name_orig)
+                if self.cache is not None:
+                    # The sender's cached steps are stale; keep this step with the event folded in
+                    summary = self.cache.peek(name_orig, step)
+                    self.cache.invalidate(name_orig)
+                    if summary is not None:
+                        summary = summary.copy()
+                        self._fold(summary, event, step)
+                        self.cache.put(name_orig, step, summary)
+            if staging is not None and not staging.events:
+                del self._staging[token]
+            if rows:
+                self._advance(max(row[0] for row in rows))
+        if self.cache is not None:
+            self.cache.flush()
+
+    def _advance(self, step: int) -> None:
+        """Drop senders whose newest event is outside the window ending at ``step`` (holding the lock)."""
+        if step <= self._max_step:
+            return
+        self._max_step = step
+        horizon = step - self.window_steps
+        for bucket in [bucket for bucket in self._senders_at if bucket <= horizon]:
+            for name in self._senders_at.pop(bucket):
+                history = self._history.get(name)
+                if history is not None and (not history or history[-1].step <= horizon):
+                    del self._history[name]
+                    if self.cache is not None:
+                        self.cache.invalidate(name)
+
+    def discard(self, token: str) -> None:
+        """Drop the rows still staged under ``token`` (their batch was not stored)."""
+        with self._lock:
+            self._staging.pop(token, None)
+
+    def compute_transaction(self, tx: Transaction, update: bool = True) -> Dict[str, float]:
+        """Compute features for a Transaction model instance."""
+        return self.compute(tx.step, tx.type, tx.amount, tx.nameOrig, tx.nameDest, update=update)
+
+    def compute_many(self, rows: Iterable[dict]) -> List[Dict[str, float]]:
+        """Compute features for step-ordered PaySim-style rows, updating state."""
+        rows = [(row["step"], row["type"], row["amount"], row["nameOrig"], row["nameDest"]) for row in rows]
+        features = self.compute_staged(rows)
+        self.record(rows)
+        return features
+
+    def evict_before(self, step: int) -> int:
+        """
+        Drop history older than the window ending at ``step``.
+
+        Returns:
+            int: Number of senders removed entirely
+        """
+        removed = 0
+        with self._lock:
+            for name in list(self._history):
+                history = self._history[name]
+                trimmed = False
+                while history and step - history[0].step >= self.window_steps:
+                    history.popleft()
+                    trimmed = True
+                if trimmed and self.cache is not None:
+                    self.cache.invalidate(name)
+                if not history:
+                    del self._history[name]
+                    removed += 1
+        if self.cache is not None:
+            self.cache.flush()
+        return removed
+
+    def clear(self) -> None:
+        """Forget all sender history (and cached summaries)."""
+        with self._lock:
+            self._history.clear()
+            self._staging.clear()
+            self._senders_at.clear()
+            self._max_step = 0
+        if self.cache is not None:
+            self.cache.clear()
+
+    def __len__(self) -> int:
+        return len(self._history)
+
+
+@lru_cache()
+def get_feature_engine() -> FeatureEngine:
+    """Get the process-wide feature engine (cached per FEATURE_CACHE_* settings)."""
+    cache = None
+    if settings.FEATURE_CACHE_SIZE > 0:
+        cache = FeatureCache(
+            maxsize=settings.FEATURE_CACHE_SIZE,
+            ttl_steps=settings.FEATURE_CACHE_TTL_STEPS,
+            backend=make_backend(settings.FEATURE_CACHE_BACKEND),
+            shared_ttl_seconds=settings.FEATURE_CACHE_SHARED_TTL_SECONDS,
+        )
+    return FeatureEngine(cache=cache)
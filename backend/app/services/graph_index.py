@@ -0,0 +1,320 @@
+"""In-memory transaction graph for counterparty and mule-ring expansion."""
+
+import threading
+from bisect import bisect_left, bisect_right, insort
+from collections import defaultdict, deque
+from typing import Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.models.transaction import Transaction
+
+# Edge: (step, counterparty entity id, amount); lists are kept sorted by step
+Edge = Tuple[int, int, float]
+
+# A transaction as the graph stores it: (orig id, dest id, step, amount)
+EdgeRow = Tuple[int, int, int, float]
+
+_MAX_STEP = float("inf")
+
+
+def edge_rows(transactions: Iterable[Transaction]) -> List[EdgeRow]:
+    """Graph rows for transactions with interned ids (others are skipped)."""
+    return [
+        (tx.orig_id, tx.dest_id, tx.step, float(tx.amount))
+        for tx in transactions
+        if tx.orig_id is not None and tx.dest_id is not None
+    ]
+
+
+class TransactionGraph:
+    """
+    Adjacency index over transactions keyed by entity id.
+
+    Keeps sender → receivers and receiver → senders edge lists, each
+    sorted by step so step-window filters are a binary search. Replaces
+    repeated self-joins on ``transactions`` for k-hop questions like
+    "who else did this destination receive from within N steps".
+
+    With ``window_steps`` only the most recent steps are kept: adding
+    transactions that advance the newest step evicts edges older than
+    the window.
+    """
+
+    def __init__(self, window_steps: Optional[int] = None):
+        self.window_steps = window_steps
+        self._out: Dict[int, List[Edge]] = defaultdict(list)
+        self._in: Dict[int, List[Edge]] = defaultdict(list)
+        self._lock = threading.RLock()
+        self.edge_count = 0
+        self.max_step = 0
+
+    # ------------------------------------------------------------------
+    # Construction
+    # ------------------------------------------------------------------
+
+    def add_edge(self, orig: int, dest: int, step: int, amount: float = 0.0) -> None:
+        """Add one transaction edge (appends when steps arrive in order)."""
+        with self._lock:
+            for edges, edge in ((self._out[orig], (step, dest, amount)), (self._in[dest], (step, orig, amount))):
+                if not edges or edges[-1][0] <= step:
+                    edges.append(edge)
+                else:
+                    insort(edges, edge)
+            self.edge_count += 1
+            self.max_step = max(self.max_step, step)
+
+    def add_edges(self, rows: Iterable[EdgeRow]) -> int:
+        """Add (orig, dest, step, amount) rows, then evict past the window."""
+        added = 0
+        latest = self.max_step
+        for orig, dest, step, amount in rows:
+            self.add_edge(orig, dest, step, amount)
+            added += 1
+        if self.window_steps is not None and self.max_step > latest:
+            self.evict_before(self.max_step - self.window_steps + 1)
+        return added
+
+    def add_transactions(self, transactions: Iterable[Transaction]) -> int:
+        """Add transactions with interned ``orig_id``/``dest_id``, then evict past the window."""
+        return self.add_edges(edge_rows(transactions))
+
+    @classmethod
+    def from_db(
+        cls,
+        db: Session,
+        window_steps: Optional[int] = None,
+        batch_size: int = 50_000,
+    ) -> "TransactionGraph":
+        """
+        Build the graph from the transactions table.
+
+        Args:
+            db: Database session
+            window_steps: Only load (and keep) the most recent N steps (None for all)
+            batch_size: Rows fetched per round trip
+        """
+        graph = cls(window_steps)
+        stmt = select(
+            Transaction.orig_id, Transaction.dest_id, Transaction.step, Transaction.amount
+        ).where(Transaction.orig_id.isnot(None), Transaction.dest_id.isnot(None))
+
+        if window_steps is not None:
+            latest = db.execute(select(func.max(Transaction.step))).scalar()
+            if latest is not None:
+                stmt = stmt.where(Transaction.step > latest - window_steps)
+
+        stmt = stmt.order_by(Transaction.step).execution_options(yield_per=batch_size)
+        for orig, dest, step, amount in db.execute(stmt):
+            graph.add_edge(orig, dest, step, float(amount))
+        return graph
+
+    @classmethod
+    def from_store(cls, store) -> "TransactionGraph":
+        """Build the graph from a ``TransactionStore`` (ids are store account ids)."""
+        graph = cls()
+        records = store.records
+        for orig, dest, step, amount in zip(
+            records["orig"].tolist(),
+            records["dest"].tolist(),
+            records["step"].tolist(),
+            records["amount"].tolist(),
+        ):
+            graph.add_edge(orig, dest, step, amount)
+        return graph
+
+    def evict_before(self, step: int) -> int:
+        """
+        Drop edges older than ``step`` to bound memory to recent activity.
+
+        Returns:
+            int: Number of transactions evicted
+        """
+        evicted = 0
+        with self._lock:
+            for index, counting in ((self._out, True), (self._in, False)):
+                for node in list(index):
+                    edges = index[node]
+                    cut = bisect_left(edges, (step,))
+                    if cut:
+                        if counting:
+                            evicted += cut
+                        del edges[:cut]
+                    if not edges:
+                        del index[node]
+            self.edge_count -= evicted
+        return evicted
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _window(edges: List[Edge], min_step: Optional[int], max_step: Optional[int]) -> List[Edge]:
+        lo = bisect_left(edges, (min_step,)) if min_step is not None else 0
+        hi = bisect_right(edges, (max_step, _MAX_STEP)) if max_step is not None else len(edges)
+        return edges[lo:hi]
+
+    def _indexes(self, direction: str) -> List[Dict[int, List[Edge]]]:
+        if direction == "out":
+            return [self._out]
+        if direction == "in":
+            return [self._in]
+        if direction == "both":
+            return [self._out, self._in]
+        raise ValueError(f"Invalid direction: {direction} (expected out, in or both)")
+
+    def edges(
+        self,
+        node: int,
+        direction: str = "out",
+        min_step: Optional[int] = None,
+        max_step: Optional[int] = None,
+    ) -> List[Edge]:
+        """Edges of ``node`` within a step window, in step order."""
+        with self._lock:
+            result: List[Edge] = []
+            for index in self._indexes(direction):
+                edges = index.get(node)
+                if edges:
+                    result.extend(self._window(edges, min_step, max_step))
+            return result
+
+    def neighbors(
+        self,
+        node: int,
+        direction: str = "out",
+        min_step: Optional[int] = None,
+        max_step: Optional[int] = None,
+    ) -> Set[int]:
+        """Distinct counterparties of ``node`` within a step window."""
+        return {other for _, other, _ in self.edges(node, direction, min_step, max_step)}
+
+    def fan_out(self, node: int, min_step: Optional[int] = None, max_step: Optional[int] = None) -> int:
+        """Number of distinct receivers ``node`` sent to."""
+        return len(self.neighbors(node, "out", min_step, max_step))
+
+    def fan_in(self, node: int, min_step: Optional[int] = None, max_step: Optional[int] = None) -> int:
+        """Number of distinct senders ``node`` received from."""
+        return len(self.neighbors(node, "in", min_step, max_step))
+
+    def expand(
+        self,
+        node: int,
+        hops: int = 2,
+        direction: str = "both",
+        min_step: Optional[int] = None,
+        max_step: Optional[int] = None,
+        max_nodes: int = 10_000,
+    ) -> Dict[int, int]:
+        """
+        Breadth-first k-hop expansion from ``node``.
+
+        Args:
+            node: Starting entity id
+            hops: Maximum number of hops
+            direction: Follow outgoing, incoming or both edge directions
+            min_step: Only follow edges at or after this step
+            max_step: Only follow edges at or before this step
+            max_nodes: Stop once this many nodes are reached (hub guard)
+
+        Returns:
+            Dict[int, int]: Reached entity id → hop distance (start is 0)
+        """
+        distances = {node: 0}
+        frontier = deque([node])
+        while frontier and len(distances) < max_nodes:
+            current = frontier.popleft()
+            depth = distances[current]
+            if depth >= hops:
+                continue
+            for other in self.neighbors(current, direction, min_step, max_step):
+                if other not in distances:
+                    distances[other] = depth + 1
+                    frontier.append(other)
+                    if len(distances) >= max_nodes:
+                        break
+        return distances
+
+    def connected_components(
+        self,
+        min_step: Optional[int] = None,
+        max_step: Optional[int] = None,
+        min_size: int = 2,
+    ) -> List[Set[int]]:
+        """
+        Weakly connected components over edges within a step window.
+
+        Returns:
+            List[Set[int]]: Components with at least ``min_size`` entities, largest first
+        """
+        parent: Dict[int, int] = {}
+
+        def find(x: int) -> int:
+            root = x
+            while parent.get(root, root) != root:
+                root = parent[root]
+            while parent.get(x, x) != root:
+                parent[x], x = root, parent[x]
+            return root
+
+        with self._lock:
+            for orig, edges in self._out.items():
+                for _, dest, _ in self._window(edges, min_step, max_step):
+                    parent.setdefault(orig, orig)
+                    parent.setdefault(dest, dest)
+                    a, b = find(orig), find(dest)
+                    if a != b:
+                        parent[a] = b
+
+        components: Dict[int, Set[int]] = defaultdict(set)
+        for member in list(parent):
+            components[find(member)].add(member)
+
+        result = [members for members in components.values() if len(members) >= min_size]
+        result.sort(key=len, reverse=True)
+        return result
+
+
+_graph: Optional[TransactionGraph] = None
+_graph_lock = threading.Lock()
+
+
+def get_transaction_graph(db: Session) -> TransactionGraph:
+    """
+    Get the process-wide graph, building it from the database on first use.
+
+    Each worker holds its own graph. With WORKERS > 1 the worker storing a
+    batch sends its edges to every other worker after commit (see
+    ShardRouter.publish_edges), so all graphs answer alike; a worker that
+    was unreachable at the time misses those edges until it restarts.
+    """
+    global _graph
+    if _graph is None:
+        with _graph_lock:
+            if _graph is None:
+                _graph = TransactionGraph.from_db(db, window_steps=settings.GRAPH_WINDOW_STEPS)
+    return _graph
+
+
+def add_to_transaction_graph(rows: Sequence[EdgeRow]) -> None:
+    """
+    Add committed edges to the process-wide graph if it is built.
+
+    Waits for a build in progress, whose query may have started before
+    the rows were committed; rows it already read are added twice, which
+    the distinct-counterparty queries tolerate.
+    """
+    with _graph_lock:
+        graph = _graph
+    if graph is not None:
+        graph.add_edges(rows)
+
+
+def reset_transaction_graph() -> None:
+    """Discard the process-wide graph (rebuilt on next use)."""
+    global _graph
+    with _graph_lock:
+        _graph = None
@@ -0,0 +1,302 @@
+"""Model registry - versioned model artifacts on disk and hot champion swaps."""
+
+import json
+import logging
+import os
+import shutil
+import threading
+import time
+from datetime import datetime
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from app.config import settings
+from app.services.feature_engine import FEATURE_NAMES
+from app.services.scoring import MockModel, ModelScorer, artifact_version, load_scorer
+from app.utils.metrics import MODEL_RELOADS
+
+logger = logging.getLogger("app.model")
+
+ARTIFACT_NAME = "model.pkl"
+METADATA_NAME = "metadata.json"
+CURRENT_NAME = "CURRENT"
+
+# Sample batch scored before a new model is swapped in (first-call costs paid off the hot path)
+WARMUP_FEATURES: List[Dict[str, float]] = [
+    {name: 0.0 for name in FEATURE_NAMES},
+    {**{name: 1.0 for name in FEATURE_NAMES}, "amount_zscore": 3.0, "velocity_1h": 5.0},
+] * 16
+
+
+class UnknownModelVersionError(LookupError):
+    """The requested model version is not in the registry."""
+
+
+class ModelRegistry:
+    """
+    Versioned model artifacts under MODEL_REGISTRY_DIR.
+
+    Layout::
+
+        <root>/CURRENT                 active version name
+        <root>/<version>/model.pkl     joblib artifact
+        <root>/<version>/metadata.json free-form (created_at, metrics, ...)
+
+    Without a CURRENT file the newest version is active. CURRENT is
+    replaced atomically, so every worker watching the registry sees
+    either the old or the new version.
+    """
+
+    def __init__(self, root: str):
+        self.root = Path(root)
+
+    def versions(self) -> List[Dict]:
+        """Registered versions with their metadata, oldest first."""
+        if not self.root.is_dir():
+            return []
+        versions = []
+        for directory in self.root.iterdir():
+            if not (directory / ARTIFACT_NAME).is_file():
+                continue
+            metadata = {}
+            if (directory / METADATA_NAME).is_file():
+                metadata = json.loads((directory / METADATA_NAME).read_text())
+            metadata.setdefault(
+                "created_at",
+                datetime.utcfromtimestamp((directory / ARTIFACT_NAME).stat().st_mtime).isoformat(),
+            )
+            versions.append({**metadata, "version": directory.name})
+        return sorted(versions, key=lambda v: (v["created_at"], v["version"]))
+
+    def path(self, version: str) -> Path:
+        """Artifact path of a version."""
+        path = self.root / version / ARTIFACT_NAME
+        if "/" in version or version.startswith(".") or not path.is_file():
+            raise UnknownModelVersionError(f"Model version {version!r} not found in {self.root}")
+        return path
+
+    def active(self) -> Optional[str]:
+        """The active version (CURRENT, else the newest), or None for an empty registry."""
+        current = self.root / CURRENT_NAME
+        if current.is_file():
+            version = current.read_text().strip()
+            if (self.root / version / ARTIFACT_NAME).is_file():
+                return version
+            logger.warning("CURRENT names missing model version %s; using the newest", version)
+        versions = self.versions()
+        return versions[-1]["version"] if versions else None
+
+    def activate(self, version: str) -> None:
+        """Point CURRENT at ``version`` (atomic rename)."""
+        self.path(version)
+        tmp = self.root / f".{CURRENT_NAME}.{os.getpid()}"
+        tmp.write_text(version + "\n")
+        os.replace(tmp, self.root / CURRENT_NAME)
+
+    def register(self, version: str, artifact: str, metadata: Optional[Dict] = None) -> Path:
+        """Copy an artifact into the registry as ``version`` (does not activate it)."""
+        directory = self.root / version
+        if directory.exists():
+            raise ValueError(f"Model version {version!r} already registered")
+        directory.mkdir(parents=True)
+        shutil.copyfile(artifact, directory / ARTIFACT_NAME)
+        metadata = {"created_at": datetime.utcnow().isoformat(), **(metadata or {})}
+        (directory / METADATA_NAME).write_text(json.dumps(metadata, indent=2))
+        return directory / ARTIFACT_NAME
+
+
+class ModelManager:
+    """
+    Holds the champion scorer and swaps it without pausing ingestion.
+
+    A new version is loaded and warmed with a sample batch in a
+    background thread while the old one keeps scoring; the swap is a
+    single reference assignment, and batches already scoring finish on
+    the model they started with. A watcher thread follows the registry's
+    active version, so activating a version on one worker reloads all.
+    """
+
+    def __init__(self, registry: ModelRegistry):
+        self.registry = registry
+        self._champion: Optional[ModelScorer] = None
+        self._load_lock = threading.Lock()
+        self._state_lock = threading.Lock()
+        self._loading: Optional[str] = None
+        self._watcher: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+        self.loaded_at: Optional[datetime] = None
+        self.warm_ms: Optional[float] = None
+        self.last_error: Optional[str] = None
+
+    @property
+    def champion(self) -> ModelScorer:
+        """The current champion (loaded on first use)."""
+        champion = self._champion
+        return champion if champion is not None else self.load_initial()
+
+    @property
+    def loading(self) -> Optional[str]:
+        """Version being loaded in the background, if any."""
+        return self._loading
+
+    def load_initial(self) -> ModelScorer:
+        """
+        Load the registry's active version, else ML_MODEL_PATH, else the mock model.
+
+        Idempotent; called by warm-up and by the cluster supervisor before forking.
+        """
+        with self._load_lock:
+            if self._champion is not None:
+                return self._champion
+            version = None if settings.USE_MOCK_SCORING else self.registry.active()
+            if version is not None:
+                scorer = load_scorer(str(self.registry.path(version)), version)
+            else:
+                from app.services.model_store import load_model
+
+                model = load_model()
+                if model is None:
+                    model = MockModel()
+                    scorer = ModelScorer(model, model.version)
+                else:
+                    scorer = ModelScorer(model, artifact_version(settings.ML_MODEL_PATH))
+            self._install(scorer)
+            return scorer
+
+    def reload(self, version: Optional[str] = None, activate: bool = False) -> ModelScorer:
+        """
+        Load, warm and swap in ``version`` (default: the registry's active version).
+
+        With ``activate`` the registry's CURRENT is pointed at ``version``
+        only once it has loaded and warmed, just before the swap, so a
+        version that fails to load never becomes active for other workers.
+
+        Raises:
+            UnknownModelVersionError: Version not in the registry
+            RuntimeError: Mock scoring is enabled
+        """
+        if settings.USE_MOCK_SCORING:
+            raise RuntimeError("USE_MOCK_SCORING is enabled; the registry is not used")
+        version = version or self.registry.active()
+        if version is None:
+            raise UnknownModelVersionError(f"No model versions in {self.registry.root}")
+        path = self.registry.path(version)
+
+        with self._load_lock:
+            current = self._champion
+            if current is not None and current.version == version:
+                if activate:
+                    self.registry.activate(version)
+                return current
+            self._loading = version
+            try:
+                scorer = load_scorer(str(path), version)
+                self._warm(scorer)
+                if activate:
+                    self.registry.activate(version)
+                self._swap(scorer)
+            except Exception as e:
+                self.last_error = f"{type(e).__name__}: {e}"
+                MODEL_RELOADS.labels("failed").inc()
+                logger.exception("Loading model version %s failed; keeping %s", version,
+                                 current.version if current else None)
+                raise
+            finally:
+                self._loading = None
+        MODEL_RELOADS.labels("swapped").inc()
+        logger.info("Champion model swapped to %s", version,
+                    extra={"previous": current.version if current else None, "warm_ms": self.warm_ms})
+        return scorer
+
+    def _install(self, scorer: ModelScorer) -> None:
+        """Warm ``scorer`` and make it the champion."""
+        self._warm(scorer)
+        self._swap(scorer)
+
+    def _warm(self, scorer: ModelScorer) -> None:
+        """Score a sample batch so first-call costs are paid before the swap."""
+        started = time.perf_counter()
+        scorer.score(WARMUP_FEATURES)
+        self.warm_ms = round((time.perf_counter() - started) * 1000, 3)
+
+    def _swap(self, scorer: ModelScorer) -> None:
+        self._champion = scorer
+        self.loaded_at = datetime.utcnow()
+        self.last_error = None
+
+    def activate(self, version: str) -> threading.Thread:
+        """
+        Load and warm ``version`` in a background thread, then make it active.
+
+        The registry's CURRENT changes only after the load and warm-up
+        succeed; on failure it keeps naming the previous version.
+
+        Raises:
+            UnknownModelVersionError: Version not in the registry
+            RuntimeError: Mock scoring is enabled or another load is running
+        """
+        if settings.USE_MOCK_SCORING:
+            raise RuntimeError("USE_MOCK_SCORING is enabled; the registry is not used")
+        self.registry.path(version)
+        with self._state_lock:
+            if self._loading is not None:
+                raise RuntimeError(f"Model version {self._loading} is still loading")
+            self._loading = version
+        thread = threading.Thread(
+            target=self._reload_quietly, args=(version, True), name="model-reload", daemon=True
+        )
+        thread.start()
+        return thread
+
+    def _reload_quietly(self, version: Optional[str] = None, activate: bool = False) -> None:
+        try:
+            self.reload(version, activate)
+        except Exception:
+            pass  # Logged and kept in last_error by reload()
+        finally:
+            self._loading = None
+
+    def watch(self, poll_seconds: float) -> None:
+        """Reload whenever the registry's active version changes (no-op if poll_seconds <= 0)."""
+        if poll_seconds <= 0 or settings.USE_MOCK_SCORING or self._watcher is not None:
+            return
+        self._stop.clear()
+        self._watcher = threading.Thread(target=self._watch, args=(poll_seconds,), name="model-watcher", daemon=True)
+        self._watcher.start()
+
+    def _watch(self, poll_seconds: float) -> None:
+        while not self._stop.wait(poll_seconds):
+            current = self._champion
+            if current is None or self._loading is not None:
+                continue  # Initial load (warm-up) or a reload in progress
+            try:
+                version = self.registry.active()
+            except OSError:
+                logger.exception("Reading model registry %s failed", self.registry.root)
+                continue
+            if version is not None and version != current.version:
+                self._reload_quietly(version)
+
+    def stop(self) -> None:
+        """Stop the registry watcher."""
+        self._stop.set()
+        if self._watcher is not None:
+            self._watcher.join()
+            self._watcher = None
+
+    def status(self) -> Dict:
+        champion = self._champion
+        return {
+            "version": champion.version if champion else None,
+            "loaded_at": self.loaded_at.isoformat() if self.loaded_at else None,
+            "warm_ms": self.warm_ms,
+            "loading": self._loading,
+            "last_error": self.last_error,
+        }
+
+
+@lru_cache()
+def get_model_manager() -> ModelManager:
+    """Get the process-wide champion model manager."""
+    return ModelManager(ModelRegistry(settings.MODEL_REGISTRY_DIR))
@@ -0,0 +1,53 @@
+"""Model store - loads the scoring model once per process tree."""
+
+import logging
+import threading
+from pathlib import Path
+from typing import Any, Optional
+
+from app.config import settings
+
+logger = logging.getLogger("app.model")
+
+_model: Optional[Any] = None
+_lock = threading.Lock()
+
+
+def load_model(path: Optional[str] = None) -> Optional[Any]:
+    """
+    Load the scoring model (idempotent).
+
+    Numpy arrays inside an uncompressed joblib dump are memory-mapped
+    read-only, so every worker maps the same pages. When the cluster
+    supervisor calls this before forking, the rest of the object graph
+    is shared copy-on-write as well.
+
+    Returns:
+        Optional[Any]: The model, or None with mock scoring or no model file
+    """
+    global _model
+    if _model is not None or settings.USE_MOCK_SCORING:
+        return _model
+
+    model_path = Path(path or settings.ML_MODEL_PATH)
+    if not model_path.exists():
+        logger.warning("Model file %s not found; scoring unavailable", model_path)
+        return None
+
+    with _lock:
+        if _model is None:
+            _model = load_artifact(model_path)
+            logger.info("Loaded model from %s", model_path)
+    return _model
+
+
+def load_artifact(path) -> Any:
+    """Load a joblib model artifact with numpy arrays memory-mapped read-only."""
+    import joblib
+
+    return joblib.load(path, mmap_mode="r")
+
+
+def get_model() -> Optional[Any]:
+    """Get the loaded model without triggering a load."""
+    return _model
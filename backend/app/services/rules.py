@@ -0,0 +1,52 @@
+"""Detection rules evaluated on engineered features."""
+
+from typing import Dict, List
+
+# Rule catalogue (ids match the RULES_TEMPLATES used by scripts/seed_data.py)
+RULES: Dict[str, Dict[str, str]] = {
+    "R001": {
+        "rule_id": "R001",
+        "rule_name": "HIGH_VALUE_TRANSFER",
+        "reason": "Transfer amount exceeds $200,000 threshold",
+    },
+    "R002": {
+        "rule_id": "R002",
+        "rule_name": "NEW_COUNTERPARTY",
+        "reason": "First transaction between these entities in 7 days",
+    },
+    "R003": {
+        "rule_id": "R003",
+        "rule_name": "VELOCITY_SPIKE",
+        "reason": "Transaction count in 24h exceeds 10",
+    },
+    "R004": {
+        "rule_id": "R004",
+        "rule_name": "TRANSFER_CASHOUT_SEQUENCE",
+        "reason": "TRANSFER followed by CASH_OUT within 2 hours",
+    },
+}
+
+# Boolean feature (see app.services.feature_engine) → rule it triggers
+FEATURE_RULES = {
+    "high_value_transfer_rule": "R001",
+    "cashout_sequence_2h": "R004",
+}
+
+
+def evaluate_rules(features: Dict[str, float]) -> List[Dict[str, str]]:
+    """
+    Rules triggered by one transaction's features.
+
+    Returns:
+        List[Dict[str, str]]: RuleTrigger dicts, in catalogue order
+    """
+    return [RULES[rule_id] for name, rule_id in FEATURE_RULES.items() if features.get(name)]
+
+
+def merge_rules(*rule_lists: List[Dict[str, str]]) -> List[Dict[str, str]]:
+    """Union of RuleTrigger lists by rule_id, keeping first-seen order."""
+    merged: Dict[str, Dict[str, str]] = {}
+    for rules in rule_lists:
+        for rule in rules:
+            merged.setdefault(rule["rule_id"], rule)
+    return list(merged.values())
@@ -0,0 +1,118 @@
+"""Scoring - champion model scores for ingested micro-batches."""
+
+import math
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence
+
+from app.config import settings
+from app.models.alert import AlertPriority, RiskBand
+from app.services.feature_engine import FEATURE_NAMES
+
+# Risk bands by score (same cut-offs as scripts/seed_data.py)
+RISK_BANDS = [
+    (0.90, RiskBand.CRITICAL, AlertPriority.CRITICAL),
+    (0.75, RiskBand.HIGH, AlertPriority.HIGH),
+    (0.60, RiskBand.MEDIUM, AlertPriority.MEDIUM),
+    (0.0, RiskBand.LOW, AlertPriority.LOW),
+]
+
+
+def risk_band(score: float) -> RiskBand:
+    """Risk band for a model score."""
+    return next(band for cutoff, band, _ in RISK_BANDS if score >= cutoff)
+
+
+def alert_priority(score: float, rules_triggered: bool) -> AlertPriority:
+    """Priority from the score; rule hits are at least HIGH, and CRITICAL with a score > 0.7."""
+    priority = next(priority for cutoff, _, priority in RISK_BANDS if score >= cutoff)
+    if rules_triggered:
+        if score > 0.7:
+            return AlertPriority.CRITICAL
+        if priority in (AlertPriority.LOW, AlertPriority.MEDIUM):
+            return AlertPriority.HIGH
+    return priority
+
+
+class MockModel:
+    """
+    Deterministic stand-in for the trained model (USE_MOCK_SCORING).
+
+    A fixed logistic function of the engineered features, so scores react
+    to the same signals as the rules without a model artifact.
+    """
+
+    WEIGHTS = {
+        "velocity_1h": 0.3,
+        "amount_zscore": 0.6,
+        "new_counterparty_7d": 0.8,
+        "high_value_transfer_rule": 2.5,
+        "cashout_sequence_2h": 2.0,
+    }
+    BIAS = -4.0
+
+    def __init__(self, version: str = "mock-v1", bias: Optional[float] = None):
+        self.version = version
+        self.bias = self.BIAS if bias is None else bias
+
+    def score_features(self, features: Sequence[Dict[str, float]]) -> List[float]:
+        scores = []
+        for values in features:
+            z = self.bias
+            for name, weight in self.WEIGHTS.items():
+                z += weight * max(-3.0, min(float(values.get(name, 0.0)), 5.0))
+            scores.append(round(1.0 / (1.0 + math.exp(-z)), 6))
+        return scores
+
+
+class ModelScorer:
+    """Scores feature dicts with a loaded model artifact or MockModel."""
+
+    def __init__(self, model: Any, version: str):
+        self.model = model
+        self.version = version
+
+    def score(self, features: Sequence[Dict[str, float]]) -> List[float]:
+        """
+        Score a micro-batch.
+
+        Returns:
+            List[float]: Fraud probability per feature dict, in order
+        """
+        if not features:
+            return []
+        if hasattr(self.model, "score_features"):
+            return self.model.score_features(features)
+
+        import numpy as np
+
+        matrix = np.array([[values[name] for name in FEATURE_NAMES] for values in features])
+        return self.model.predict_proba(matrix)[:, 1].astype(float).tolist()
+
+
+def load_scorer(path: Optional[str], version: Optional[str] = None) -> ModelScorer:
+    """
+    Build a scorer for a model artifact; ``mock`` (or mock scoring) gives MockModel.
+    """
+    from app.services.model_store import load_artifact
+
+    if settings.USE_MOCK_SCORING or not path or path == "mock":
+        model = MockModel()
+        return ModelScorer(model, version or model.version)
+    return ModelScorer(load_artifact(path), version or artifact_version(path))
+
+
+def artifact_version(path: str) -> str:
+    """Model version from the artifact file name (``fraud_detector_v1.pkl`` → ``fraud_detector_v1``)."""
+    return Path(path).stem
+
+
+def get_champion() -> ModelScorer:
+    """
+    Get the current champion scorer (see app.services.model_registry).
+
+    Callers should take it once per batch: a hot swap replaces the
+    champion between calls, never during one.
+    """
+    from app.services.model_registry import get_model_manager
+
+    return get_model_manager().champion
@@ -0,0 +1,187 @@
+"""Search service - ranked full-text search over alert notes and account names."""
+
+import re
+from typing import Dict, List, Tuple
+
+from sqlalchemy import Float, Integer, String, column, func, select, table, text
+from sqlalchemy.orm import Session, joinedload
+
+from app.models.alert import Alert
+from app.models.entity import Entity, EntityAggregate
+from app.models.search import NAMES_FTS, NOTES_FTS, rebuild_statements
+from app.schemas.search import AccountMatch
+
+# Below this length a substring cannot use the trigram index; only prefixes are searched
+MIN_SUBSTRING_LENGTH = 3
+
+# Rank of an account match (lower sorts first)
+MATCH_RANKS = {"exact": 0, "prefix": 1, "substring": 2}
+
+# FTS5 trigram index over entities.name (rowid = entities.id)
+_names_fts = table(NAMES_FTS, column("rowid", Integer), column("name", String))
+
+# Upper bound for prefix range scans on the name index
+_PREFIX_END = "\U0010ffff"
+
+
+def _terms(query: str) -> List[str]:
+    return re.findall(r"\w+", query)
+
+
+def _fts_query(terms: List[str]) -> str:
+    """FTS5 query: every term required, the last one as a prefix (search as you type)."""
+    return " ".join(f'"{term}"' for term in terms) + "*"
+
+
+def _tsquery(terms: List[str]) -> str:
+    """PostgreSQL tsquery: every term required, the last one as a prefix."""
+    return " & ".join(terms[:-1] + [f"{terms[-1]}:*"])
+
+
+def _match_kind(name: str, query: str) -> str:
+    name, query = name.lower(), query.lower()
+    if name == query:
+        return "exact"
+    return "prefix" if name.startswith(query) else "substring"
+
+
+class SearchService:
+    """Business logic for search over alert notes and account names."""
+
+    @staticmethod
+    def search_alert_notes(
+        db: Session,
+        query: str,
+        page: int = 1,
+        page_size: int = 25,
+        max_matches: int = 1000,
+    ) -> Tuple[List[Tuple[Alert, float, str]], int, bool]:
+        """
+        Full-text search over the notes of hot alerts, best match first.
+
+        Every word must match; the last may be a prefix. Ranked with bm25
+        on SQLite and ts_rank on PostgreSQL. Archived alerts are not
+        indexed (they rejoin the index when restored).
+
+        Returns:
+            tuple: ([(alert, score, snippet)], total, truncated); the total
+            is counted up to ``max_matches``
+        """
+        terms = _terms(query)
+        if not terms:
+            return [], 0, False
+
+        score_columns = (column("id", Alert.__table__.c.id.type), column("score", Float), column("snippet", String))
+        if db.get_bind().dialect.name == "postgresql":
+            params = {"query": _tsquery(terms)}
+            matches = "FROM alerts, to_tsquery('english', :query) AS query WHERE notes_tsv @@ query"
+            count_sql = f"SELECT count(*) FROM (SELECT 1 {matches} LIMIT :cap) AS hits"
+            page_sql = (
+                "SELECT id, ts_rank(notes_tsv, query) AS score, "
+                "ts_headline('english', notes, query, 'StartSel=[, StopSel=], MinWords=8, MaxWords=24') AS snippet "
+                f"{matches} ORDER BY score DESC, id LIMIT :limit OFFSET :offset"
+            )
+        else:
+            params = {"query": _fts_query(terms)}
+            count_sql = f"SELECT count(*) FROM (SELECT rowid FROM {NOTES_FTS} WHERE {NOTES_FTS} MATCH :query LIMIT :cap)"
+            # bm25 is lower for better matches; negate so higher means more relevant
+            page_sql = (
+                f"SELECT a.id, -bm25({NOTES_FTS}) AS score, snippet({NOTES_FTS}, 0, '[', ']', '...', 16) AS snippet "
+                f"FROM {NOTES_FTS} JOIN alerts AS a ON a.search_id = {NOTES_FTS}.rowid "
+                f"WHERE {NOTES_FTS} MATCH :query ORDER BY score DESC LIMIT :limit OFFSET :offset"
+            )
+
+        total = db.execute(text(count_sql), {**params, "cap": max_matches}).scalar()
+        if not total:
+            return [], 0, False
+        rows = db.execute(
+            text(page_sql).columns(*score_columns),
+            {**params, "limit": page_size, "offset": (page - 1) * page_size},
+        ).all()
+
+        alerts = {
+            alert.id: alert
+            for alert in db.query(Alert)
+            .options(joinedload(Alert.transaction))
+            .filter(Alert.id.in_([row.id for row in rows]))
+        } if rows else {}
+        hits = [(alerts[row.id], float(row.score), row.snippet or "") for row in rows if row.id in alerts]
+        return hits, total, total >= max_matches
+
+    @staticmethod
+    def search_accounts(
+        db: Session,
+        query: str,
+        page: int = 1,
+        page_size: int = 25,
+        max_matches: int = 1000,
+    ) -> Tuple[List[AccountMatch], int, bool]:
+        """
+        Find accounts whose name contains ``query`` (case-insensitive).
+
+        Prefixes come from the index on lower(name) and substrings of 3+
+        characters from the trigram index, each capped at ``max_matches``.
+        Exact matches rank first, then prefix, then substring matches,
+        then by name.
+
+        Returns:
+            tuple: (matches, total, truncated)
+        """
+        query = query.strip()
+        if not query:
+            return [], 0, False
+
+        # Range scan of ix_entities_name_lower, so "c123" finds "C123..."
+        lowered = func.lower(Entity.name)
+        prefix = query.lower()
+        names: Dict[int, str] = dict(db.execute(
+            select(Entity.id, Entity.name)
+            .where(lowered >= prefix, lowered < prefix + _PREFIX_END)
+            .order_by(lowered)
+            .limit(max_matches)
+        ).all())
+        truncated = len(names) >= max_matches
+
+        if len(query) >= MIN_SUBSTRING_LENGTH:
+            if db.get_bind().dialect.name == "postgresql":
+                escaped = query.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+                substring = select(Entity.id, Entity.name).where(Entity.name.ilike(f"%{escaped}%", escape="\\"))
+            else:
+                substring = (
+                    select(Entity.id, Entity.name)
+                    .join_from(_names_fts, Entity, Entity.id == _names_fts.c.rowid)
+                    .where(_names_fts.c.name.match('"' + query.replace('"', '""') + '"'))
+                )
+            matched = db.execute(substring.limit(max_matches)).all()
+            truncated = truncated or len(matched) >= max_matches
+            names.update(matched)
+
+        ranked = sorted(names.items(), key=lambda item: (MATCH_RANKS[_match_kind(item[1], query)], item[1]))
+        page_rows = ranked[(page - 1) * page_size:page * page_size]
+
+        aggregates = {
+            aggregate.entity_id: aggregate
+            for aggregate in db.query(EntityAggregate).filter(
+                EntityAggregate.entity_id.in_([entity_id for entity_id, _ in page_rows])
+            )
+        } if page_rows else {}
+
+        matches = []
+        for entity_id, name in page_rows:
+            aggregate = aggregates.get(entity_id)
+            matches.append(AccountMatch(
+                name=name,
+                match=_match_kind(name, query),
+                is_merchant=name.startswith("M"),
+                total_transactions=aggregate.total_transactions if aggregate else 0,
+                alert_count=aggregate.alert_count if aggregate else 0,
+                fraud_count=aggregate.fraud_count if aggregate else 0,
+            ))
+        return matches, len(names), truncated
+
+    @staticmethod
+    def rebuild(db: Session) -> None:
+        """Repopulate the SQLite FTS indexes from their tables (e.g. after writes that bypassed the triggers); commits."""
+        for statement in rebuild_statements(db.get_bind().dialect.name):
+            db.execute(text(statement))
+        db.commit()
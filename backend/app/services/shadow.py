@@ -0,0 +1,224 @@
+"""Shadow scoring - a challenger model scored off the ingestion path."""
+
+import logging
+import queue
+import threading
+from functools import lru_cache
+from typing import Callable, Dict, List, NamedTuple, Optional
+from uuid import UUID
+
+from sqlalchemy import case, func, insert, select
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.models.shadow_score import ShadowScore
+from app.models.transaction import Transaction
+from app.services.scoring import ModelScorer, load_scorer
+from app.utils.metrics import SCORING_QUEUE_DEPTH, SHADOW_BATCHES
+
+logger = logging.getLogger("app.shadow")
+
+
+class ShadowBatch(NamedTuple):
+    """One ingested micro-batch as the champion saw it."""
+
+    ids: List[UUID]
+    steps: List[int]
+    features: List[Dict[str, float]]
+    champion_scores: List[float]
+
+
+class ShadowScorer:
+    """
+    Scores ingested micro-batches with a challenger model in a background thread.
+
+    Ingestion only enqueues (``put_nowait``) after its commit; the queue is
+    bounded and a batch that does not fit is shed and counted rather than
+    waited for, so a slow challenger never adds latency to the champion.
+    Scores are bulk-inserted into ``shadow_scores`` with the worker's own
+    session.
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], Session],
+        queue_size: int = 100,
+        challenger: Optional[ModelScorer] = None,
+    ):
+        self.session_factory = session_factory
+        self.challenger = challenger
+        self._queue: "queue.Queue[Optional[ShadowBatch]]" = queue.Queue(maxsize=queue_size)
+        self._thread: Optional[threading.Thread] = None
+        self.stats = {"scored": 0, "shed": 0, "failed": 0, "rows": 0, "shed_rows": 0}
+        self.last_error: Optional[str] = None
+
+    @property
+    def enabled(self) -> bool:
+        """True while a challenger is loaded and the worker runs."""
+        return self.challenger is not None and self._thread is not None and self._thread.is_alive()
+
+    def load(self, path: str) -> None:
+        """Load the challenger model (warm-up task)."""
+        self.challenger = load_scorer(path)
+        logger.info("Loaded challenger model %s", self.challenger.version)
+
+    def start(self) -> None:
+        """Start the worker thread (no-op if running)."""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._thread = threading.Thread(target=self._run, name="shadow-scorer", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """Stop the worker after the batches already queued."""
+        if self._thread is None:
+            return
+        try:
+            self._queue.put(None, timeout=timeout)
+        except queue.Full:
+            logger.warning("Shadow queue still full at shutdown; abandoning queued batches")
+        self._thread.join(timeout)
+        self._thread = None
+
+    def submit(self, batch: ShadowBatch) -> bool:
+        """
+        Hand a micro-batch to the challenger without blocking.
+
+        Returns:
+            bool: False when disabled or the batch was shed (queue full)
+        """
+        if not self.enabled or not batch.ids:
+            return False
+        try:
+            self._queue.put_nowait(batch)
+        except queue.Full:
+            self.stats["shed"] += 1
+            self.stats["shed_rows"] += len(batch.ids)
+            SHADOW_BATCHES.labels("shed").inc()
+            return False
+        SCORING_QUEUE_DEPTH.labels("shadow").set(self._queue.qsize())
+        return True
+
+    def join(self) -> None:
+        """Block until every queued batch has been processed (tests, shutdown)."""
+        self._queue.join()
+
+    def _run(self) -> None:
+        while True:
+            batch = self._queue.get()
+            try:
+                if batch is None:
+                    return
+                self._score(batch)
+            finally:
+                SCORING_QUEUE_DEPTH.labels("shadow").set(self._queue.qsize())
+                self._queue.task_done()
+
+    def _score(self, batch: ShadowBatch) -> None:
+        challenger = self.challenger
+        try:
+            scores = challenger.score(batch.features)
+            rows = [
+                {
+                    "transaction_id": transaction_id,
+                    "model_version": challenger.version,
+                    "step": step,
+                    "champion_score": champion,
+                    "challenger_score": score,
+                }
+                for transaction_id, step, champion, score in zip(
+                    batch.ids, batch.steps, batch.champion_scores, scores
+                )
+            ]
+            db = self.session_factory()
+            try:
+                db.execute(insert(ShadowScore), rows)
+                db.commit()
+            finally:
+                db.close()
+        except Exception as e:
+            self.stats["failed"] += 1
+            self.last_error = f"{type(e).__name__}: {e}"
+            SHADOW_BATCHES.labels("failed").inc()
+            logger.exception("Shadow scoring failed for a batch of %d", len(batch.ids))
+            return
+        self.stats["scored"] += 1
+        self.stats["rows"] += len(rows)
+        SHADOW_BATCHES.labels("scored").inc()
+
+    def status(self) -> Dict:
+        return {
+            "enabled": self.enabled,
+            "challenger_version": self.challenger.version if self.challenger else None,
+            "queue_depth": self._queue.qsize(),
+            "queue_size": self._queue.maxsize,
+            "batches": dict(self.stats),
+            "last_error": self.last_error,
+        }
+
+
+def compare_models(db: Session, threshold: float) -> List[Dict]:
+    """
+    Champion vs challenger on every shadow-scored transaction, per challenger version.
+
+    Agreement is on the alert decision at ``threshold``; precision and
+    recall use ``isFraud`` of the joined transactions.
+    """
+    champion = ShadowScore.champion_score >= threshold
+    challenger = ShadowScore.challenger_score >= threshold
+    fraud = Transaction.isFraud.is_(True)
+
+    def count(condition):
+        return func.sum(case((condition, 1), else_=0))
+
+    rows = db.execute(
+        select(
+            ShadowScore.model_version,
+            func.count(),
+            func.avg(func.abs(ShadowScore.champion_score - ShadowScore.challenger_score)),
+            count(champion == challenger),
+            count(fraud),
+            count(champion),
+            count(challenger),
+            count(champion & fraud),
+            count(challenger & fraud),
+            func.min(ShadowScore.step),
+            func.max(ShadowScore.step),
+        )
+        .join(Transaction, Transaction.id == ShadowScore.transaction_id)
+        .group_by(ShadowScore.model_version)
+    ).all()
+
+    def metrics(alerts: int, hits: int, frauds: int) -> Dict:
+        return {
+            "alerts": alerts,
+            "true_positives": hits,
+            "precision": round(hits / alerts, 6) if alerts else 0.0,
+            "recall": round(hits / frauds, 6) if frauds else 0.0,
+        }
+
+    return [
+        {
+            "model_version": version,
+            "transactions": total,
+            "fraud": frauds,
+            "first_step": first_step,
+            "last_step": last_step,
+            "mean_abs_diff": round(float(mean_diff or 0.0), 6),
+            "agreement": round(agree / total, 6) if total else 0.0,
+            "champion": metrics(int(champion_alerts), int(champion_hits), int(frauds)),
+            "challenger": metrics(int(challenger_alerts), int(challenger_hits), int(frauds)),
+        }
+        for (
+            version, total, mean_diff, agree, frauds, champion_alerts, challenger_alerts,
+            champion_hits, challenger_hits, first_step, last_step,
+        ) in rows
+    ]
+
+
+@lru_cache()
+def get_shadow_scorer() -> ShadowScorer:
+    """Get the process-wide shadow scorer (idle until a challenger is loaded and started)."""
+    from app.database import SessionLocal
+
+    return ShadowScorer(SessionLocal, settings.SHADOW_QUEUE_SIZE)
@@ -0,0 +1,334 @@
+"""Account sharding - routes per-account feature state to its owning worker."""
+
+import logging
+import os
+import stat
+import threading
+import zlib
+from collections import defaultdict
+from functools import lru_cache
+from multiprocessing import AuthenticationError
+from multiprocessing.connection import Client, Connection, Listener
+from typing import Any, Dict, List, Optional, Sequence, Set
+
+from app.config import settings
+from app.services.alert_broker import get_alert_broker
+from app.services.feature_engine import FeatureEngine, FeatureRow, get_feature_engine
+from app.services.graph_index import EdgeRow, add_to_transaction_graph
+
+logger = logging.getLogger("app.sharding")
+
+
+class ShardUnavailableError(RuntimeError):
+    """The worker owning an account could not be reached."""
+
+
+class ShardSetupError(RuntimeError):
+    """Cross-shard sockets cannot be served safely (missing key or unsafe directory)."""
+
+
+def shard_of(account: str, shards: int) -> int:
+    """
+    Shard owning ``account``.
+
+    Uses CRC32 rather than ``hash()``, which is salted per process and
+    would send the same account to different workers.
+    """
+    if shards <= 1:
+        return 0
+    return zlib.crc32(account.encode()) % shards
+
+
+def socket_path(socket_dir: str, index: int) -> str:
+    """Unix socket the worker owning shard ``index`` listens on."""
+    return os.path.join(socket_dir, f"shard-{index}.sock")
+
+
+def ensure_private_dir(path: str) -> None:
+    """
+    Create ``path`` with mode 0700, or check an existing one is as private.
+
+    Raises:
+        ShardSetupError: The path is not a directory owned by this user
+            and closed to everyone else (e.g. pre-created by another user)
+    """
+    try:
+        os.mkdir(path, 0o700)
+    except FileExistsError:
+        pass
+    info = os.lstat(path)
+    if not stat.S_ISDIR(info.st_mode):
+        raise ShardSetupError(f"Shard socket path {path} is not a directory")
+    if info.st_uid != os.getuid():
+        raise ShardSetupError(f"Shard socket directory {path} is owned by uid {info.st_uid}, not this process")
+    if info.st_mode & 0o077:
+        raise ShardSetupError(
+            f"Shard socket directory {path} is accessible to other users (mode {stat.S_IMODE(info.st_mode):o})"
+        )
+
+
+class ShardRouter:
+    """
+    Computes features on the worker that owns each sender.
+
+    Every worker holds the sliding windows for the senders hashed to its
+    shard. Rows for local senders go straight to the local FeatureEngine;
+    the rest are batched per shard and sent over a Unix socket to the
+    owner, so a sender's history is never split or duplicated across
+    processes. Results come back in input order.
+
+    Rows are computed staged under a batch token and recorded on their
+    owners only after the batch is stored (see FeatureEngine.compute_staged).
+
+    The same sockets carry committed alert events and transaction graph
+    edges to every other worker (:meth:`publish_alerts`,
+    :meth:`publish_edges`), so stream clients and network queries see the
+    same data whichever worker stored it.
+
+    Messages are pickled, so both ends authenticate with the cluster's
+    shared ``authkey`` and the sockets live in a private (0700) directory.
+    """
+
+    def __init__(
+        self,
+        index: int = 0,
+        count: int = 1,
+        socket_dir: str = "",
+        engine: Optional[FeatureEngine] = None,
+        timeout: float = 5.0,
+        authkey: bytes = b"",
+    ):
+        self.index = index
+        self.count = max(count, 1)
+        self.socket_dir = socket_dir
+        self.authkey = authkey
+        self.engine = engine if engine is not None else FeatureEngine()
+        self.timeout = timeout
+        self._peers: Dict[int, Connection] = {}
+        self._peer_locks: Dict[int, threading.Lock] = defaultdict(threading.Lock)
+        # Peers holding rows staged under each token (to discard them)
+        self._touched: Dict[str, Set[int]] = {}
+        self._touched_lock = threading.Lock()
+        self._listener: Optional[Listener] = None
+        self._thread: Optional[threading.Thread] = None
+
+    def owns(self, account: str) -> bool:
+        return shard_of(account, self.count) == self.index
+
+    def _by_shard(self, rows: Sequence[FeatureRow]) -> Dict[int, List[int]]:
+        positions: Dict[int, List[int]] = defaultdict(list)
+        for i, row in enumerate(rows):
+            positions[shard_of(row[3], self.count)].append(i)
+        return positions
+
+    def compute_many(self, rows: Sequence[FeatureRow], token: Optional[str] = None) -> List[Dict[str, float]]:
+        """
+        Compute features for step-ordered rows on each sender's owner, staged under ``token``.
+
+        Nothing is recorded: call :meth:`record_many` with the same rows
+        and token once they are stored, and :meth:`discard` when done.
+
+        Raises:
+            ShardUnavailableError: A peer shard did not answer
+        """
+        if self.count == 1:
+            return self.engine.compute_staged(rows, token)
+
+        results: List[Optional[Dict[str, float]]] = [None] * len(rows)
+        for shard, indexes in self._by_shard(rows).items():
+            batch = [rows[i] for i in indexes]
+            if shard == self.index:
+                features = self.engine.compute_staged(batch, token)
+            else:
+                if token is not None:
+                    with self._touched_lock:
+                        self._touched.setdefault(token, set()).add(shard)
+                features = self._call(shard, "compute", token, batch)
+            for i, value in zip(indexes, features):
+                results[i] = value
+        return results
+
+    def record_many(self, rows: Sequence[FeatureRow], token: Optional[str] = None) -> None:
+        """
+        Add stored rows to their senders' windows on each owner.
+
+        Runs after the rows are committed, so it cannot fail the batch: an
+        owner that cannot be reached is logged and misses those rows.
+        """
+        if self.count == 1:
+            self.engine.record(rows, token)
+            return
+
+        if token is not None:
+            with self._touched_lock:
+                self._touched.pop(token, None)
+        for shard, indexes in self._by_shard(rows).items():
+            batch = [rows[i] for i in indexes]
+            if shard == self.index:
+                self.engine.record(batch, token)
+                continue
+            try:
+                self._call(shard, "record", token, batch)
+            except ShardUnavailableError as e:
+                logger.warning("Stored rows not recorded in shard %d windows: %s", shard, e)
+
+    def discard(self, token: str) -> None:
+        """Drop rows still staged under ``token`` on every shard they were sent to."""
+        self.engine.discard(token)
+        with self._touched_lock:
+            shards = self._touched.pop(token, set())
+        for shard in shards:
+            try:
+                self._call(shard, "discard", token, [])
+            except ShardUnavailableError as e:
+                logger.warning("Staged rows not discarded on shard %d: %s", shard, e)
+
+    def publish_alerts(self, payloads: Sequence[Dict[str, Any]]) -> None:
+        """
+        Push committed alert events to the subscribers of every other worker.
+
+        Like :meth:`record_many` it runs after commit and cannot fail the
+        batch: a worker that cannot be reached is logged and misses them.
+        """
+        self._broadcast("publish", payloads, "Alert events")
+
+    def publish_edges(self, rows: Sequence[EdgeRow]) -> None:
+        """
+        Add committed transaction edges to every other worker's graph (if built).
+
+        Runs after commit like :meth:`publish_alerts`; a worker that cannot
+        be reached is logged and misses them.
+        """
+        self._broadcast("edges", rows, "Graph edges")
+
+    def _broadcast(self, op: str, rows: Sequence, what: str) -> None:
+        for shard in range(self.count):
+            if shard == self.index:
+                continue
+            try:
+                self._call(shard, op, None, rows)
+            except ShardUnavailableError as e:
+                logger.warning("%s not published on shard %d: %s", what, shard, e)
+
+    def _call(self, shard: int, op: str, token: Optional[str], rows: Sequence):
+        with self._peer_locks[shard]:
+            try:
+                conn = self._peers.get(shard)
+                if conn is None:
+                    conn = self._peers[shard] = Client(socket_path(self.socket_dir, shard), authkey=self.authkey)
+                conn.send((op, token, list(rows)))
+                if not conn.poll(self.timeout):
+                    raise TimeoutError(f"no reply within {self.timeout}s")
+                status, payload = conn.recv()
+            except (OSError, EOFError, TimeoutError, AuthenticationError) as e:
+                self._drop_peer(shard)
+                raise ShardUnavailableError(f"Shard {shard} unavailable: {e}") from e
+
+        if status != "ok":
+            raise ShardUnavailableError(f"Shard {shard} rejected request: {payload}")
+        return payload
+
+    def _drop_peer(self, shard: int) -> None:
+        conn = self._peers.pop(shard, None)
+        if conn is not None:
+            conn.close()
+
+    def serve(self) -> None:
+        """
+        Start answering peer requests for this shard in a background thread.
+
+        Raises:
+            ShardSetupError: No authkey or socket directory was configured
+                (app.cluster sets both), or the directory is not private
+        """
+        if self.count == 1 or self._listener is not None:
+            return
+        if not self.authkey or not self.socket_dir:
+            raise ShardSetupError(
+                "WORKERS > 1 needs SHARD_AUTHKEY and SHARD_SOCKET_DIR; start with python -m app.cluster"
+            )
+        ensure_private_dir(self.socket_dir)
+        address = socket_path(self.socket_dir, self.index)
+        if os.path.exists(address):
+            os.unlink(address)
+        self._listener = Listener(address, family="AF_UNIX", authkey=self.authkey)
+        self._thread = threading.Thread(
+            target=self._accept_loop, name=f"shard-{self.index}", daemon=True
+        )
+        self._thread.start()
+        logger.info("Shard %d/%d listening on %s", self.index, self.count, address)
+
+    def _accept_loop(self) -> None:
+        while self._listener is not None:
+            try:
+                conn = self._listener.accept()
+            except AuthenticationError:
+                logger.warning("Rejected shard connection with a wrong authkey")
+                continue
+            except OSError:
+                return
+            if self._listener is None:
+                conn.close()
+                return
+            threading.Thread(target=self._handle, args=(conn,), daemon=True).start()
+
+    def _handle(self, conn: Connection) -> None:
+        with conn:
+            while True:
+                try:
+                    op, token, rows = conn.recv()
+                except (EOFError, OSError):
+                    return
+                if op == "publish":
+                    broker = get_alert_broker()
+                    for payload in rows:
+                        broker.publish(payload)
+                    conn.send(("ok", None))
+                    continue
+                if op == "edges":
+                    add_to_transaction_graph(rows)
+                    conn.send(("ok", None))
+                    continue
+                misrouted = [row[3] for row in rows if not self.owns(row[3])]
+                if misrouted:
+                    conn.send(("error", f"accounts not owned by shard {self.index}: {misrouted[:5]}"))
+                    continue
+                if op == "compute":
+                    conn.send(("ok", self.engine.compute_staged(rows, token)))
+                elif op == "record":
+                    self.engine.record(rows, token)
+                    conn.send(("ok", None))
+                elif op == "discard":
+                    self.engine.discard(token)
+                    conn.send(("ok", None))
+                else:
+                    conn.send(("error", f"unknown operation {op!r}"))
+
+    def close(self) -> None:
+        """Stop serving and close peer connections."""
+        listener, self._listener = self._listener, None
+        if listener is not None:
+            address = listener.address
+            try:
+                # Wake the accept loop so its thread exits
+                Client(address, authkey=self.authkey).close()
+            except (OSError, AuthenticationError):
+                pass
+            listener.close()
+            if os.path.exists(address):
+                os.unlink(address)
+        for shard in list(self._peers):
+            self._drop_peer(shard)
+
+
+@lru_cache()
+def get_shard_router() -> ShardRouter:
+    """Get this worker's shard router (configured from Settings)."""
+    return ShardRouter(
+        index=settings.SHARD_INDEX,
+        count=settings.WORKERS,
+        socket_dir=settings.SHARD_SOCKET_DIR,
+        engine=get_feature_engine(),
+        timeout=settings.SHARD_TIMEOUT,
+        authkey=settings.SHARD_AUTHKEY.encode(),
+    )
@@ -0,0 +1,188 @@
+"""Transaction service - ingestion of live transactions."""
+
+from datetime import datetime
+from typing import Dict, List, NamedTuple, Optional, Sequence
+from uuid import UUID, uuid4
+
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.models.transaction import Transaction, TransactionType
+from app.schemas.transaction import TransactionCreate
+from app.services.alert_aggregator import AlertCandidate, get_alert_aggregator
+from app.services.alert_service import AlertService
+from app.services.entity_dictionary import get_entity_dictionary
+from app.services.entity_service import EntityService
+from app.services.feature_engine import FeatureRow
+from app.services.graph_index import add_to_transaction_graph, edge_rows
+from app.services.rules import evaluate_rules
+from app.services.scoring import ModelScorer, alert_priority, get_champion, risk_band
+from app.services.shadow import ShadowBatch, get_shadow_scorer
+from app.services.sharding import get_shard_router
+from app.utils.metrics import SCORING_BATCH_SIZE
+
+
+class TransactionRow(NamedTuple):
+    """A validated transaction to store (the fields of TransactionCreate)."""
+
+    step: int
+    type: TransactionType
+    amount: float
+    nameOrig: str
+    nameDest: str
+    isFraud: bool = False
+    isFlaggedFraud: bool = False
+    timestamp: Optional[datetime] = None
+
+
+def feature_rows(items: Sequence[TransactionRow]) -> List[FeatureRow]:
+    """Feature engine input for transactions (TransactionCreate or TransactionRow)."""
+    return [(item.step, item.type.value, item.amount, item.nameOrig, item.nameDest) for item in items]
+
+
+class IngestResult(NamedTuple):
+    """Outcome of ingesting one micro-batch."""
+
+    transactions: List[Transaction]
+    ids: List[UUID]
+    features: List[Dict[str, float]]
+    scores: List[float]
+    alerts_created: int
+    alerts_merged: int
+
+
+class TransactionService:
+    """Business logic for transaction ingestion."""
+
+    @staticmethod
+    def ingest(
+        db: Session,
+        items: Sequence[TransactionCreate],
+    ) -> IngestResult:
+        """
+        Store a micro-batch of transactions and update derived state.
+
+        Sliding-window features are computed by the worker owning each
+        sender, staged rather than recorded, so a peer that cannot be
+        reached fails the whole batch with neither the database nor any
+        sender's window changed. The champion model scores the batch and
+        :meth:`store_scored` writes it.
+
+        Returns:
+            IngestResult: Stored transactions, their features and champion
+            scores (input order) with alert counts
+
+        Raises:
+            ShardUnavailableError: The worker owning a sender is unreachable
+        """
+        SCORING_BATCH_SIZE.labels("ingest").observe(len(items))
+        router = get_shard_router()
+        token = uuid4().hex
+        try:
+            features = router.compute_many(feature_rows(items), token)
+            # One champion per batch, even if a new model is swapped in meanwhile
+            champion = get_champion()
+            scores = champion.score(features)
+            rules = [evaluate_rules(values) for values in features]
+            return TransactionService.store_scored(db, items, features, scores, rules, champion, token)
+        except Exception:
+            # Nothing was stored: the windows must not keep these rows
+            router.discard(token)
+            raise
+
+    @staticmethod
+    def store_scored(
+        db: Session,
+        items: Sequence[TransactionRow],
+        features: Sequence[Dict[str, float]],
+        scores: Sequence[float],
+        rules: Sequence[List[Dict[str, str]]],
+        champion: ModelScorer,
+        token: Optional[str] = None,
+    ) -> IngestResult:
+        """
+        Store scored transactions, their aggregates and alerts in one commit.
+
+        Account names are interned once per batch and entity aggregates
+        are folded in the same database transaction. Transactions scoring
+        at least ALERT_SCORE_THRESHOLD or triggering rules raise alerts,
+        coalesced per sender burst; each new alert is counted in its
+        sender's profile (merges are not). Only after commit are the rows
+        recorded in their senders' feature windows (taking them off the
+        staging under ``token``); then the batch is offered to the shadow
+        (challenger) scorer without waiting for it, and the in-memory
+        graph (if built) is updated here and on every other worker.
+
+        Args:
+            items: Step-ordered rows with the fields of TransactionCreate
+            features: Sliding-window features, aligned with ``items``
+            scores: Champion scores, aligned with ``items``
+            rules: Triggered rules, aligned with ``items``
+            champion: Model that produced ``scores``
+            token: Staging token the features were computed under
+
+        Returns:
+            IngestResult: Stored transactions with alert counts
+        """
+        entities = get_entity_dictionary()
+        senders = [item.nameOrig for item in items]
+        names = senders + [item.nameDest for item in items]
+        try:
+            ids = entities.intern_many(db, names)
+            n = len(items)
+
+            transactions = []
+            for item, orig_id, dest_id in zip(items, ids[:n], ids[n:]):
+                transaction = Transaction(
+                    step=item.step,
+                    type=item.type,
+                    amount=item.amount,
+                    nameOrig=item.nameOrig,
+                    nameDest=item.nameDest,
+                    orig_id=orig_id,
+                    dest_id=dest_id,
+                    isFraud=item.isFraud,
+                    isFlaggedFraud=item.isFlaggedFraud,
+                )
+                if item.timestamp is not None:
+                    transaction.created_at = item.timestamp
+                transactions.append(transaction)
+
+            db.add_all(transactions)
+            EntityService.update_aggregates(db, transactions)
+            candidates = [
+                AlertCandidate(
+                    transaction=transaction,
+                    ml_score=score,
+                    ml_risk_band=risk_band(score),
+                    priority=alert_priority(score, bool(triggered)),
+                    rules_triggered=triggered,
+                    model_version=champion.version,
+                )
+                for transaction, score, triggered in zip(transactions, scores, rules)
+                if triggered or score >= settings.ALERT_SCORE_THRESHOLD
+            ]
+            created, merged = AlertService.raise_alerts(db, candidates)
+            # Read ids before commit expires every row (one refresh per row otherwise)
+            db.flush()
+            # New parent alerts count towards their sender's fraud history
+            EntityService.record_history(db, [alert.transaction.orig_id for alert in created], alerts=1)
+            tx_ids = [transaction.id for transaction in transactions]
+            edges = edge_rows(transactions)
+            db.commit()
+        except Exception:
+            db.rollback()
+            # Only this batch's names and senders can point at rolled-back rows
+            entities.forget(names)
+            get_alert_aggregator().forget(senders)
+            raise
+
+        router = get_shard_router()
+        router.record_many(feature_rows(items), token)
+        get_shadow_scorer().submit(
+            ShadowBatch(tx_ids, [item.step for item in items], features, scores)
+        )
+        add_to_transaction_graph(edges)
+        if router.count > 1:
+            router.publish_edges(edges)
+        return IngestResult(transactions, tx_ids, features, scores, len(created), len(merged))
@@ -0,0 +1,108 @@
+"""Background warm-up tasks and application readiness."""
+
+import asyncio
+import logging
+import time
+from functools import lru_cache
+from typing import Callable, Dict, List, Optional
+
+logger = logging.getLogger("app.warmup")
+
+PENDING = "pending"
+RUNNING = "running"
+READY = "ready"
+FAILED = "failed"
+
+
+class WarmupTask:
+    """One named warm-up step (runs in a worker thread)."""
+
+    def __init__(self, name: str, fn: Callable[[], None], required: bool = True):
+        self.name = name
+        self.fn = fn
+        self.required = required
+        self.state = PENDING
+        self.error: Optional[str] = None
+        self.duration_ms: Optional[float] = None
+
+    def run(self) -> None:
+        self.state = RUNNING
+        started = time.perf_counter()
+        try:
+            self.fn()
+            self.state = READY
+        except Exception as e:
+            self.state = FAILED
+            self.error = f"{type(e).__name__}: {e}"
+            logger.exception("Warm-up task %s failed", self.name)
+        finally:
+            self.duration_ms = round((time.perf_counter() - started) * 1000, 3)
+
+    def to_dict(self) -> Dict:
+        return {
+            "state": self.state,
+            "required": self.required,
+            "duration_ms": self.duration_ms,
+            "error": self.error,
+        }
+
+
+class Warmup:
+    """
+    Runs registered warm-up tasks in the background after startup.
+
+    The process is live as soon as it serves requests; it is ready once
+    every required task has finished. Heavy subsystems (graph index,
+    model, explainer) register here instead of loading at import time.
+    """
+
+    def __init__(self):
+        self._tasks: Dict[str, WarmupTask] = {}
+        self._runner: Optional[asyncio.Task] = None
+
+    def register(self, name: str, fn: Callable[[], None], required: bool = True) -> None:
+        """Register (or replace) a warm-up task."""
+        self._tasks[name] = WarmupTask(name, fn, required)
+
+    @property
+    def tasks(self) -> List[WarmupTask]:
+        return list(self._tasks.values())
+
+    async def run(self) -> None:
+        """Run all pending tasks concurrently in worker threads."""
+        pending = [task for task in self._tasks.values() if task.state == PENDING]
+        await asyncio.gather(*(asyncio.to_thread(task.run) for task in pending))
+        logger.info("Warm-up finished", extra={"tasks": {t.name: t.state for t in pending}})
+
+    def start(self) -> asyncio.Task:
+        """Start ``run`` as a background task on the running loop."""
+        self._runner = asyncio.create_task(self.run())
+        return self._runner
+
+    async def stop(self) -> None:
+        """Cancel the background runner (threads finish their current task)."""
+        if self._runner and not self._runner.done():
+            self._runner.cancel()
+            try:
+                await self._runner
+            except asyncio.CancelledError:
+                pass
+
+    @property
+    def ready(self) -> bool:
+        """True once every required task is ready."""
+        return all(task.state == READY for task in self._tasks.values() if task.required)
+
+    def status(self) -> Dict[str, Dict]:
+        return {name: task.to_dict() for name, task in self._tasks.items()}
+
+    def clear(self) -> None:
+        """Forget all tasks."""
+        self._tasks.clear()
+        self._runner = None
+
+
+@lru_cache()
+def get_warmup() -> Warmup:
+    """Get the process-wide warm-up registry."""
+    return Warmup()
@@ -0,0 +1,159 @@
+"""Compact encodings for alert payloads (rules, reason codes, SHAP values).
+
+Alerts used to store three JSON columns of mostly repeated templates.
+They are now stored as:
+
+- ``rules_mask``: integer bitmask, bit ``i`` = ``RULE_IDS[i]`` (the rule
+  catalogue in app.services.rules)
+- ``reason_code_ids``: one byte per ``ReasonCode`` id, in order
+- ``shap``: little-endian float32 array, one slot per ``SHAP_FEATURES``
+  entry (NaN where the model reported no value)
+
+Catalogues are append-only: ids and bit positions are persisted, so new
+entries go at the end and existing ones are never reordered or reused.
+Decoding back to ``RuleTrigger``/``ShapValue`` dicts is only needed on
+the alert detail path; list views use ``rule_count``.
+"""
+
+import enum
+import math
+import struct
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Union
+
+# Bit order of rules_mask
+RULE_IDS = ["R001", "R002", "R003", "R004"]
+
+# Slot order of the shap array: model features (app.services.feature_engine
+# and the workplan's model inputs), then the explanation templates' extras
+SHAP_FEATURES = [
+    "velocity_1h",
+    "amount_zscore",
+    "new_counterparty_7d",
+    "high_value_transfer_rule",
+    "cashout_sequence_2h",
+    "amount",
+    "type_encoded",
+    "high_value_rule",
+    "amount_percentile",
+    "hour_of_day",
+    "tx_count_24h",
+    "unique_dest_7d",
+    "pair_count_24h",
+    "dest_velocity_1h",
+    "transfer_ratio_24h",
+    "orig_velocity_1h",
+    "type_transfer",
+]
+SHAP_INDEX = {name: i for i, name in enumerate(SHAP_FEATURES)}
+
+
+class ReasonCode(enum.IntEnum):
+    """Model reason codes; the value is the stored id (0 is never used)."""
+
+    high_ml_score = 1
+    outlier_detection = 2
+    pattern_match = 3
+    high_transaction_amount = 4
+    amount_exceeds_threshold = 5
+    new_recipient = 6
+    first_time_transaction = 7
+    velocity_spike = 8
+    unusual_frequency = 9
+    burst_activity = 10
+    unusual_time = 11
+    off_hours_transaction = 12
+    VELOCITY_1H = 13
+    AMOUNT_ZSCORE = 14
+    NEW_COUNTERPARTY_7D = 15
+    HIGH_VALUE_RULE = 16
+    CASHOUT_SEQUENCE_2H = 17
+    AMOUNT = 18
+
+
+@lru_cache()
+def _rule_catalogue() -> Dict[str, Dict[str, str]]:
+    # Imported lazily: app.services imports the models that use this module
+    from app.services.rules import RULES
+
+    return RULES
+
+
+def encode_rules(rules: Iterable[Union[Dict[str, str], str]]) -> int:
+    """
+    Bitmask for RuleTrigger dicts (or rule ids).
+
+    Raises:
+        ValueError: A rule id is not in RULE_IDS
+    """
+    mask = 0
+    for rule in rules:
+        rule_id = rule if isinstance(rule, str) else rule["rule_id"]
+        try:
+            mask |= 1 << RULE_IDS.index(rule_id)
+        except ValueError:
+            raise ValueError(f"Unknown rule id {rule_id!r}") from None
+    return mask
+
+
+def decode_rules(mask: int) -> List[Dict[str, str]]:
+    """RuleTrigger dicts for a bitmask, in catalogue order."""
+    catalogue = _rule_catalogue()
+    return [catalogue[rule_id] for i, rule_id in enumerate(RULE_IDS) if mask >> i & 1]
+
+
+def rule_count(mask: int) -> int:
+    """Number of rules in a bitmask (no decoding)."""
+    return bin(mask or 0).count("1")
+
+
+def encode_reason_codes(codes: Iterable[str]) -> bytes:
+    """
+    One byte per reason code id, first occurrence order.
+
+    Raises:
+        ValueError: A code is not a ReasonCode
+    """
+    ids = []
+    for code in dict.fromkeys(codes):
+        try:
+            ids.append(ReasonCode[code].value)
+        except KeyError:
+            raise ValueError(f"Unknown reason code {code!r}") from None
+    return bytes(ids)
+
+
+def decode_reason_codes(data: Optional[bytes]) -> List[str]:
+    """Reason code names for stored ids."""
+    return [ReasonCode(code_id).name for code_id in data or b""]
+
+
+def encode_shap(values: Optional[Iterable[Dict[str, float]]]) -> Optional[bytes]:
+    """
+    Fixed-width float32 array in SHAP_FEATURES order (None stays None).
+
+    Raises:
+        ValueError: A feature is not in SHAP_FEATURES
+    """
+    if values is None:
+        return None
+    slots = [math.nan] * len(SHAP_FEATURES)
+    for item in values:
+        try:
+            slots[SHAP_INDEX[item["feature"]]] = float(item["value"])
+        except KeyError:
+            raise ValueError(f"Unknown SHAP feature {item.get('feature')!r}") from None
+    return struct.pack(f"<{len(slots)}f", *slots)
+
+
+def decode_shap(data: Optional[bytes]) -> Optional[List[Dict[str, float]]]:
+    """ShapValue dicts, largest contribution first (arrays from older, shorter catalogues decode too)."""
+    if data is None:
+        return None
+    values = struct.unpack(f"<{len(data) // 4}f", data)
+    items = [
+        {"feature": SHAP_FEATURES[i], "value": round(value, 6)}
+        for i, value in enumerate(values)
+        if not math.isnan(value)
+    ]
+    return sorted(items, key=lambda item: abs(item["value"]), reverse=True)
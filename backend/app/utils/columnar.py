@@ -0,0 +1,323 @@
+"""Columnar (Parquet/Arrow) storage for transactions and alerts.
+
+The raw PaySim CSV is ~470MB and has to be fully parsed on every load.
+This module converts it once into a partitioned Parquet dataset with
+dictionary-encoded string columns, and reads it back through Arrow with
+memory-mapped files so numeric columns are never copied.
+
+Layout::
+
+    <root>/day=1/part-0.parquet
+    <root>/day=2/part-0.parquet
+    ...
+
+where ``day`` is derived from ``step`` (one step = one hour).
+"""
+
+from pathlib import Path
+from typing import Iterable, Iterator, List, Optional, Sequence, Tuple
+
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pa_csv
+import pyarrow.dataset as pa_ds
+import pyarrow.parquet as pq
+
+# Columns stored as Arrow dictionaries (low cardinality or heavily repeated)
+DICTIONARY_COLUMNS = ["type", "nameOrig", "nameDest"]
+
+# Hours per partition
+STEPS_PER_DAY = 24
+
+PARTITION_COLUMN = "day"
+
+TRANSACTION_SCHEMA = pa.schema(
+    [
+        ("step", pa.int32()),
+        ("type", pa.dictionary(pa.int8(), pa.string())),
+        ("amount", pa.float64()),
+        ("nameOrig", pa.dictionary(pa.int32(), pa.string())),
+        ("oldbalanceOrg", pa.float64()),
+        ("newbalanceOrig", pa.float64()),
+        ("nameDest", pa.dictionary(pa.int32(), pa.string())),
+        ("oldbalanceDest", pa.float64()),
+        ("newbalanceDest", pa.float64()),
+        ("isFraud", pa.bool_()),
+        ("isFlaggedFraud", pa.bool_()),
+    ]
+)
+
+# Plain types used while parsing the CSV (dictionary encoding happens per batch)
+_CSV_COLUMN_TYPES = {
+    field.name: (field.type.value_type if pa.types.is_dictionary(field.type) else field.type)
+    for field in TRANSACTION_SCHEMA
+}
+
+
+def step_to_day(step: int) -> int:
+    """Map a PaySim step (1-744) to its 1-based day partition."""
+    return (int(step) - 1) // STEPS_PER_DAY + 1
+
+
+def _day_range(min_step: Optional[int], max_step: Optional[int]) -> Tuple[Optional[int], Optional[int]]:
+    """Day partitions covering a step range (used for partition pruning)."""
+    return (
+        step_to_day(min_step) if min_step is not None else None,
+        step_to_day(max_step) if max_step is not None else None,
+    )
+
+
+def _with_partition_column(batch: pa.RecordBatch) -> pa.RecordBatch:
+    """Dictionary-encode string columns and append the ``day`` partition key."""
+    arrays = []
+    for field in TRANSACTION_SCHEMA:
+        column = batch.column(batch.schema.get_field_index(field.name))
+        arrays.append(column.cast(field.type))
+
+    steps = batch.column(batch.schema.get_field_index("step"))
+    day = pc.add(pc.divide(pc.subtract(steps, 1), STEPS_PER_DAY), 1).cast(pa.int16())
+    arrays.append(day)
+
+    return pa.RecordBatch.from_arrays(
+        arrays, schema=TRANSACTION_SCHEMA.append(pa.field(PARTITION_COLUMN, pa.int16()))
+    )
+
+
+def iter_csv_batches(csv_path: str, block_size_mb: int = 64) -> Iterator[pa.RecordBatch]:
+    """
+    Stream a PaySim CSV as Arrow record batches.
+
+    Args:
+        csv_path: Path to CSV file
+        block_size_mb: Bytes parsed per batch (bounds peak memory)
+
+    Yields:
+        pa.RecordBatch: Parsed rows with typed (non-dictionary) columns
+    """
+    reader = pa_csv.open_csv(
+        csv_path,
+        read_options=pa_csv.ReadOptions(block_size=block_size_mb * 1024 * 1024),
+        convert_options=pa_csv.ConvertOptions(
+            column_types=_CSV_COLUMN_TYPES,
+            include_columns=list(_CSV_COLUMN_TYPES),
+        ),
+    )
+    for batch in reader:
+        yield batch
+
+
+def write_transactions_dataset(
+    batches: Iterable[pa.RecordBatch],
+    output_dir: str,
+    compression: str = "zstd",
+    max_rows_per_group: int = 1_000_000,
+) -> None:
+    """
+    Write record batches as a day-partitioned Parquet dataset.
+
+    Existing partitions under ``output_dir`` are replaced.
+    """
+    pa_ds.write_dataset(
+        (_with_partition_column(batch) for batch in batches),
+        base_dir=output_dir,
+        schema=TRANSACTION_SCHEMA.append(pa.field(PARTITION_COLUMN, pa.int16())),
+        format="parquet",
+        partitioning=pa_ds.partitioning(
+            pa.schema([(PARTITION_COLUMN, pa.int16())]), flavor="hive"
+        ),
+        file_options=pa_ds.ParquetFileFormat().make_write_options(
+            compression=compression,
+            use_dictionary=DICTIONARY_COLUMNS,
+        ),
+        max_rows_per_group=max_rows_per_group,
+        existing_data_behavior="delete_matching",
+    )
+
+
+def convert_csv_to_parquet(
+    csv_path: str,
+    output_dir: str,
+    block_size_mb: int = 64,
+    compression: str = "zstd",
+) -> dict:
+    """
+    Convert the PaySim CSV to a partitioned Parquet dataset.
+
+    Args:
+        csv_path: Path to CSV file
+        output_dir: Dataset root directory
+        block_size_mb: CSV block size per batch
+        compression: Parquet compression codec
+
+    Returns:
+        dict: Row and file statistics
+    """
+    rows = 0
+
+    def counted(batches: Iterable[pa.RecordBatch]) -> Iterator[pa.RecordBatch]:
+        nonlocal rows
+        for batch in batches:
+            rows += batch.num_rows
+            yield batch
+
+    write_transactions_dataset(
+        counted(iter_csv_batches(csv_path, block_size_mb=block_size_mb)),
+        output_dir,
+        compression=compression,
+    )
+
+    files = sorted(Path(output_dir).rglob("*.parquet"))
+    return {
+        "rows": rows,
+        "files": len(files),
+        "bytes": sum(f.stat().st_size for f in files),
+    }
+
+
+def _step_filter(min_step: Optional[int], max_step: Optional[int]) -> Optional[List[tuple]]:
+    """Build a pyarrow filter on ``day`` (partition pruning) and ``step``."""
+    min_day, max_day = _day_range(min_step, max_step)
+    filters = []
+    if min_step is not None:
+        filters += [(PARTITION_COLUMN, ">=", min_day), ("step", ">=", min_step)]
+    if max_step is not None:
+        filters += [(PARTITION_COLUMN, "<=", max_day), ("step", "<=", max_step)]
+    return filters or None
+
+
+def read_transactions(
+    path: str,
+    columns: Optional[Sequence[str]] = None,
+    min_step: Optional[int] = None,
+    max_step: Optional[int] = None,
+    memory_map: bool = True,
+) -> pa.Table:
+    """
+    Read transactions from a Parquet dataset as an Arrow table.
+
+    String columns come back dictionary-encoded and files are memory-mapped,
+    so only the requested columns and day partitions are paged in.
+
+    Args:
+        path: Dataset root directory (or a single Parquet file)
+        columns: Columns to read (None for all transaction columns)
+        min_step: Inclusive lower bound on ``step``
+        max_step: Inclusive upper bound on ``step``
+        memory_map: Memory-map files instead of reading into buffers
+
+    Returns:
+        pa.Table: Transactions (without the ``day`` partition column)
+    """
+    columns = list(columns) if columns is not None else TRANSACTION_SCHEMA.names
+    table = pq.read_table(
+        path,
+        columns=columns,
+        filters=_step_filter(min_step, max_step),
+        memory_map=memory_map,
+        read_dictionary=[c for c in DICTIONARY_COLUMNS if c in columns],
+        partitioning="hive",
+    )
+    return table
+
+
+def load_transactions_frame(
+    path: str,
+    columns: Optional[Sequence[str]] = None,
+    min_step: Optional[int] = None,
+    max_step: Optional[int] = None,
+):
+    """
+    Load transactions as a pandas DataFrame for analysis and training.
+
+    Dictionary columns become ``category`` dtype and numeric columns are
+    converted without copying where Arrow allows it.
+
+    Returns:
+        pd.DataFrame: Transactions
+    """
+    table = read_transactions(path, columns=columns, min_step=min_step, max_step=max_step)
+    return table.to_pandas(self_destruct=True, split_blocks=True)
+
+
+def export_alerts_to_parquet(db, output_path: str, batch_size: int = 50_000) -> int:
+    """
+    Export alerts joined with their transaction features to a Parquet file.
+
+    Args:
+        db: SQLAlchemy session
+        output_path: Destination ``.parquet`` file
+        batch_size: Rows fetched and written per batch
+
+    Returns:
+        int: Number of alerts exported
+    """
+    from sqlalchemy import select
+
+    from app.models.alert import Alert
+    from app.models.transaction import Transaction
+    from app.utils.alert_payload import rule_count
+
+    schema = pa.schema(
+        [
+            ("alert_id", pa.string()),
+            ("transaction_id", pa.string()),
+            ("status", pa.dictionary(pa.int8(), pa.string())),
+            ("priority", pa.dictionary(pa.int8(), pa.string())),
+            ("ml_score", pa.float64()),
+            ("ml_risk_band", pa.dictionary(pa.int8(), pa.string())),
+            ("rules_count", pa.int16()),
+            ("created_at", pa.timestamp("us")),
+            ("step", pa.int32()),
+            ("type", pa.dictionary(pa.int8(), pa.string())),
+            ("amount", pa.float64()),
+            ("nameOrig", pa.dictionary(pa.int32(), pa.string())),
+            ("nameDest", pa.dictionary(pa.int32(), pa.string())),
+            ("isFraud", pa.bool_()),
+        ]
+    )
+
+    stmt = (
+        select(
+            Alert.id,
+            Alert.transaction_id,
+            Alert.status,
+            Alert.priority,
+            Alert.ml_score,
+            Alert.ml_risk_band,
+            Alert.rules_mask,
+            Alert.created_at,
+            Transaction.step,
+            Transaction.type,
+            Transaction.amount,
+            Transaction.nameOrig,
+            Transaction.nameDest,
+            Transaction.isFraud,
+        )
+        .join(Transaction, Alert.transaction_id == Transaction.id)
+        .order_by(Alert.created_at)
+        .execution_options(yield_per=batch_size)
+    )
+
+    exported = 0
+    with pq.ParquetWriter(output_path, schema, compression="zstd") as writer:
+        for rows in db.execute(stmt).partitions():
+            columns = {name: [] for name in schema.names}
+            for row in rows:
+                columns["alert_id"].append(str(row[0]))
+                columns["transaction_id"].append(str(row[1]))
+                columns["status"].append(row[2].value)
+                columns["priority"].append(row[3].value)
+                columns["ml_score"].append(row[4])
+                columns["ml_risk_band"].append(row[5].value)
+                columns["rules_count"].append(rule_count(row[6]))
+                columns["created_at"].append(row[7])
+                columns["step"].append(row[8])
+                columns["type"].append(row[9].value)
+                columns["amount"].append(float(row[10]))
+                columns["nameOrig"].append(row[11])
+                columns["nameDest"].append(row[12])
+                columns["isFraud"].append(row[13])
+            writer.write_table(pa.table(columns, schema=schema))
+            exported += len(rows)
+
+    return exported
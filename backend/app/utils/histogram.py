@@ -0,0 +1,90 @@
+"""Fixed-memory latency histogram with percentile queries."""
+
+import math
+from typing import Dict, Iterable, List
+
+
+class LatencyHistogram:
+    """
+    Log-bucketed latency histogram (HdrHistogram-style).
+
+    Values are recorded in seconds into buckets whose width grows by
+    ``precision`` (2% by default), so memory is bounded by the dynamic
+    range rather than the number of samples and every percentile is
+    accurate to within ``precision``.
+
+    Example:
+        hist = LatencyHistogram()
+        hist.record(0.012)
+        hist.percentile(99)
+    """
+
+    def __init__(self, min_value: float = 1e-6, max_value: float = 600.0, precision: float = 0.02):
+        self.min_value = min_value
+        self.max_value = max_value
+        self._log_base = math.log1p(precision)
+        self._counts: List[int] = [0] * (self._bucket(max_value) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.min = math.inf
+        self.max = 0.0
+
+    def _bucket(self, value: float) -> int:
+        value = min(max(value, self.min_value), self.max_value)
+        return int(math.log(value / self.min_value) / self._log_base)
+
+    def _bucket_value(self, index: int) -> float:
+        """Upper edge of a bucket."""
+        return min(self.min_value * math.exp((index + 1) * self._log_base), self.max_value)
+
+    def record(self, value: float) -> None:
+        """Record one latency in seconds."""
+        self._counts[self._bucket(value)] += 1
+        self.count += 1
+        self.total += value
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+
+    def record_many(self, values: Iterable[float]) -> None:
+        """Record several latencies."""
+        for value in values:
+            self.record(value)
+
+    def merge(self, other: "LatencyHistogram") -> None:
+        """Add another histogram with identical bucket layout."""
+        if len(other._counts) != len(self._counts):
+            raise ValueError("Histograms have different bucket layouts")
+        for i, c in enumerate(other._counts):
+            self._counts[i] += c
+        self.count += other.count
+        self.total += other.total
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+
+    def percentile(self, pct: float) -> float:
+        """Latency at the given percentile (0-100); 0.0 when empty."""
+        if not self.count:
+            return 0.0
+        rank = max(1, math.ceil(self.count * pct / 100.0))
+        seen = 0
+        for index, c in enumerate(self._counts):
+            seen += c
+            if seen >= rank:
+                return min(self._bucket_value(index), self.max)
+        return self.max
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+    def summary(self) -> Dict[str, float]:
+        """Count, mean, max and p50/p95/p99/p999 in milliseconds."""
+        return {
+            "count": self.count,
+            "mean_ms": round(self.mean * 1000, 3),
+            "p50_ms": round(self.percentile(50) * 1000, 3),
+            "p95_ms": round(self.percentile(95) * 1000, 3),
+            "p99_ms": round(self.percentile(99) * 1000, 3),
+            "p999_ms": round(self.percentile(99.9) * 1000, 3),
+            "max_ms": round(self.max * 1000, 3),
+        }
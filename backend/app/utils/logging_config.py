@@ -0,0 +1,62 @@
+"""Logging setup: structured JSON or plain text depending on LOG_FORMAT."""
+
+import json
+import logging
+import sys
+from datetime import datetime, timezone
+
+# Attributes every LogRecord has; anything else was passed via ``extra=``
+_RECORD_ATTRS = set(vars(logging.LogRecord("", 0, "", 0, "", (), None))) | {"message", "asctime"}
+
+TEXT_FORMAT = "%(asctime)s %(levelname)s [%(name)s] %(message)s"
+
+
+class JsonFormatter(logging.Formatter):
+    """
+    One JSON object per line.
+
+    Example:
+        logger.info("Alert created", extra={"alert_id": str(alert.id)})
+        # {"timestamp": "...", "level": "INFO", "logger": "app", "message": "Alert created", "alert_id": "..."}
+    """
+
+    def format(self, record: logging.LogRecord) -> str:
+        payload = {
+            "timestamp": datetime.fromtimestamp(record.created, tz=timezone.utc).isoformat(),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        for key, value in record.__dict__.items():
+            if key not in _RECORD_ATTRS and not key.startswith("_"):
+                payload[key] = value
+        if record.exc_info:
+            payload["exc_info"] = self.formatException(record.exc_info)
+        return json.dumps(payload, default=str)
+
+
+def configure_logging(level: str = "INFO", fmt: str = "json") -> None:
+    """
+    Install a single stdout handler on the root logger.
+
+    Uvicorn's loggers are routed through it too so access and error
+    logs share the format. Safe to call more than once.
+
+    Args:
+        level: Log level name
+        fmt: "json" for structured logs, anything else for plain text
+    """
+    handler = logging.StreamHandler(sys.stdout)
+    handler.setFormatter(JsonFormatter() if fmt.lower() == "json" else logging.Formatter(TEXT_FORMAT))
+    handler._fraud_detection = True
+
+    root = logging.getLogger()
+    for existing in [h for h in root.handlers if getattr(h, "_fraud_detection", False)]:
+        root.removeHandler(existing)
+    root.addHandler(handler)
+    root.setLevel(level.upper())
+
+    for name in ("uvicorn", "uvicorn.error", "uvicorn.access"):
+        uvicorn_logger = logging.getLogger(name)
+        uvicorn_logger.handlers = []
+        uvicorn_logger.propagate = True
@@ -0,0 +1,201 @@
+"""Prometheus metrics: request latency middleware and SQLAlchemy query accounting."""
+
+import time
+from contextvars import ContextVar
+from typing import Optional
+
+from prometheus_client import (
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    generate_latest,
+)
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+# Own registry so only application metrics are exposed and tests can import freely
+REGISTRY = CollectorRegistry(auto_describe=True)
+
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+COUNT_BUCKETS = (0, 1, 2, 5, 10, 20, 50, 100, 200, 500, 1000)
+
+HTTP_REQUEST_DURATION = Histogram(
+    "http_request_duration_seconds",
+    "HTTP request latency by route template",
+    ["method", "route", "status"],
+    buckets=LATENCY_BUCKETS,
+    registry=REGISTRY,
+)
+HTTP_REQUESTS_IN_PROGRESS = Gauge(
+    "http_requests_in_progress",
+    "HTTP requests currently being served",
+    registry=REGISTRY,
+)
+DB_QUERIES = Counter(
+    "db_queries_total",
+    "SQL statements executed",
+    registry=REGISTRY,
+)
+DB_QUERY_DURATION = Histogram(
+    "db_query_duration_seconds",
+    "Latency of individual SQL statements",
+    buckets=LATENCY_BUCKETS,
+    registry=REGISTRY,
+)
+DB_QUERIES_PER_REQUEST = Histogram(
+    "db_queries_per_request",
+    "SQL statements issued while serving one HTTP request",
+    ["route"],
+    buckets=COUNT_BUCKETS,
+    registry=REGISTRY,
+)
+DB_TIME_PER_REQUEST = Histogram(
+    "db_time_per_request_seconds",
+    "Time spent in SQL statements while serving one HTTP request",
+    ["route"],
+    buckets=LATENCY_BUCKETS,
+    registry=REGISTRY,
+)
+SCORING_BATCH_SIZE = Histogram(
+    "scoring_batch_size",
+    "Transactions per ingestion/scoring batch",
+    ["stage"],
+    buckets=(1, 2, 5, 10, 25, 50, 100, 250, 500, 1000, 5000),
+    registry=REGISTRY,
+)
+SCORING_QUEUE_DEPTH = Gauge(
+    "scoring_queue_depth",
+    "Items waiting in a scoring queue",
+    ["queue"],
+    registry=REGISTRY,
+)
+MODEL_RELOADS = Counter(
+    "model_reloads_total",
+    "Champion model hot swaps by outcome (swapped, failed)",
+    ["outcome"],
+    registry=REGISTRY,
+)
+FEATURE_CACHE_REQUESTS = Counter(
+    "feature_cache_requests_total",
+    "Feature cache lookups by tier (local, shared) and result (hit, miss)",
+    ["tier", "result"],
+    registry=REGISTRY,
+)
+SHADOW_BATCHES = Counter(
+    "shadow_batches_total",
+    "Micro-batches handed to the challenger model by outcome (scored, shed, failed)",
+    ["outcome"],
+    registry=REGISTRY,
+)
+ALERT_ARCHIVE_MOVES = Counter(
+    "alert_archive_moves_total",
+    "Alerts moved between the hot table and the archive by direction (archived, restored)",
+    ["direction"],
+    registry=REGISTRY,
+)
+BATCH_STAGE_ROWS = Counter(
+    "batch_scoring_stage_rows_total",
+    "Rows processed by each batch scoring stage (parse, features, rules, score, store)",
+    ["stage"],
+    registry=REGISTRY,
+)
+BATCH_STAGE_SECONDS = Counter(
+    "batch_scoring_stage_busy_seconds_total",
+    "Time each batch scoring stage spent working (not waiting on its queues)",
+    ["stage"],
+    registry=REGISTRY,
+)
+
+
+class RequestStats:
+    """Per-request SQL counters; one small object per request."""
+
+    __slots__ = ("queries", "db_time")
+
+    def __init__(self):
+        self.queries = 0
+        self.db_time = 0.0
+
+
+_request_stats: ContextVar[Optional[RequestStats]] = ContextVar("request_stats", default=None)
+
+
+def current_request_stats() -> Optional[RequestStats]:
+    """SQL counters of the request being served in this context, if any."""
+    return _request_stats.get()
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("query_start", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    elapsed = time.perf_counter() - conn.info["query_start"].pop()
+    DB_QUERIES.inc()
+    DB_QUERY_DURATION.observe(elapsed)
+    stats = _request_stats.get()
+    if stats is not None:
+        stats.queries += 1
+        stats.db_time += elapsed
+
+
+def instrument_engine(engine: Engine) -> None:
+    """Count and time every statement executed on ``engine`` (idempotent)."""
+    if not event.contains(engine, "before_cursor_execute", _before_cursor_execute):
+        event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+
+
+def _route_template(scope) -> str:
+    """Route path template (e.g. /api/alerts/{alert_id}) to keep label cardinality bounded."""
+    route = scope.get("route")
+    return getattr(route, "path", None) or "unmatched"
+
+
+class MetricsMiddleware:
+    """
+    Pure ASGI middleware recording latency, in-flight requests and SQL usage.
+
+    Metrics are preaggregated histograms labelled by route template, so
+    the per-request cost is a timer, a slotted counter object and a few
+    histogram observations.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status = 500
+
+        async def send_wrapper(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        stats = RequestStats()
+        token = _request_stats.set(stats)
+        HTTP_REQUESTS_IN_PROGRESS.inc()
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            elapsed = time.perf_counter() - started
+            HTTP_REQUESTS_IN_PROGRESS.dec()
+            _request_stats.reset(token)
+
+            route = _route_template(scope)
+            HTTP_REQUEST_DURATION.labels(scope["method"], route, str(status)).observe(elapsed)
+            DB_QUERIES_PER_REQUEST.labels(route).observe(stats.queries)
+            DB_TIME_PER_REQUEST.labels(route).observe(stats.db_time)
+
+
+def render_metrics() -> bytes:
+    """All application metrics in the Prometheus text exposition format."""
+    return generate_latest(REGISTRY)
+
@@ -0,0 +1,203 @@
+"""In-process profiling: statistical stack sampler and per-request cProfile capture."""
+
+import cProfile
+import hmac
+import io
+import marshal
+import pstats
+import sys
+import threading
+import time
+import uuid
+from collections import Counter, OrderedDict
+from typing import Dict, List, Optional, Tuple
+
+from fastapi.responses import JSONResponse
+
+from app.config import settings
+
+ADMIN_TOKEN_HEADER = "X-Admin-Token"
+
+
+def is_admin_token(token: Optional[str]) -> bool:
+    """Check an admin token against ADMIN_API_KEY (admin disabled when unset)."""
+    if not settings.ADMIN_API_KEY or not token:
+        return False
+    return hmac.compare_digest(token, settings.ADMIN_API_KEY)
+
+
+def _frame_label(frame) -> str:
+    code = frame.f_code
+    module = frame.f_globals.get("__name__", "?")
+    return f"{module}:{code.co_name}:{frame.f_lineno}"
+
+
+class SamplingProfiler:
+    """
+    Statistical profiler sampling every thread's stack at a fixed interval.
+
+    ``run`` (called from a worker thread) reads ``sys._current_frames()``;
+    no tracing hooks are installed, so overhead is one stack walk per
+    thread per sample and the profiled code runs at full speed between
+    samples.
+
+    Output is the collapsed-stack format (``root;caller;callee count``)
+    read by flamegraph.pl, speedscope and inferno.
+    """
+
+    _lock = threading.Lock()
+
+    def __init__(self, interval: float = 0.005, max_depth: int = 128):
+        self.interval = interval
+        self.max_depth = max_depth
+        self.stacks: Counter = Counter()
+        self.samples = 0
+        self.duration = 0.0
+
+    def _sample(self, skip: int) -> None:
+        names = {t.ident: t.name for t in threading.enumerate()}
+        for ident, frame in sys._current_frames().items():
+            if ident == skip:
+                continue
+            stack: List[str] = []
+            while frame is not None and len(stack) < self.max_depth:
+                stack.append(_frame_label(frame))
+                frame = frame.f_back
+            stack.append(f"thread:{names.get(ident, ident)}")
+            self.stacks[";".join(reversed(stack))] += 1
+        self.samples += 1
+
+    def run(self, seconds: float) -> "SamplingProfiler":
+        """
+        Sample for ``seconds`` (blocking); one profile per process at a time.
+
+        Raises:
+            RuntimeError: If another profile is already running
+        """
+        if not self._lock.acquire(blocking=False):
+            raise RuntimeError("A profile is already running")
+        try:
+            me = threading.get_ident()
+            started = time.perf_counter()
+            deadline = started + seconds
+            while time.perf_counter() < deadline:
+                self._sample(me)
+                time.sleep(self.interval)
+            self.duration = time.perf_counter() - started
+        finally:
+            self._lock.release()
+        return self
+
+    def collapsed(self) -> str:
+        """Collapsed stacks, one ``frames count`` line per distinct stack."""
+        return "".join(f"{stack} {count}\n" for stack, count in self.stacks.most_common())
+
+    def top_functions(self, n: int = 25) -> List[Tuple[str, int, int]]:
+        """(function, self samples, total samples), hottest self time first."""
+        self_counts: Counter = Counter()
+        total_counts: Counter = Counter()
+        for stack, count in self.stacks.items():
+            frames = [f.rsplit(":", 1)[0] for f in stack.split(";")[1:]]
+            if frames:
+                self_counts[frames[-1]] += count
+            for frame in set(frames):
+                total_counts[frame] += count
+        return [(fn, c, total_counts[fn]) for fn, c in self_counts.most_common(n)]
+
+
+class RequestProfileStore:
+    """Bounded in-memory store of per-request cProfile captures."""
+
+    def __init__(self, capacity: int = 20):
+        self.capacity = capacity
+        self._profiles: "OrderedDict[str, Dict]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def add(self, profile_id: str, profile: cProfile.Profile, method: str, path: str, elapsed: float) -> None:
+        """Store a finished profile under ``profile_id``."""
+        profile.create_stats()
+        text = io.StringIO()
+        pstats.Stats(profile, stream=text).sort_stats("cumulative").print_stats(50)
+        with self._lock:
+            self._profiles[profile_id] = {
+                "method": method,
+                "path": path,
+                "elapsed_ms": round(elapsed * 1000, 3),
+                "pstats": marshal.dumps(profile.stats),
+                "text": text.getvalue(),
+            }
+            while len(self._profiles) > self.capacity:
+                self._profiles.popitem(last=False)
+
+    def get(self, profile_id: str) -> Optional[Dict]:
+        with self._lock:
+            return self._profiles.get(profile_id)
+
+    def list(self) -> List[Dict]:
+        with self._lock:
+            return [
+                {"id": pid, "method": p["method"], "path": p["path"], "elapsed_ms": p["elapsed_ms"]}
+                for pid, p in reversed(self._profiles.items())
+            ]
+
+
+request_profiles = RequestProfileStore()
+
+
+class ProfilingMiddleware:
+    """
+    Pure ASGI middleware running a request under cProfile on demand.
+
+    Triggered by ``X-Profile: 1`` plus a valid ``X-Admin-Token``; the
+    response carries ``X-Profile-Id`` for ``GET /api/admin/profiles/{id}``.
+    cProfile traces the event-loop thread: ``def`` endpoints running in the
+    threadpool appear as time awaiting the worker thread, and other
+    requests interleaved on the loop are included.
+
+    One capture per process at a time: a profiled request arriving while
+    another is being captured gets 409 Conflict.
+    """
+
+    _lock = threading.Lock()
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        flag = token = None
+        for name, value in scope["headers"]:
+            if name == b"x-profile":
+                flag = value
+            elif name == b"x-admin-token":
+                token = value.decode("latin-1")
+        if flag in (None, b"0", b"false") or not is_admin_token(token):
+            await self.app(scope, receive, send)
+            return
+
+        if not self._lock.acquire(blocking=False):
+            response = JSONResponse(status_code=409, content={"detail": "A profile is already running"})
+            await response(scope, receive, send)
+            return
+
+        profile = cProfile.Profile()
+        profile_id = uuid.uuid4().hex[:12]
+        started = time.perf_counter()
+
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start":
+                message["headers"] = list(message.get("headers", [])) + [(b"x-profile-id", profile_id.encode())]
+            await send(message)
+
+        try:
+            profile.enable()
+            try:
+                await self.app(scope, receive, send_wrapper)
+            finally:
+                profile.disable()
+                request_profiles.add(profile_id, profile, scope["method"], scope["path"], time.perf_counter() - started)
+        finally:
+            self._lock.release()
@@ -0,0 +1,220 @@
+"""SQL diagnostics: slow-query log with EXPLAIN plans and N+1 detection."""
+
+import logging
+import re
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import lru_cache
+from typing import Iterator, List, Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from app.config import settings
+
+logger = logging.getLogger("app.sql")
+
+_IN_LIST = re.compile(r"\(\s*(?:\?|%\([^)]*\)s|:\w+)(?:\s*,\s*(?:\?|%\([^)]*\)s|:\w+))*\s*\)")
+_STRING = re.compile(r"'(?:[^']|'')*'")
+_NUMBER = re.compile(r"\b\d+(?:\.\d+)?\b")
+_SPACE = re.compile(r"\s+")
+
+
+class NPlusOneError(RuntimeError):
+    """Raised when one statement shape repeats too often within one request."""
+
+
+class TooManyQueriesError(AssertionError):
+    """Raised by ``assert_max_queries`` when a block exceeds its query budget."""
+
+
+@lru_cache(maxsize=2048)
+def statement_shape(statement: str) -> str:
+    """
+    Normalize a statement so repeated lookups with different values compare equal.
+
+    Literals become ``?`` and ``IN (...)`` lists collapse to ``IN (...)``.
+    """
+    shape = _STRING.sub("?", statement)
+    shape = _NUMBER.sub("?", shape)
+    shape = _IN_LIST.sub("(...)", shape)
+    return _SPACE.sub(" ", shape).strip()
+
+
+class QueryTracker:
+    """Statement counts by shape for one request or code block."""
+
+    def __init__(self, label: str = ""):
+        self.label = label
+        self.count = 0
+        self.shapes: Counter = Counter()
+
+    def record(self, statement: str) -> int:
+        """Count a statement; returns how often its shape has been seen."""
+        self.count += 1
+        shape = statement_shape(statement)
+        self.shapes[shape] += 1
+        return self.shapes[shape]
+
+    def repeated(self, threshold: int) -> List[tuple]:
+        """(shape, count) for shapes seen at least ``threshold`` times."""
+        return [(shape, n) for shape, n in self.shapes.most_common() if n >= threshold]
+
+
+_request_tracker: ContextVar[Optional[QueryTracker]] = ContextVar("query_tracker", default=None)
+
+# Trackers that see statements from every thread (test fixtures run the
+# app in another thread, where context variables do not reach)
+_global_trackers: List[QueryTracker] = []
+_global_lock = threading.Lock()
+
+
+class QueryDiagnostics:
+    """
+    Engine event hooks for slow statements and per-request N+1 detection.
+
+    Args:
+        slow_query_ms: Log statements slower than this with their plan
+        explain: Run EXPLAIN on slow SELECTs and include the plan
+        n_plus_one_threshold: Identical shapes per request before reporting
+        raise_on_n_plus_one: Raise NPlusOneError instead of logging (tests)
+    """
+
+    def __init__(
+        self,
+        slow_query_ms: float = 200.0,
+        explain: bool = True,
+        n_plus_one_threshold: int = 10,
+        raise_on_n_plus_one: bool = False,
+    ):
+        self.slow_query_ms = slow_query_ms
+        self.explain = explain
+        self.n_plus_one_threshold = n_plus_one_threshold
+        self.raise_on_n_plus_one = raise_on_n_plus_one
+
+    def install(self, engine: Engine) -> None:
+        """Attach the hooks to ``engine`` (idempotent)."""
+        if not event.contains(engine, "before_cursor_execute", self._before):
+            event.listen(engine, "before_cursor_execute", self._before)
+            event.listen(engine, "after_cursor_execute", self._after)
+
+    def _before(self, conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("diagnostics_start", []).append(time.perf_counter())
+
+    def _after(self, conn, cursor, statement, parameters, context, executemany):
+        elapsed_ms = (time.perf_counter() - conn.info["diagnostics_start"].pop()) * 1000
+
+        if elapsed_ms >= self.slow_query_ms:
+            self._log_slow(conn, statement, parameters, elapsed_ms, executemany)
+
+        with _global_lock:
+            for tracker in _global_trackers:
+                tracker.record(statement)
+
+        tracker = _request_tracker.get()
+        if tracker is not None and tracker.record(statement) == self.n_plus_one_threshold:
+            message = (
+                f"Possible N+1 in {tracker.label or 'request'}: statement repeated "
+                f"{self.n_plus_one_threshold} times: {statement_shape(statement)[:300]}"
+            )
+            if self.raise_on_n_plus_one:
+                raise NPlusOneError(message)
+            logger.warning(message, extra={"route": tracker.label, "statement_shape": statement_shape(statement)})
+
+    def _log_slow(self, conn, statement, parameters, elapsed_ms, executemany):
+        plan = None
+        if self.explain and not executemany and statement.lstrip().upper().startswith("SELECT"):
+            plan = explain(conn, statement, parameters)
+        logger.warning(
+            "Slow query (%.1f ms): %s",
+            elapsed_ms,
+            statement[:1000],
+            extra={"elapsed_ms": round(elapsed_ms, 3), "parameters": repr(parameters)[:500], "plan": plan},
+        )
+
+
+def explain(conn, statement: str, parameters) -> Optional[str]:
+    """
+    Query plan for a statement on the same connection, or None if unavailable.
+
+    Uses a raw DBAPI cursor so the EXPLAIN itself is not traced.
+    """
+    prefix = "EXPLAIN QUERY PLAN " if conn.dialect.name == "sqlite" else "EXPLAIN "
+    try:
+        cursor = conn.connection.cursor()
+        try:
+            cursor.execute(prefix + statement, parameters)
+            rows = cursor.fetchall()
+        finally:
+            cursor.close()
+    except Exception as e:
+        return f"EXPLAIN failed: {e}"
+    return "\n".join(" ".join(str(col) for col in row) for row in rows)
+
+
+@contextmanager
+def track_queries(label: str = "") -> Iterator[QueryTracker]:
+    """Track statements issued in the current context (request or task)."""
+    tracker = QueryTracker(label)
+    token = _request_tracker.set(tracker)
+    try:
+        yield tracker
+    finally:
+        _request_tracker.reset(token)
+
+
+@contextmanager
+def capture_queries() -> Iterator[QueryTracker]:
+    """Track statements issued on any thread while the block runs."""
+    tracker = QueryTracker("capture")
+    with _global_lock:
+        _global_trackers.append(tracker)
+    try:
+        yield tracker
+    finally:
+        with _global_lock:
+            _global_trackers.remove(tracker)
+
+
+@contextmanager
+def assert_max_queries(max_queries: int) -> Iterator[QueryTracker]:
+    """
+    Fail if the block issues more than ``max_queries`` statements.
+
+    Example:
+        with assert_max_queries(3):
+            client.get("/api/alerts")
+    """
+    with capture_queries() as tracker:
+        yield tracker
+    if tracker.count > max_queries:
+        listing = "\n".join(f"  {n}x {shape[:200]}" for shape, n in tracker.shapes.most_common())
+        raise TooManyQueriesError(f"{tracker.count} queries issued (max {max_queries}):\n{listing}")
+
+
+class QueryDiagnosticsMiddleware:
+    """Pure ASGI middleware scoping N+1 detection to each HTTP request."""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        with track_queries(f"{scope['method']} {scope['path']}"):
+            await self.app(scope, receive, send)
+
+
+@lru_cache()
+def get_query_diagnostics() -> QueryDiagnostics:
+    """Get the process-wide query diagnostics hooks."""
+    return QueryDiagnostics(
+        slow_query_ms=settings.SLOW_QUERY_MS,
+        explain=settings.SLOW_QUERY_EXPLAIN,
+        n_plus_one_threshold=settings.N_PLUS_ONE_THRESHOLD,
+        raise_on_n_plus_one=settings.N_PLUS_ONE_RAISE,
+    )
@@ -0,0 +1,119 @@
+"""Schema versioning: Alembic migrations and the startup revision check."""
+
+import logging
+from pathlib import Path
+from typing import Optional, Sequence
+
+from sqlalchemy import inspect, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import OperationalError, ProgrammingError
+
+logger = logging.getLogger("app.schema")
+
+BACKEND_DIR = Path(__file__).resolve().parents[2]
+ALEMBIC_INI = BACKEND_DIR / "alembic.ini"
+
+# Latest revision in alembic/versions; bump together with every new migration
+SCHEMA_REVISION = "0010"
+
+# Revision matching a database built by the old ``Base.metadata.create_all``
+BASELINE_REVISION = "0001"
+
+
+class SchemaVersionError(RuntimeError):
+    """Database schema revision does not match the code."""
+
+
+def current_revision(engine: Engine) -> Optional[str]:
+    """
+    Read the applied revision with a single query.
+
+    Returns:
+        Optional[str]: Revision id, or None when the database is unversioned
+    """
+    try:
+        with engine.connect() as conn:
+            return conn.execute(text("SELECT version_num FROM alembic_version")).scalar()
+    except (OperationalError, ProgrammingError):
+        return None
+
+
+def verify_schema(engine: Engine) -> str:
+    """
+    Fast startup check: the database is at SCHEMA_REVISION.
+
+    Raises:
+        SchemaVersionError: Unversioned, behind or ahead of the code
+    """
+    revision = current_revision(engine)
+    if revision is None:
+        raise SchemaVersionError("Database is not versioned; run `alembic upgrade head`")
+    if revision != SCHEMA_REVISION:
+        raise SchemaVersionError(
+            f"Database is at revision {revision}, code expects {SCHEMA_REVISION}; "
+            "run `alembic upgrade head`"
+        )
+    return revision
+
+
+def alembic_config(engine: Engine):
+    """Alembic config bound to ``engine`` (imports alembic lazily)."""
+    from alembic.config import Config
+
+    config = Config(str(ALEMBIC_INI))
+    config.set_main_option("script_location", str(BACKEND_DIR / "alembic"))
+    config.set_main_option("sqlalchemy.url", engine.url.render_as_string(hide_password=False))
+    config.attributes["configure_logger"] = False
+    return config
+
+
+def upgrade_database(engine: Engine, revision: str = "head") -> None:
+    """
+    Apply migrations up to ``revision``.
+
+    Databases created by ``create_all`` before migrations existed are
+    stamped at BASELINE_REVISION first so only newer migrations run.
+    """
+    from alembic import command
+
+    config = alembic_config(engine)
+    if current_revision(engine) is None and inspect(engine).has_table("transactions"):
+        logger.info("Stamping unversioned database at %s", BASELINE_REVISION)
+        command.stamp(config, BASELINE_REVISION)
+    command.upgrade(config, revision)
+
+
+def create_index_online(
+    name: str,
+    table: str,
+    columns: Sequence[str],
+    unique: bool = False,
+) -> None:
+    """
+    Build an index without blocking writes (for use inside migrations).
+
+    PostgreSQL uses ``CREATE INDEX CONCURRENTLY`` outside the migration
+    transaction; other dialects fall back to ``IF NOT EXISTS``, which is
+    as close to online as SQLite gets.
+    """
+    from alembic import op
+
+    if op.get_context().dialect.name == "postgresql":
+        with op.get_context().autocommit_block():
+            op.create_index(
+                name, table, list(columns), unique=unique,
+                postgresql_concurrently=True, if_not_exists=True,
+            )
+    else:
+        op.create_index(name, table, list(columns), unique=unique, if_not_exists=True)
+
+
+def drop_index_online(name: str, table: str) -> None:
+    """Drop an index without blocking writes (counterpart of create_index_online)."""
+    from alembic import op
+
+    if op.get_context().dialect.name == "postgresql":
+        with op.get_context().autocommit_block():
+            op.drop_index(name, table_name=table, postgresql_concurrently=True, if_exists=True)
+    else:
+        op.drop_index(name, table_name=table, if_exists=True)
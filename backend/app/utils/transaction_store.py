@@ -0,0 +1,277 @@
+"""Memory-compact, array-backed transaction store.
+
+Holds the full PaySim dataset (6.3M rows) in a single structured NumPy
+array of ~21 bytes per row, with account names interned to dense integer
+ids and CSR-style indexes for per-account lookups. Used by the feature
+engine, the replay tool and the backtester instead of ORM objects or
+object-dtype pandas frames.
+
+Account ids are positions in a sorted array of unique account names, so
+name → id is a binary search and no Python dict of millions of strings
+is ever built.
+"""
+
+from pathlib import Path
+from typing import Iterable, Optional, Sequence, Union
+
+import numpy as np
+
+from app.models.transaction import TransactionType
+
+# Categorical codes for ``type`` (stable enum order)
+TYPE_NAMES = [t.value for t in TransactionType]
+TYPE_CODES = {name: code for code, name in enumerate(TYPE_NAMES)}
+
+TRANSACTION_DTYPE = np.dtype(
+    [
+        ("step", np.int16),
+        ("type", np.int8),
+        ("amount", np.float64),
+        ("orig", np.int32),
+        ("dest", np.int32),
+        ("is_fraud", np.bool_),
+        ("is_flagged", np.bool_),
+    ]
+)
+
+_ARRAY_FILES = ("records", "accounts", "orig_offsets", "orig_order", "dest_offsets", "dest_order")
+
+
+def encode_types(types: Iterable[str]) -> np.ndarray:
+    """Encode transaction type names (``CASH-OUT`` or ``CASH_OUT``) as int8 codes."""
+    values = np.asarray(types, dtype=object)
+    uniques, inverse = np.unique(values, return_inverse=True)
+    lookup = np.array([TYPE_CODES[str(u).replace("-", "_")] for u in uniques], dtype=np.int8)
+    return lookup[inverse]
+
+
+def build_csr_index(keys: np.ndarray, size: int):
+    """
+    Build a CSR-style index grouping row positions by key.
+
+    Rows for key ``k`` are ``order[offsets[k]:offsets[k + 1]]`` and keep
+    their original relative order (stable sort), so a step-ordered store
+    yields step-ordered per-account rows.
+
+    Returns:
+        tuple: (offsets, order)
+    """
+    order = np.argsort(keys, kind="stable").astype(np.int32)
+    counts = np.bincount(keys, minlength=size)
+    offsets = np.zeros(size + 1, dtype=np.int64)
+    np.cumsum(counts, out=offsets[1:])
+    return offsets, order
+
+
+class TransactionStore:
+    """
+    Array-backed transaction store with per-account indexes.
+
+    Attributes:
+        records: Structured array with ``TRANSACTION_DTYPE``
+        accounts: Sorted unique account names (bytes); id = position
+    """
+
+    def __init__(
+        self,
+        records: np.ndarray,
+        accounts: np.ndarray,
+        orig_index: Optional[tuple] = None,
+        dest_index: Optional[tuple] = None,
+    ):
+        self.records = records
+        self.accounts = accounts
+        self.orig_offsets, self.orig_order = orig_index or build_csr_index(
+            records["orig"], len(accounts)
+        )
+        self.dest_offsets, self.dest_order = dest_index or build_csr_index(
+            records["dest"], len(accounts)
+        )
+
+    # ------------------------------------------------------------------
+    # Construction
+    # ------------------------------------------------------------------
+
+    @classmethod
+    def from_arrays(
+        cls,
+        step: Sequence[int],
+        type: Sequence[str],
+        amount: Sequence[float],
+        name_orig: Sequence[str],
+        name_dest: Sequence[str],
+        is_fraud: Optional[Sequence[bool]] = None,
+        is_flagged: Optional[Sequence[bool]] = None,
+    ) -> "TransactionStore":
+        """Build a store from column sequences, interning account names."""
+        n = len(step)
+        names = np.concatenate(
+            [np.asarray(name_orig, dtype=np.bytes_), np.asarray(name_dest, dtype=np.bytes_)]
+        )
+        accounts, ids = np.unique(names, return_inverse=True)
+
+        records = np.empty(n, dtype=TRANSACTION_DTYPE)
+        records["step"] = np.asarray(step)
+        records["type"] = encode_types(type)
+        records["amount"] = np.asarray(amount, dtype=np.float64)
+        records["orig"] = ids[:n]
+        records["dest"] = ids[n:]
+        records["is_fraud"] = np.asarray(is_fraud, dtype=bool) if is_fraud is not None else False
+        records["is_flagged"] = np.asarray(is_flagged, dtype=bool) if is_flagged is not None else False
+
+        # Keep rows in step order so per-account slices and step ranges are ordered
+        if n > 1 and np.any(np.diff(records["step"]) < 0):
+            records = records[np.argsort(records["step"], kind="stable")]
+        return cls(records, accounts)
+
+    @classmethod
+    def from_frame(cls, df) -> "TransactionStore":
+        """Build a store from a PaySim-shaped pandas DataFrame."""
+        return cls.from_arrays(
+            step=df["step"].to_numpy(),
+            type=df["type"].astype(str).to_numpy(),
+            amount=df["amount"].to_numpy(),
+            name_orig=df["nameOrig"].astype(str).to_numpy(),
+            name_dest=df["nameDest"].astype(str).to_numpy(),
+            is_fraud=df["isFraud"].to_numpy() if "isFraud" in df else None,
+            is_flagged=df["isFlaggedFraud"].to_numpy() if "isFlaggedFraud" in df else None,
+        )
+
+    @classmethod
+    def from_csv(cls, csv_path: str) -> "TransactionStore":
+        """Build a store from the PaySim CSV, skipping balance columns."""
+        import pandas as pd
+
+        df = pd.read_csv(
+            csv_path,
+            usecols=["step", "type", "amount", "nameOrig", "nameDest", "isFraud", "isFlaggedFraud"],
+            dtype={"step": np.int16, "type": "category", "isFraud": bool, "isFlaggedFraud": bool},
+        )
+        return cls.from_frame(df)
+
+    @classmethod
+    def from_parquet(cls, path: str) -> "TransactionStore":
+        """Build a store from a Parquet dataset written by ``app.utils.columnar``."""
+        from app.utils.columnar import load_transactions_frame
+
+        df = load_transactions_frame(
+            path,
+            columns=["step", "type", "amount", "nameOrig", "nameDest", "isFraud", "isFlaggedFraud"],
+        )
+        return cls.from_frame(df)
+
+    # ------------------------------------------------------------------
+    # Persistence
+    # ------------------------------------------------------------------
+
+    def save(self, directory: Union[str, Path]) -> None:
+        """Save arrays as ``.npy`` files so they can be memory-mapped on load."""
+        directory = Path(directory)
+        directory.mkdir(parents=True, exist_ok=True)
+        arrays = {
+            "records": self.records,
+            "accounts": self.accounts,
+            "orig_offsets": self.orig_offsets,
+            "orig_order": self.orig_order,
+            "dest_offsets": self.dest_offsets,
+            "dest_order": self.dest_order,
+        }
+        for name in _ARRAY_FILES:
+            np.save(directory / f"{name}.npy", arrays[name])
+
+    @classmethod
+    def load(cls, directory: Union[str, Path], mmap: bool = True) -> "TransactionStore":
+        """Load a saved store; with ``mmap`` pages are shared across processes."""
+        directory = Path(directory)
+        mode = "r" if mmap else None
+        arrays = {name: np.load(directory / f"{name}.npy", mmap_mode=mode) for name in _ARRAY_FILES}
+        return cls(
+            arrays["records"],
+            arrays["accounts"],
+            orig_index=(arrays["orig_offsets"], arrays["orig_order"]),
+            dest_index=(arrays["dest_offsets"], arrays["dest_order"]),
+        )
+
+    # ------------------------------------------------------------------
+    # Lookups
+    # ------------------------------------------------------------------
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    @property
+    def num_accounts(self) -> int:
+        """Number of distinct accounts (senders and receivers)."""
+        return len(self.accounts)
+
+    @property
+    def nbytes(self) -> int:
+        """Total bytes held by the store's arrays."""
+        return sum(
+            a.nbytes
+            for a in (
+                self.records,
+                self.accounts,
+                self.orig_offsets,
+                self.orig_order,
+                self.dest_offsets,
+                self.dest_order,
+            )
+        )
+
+    def account_id(self, name: str) -> int:
+        """Get the interned id for an account name (-1 if unknown)."""
+        key = np.bytes_(name)
+        pos = int(np.searchsorted(self.accounts, key))
+        if pos < len(self.accounts) and self.accounts[pos] == key:
+            return pos
+        return -1
+
+    def account_name(self, account_id: int) -> str:
+        """Get the account name for an interned id."""
+        return self.accounts[account_id].decode()
+
+    def _resolve(self, account: Union[int, str]) -> int:
+        return self.account_id(account) if isinstance(account, str) else int(account)
+
+    def sent_by(self, account: Union[int, str]) -> np.ndarray:
+        """Row positions where ``account`` is the sender (in step order)."""
+        account_id = self._resolve(account)
+        if account_id < 0:
+            return np.empty(0, dtype=np.int32)
+        return self.orig_order[self.orig_offsets[account_id]:self.orig_offsets[account_id + 1]]
+
+    def received_by(self, account: Union[int, str]) -> np.ndarray:
+        """Row positions where ``account`` is the receiver (in step order)."""
+        account_id = self._resolve(account)
+        if account_id < 0:
+            return np.empty(0, dtype=np.int32)
+        return self.dest_order[self.dest_offsets[account_id]:self.dest_offsets[account_id + 1]]
+
+    def out_degree(self) -> np.ndarray:
+        """Transactions sent per account id."""
+        return np.diff(self.orig_offsets)
+
+    def in_degree(self) -> np.ndarray:
+        """Transactions received per account id."""
+        return np.diff(self.dest_offsets)
+
+    def step_slice(self, min_step: int, max_step: int) -> np.ndarray:
+        """Row positions with ``min_step <= step <= max_step`` (requires step-ordered rows)."""
+        steps = self.records["step"]
+        start = int(np.searchsorted(steps, min_step, side="left"))
+        stop = int(np.searchsorted(steps, max_step, side="right"))
+        return np.arange(start, stop, dtype=np.int32)
+
+    def to_dict(self, row: int) -> dict:
+        """Decode one row into PaySim column names (for display/debugging)."""
+        record = self.records[row]
+        return {
+            "step": int(record["step"]),
+            "type": TYPE_NAMES[record["type"]],
+            "amount": float(record["amount"]),
+            "nameOrig": self.account_name(record["orig"]),
+            "nameDest": self.account_name(record["dest"]),
+            "isFraud": bool(record["is_fraud"]),
+            "isFlaggedFraud": bool(record["is_flagged"]),
+        }
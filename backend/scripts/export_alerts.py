@@ -0,0 +1,87 @@
+"""Script to export alerts with their transactions as CSV or JSON Lines (optionally gzipped)."""
+
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Optional
+
+# Add parent directory to path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from app.config import settings
+from app.services.alert_export import EXPORT_FORMATS, decode_cursor, stream_alert_export
+
+
+def export(
+    output_path: str,
+    fmt: str = "csv",
+    created_from: Optional[datetime] = None,
+    created_to: Optional[datetime] = None,
+    cursor: Optional[str] = None,
+    batch_size: int = settings.EXPORT_BATCH_SIZE,
+) -> int:
+    """
+    Stream the export to ``output_path`` (gzipped when it ends in .gz).
+
+    Returns:
+        int: Bytes written
+    """
+    from app.database import SessionLocal
+
+    db = SessionLocal()
+    written = 0
+    try:
+        chunks = stream_alert_export(
+            db,
+            fmt=fmt,
+            compress=output_path.endswith(".gz"),
+            created_from=created_from,
+            created_to=created_to,
+            after=decode_cursor(cursor) if cursor else None,
+            batch_size=batch_size,
+        )
+        with open(output_path, "wb") as f:
+            for chunk in chunks:
+                f.write(chunk)
+                written += len(chunk)
+    finally:
+        db.close()
+    return written
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Export alerts with their transactions (streamed, constant memory)")
+    parser.add_argument("output", type=str, help="Output file; a .gz suffix compresses it")
+    parser.add_argument("--format", choices=EXPORT_FORMATS, default="csv", help="Output format")
+    parser.add_argument("--from", dest="created_from", type=datetime.fromisoformat, default=None,
+                        help="Alerts created at or after this ISO timestamp")
+    parser.add_argument("--to", dest="created_to", type=datetime.fromisoformat, default=None,
+                        help="Alerts created before this ISO timestamp")
+    parser.add_argument("--cursor", type=str, default=None,
+                        help="Resume after the alert with this cursor (from a previous export)")
+    parser.add_argument("--batch-size", type=int, default=settings.EXPORT_BATCH_SIZE,
+                        help="Alerts read per server-side cursor fetch")
+
+    args = parser.parse_args()
+
+    try:
+        print(f"📤 Exporting alerts → {args.output}")
+        started = time.perf_counter()
+        written = export(
+            args.output,
+            fmt=args.format,
+            created_from=args.created_from,
+            created_to=args.created_to,
+            cursor=args.cursor,
+            batch_size=args.batch_size,
+        )
+        print(f"Size: {written / (1024**2):.1f} MB")
+        print(f"Elapsed: {time.perf_counter() - started:.1f}s")
+        print("✅ Export completed successfully!")
+
+    except Exception as e:
+        print(f"\n❌ Error: {e}")
+        sys.exit(1)
@@ -0,0 +1,84 @@
+"""Script to convert the transaction CSV (and optionally alerts) to Parquet."""
+
+import sys
+import time
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from app.config import settings
+from app.utils.columnar import convert_csv_to_parquet
+
+
+def export_alerts(output_path: str) -> int:
+    """Export alerts with transaction features from the database."""
+    from app.database import SessionLocal
+    from app.utils.columnar import export_alerts_to_parquet
+
+    db = SessionLocal()
+    try:
+        return export_alerts_to_parquet(db, output_path)
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Convert transactions CSV to partitioned Parquet")
+    parser.add_argument(
+        "--csv",
+        type=str,
+        default=settings.DATASET_PATH,
+        help="Path to CSV file"
+    )
+    parser.add_argument(
+        "--output",
+        type=str,
+        default=settings.PARQUET_DATASET_PATH,
+        help="Output dataset directory"
+    )
+    parser.add_argument(
+        "--block-size-mb",
+        type=int,
+        default=64,
+        help="CSV block size parsed per batch"
+    )
+    parser.add_argument(
+        "--alerts",
+        type=str,
+        default=None,
+        help="Also export alerts with features to this .parquet file (optional)"
+    )
+
+    args = parser.parse_args()
+
+    try:
+        print(f"📂 Converting {args.csv} → {args.output}")
+        started = time.perf_counter()
+        stats = convert_csv_to_parquet(
+            csv_path=args.csv,
+            output_dir=args.output,
+            block_size_mb=args.block_size_mb,
+        )
+        elapsed = time.perf_counter() - started
+
+        print("\n" + "="*60)
+        print("📊 EXPORT STATISTICS")
+        print("="*60)
+        print(f"Rows: {stats['rows']}")
+        print(f"Files: {stats['files']}")
+        print(f"Size: {stats['bytes'] / (1024**2):.1f} MB")
+        print(f"Elapsed: {elapsed:.1f}s")
+
+        if args.alerts:
+            exported = export_alerts(args.alerts)
+            print(f"Alerts exported: {exported} → {args.alerts}")
+
+        print("="*60)
+        print("✅ Export completed successfully!")
+
+    except Exception as e:
+        print(f"\n❌ Error: {e}")
+        sys.exit(1)
@@ -2,6 +2,7 @@
 
 import sys
 from pathlib import Path
+from typing import Optional
 
 # Add parent directory to path
 sys.path.append(str(Path(__file__).parent.parent))
@@ -12,6 +13,8 @@ from sqlalchemy.orm import Session
 from app.config import settings
 from app.database import SessionLocal, init_db
 from app.models.transaction import Transaction, TransactionType
+from app.services.entity_dictionary import get_entity_dictionary
+from app.services.entity_service import EntityService
 
 
 def load_transactions_from_csv(
@@ -55,6 +58,7 @@ def load_transactions_from_csv(
     init_db()
     
     db: Session = SessionLocal()
+    entities = get_entity_dictionary()
     
     try:
         loaded = 0
@@ -64,7 +68,12 @@ def load_transactions_from_csv(
         for i in range(0, len(df), batch_size):
             batch = df.iloc[i:i + batch_size]
             
-            for _, row in batch.iterrows():
+            # Intern account names once per batch
+            orig_ids = entities.intern_many(db, batch["nameOrig"].astype(str))
+            dest_ids = entities.intern_many(db, batch["nameDest"].astype(str))
+            batch_transactions = []
+            
+            for (_, row), orig_id, dest_id in zip(batch.iterrows(), orig_ids, dest_ids):
                 try:
                     transaction = Transaction(
                         step=int(row["step"]),
@@ -72,6 +81,8 @@ def load_transactions_from_csv(
                         amount=float(row["amount"]),
                         nameOrig=str(row["nameOrig"]),
                         nameDest=str(row["nameDest"]),
+                        orig_id=orig_id,
+                        dest_id=dest_id,
                         oldbalanceOrg=float(row["oldbalanceOrg"]) if pd.notna(row["oldbalanceOrg"]) else None,
                         newbalanceOrig=float(row["newbalanceOrig"]) if pd.notna(row["newbalanceOrig"]) else None,
                         oldbalanceDest=float(row["oldbalanceDest"]) if pd.notna(row["oldbalanceDest"]) else None,
@@ -80,12 +91,14 @@ def load_transactions_from_csv(
                         isFlaggedFraud=bool(row["isFlaggedFraud"]),
                     )
                     db.add(transaction)
+                    batch_transactions.append(transaction)
                     loaded += 1
                 except Exception as e:
                     print(f"❌ Error loading row: {e}")
                     errors += 1
             
-            # Commit batch
+            # Update entity profiles and commit batch
+            EntityService.update_aggregates(db, batch_transactions)
             db.commit()
             print(f"✅ Loaded {loaded} transactions ({errors} errors)")
         
@@ -110,7 +123,6 @@ def load_transactions_from_csv(
 
 if __name__ == "__main__":
     import argparse
-    from typing import Optional
     
     parser = argparse.ArgumentParser(description="Load transactions from CSV")
     parser.add_argument(
@@ -0,0 +1,30 @@
+"""Script to recount alerts and correct the dashboard counters (run from cron)."""
+
+import sys
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from app.database import SessionLocal
+from app.services.alert_counters import AlertCounters
+
+
+def reconcile() -> dict:
+    """Reconcile the counters; returns the drift that was corrected."""
+    db = SessionLocal()
+    try:
+        return AlertCounters.reconcile(db)
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    drift = reconcile()
+    if not drift:
+        print("Counters match the alert tables")
+        sys.exit(0)
+    print("Corrected drift (stored - actual):")
+    for dimension, values in sorted(drift.items()):
+        for value, difference in sorted(values.items()):
+            print(f"  {dimension}={value or '(unassigned)'}: {difference:+d}")
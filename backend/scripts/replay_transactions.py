@@ -0,0 +1,329 @@
+"""Script to replay transactions into the ingestion API at a multiple of real time."""
+
+import asyncio
+import json
+import sys
+import time
+from collections import Counter
+from pathlib import Path
+from typing import Awaitable, Callable, Iterable, Iterator, List, Optional, Tuple
+
+# Add parent directory to path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from app.config import settings
+from app.utils.histogram import LatencyHistogram
+
+# One PaySim step is one hour of simulated time
+STEP_SECONDS = 3600.0
+
+PAYLOAD_COLUMNS = ["step", "type", "amount", "nameOrig", "nameDest", "isFraud", "isFlaggedFraud"]
+
+Sender = Callable[[List[dict]], Awaitable[None]]
+
+
+def iter_csv_rows(csv_path: str, limit: Optional[int] = None, chunk_size: int = 100_000) -> Iterator[dict]:
+    """Stream transaction payloads from the PaySim CSV (balance columns skipped)."""
+    import pandas as pd
+
+    emitted = 0
+    for chunk in pd.read_csv(csv_path, usecols=PAYLOAD_COLUMNS, chunksize=chunk_size):
+        for row in chunk.itertuples(index=False):
+            yield {
+                "step": int(row.step),
+                "type": row.type,
+                "amount": float(row.amount),
+                "nameOrig": row.nameOrig,
+                "nameDest": row.nameDest,
+                "isFraud": bool(row.isFraud),
+                "isFlaggedFraud": bool(row.isFlaggedFraud),
+            }
+            emitted += 1
+            if limit is not None and emitted >= limit:
+                return
+
+
+def iter_db_rows(limit: Optional[int] = None, batch_size: int = 10_000) -> Iterator[dict]:
+    """Stream transaction payloads from the transactions table in step order."""
+    from sqlalchemy import select
+
+    from app.database import SessionLocal
+    from app.models.transaction import Transaction
+
+    stmt = select(
+        Transaction.step,
+        Transaction.type,
+        Transaction.amount,
+        Transaction.nameOrig,
+        Transaction.nameDest,
+        Transaction.isFraud,
+        Transaction.isFlaggedFraud,
+    ).order_by(Transaction.step, Transaction.created_at)
+    if limit is not None:
+        stmt = stmt.limit(limit)
+
+    db = SessionLocal()
+    try:
+        for row in db.execute(stmt.execution_options(yield_per=batch_size)):
+            yield {
+                "step": row.step,
+                "type": row.type.value,
+                "amount": float(row.amount),
+                "nameOrig": row.nameOrig,
+                "nameDest": row.nameDest,
+                "isFraud": row.isFraud,
+                "isFlaggedFraud": row.isFlaggedFraud,
+            }
+    finally:
+        db.close()
+
+
+def schedule(
+    rows: Iterable[dict],
+    speedup: float,
+    step_seconds: float = STEP_SECONDS,
+) -> Iterator[Tuple[float, dict]]:
+    """
+    Assign each row a send offset (seconds from start) over ``step``.
+
+    Step ``s`` occupies ``[(s - first_step), (s - first_step + 1)) * step_seconds / speedup``
+    and its rows are spread evenly across that interval in input order,
+    so the same input and speedup always produce the same schedule.
+    ``speedup <= 0`` sends everything as fast as possible.
+
+    Rows must be ordered by step.
+    """
+    if speedup <= 0:
+        for row in rows:
+            yield 0.0, row
+        return
+
+    interval = step_seconds / speedup
+    first_step: Optional[int] = None
+    current: List[dict] = []
+
+    def flush() -> Iterator[Tuple[float, dict]]:
+        base = (current[0]["step"] - first_step) * interval
+        spacing = interval / len(current)
+        for i, buffered in enumerate(current):
+            yield base + i * spacing, buffered
+
+    for row in rows:
+        if first_step is None:
+            first_step = row["step"]
+        if current and row["step"] != current[0]["step"]:
+            if row["step"] < current[0]["step"]:
+                raise ValueError("Rows must be ordered by step")
+            yield from flush()
+            current = []
+        current.append(row)
+    if current:
+        yield from flush()
+
+
+def batched(scheduled: Iterable[Tuple[float, dict]], batch_size: int) -> Iterator[Tuple[float, List[dict]]]:
+    """Group scheduled rows into micro-batches sent at the first row's offset."""
+    batch: List[dict] = []
+    offset = 0.0
+    for row_offset, row in scheduled:
+        if not batch:
+            offset = row_offset
+        batch.append(row)
+        if len(batch) >= batch_size:
+            yield offset, batch
+            batch = []
+    if batch:
+        yield offset, batch
+
+
+async def replay(
+    batches: Iterable[Tuple[float, List[dict]]],
+    send: Sender,
+    concurrency: int = 64,
+) -> dict:
+    """
+    Send scheduled batches with ``concurrency`` in-flight requests.
+
+    Args:
+        batches: (offset seconds, rows) in offset order
+        send: Coroutine sending one batch; raises on failure
+        concurrency: Number of concurrent senders (connections)
+
+    Returns:
+        dict: Throughput, error and latency statistics
+    """
+    loop = asyncio.get_running_loop()
+    queue: asyncio.Queue = asyncio.Queue(maxsize=concurrency * 2)
+    latency = LatencyHistogram()
+    errors: Counter = Counter()
+    stats = {"requests": 0, "rows": 0, "rows_ok": 0, "max_lag_s": 0.0}
+
+    start = loop.time()
+
+    async def producer() -> None:
+        for offset, batch in batches:
+            delay = start + offset - loop.time()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            else:
+                stats["max_lag_s"] = max(stats["max_lag_s"], -delay)
+            await queue.put(batch)
+        for _ in range(concurrency):
+            await queue.put(None)
+
+    async def worker() -> None:
+        while True:
+            batch = await queue.get()
+            if batch is None:
+                return
+            started = time.perf_counter()
+            try:
+                await send(batch)
+                stats["rows_ok"] += len(batch)
+            except Exception as e:
+                response = getattr(e, "response", None)
+                key = f"HTTP {response.status_code}" if response is not None else type(e).__name__
+                errors[key] += 1
+            latency.record(time.perf_counter() - started)
+            stats["requests"] += 1
+            stats["rows"] += len(batch)
+
+    await asyncio.gather(producer(), *(worker() for _ in range(concurrency)))
+    elapsed = loop.time() - start
+
+    failed = sum(errors.values())
+    return {
+        "requests": stats["requests"],
+        "rows": stats["rows"],
+        "rows_ok": stats["rows_ok"],
+        "errors": dict(errors),
+        "error_rate": round(failed / stats["requests"], 6) if stats["requests"] else 0.0,
+        "elapsed_s": round(elapsed, 3),
+        "rows_per_s": round(stats["rows"] / elapsed, 1) if elapsed else 0.0,
+        "requests_per_s": round(stats["requests"] / elapsed, 1) if elapsed else 0.0,
+        "max_lag_s": round(stats["max_lag_s"], 3),
+        "latency": latency.summary(),
+    }
+
+
+def http_sender(client, base_url: str) -> Sender:
+    """Build a sender posting single rows or micro-batches to the ingestion API."""
+    single_url = f"{base_url}{settings.API_V1_PREFIX}/transactions"
+    batch_url = f"{single_url}/batch"
+
+    async def send(batch: List[dict]) -> None:
+        if len(batch) == 1:
+            response = await client.post(single_url, json=batch[0])
+        else:
+            response = await client.post(batch_url, json={"transactions": batch})
+        response.raise_for_status()
+
+    return send
+
+
+async def run(args) -> dict:
+    """Run a replay from parsed command-line arguments."""
+    import httpx
+
+    if args.source == "csv":
+        rows = iter_csv_rows(args.csv, limit=args.limit)
+    else:
+        rows = iter_db_rows(limit=args.limit)
+
+    batches = batched(schedule(rows, args.speedup, args.step_seconds), args.batch_size)
+    limits = httpx.Limits(max_connections=args.concurrency, max_keepalive_connections=args.concurrency)
+    async with httpx.AsyncClient(limits=limits, timeout=args.timeout) as client:
+        return await replay(batches, http_sender(client, args.url), concurrency=args.concurrency)
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Replay transactions into the ingestion API")
+    parser.add_argument(
+        "--source",
+        choices=["csv", "db"],
+        default="csv",
+        help="Read transactions from the CSV or the transactions table"
+    )
+    parser.add_argument(
+        "--csv",
+        type=str,
+        default=settings.DATASET_PATH,
+        help="Path to CSV file"
+    )
+    parser.add_argument(
+        "--url",
+        type=str,
+        default="http://localhost:8000",
+        help="Base URL of the API"
+    )
+    parser.add_argument(
+        "--speedup",
+        type=float,
+        default=0,
+        help="Multiple of real time (one step = one hour); 0 sends as fast as possible"
+    )
+    parser.add_argument(
+        "--step-seconds",
+        type=float,
+        default=STEP_SECONDS,
+        help="Real-time duration of one step"
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=64,
+        help="Concurrent connections"
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=1,
+        help="Transactions per request (uses /batch when > 1)"
+    )
+    parser.add_argument(
+        "--limit",
+        type=int,
+        default=None,
+        help="Maximum number of transactions to replay (optional)"
+    )
+    parser.add_argument(
+        "--timeout",
+        type=float,
+        default=30.0,
+        help="Per-request timeout in seconds"
+    )
+    parser.add_argument(
+        "--json-report",
+        type=str,
+        default=None,
+        help="Write the report as JSON to this path (optional)"
+    )
+
+    args = parser.parse_args()
+
+    try:
+        report = asyncio.run(run(args))
+
+        print("\n" + "="*60)
+        print("📊 REPLAY STATISTICS")
+        print("="*60)
+        print(f"Requests: {report['requests']} ({report['requests_per_s']}/s)")
+        print(f"Rows: {report['rows']} ({report['rows_per_s']}/s)")
+        print(f"Error rate: {report['error_rate']:.4%}")
+        for error, count in report["errors"].items():
+            print(f"  {error}: {count}")
+        print(f"Max schedule lag: {report['max_lag_s']}s")
+        print("\nLatency:")
+        for key, value in report["latency"].items():
+            print(f"  {key}: {value}")
+        print("="*60)
+
+        if args.json_report:
+            Path(args.json_report).write_text(json.dumps(report, indent=2))
+            print(f"📝 Report written to {args.json_report}")
+
+    except Exception as e:
+        print(f"\n❌ Error: {e}")
+        sys.exit(1)
@@ -0,0 +1,84 @@
+"""Script to score a transaction CSV of any size through the batch scoring pipeline."""
+
+import sys
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from app.config import settings
+from app.services.batch_scoring import BatchScoringError, BatchScoringReport, score_file
+
+
+def score(
+    csv_path: str,
+    chunk_size: int = settings.BATCH_SCORING_CHUNK_SIZE,
+    queue_size: int = settings.BATCH_SCORING_QUEUE_SIZE,
+    start_line: int = 2,
+) -> BatchScoringReport:
+    """
+    Score and store every valid row of ``csv_path`` from ``start_line`` on (no upload size limit).
+
+    Returns:
+        BatchScoringReport: Row and alert counts with per-stage throughput
+
+    Raises:
+        BatchScoringError: A chunk failed; earlier chunks stay stored (see its report)
+    """
+    from app.database import SessionLocal
+
+    db = SessionLocal()
+    try:
+        return score_file(db, csv_path, chunk_size=chunk_size, queue_size=queue_size, first_line=start_line)
+    finally:
+        db.close()
+
+
+def print_report(report: BatchScoringReport) -> None:
+    """Row counts, then one line per stage with the bottleneck marked."""
+    print(f"Rows: {report.rows_read} read, {report.rows_stored} stored, {report.rows_rejected} rejected")
+    for error in report.errors[:10]:
+        print(f"  line {error.line}: {error.reason}")
+    print(f"Alerts: {report.alerts_created} created, {report.alerts_merged} merged (model {report.model_version})")
+    print(f"{'stage':<10}{'rows/s':>12}{'busy s':>10}{'starved s':>11}{'blocked s':>11}")
+    for stage in report.stages:
+        marker = "  ← bottleneck" if stage.name == report.bottleneck else ""
+        print(
+            f"{stage.name:<10}{stage.rows_per_second:>12,.0f}{stage.busy_seconds:>10.2f}"
+            f"{stage.starved_seconds:>11.2f}{stage.blocked_seconds:>11.2f}{marker}"
+        )
+    print(f"Elapsed: {report.elapsed_seconds:.1f}s ({report.rows_stored / max(report.elapsed_seconds, 1e-9):,.0f} rows/s)")
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description="Score a PaySim-layout CSV: parse → features → rules → score → store, one thread per stage"
+    )
+    parser.add_argument("csv_path", type=str, help="Transactions CSV, ordered by step")
+    parser.add_argument("--chunk-size", type=int, default=settings.BATCH_SCORING_CHUNK_SIZE,
+                        help="Rows per chunk (one database transaction each)")
+    parser.add_argument("--queue-size", type=int, default=settings.BATCH_SCORING_QUEUE_SIZE,
+                        help="Chunks buffered between two stages")
+    parser.add_argument("--start-line", type=int, default=2,
+                        help="First file line to score, e.g. the resume line of a failed run (header is line 1)")
+
+    args = parser.parse_args()
+
+    try:
+        print(f"📂 Scoring transactions from: {args.csv_path}")
+        print_report(score(
+            args.csv_path, chunk_size=args.chunk_size, queue_size=args.queue_size, start_line=args.start_line
+        ))
+        print("✅ Batch scoring completed successfully!")
+
+    except BatchScoringError as e:
+        print(f"\n❌ Error: {e}")
+        print_report(e.report)
+        print(f"↩️  Stored up to line {e.report.last_line_stored}; resume with --start-line {e.report.resume_line}")
+        sys.exit(1)
+
+    except Exception as e:
+        print(f"\n❌ Error: {e}")
+        sys.exit(1)
@@ -16,6 +16,8 @@ from sqlalchemy.orm import Session
 from app.database import SessionLocal, init_db
 from app.models.alert import Alert, AlertPriority, AlertStatus, RiskBand
 from app.models.transaction import Transaction
+from app.services.alert_counters import AlertCounters
+from app.services.entity_service import EntityService
 
 fake = Faker()
 
@@ -216,28 +218,19 @@ def seed_alerts(count: int = 100) -> dict:
             db.add(alert)
             alerts_created += 1
         
+        # Count alerts in the sender's entity profile, as ingestion does
+        EntityService.record_history(db, [tx.orig_id for tx in transactions], alerts=1)
         db.commit()
         
-        # Get statistics
+        # Get statistics (dashboard counters, maintained on write)
+        summary = AlertCounters.summary(db)
         stats = {
             "total_alerts": alerts_created,
-            "by_status": {},
-            "by_priority": {},
-            "by_risk_band": {},
+            "by_status": summary["by_status"],
+            "by_priority": summary["by_priority"],
+            "by_risk_band": summary["by_risk_band"],
         }
         
-        for status in AlertStatus:
-            count = db.query(Alert).filter(Alert.status == status).count()
-            stats["by_status"][status.value] = count
-        
-        for priority in AlertPriority:
-            count = db.query(Alert).filter(Alert.priority == priority).count()
-            stats["by_priority"][priority.value] = count
-        
-        for risk_band in RiskBand:
-            count = db.query(Alert).filter(Alert.ml_risk_band == risk_band).count()
-            stats["by_risk_band"][risk_band.value] = count
-        
         return stats
         
     finally:
@@ -0,0 +1,180 @@
+"""Benchmark fixtures: shared large database and JSON baseline regression guard."""
+
+import json
+import platform
+import warnings
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.database import Base, get_db
+from app.main import app
+from app.services.alert_counters import AlertCounters
+from tests.benchmarks.generators import populate_alerts, populate_entities
+
+BENCH_DATABASE_PATH = Path("./benchmark_fraud_detection.db")
+
+
+class BaselineStore:
+    """
+    Benchmark medians keyed by test, loaded from and saved to JSON.
+
+    A result regresses when its median exceeds the baseline median by
+    more than ``threshold`` (a fraction). Baselines recorded at a
+    different ``--bench-alerts`` scale are not compared. A result with
+    nothing to compare against warns, or fails with ``require``, so a
+    missing baseline never passes as "no regression".
+    """
+
+    def __init__(self, path: Path, alerts: int, threshold: float, require: bool = False):
+        self.path = path
+        self.alerts = alerts
+        self.threshold = threshold
+        self.require = require
+        self.results = {}
+        self.baseline = {}
+        self.missing_reason = f"no baseline file {path}"
+        if path.exists():
+            data = json.loads(path.read_text())
+            if data.get("alerts") == alerts:
+                self.baseline = data.get("benchmarks", {})
+                self.missing_reason = f"not in {path}"
+            else:
+                self.missing_reason = f"{path} was recorded with --bench-alerts {data.get('alerts')}"
+
+    def record(self, name: str, stats) -> None:
+        """Keep a result for saving."""
+        self.results[name] = {
+            "median": stats.median,
+            "mean": stats.mean,
+            "min": stats.min,
+            "stddev": stats.stddev,
+            "rounds": stats.rounds,
+        }
+
+    def check(self, name: str, stats) -> None:
+        """Fail if a result regressed past the threshold over its baseline (warn or fail if it has none)."""
+        baseline = self.baseline.get(name)
+        if baseline is None:
+            message = (
+                f"{name} not checked for regressions: {self.missing_reason} "
+                f"(record one with --bench-update-baseline)"
+            )
+            if self.require:
+                pytest.fail(message, pytrace=False)
+            warnings.warn(message, pytest.PytestWarning)
+            return
+        limit = baseline["median"] * (1 + self.threshold)
+        if stats.median > limit:
+            pytest.fail(
+                f"{name} regressed: median {stats.median * 1000:.3f}ms > "
+                f"{limit * 1000:.3f}ms (baseline {baseline['median'] * 1000:.3f}ms "
+                f"+{self.threshold:.0%})",
+                pytrace=False,
+            )
+
+    def save(self) -> None:
+        """Write collected results as the new baseline (merged with existing entries)."""
+        benchmarks = dict(self.baseline)
+        benchmarks.update(self.results)
+        self.path.write_text(json.dumps({
+            "alerts": self.alerts,
+            "machine": platform.machine(),
+            "python": platform.python_version(),
+            "updated_at": datetime.utcnow().isoformat(),
+            "benchmarks": dict(sorted(benchmarks.items())),
+        }, indent=2) + "\n")
+
+
+@pytest.fixture(scope="session")
+def baseline_store(request):
+    """Session-wide baseline store; saved on exit with --bench-update-baseline."""
+    store = BaselineStore(
+        Path(request.config.getoption("--bench-baseline")),
+        alerts=request.config.getoption("--bench-alerts"),
+        threshold=request.config.getoption("--bench-threshold"),
+        require=request.config.getoption("--bench-require-baseline"),
+    )
+    yield store
+    if request.config.getoption("--bench-update-baseline") and store.results:
+        store.save()
+
+
+@pytest.fixture(autouse=True)
+def regression_guard(request, baseline_store):
+    """Compare each benchmark against its stored baseline after it runs."""
+    yield
+    bench = request.node.funcargs.get("benchmark")
+    stats = getattr(getattr(bench, "stats", None), "stats", None)
+    if stats is None:
+        return
+    name = _benchmark_name(request)
+    baseline_store.record(name, stats)
+    if not request.config.getoption("--bench-update-baseline"):
+        baseline_store.check(name, stats)
+
+
+def _benchmark_name(request) -> str:
+    module = request.node.module.__name__.rsplit(".", 1)[-1]
+    return f"{module}::{request.node.name}"
+
+
+@pytest.fixture(scope="session")
+def bench_engine():
+    """On-disk SQLite database shared by the query benchmarks."""
+    if BENCH_DATABASE_PATH.exists():
+        BENCH_DATABASE_PATH.unlink()
+    engine = create_engine(
+        f"sqlite:///{BENCH_DATABASE_PATH}",
+        connect_args={"check_same_thread": False},
+    )
+    Base.metadata.create_all(bind=engine)
+    yield engine
+    engine.dispose()
+    if BENCH_DATABASE_PATH.exists():
+        BENCH_DATABASE_PATH.unlink()
+
+
+@pytest.fixture(scope="session")
+def bench_alert_ids(request, bench_engine):
+    """Populate ``--bench-alerts`` alerts (default 1M); returns sample ids."""
+    ids = populate_alerts(bench_engine, request.config.getoption("--bench-alerts"))
+    # Core bulk inserts bypass the counter hooks; seed the dashboard counters once
+    db = sessionmaker(bind=bench_engine)()
+    try:
+        AlertCounters.reconcile(db)
+    finally:
+        db.close()
+    return ids
+
+
+@pytest.fixture(scope="session")
+def bench_entities(bench_engine, bench_alert_ids):
+    """Entities for every account in the benchmark transactions (for account search)."""
+    return populate_entities(bench_engine)
+
+
+@pytest.fixture(scope="session")
+def bench_sessionmaker(bench_engine):
+    return sessionmaker(autocommit=False, autoflush=False, bind=bench_engine)
+
+
+@pytest.fixture(scope="session")
+def bench_client(bench_sessionmaker, bench_alert_ids):
+    """Test client reading from the populated benchmark database."""
+
+    def override_get_db():
+        db = bench_sessionmaker()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    app.dependency_overrides[get_db] = override_get_db
+    with TestClient(app) as test_client:
+        yield test_client
+    app.dependency_overrides.clear()
@@ -0,0 +1,166 @@
+"""Synthetic PaySim-shaped data generators for benchmarks."""
+
+import random
+import uuid
+from datetime import datetime, timedelta
+from typing import List
+
+import numpy as np
+import pandas as pd
+from sqlalchemy import text
+from sqlalchemy.engine import Engine
+
+from app.models.alert import Alert, AlertPriority, AlertStatus, RiskBand
+from app.models.transaction import Transaction, TransactionType
+from app.utils.alert_payload import encode_reason_codes, encode_rules, encode_shap
+
+# PaySim type mix: CASH_IN, CASH_OUT, DEBIT, PAYMENT, TRANSFER
+TYPE_NAMES = [t.value for t in TransactionType]
+TYPE_WEIGHTS = [0.22, 0.35, 0.01, 0.34, 0.08]
+
+BASE_TIME = datetime(2026, 1, 1)
+
+SHAP_VALUES = [
+    {"feature": "amount_zscore", "value": 0.45},
+    {"feature": "new_counterparty_7d", "value": 0.38},
+    {"feature": "velocity_1h", "value": 0.14},
+    {"feature": "high_value_transfer_rule", "value": 0.12},
+    {"feature": "cashout_sequence_2h", "value": -0.05},
+]
+
+RULE = {"rule_id": "R001", "rule_name": "HIGH_VALUE_TRANSFER", "reason": "Transfer amount exceeds $200,000 threshold"}
+
+# Analyst notes on every NOTE_EVERY-th alert (full-text search benchmarks)
+NOTE_EVERY = 20
+NOTE_PHRASES = [
+    "Customer confirmed the transfer by phone",
+    "Possible mule account, funds cashed out within the hour",
+    "Structuring below the reporting threshold across agents",
+    "Dormant account reactivated from a new device",
+    "False positive: recurring payroll transfer",
+]
+
+# Stored forms (bulk inserts bypass the Alert properties)
+SHAP_BLOB = encode_shap(SHAP_VALUES)
+RULE_MASK = encode_rules([RULE])
+HIGH_SCORE_CODES = encode_reason_codes(["high_ml_score"])
+
+
+def generate_transaction_frame(n: int, seed: int = 42, accounts: int = 0, steps: int = 744) -> pd.DataFrame:
+    """
+    Generate ``n`` step-ordered transactions with PaySim columns.
+
+    Args:
+        n: Number of transactions
+        seed: Random seed (same seed, same data)
+        accounts: Size of the account pool (default n // 4, so senders repeat)
+        steps: Number of distinct steps
+    """
+    rng = np.random.default_rng(seed)
+    accounts = accounts or max(n // 4, 10)
+
+    amounts = np.round(rng.lognormal(mean=10.5, sigma=1.5, size=n), 2)
+    orig = rng.integers(0, accounts, size=n)
+    dest = rng.integers(0, accounts, size=n)
+    is_fraud = rng.random(n) < 0.01
+
+    return pd.DataFrame({
+        "step": np.sort(rng.integers(1, steps + 1, size=n)),
+        "type": rng.choice(TYPE_NAMES, size=n, p=TYPE_WEIGHTS),
+        "amount": amounts,
+        "nameOrig": [f"C{1_000_000_000 + i}" for i in orig],
+        "oldbalanceOrg": 0.0,
+        "newbalanceOrig": 0.0,
+        "nameDest": [f"C{2_000_000_000 + i}" for i in dest],
+        "oldbalanceDest": 0.0,
+        "newbalanceDest": 0.0,
+        "isFraud": is_fraud.astype(int),
+        "isFlaggedFraud": (is_fraud & (amounts > 200_000)).astype(int),
+    })
+
+
+def generate_transaction_rows(n: int, seed: int = 42, **kwargs) -> List[dict]:
+    """Generate ``n`` step-ordered transactions as dicts."""
+    return generate_transaction_frame(n, seed, **kwargs).to_dict("records")
+
+
+def write_paysim_csv(path, n: int, seed: int = 42) -> None:
+    """Write ``n`` synthetic transactions in the PaySim CSV layout."""
+    generate_transaction_frame(n, seed).to_csv(path, index=False)
+
+
+def populate_alerts(engine: Engine, n: int, seed: int = 42, chunk_size: int = 50_000) -> List[uuid.UUID]:
+    """
+    Bulk insert ``n`` transactions with one alert each.
+
+    Uses Core executemany inserts so a million rows load in a
+    reasonable time; no entity interning or aggregates. One alert in
+    NOTE_EVERY carries analyst notes.
+
+    Returns:
+        List[uuid.UUID]: Ids of up to 1000 alerts for detail lookups
+    """
+    rnd = random.Random(seed)
+    statuses = list(AlertStatus)
+    priorities = list(AlertPriority)
+    bands = list(RiskBand)
+    sample: List[uuid.UUID] = []
+
+    for start in range(0, n, chunk_size):
+        frame = generate_transaction_frame(min(chunk_size, n - start), seed=seed + start)
+        tx_rows, alert_rows = [], []
+        for row in frame.itertuples(index=False):
+            tx_id = uuid.UUID(int=rnd.getrandbits(128), version=4)
+            alert_id = uuid.UUID(int=rnd.getrandbits(128), version=4)
+            created = BASE_TIME + timedelta(hours=int(row.step), seconds=rnd.randint(0, 3599))
+            score = rnd.random()
+            band = bands[min(int(score * 4), 3)]
+            tx_rows.append({
+                "id": tx_id,
+                "step": int(row.step),
+                "type": TransactionType(row.type),
+                "amount": float(row.amount),
+                "nameOrig": row.nameOrig,
+                "nameDest": row.nameDest,
+                "isFraud": bool(row.isFraud),
+                "isFlaggedFraud": bool(row.isFlaggedFraud),
+                "created_at": created,
+            })
+            alert_rows.append({
+                "id": alert_id,
+                "transaction_id": tx_id,
+                "status": rnd.choice(statuses),
+                "priority": rnd.choice(priorities),
+                "ml_score": score,
+                "ml_risk_band": band,
+                "reason_code_ids": HIGH_SCORE_CODES if score > 0.7 else b"",
+                "shap": SHAP_BLOB,
+                "rules_mask": RULE_MASK if row.amount > 200_000 else 0,
+                "notes": rnd.choice(NOTE_PHRASES) if len(alert_rows) % NOTE_EVERY == 0 else None,
+                "created_at": created,
+                "updated_at": created,
+            })
+            if len(sample) < 1000:
+                sample.append(alert_id)
+
+        with engine.begin() as conn:
+            conn.execute(Transaction.__table__.insert(), tx_rows)
+            conn.execute(Alert.__table__.insert(), alert_rows)
+
+    return sample
+
+
+def populate_entities(engine: Engine) -> int:
+    """
+    Intern every account named by the populated transactions (one INSERT ... SELECT).
+
+    Returns:
+        int: Number of entities
+    """
+    with engine.begin() as conn:
+        conn.execute(text(
+            'INSERT INTO entities (name, created_at) '
+            'SELECT name, :now FROM (SELECT "nameOrig" AS name FROM transactions '
+            'UNION SELECT "nameDest" FROM transactions) AS names'
+        ), {"now": BASE_TIME})
+        return conn.execute(text("SELECT count(*) FROM entities")).scalar()
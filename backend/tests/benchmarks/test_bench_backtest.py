@@ -0,0 +1,31 @@
+"""Benchmark for the vectorized backtest sweep at full PaySim scale."""
+
+import numpy as np
+
+from app.utils.backtest import backtest
+
+# Rows in the full PaySim dataset
+PAYSIM_ROWS = 6_362_620
+THRESHOLDS = 100
+
+
+class TestBacktestBenchmarks:
+    """Wall time of a full threshold × rule-set sweep."""
+
+    def test_full_sweep(self, benchmark):
+        """6.3M rows, 100 thresholds, every combination of two rules, three capacities."""
+        rng = np.random.default_rng(42)
+        labels = rng.random(PAYSIM_ROWS) < 0.0013
+        data = {
+            "scores": rng.random(PAYSIM_ROWS),
+            "labels": labels,
+            "steps": np.sort(rng.integers(1, 745, PAYSIM_ROWS)).astype(np.int16),
+            "rules": {"R001": rng.random(PAYSIM_ROWS) < 0.006, "R004": rng.random(PAYSIM_ROWS) < 0.002},
+            "thresholds": np.linspace(0.0, 1.0, THRESHOLDS),
+        }
+
+        result = benchmark.pedantic(lambda: backtest(**data), rounds=3)
+
+        assert result.alerts.shape == (4, THRESHOLDS)
+        benchmark.extra_info["grid_points"] = result.alerts.size
+        benchmark.extra_info["rows_per_s"] = round(PAYSIM_ROWS / benchmark.stats.stats.median)
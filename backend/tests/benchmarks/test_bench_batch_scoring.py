@@ -0,0 +1,39 @@
+"""Benchmark for the pipelined batch scoring of a transaction file."""
+
+from app.services.alert_aggregator import get_alert_aggregator
+from app.services.batch_scoring import score_file
+from app.services.entity_dictionary import get_entity_dictionary
+from app.services.feature_engine import get_feature_engine
+from tests.benchmarks.generators import write_paysim_csv
+from tests.benchmarks.test_bench_ingestion import _memory_sessionmaker
+
+FILE_ROWS = 20_000
+
+
+def _reset_state() -> None:
+    get_entity_dictionary().clear()
+    get_feature_engine().clear()
+    get_alert_aggregator().clear()
+
+
+class TestBatchScoringBenchmarks:
+    """Throughput of scoring whole files through the staged pipeline."""
+
+    def test_score_file(self, benchmark, tmp_path):
+        """Rows/sec of parse → features → rules → score → store into a fresh database."""
+        csv_path = tmp_path / "paysim.csv"
+        write_paysim_csv(csv_path, FILE_ROWS)
+
+        def setup():
+            _reset_state()
+            _, session_factory = _memory_sessionmaker()
+            return (session_factory(), str(csv_path)), {}
+
+        report = benchmark.pedantic(score_file, setup=setup, rounds=3)
+        _reset_state()
+
+        assert report.rows_stored == FILE_ROWS
+        benchmark.extra_info["rows_per_s"] = round(FILE_ROWS / benchmark.stats.stats.median)
+        benchmark.extra_info["bottleneck"] = report.bottleneck
+        for stage in report.stages:
+            benchmark.extra_info[f"{stage.name}_rows_per_s"] = round(stage.rows_per_second)
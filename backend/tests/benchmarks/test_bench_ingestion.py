@@ -0,0 +1,100 @@
+"""Benchmarks for the ingestion hot paths: CSV load, alert seeding, features."""
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.database import Base
+from app.models.transaction import Transaction, TransactionType
+from app.services.entity_dictionary import get_entity_dictionary
+from app.services.feature_engine import FeatureEngine
+from scripts import load_transactions
+from scripts.seed_data import generate_mock_alert
+from tests.benchmarks.generators import (
+    generate_transaction_frame,
+    generate_transaction_rows,
+    write_paysim_csv,
+)
+
+CSV_ROWS = 20_000
+SEED_ALERTS = 5_000
+FEATURE_ROWS = 50_000
+
+
+def _memory_sessionmaker():
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    Base.metadata.create_all(bind=engine)
+    return engine, sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+
+class TestIngestionBenchmarks:
+    """Throughput of loading and enriching transactions."""
+
+    def test_csv_load(self, benchmark, monkeypatch, tmp_path):
+        """Rows/sec of scripts/load_transactions.py into a fresh database."""
+        csv_path = tmp_path / "paysim.csv"
+        write_paysim_csv(csv_path, CSV_ROWS)
+
+        def setup():
+            _, session_factory = _memory_sessionmaker()
+            monkeypatch.setattr(load_transactions, "SessionLocal", session_factory)
+            monkeypatch.setattr(load_transactions, "init_db", lambda: None)
+            get_entity_dictionary().clear()
+
+        stats = benchmark.pedantic(
+            load_transactions.load_transactions_from_csv,
+            args=(str(csv_path),),
+            setup=setup,
+            rounds=3,
+        )
+        get_entity_dictionary().clear()
+
+        assert stats["total_loaded"] == CSV_ROWS
+        benchmark.extra_info["rows_per_s"] = round(CSV_ROWS / benchmark.stats.stats.median)
+
+    def test_alert_seeding(self, benchmark):
+        """Alerts/sec of the seed_data alert generator plus commit."""
+        frame = generate_transaction_frame(SEED_ALERTS)
+        rows = [
+            {
+                "step": int(row.step),
+                "type": TransactionType(row.type),
+                "amount": float(row.amount),
+                "nameOrig": row.nameOrig,
+                "nameDest": row.nameDest,
+                "isFraud": bool(row.isFraud),
+                "isFlaggedFraud": bool(row.isFlaggedFraud),
+            }
+            for row in frame.itertuples(index=False)
+        ]
+
+        def setup():
+            engine, session_factory = _memory_sessionmaker()
+            with engine.begin() as conn:
+                conn.execute(Transaction.__table__.insert(), rows)
+            db = session_factory()
+            return (db, db.query(Transaction).all()), {}
+
+        def seed(db, transactions):
+            for tx in transactions:
+                db.add(generate_mock_alert(tx, db))
+            db.commit()
+            db.close()
+
+        benchmark.pedantic(seed, setup=setup, rounds=3)
+        benchmark.extra_info["alerts_per_s"] = round(SEED_ALERTS / benchmark.stats.stats.median)
+
+    def test_feature_computation(self, benchmark):
+        """Per-transaction cost of the sliding-window feature engine."""
+        # Small account pool so senders build up real window history
+        rows = generate_transaction_rows(FEATURE_ROWS, accounts=FEATURE_ROWS // 20)
+
+        features = benchmark.pedantic(lambda: FeatureEngine().compute_many(rows), rounds=5)
+
+        assert len(features) == FEATURE_ROWS
+        benchmark.extra_info["us_per_tx"] = round(benchmark.stats.stats.median / FEATURE_ROWS * 1e6, 3)
+
@@ -0,0 +1,76 @@
+"""Benchmarks for the alert query and serialization hot paths."""
+
+from itertools import cycle
+
+from sqlalchemy.orm import joinedload
+
+from app.models.alert import Alert, AlertPriority, AlertStatus, RiskBand
+from app.schemas.alert import AlertDetail
+
+
+class TestAlertQueryBenchmarks:
+    """Latency of the alert endpoints over the ``--bench-alerts`` database."""
+
+    def test_list_alerts_first_page(self, benchmark, bench_client):
+        """Default list view: newest 25 alerts plus total count."""
+        response = benchmark(bench_client.get, "/api/alerts")
+        assert response.status_code == 200
+
+    def test_list_alerts_filtered(self, benchmark, bench_client):
+        """Analyst queue: new critical alerts above a score."""
+        response = benchmark(
+            bench_client.get,
+            "/api/alerts",
+            params={"status": "new", "priority": "critical", "min_score": 0.5},
+        )
+        assert response.status_code == 200
+
+    def test_list_alerts_deep_page(self, benchmark, bench_client):
+        """Offset pagination far into the result set."""
+        response = benchmark(bench_client.get, "/api/alerts", params={"page": 1000, "page_size": 100})
+        assert response.status_code == 200
+
+    def test_alert_summary(self, benchmark, bench_client):
+        """Dashboard counts by status, priority, risk band and assignee."""
+        response = benchmark(bench_client.get, "/api/alerts/summary")
+        assert response.status_code == 200
+
+    def test_alert_counts_by_scan(self, benchmark, bench_sessionmaker, bench_alert_ids):
+        """Reference for the summary: the same counts as per-value count() queries."""
+        db = bench_sessionmaker()
+        try:
+            def count_all():
+                return {
+                    column.key: {value: db.query(Alert).filter(column == value).count() for value in enum}
+                    for column, enum in (
+                        (Alert.status, AlertStatus), (Alert.priority, AlertPriority), (Alert.ml_risk_band, RiskBand),
+                    )
+                }
+
+            counts = benchmark(count_all)
+            assert sum(counts["status"].values()) == db.query(Alert).count()
+        finally:
+            db.close()
+
+    def test_alert_detail(self, benchmark, bench_client, bench_alert_ids):
+        """Detail view by id, cycling through sampled alerts."""
+        ids = cycle(bench_alert_ids)
+
+        response = benchmark(lambda: bench_client.get(f"/api/alerts/{next(ids)}"))
+        assert response.status_code == 200
+
+    def test_alert_detail_serialization(self, benchmark, bench_sessionmaker, bench_alert_ids):
+        """AlertDetail validation and JSON encoding of 100 loaded alerts."""
+        db = bench_sessionmaker()
+        try:
+            alerts = (
+                db.query(Alert)
+                .options(joinedload(Alert.transaction))
+                .filter(Alert.id.in_(bench_alert_ids[:100]))
+                .all()
+            )
+
+            payloads = benchmark(lambda: [AlertDetail.model_validate(a).model_dump_json() for a in alerts])
+            assert len(payloads) == len(alerts)
+        finally:
+            db.close()
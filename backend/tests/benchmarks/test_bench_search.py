@@ -0,0 +1,50 @@
+"""Benchmarks for full-text search over alert notes and account names."""
+
+import pytest
+from sqlalchemy import func, select
+
+from app.models.entity import Entity
+
+
+@pytest.fixture(scope="module")
+def name_substring(bench_sessionmaker, bench_entities) -> str:
+    """The middle of a seeded account name, e.g. "2310068" from "C1231006815"."""
+    db = bench_sessionmaker()
+    try:
+        total = db.scalar(select(func.count(Entity.id)))
+        name = db.scalar(select(Entity.name).order_by(Entity.id).offset(total // 2).limit(1))
+    finally:
+        db.close()
+    return name[2:-2]
+
+
+class TestSearchBenchmarks:
+    """Latency of the search endpoints over the ``--bench-alerts`` database."""
+
+    def test_search_alert_notes(self, benchmark, bench_client):
+        """Ranked note search: total, first page with snippets."""
+        response = benchmark(bench_client.get, "/api/search/alerts", params={"q": "dormant device"})
+        assert response.status_code == 200
+        assert response.json()["data"]["total"] > 0
+
+    def test_search_accounts_substring(self, benchmark, bench_client, name_substring):
+        """Partial account id from the middle of the name (trigram index)."""
+        response = benchmark(bench_client.get, "/api/search/accounts", params={"q": name_substring})
+        assert response.status_code == 200
+        assert response.json()["data"]["total"] > 0
+
+    def test_search_accounts_prefix(self, benchmark, bench_client, bench_entities):
+        """Short prefix (lower(name) index), capped at SEARCH_MAX_MATCHES."""
+        response = benchmark(bench_client.get, "/api/search/accounts", params={"q": "C2"})
+        assert response.status_code == 200
+
+    def test_account_substring_by_scan(self, benchmark, bench_sessionmaker, name_substring):
+        """Reference for the trigram index: the same substring as LIKE '%...%' over entities."""
+        db = bench_sessionmaker()
+        try:
+            count = benchmark(
+                lambda: db.query(func.count(Entity.id)).filter(Entity.name.like(f"%{name_substring}%")).scalar()
+            )
+            assert count > 0
+        finally:
+            db.close()
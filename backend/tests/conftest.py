@@ -11,10 +11,17 @@ from sqlalchemy.orm import Session, sessionmaker
 # Add parent directory to path
 sys.path.append(str(Path(__file__).parent.parent))
 
+from app.config import settings
 from app.database import Base, get_db
 from app.main import app
 from app.models.transaction import Transaction, TransactionType
 from app.models.alert import Alert, AlertPriority, AlertStatus, RiskBand
+from app.services.alert_aggregator import get_alert_aggregator
+from app.services.entity_dictionary import get_entity_dictionary
+from app.services.feature_engine import get_feature_engine
+from app.services.graph_index import reset_transaction_graph
+from app.utils.metrics import instrument_engine
+from app.utils.query_diagnostics import assert_max_queries, get_query_diagnostics
 
 # Test database URL
 TEST_DATABASE_URL = "sqlite:///./test_fraud_detection.db"
@@ -24,9 +31,70 @@ test_engine = create_engine(
     TEST_DATABASE_URL,
     connect_args={"check_same_thread": False}
 )
+instrument_engine(test_engine)
+
+# The app's warm-up would build the graph from the development database
+settings.WARMUP_TRANSACTION_GRAPH = False
+
+# Tests build their own schema with create_all; don't check the development database
+settings.DB_SCHEMA_CHECK = "off"
+
+# Fail tests on N+1 query patterns instead of logging them
+diagnostics = get_query_diagnostics()
+diagnostics.raise_on_n_plus_one = True
+diagnostics.install(test_engine)
 
 TestSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=test_engine)
 
+BENCHMARK_DIR = Path(__file__).parent / "benchmarks"
+
+
+def pytest_addoption(parser):
+    """Options for the benchmark suite in tests/benchmarks."""
+    group = parser.getgroup("fraud-benchmarks")
+    group.addoption(
+        "--run-benchmarks",
+        action="store_true",
+        help="Run the benchmark suite (skipped by default)",
+    )
+    group.addoption(
+        "--bench-alerts",
+        type=int,
+        default=1_000_000,
+        help="Alerts in the query benchmark database",
+    )
+    group.addoption(
+        "--bench-baseline",
+        default=str(BENCHMARK_DIR / "baseline.json"),
+        help="JSON baseline file to compare against",
+    )
+    group.addoption(
+        "--bench-update-baseline",
+        action="store_true",
+        help="Write results to the baseline file instead of comparing",
+    )
+    group.addoption(
+        "--bench-require-baseline",
+        action="store_true",
+        help="Fail benchmarks that have no baseline to compare against (they warn otherwise)",
+    )
+    group.addoption(
+        "--bench-threshold",
+        type=float,
+        default=0.25,
+        help="Allowed median slowdown over baseline (fraction) before failing",
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    """Skip benchmarks unless --run-benchmarks is given."""
+    if config.getoption("--run-benchmarks"):
+        return
+    skip = pytest.mark.skip(reason="benchmarks run with --run-benchmarks")
+    for item in items:
+        if BENCHMARK_DIR in Path(item.fspath).parents:
+            item.add_marker(skip)
+
 
 @pytest.fixture(scope="function")
 def db_session():
@@ -43,6 +111,11 @@ def db_session():
         session.close()
         # Drop all tables after test
         Base.metadata.drop_all(bind=test_engine)
+        # Forget ids cached from the dropped entities table
+        get_entity_dictionary().clear()
+        reset_transaction_graph()
+        get_feature_engine().clear()
+        get_alert_aggregator().clear()
 
 
 @pytest.fixture(scope="function")
@@ -63,6 +136,18 @@ def client(db_session: Session):
     app.dependency_overrides.clear()
 
 
+@pytest.fixture
+def max_queries():
+    """
+    Assert a query budget for a block.
+
+    Example:
+        with max_queries(3):
+            client.get("/api/alerts")
+    """
+    return assert_max_queries
+
+
 @pytest.fixture
 def sample_transaction(db_session: Session) -> Transaction:
     """Create a sample transaction for testing."""
@@ -142,7 +227,7 @@ def multiple_alerts(db_session: Session) -> list:
             priority=list(AlertPriority)[i % len(AlertPriority)],
             ml_score=0.5 + (i * 0.05),
             ml_risk_band=list(RiskBand)[i % len(RiskBand)],
-            ml_reason_codes=["test_reason"],
+            ml_reason_codes=["high_ml_score"],
             rules_triggered=[],
         )
         db_session.add(alert)
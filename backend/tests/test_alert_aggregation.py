@@ -0,0 +1,144 @@
+"""Test cases for alert deduplication and aggregation."""
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import Session
+
+from app.models.alert import Alert, AlertPriority, AlertStatus, RiskBand
+from app.models.transaction import Transaction, TransactionType
+from app.schemas.transaction import TransactionCreate
+from app.services.alert_aggregator import AlertAggregator, AlertCandidate, get_alert_aggregator
+from app.services.entity_dictionary import get_entity_dictionary
+from app.services.rules import RULES
+from app.services.transaction_service import TransactionService
+
+
+def _transfer(step: int, sender: str = "C1", amount: float = 250_000.0) -> dict:
+    return {"step": step, "type": "TRANSFER", "amount": amount, "nameOrig": sender, "nameDest": f"C9{step}"}
+
+
+def _ingest(client: TestClient, rows) -> dict:
+    response = client.post("/api/transactions/batch", json={"transactions": rows})
+    assert response.status_code == 201
+    return response.json()["data"]
+
+
+class TestAlertAggregation:
+    """Test suite for coalescing sender bursts into parent alerts."""
+
+    def test_burst_becomes_one_alert(self, client: TestClient, db_session: Session):
+        """A burst of high-value transfers raises one alert linking all of them."""
+        data = _ingest(client, [_transfer(1) for _ in range(50)])
+        assert data["alerts_created"] == 1
+
+        data = _ingest(client, [_transfer(2) for _ in range(50)])
+        assert (data["alerts_created"], data["alerts_merged"]) == (0, 1)
+
+        alert = db_session.query(Alert).one()
+        assert alert.transaction_count == 100
+        assert (alert.first_step, alert.last_step) == (1, 2)
+
+        detail = client.get(f"/api/alerts/{alert.id}").json()["data"]
+        assert detail["transaction_count"] == 100
+        assert len(detail["linked_transaction_ids"]) == 100
+
+    def test_rules_merged(self, client: TestClient, db_session: Session):
+        """Rules from every transaction in the burst are unioned once each."""
+        _ingest(client, [
+            _transfer(1),
+            {"step": 2, "type": "CASH_OUT", "amount": 10.0, "nameOrig": "C1", "nameDest": "M1"},
+            _transfer(3),
+        ])
+        alert = db_session.query(Alert).one()
+        assert [rule["rule_id"] for rule in alert.rules_triggered] == ["R001", "R004"]
+
+    def test_window_and_senders_separate(self, client: TestClient, db_session: Session):
+        """Different senders, and the same sender after the window, get new alerts."""
+        data = _ingest(client, [_transfer(1, "C1"), _transfer(1, "C2"), _transfer(30, "C1")])
+        assert data["alerts_created"] == 3
+
+    def test_closed_alert_not_reopened(self, client: TestClient, db_session: Session):
+        """Activity after an analyst closes the alert starts a new one."""
+        _ingest(client, [_transfer(1)])
+        db_session.query(Alert).update({"status": AlertStatus.CLOSED})
+        db_session.commit()
+
+        assert _ingest(client, [_transfer(2)])["alerts_created"] == 1
+
+    def test_falls_back_to_database(self, client: TestClient, db_session: Session):
+        """Parents are found after the in-memory index is lost (restart, other worker)."""
+        _ingest(client, [_transfer(1)])
+        get_alert_aggregator().clear()
+
+        data = _ingest(client, [_transfer(2)])
+        assert (data["alerts_created"], data["alerts_merged"]) == (0, 1)
+
+    def test_rollback_forgets_only_its_batch(self, client: TestClient, db_session: Session, monkeypatch):
+        """A failed batch drops the cached windows and ids of its own accounts only."""
+        _ingest(client, [_transfer(1, "C1")])
+
+        def fail():
+            raise OperationalError("COMMIT", {}, Exception("database is locked"))
+
+        with monkeypatch.context() as patch:
+            patch.setattr(db_session, "commit", fail)
+            with pytest.raises(OperationalError):
+                TransactionService.ingest(db_session, [TransactionCreate(**_transfer(2, "C2"))])
+
+        aggregator, entities = get_alert_aggregator(), get_entity_dictionary()
+        assert "C1" in aggregator._index and "C2" not in aggregator._index
+        assert "C1" in entities._ids and "C91" in entities._ids
+        assert "C2" not in entities._ids and "C92" not in entities._ids
+
+        data = _ingest(client, [_transfer(2, "C2")])
+        assert data["alerts_created"] == 1
+
+    def test_no_alert_without_rules(self, client: TestClient, db_session: Session):
+        """Ordinary payments raise nothing."""
+        data = _ingest(client, [{"step": 1, "type": "PAYMENT", "amount": 5.0, "nameOrig": "C1", "nameDest": "M1"}])
+        assert data["alerts_created"] == 0
+        assert db_session.query(Alert).count() == 0
+
+
+class TestAlertAggregator:
+    """Test suite for AlertAggregator merge semantics and eviction."""
+
+    @staticmethod
+    def _candidate(db: Session, step: int, score: float, priority: AlertPriority, sender: str = "C1"):
+        tx = Transaction(
+            step=step, type=TransactionType.TRANSFER, amount=300_000,
+            nameOrig=sender, nameDest="C2",
+        )
+        db.add(tx)
+        return AlertCandidate(tx, score, RiskBand.HIGH if score > 0.7 else RiskBand.LOW, priority, [RULES["R001"]])
+
+    def test_keeps_max_score_and_priority(self, db_session: Session):
+        """The parent carries the highest score and priority seen."""
+        aggregator = AlertAggregator(window_steps=24)
+        aggregator.add(db_session, [
+            self._candidate(db_session, 1, 0.3, AlertPriority.MEDIUM),
+            self._candidate(db_session, 1, 0.9, AlertPriority.LOW),
+            self._candidate(db_session, 2, 0.5, AlertPriority.CRITICAL),
+        ])
+        alert = db_session.query(Alert).one()
+        assert alert.ml_score == 0.9
+        assert alert.ml_risk_band == RiskBand.HIGH
+        assert alert.priority == AlertPriority.CRITICAL
+
+    def test_index_evicts_closed_windows_and_caps_size(self, db_session: Session):
+        """Expired windows and senders beyond the cap leave the index."""
+        aggregator = AlertAggregator(window_steps=5, max_accounts=3)
+        aggregator.add(db_session, [self._candidate(db_session, 1, 0.5, AlertPriority.HIGH, f"C{i}") for i in range(5)])
+        assert len(aggregator) == 3
+
+        aggregator.add(db_session, [self._candidate(db_session, 10, 0.5, AlertPriority.HIGH, "C9")])
+        assert len(aggregator) == 1
+
+    def test_disabled_window(self, db_session: Session):
+        """window_steps=0 raises one alert per candidate."""
+        aggregator = AlertAggregator(window_steps=0)
+        created, merged = aggregator.add(
+            db_session, [self._candidate(db_session, 1, 0.5, AlertPriority.HIGH) for _ in range(3)]
+        )
+        assert (len(created), merged) == (3, [])
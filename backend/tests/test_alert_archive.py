@@ -0,0 +1,172 @@
+"""Test cases for hot/cold alert storage and archival of closed alerts."""
+
+from datetime import datetime, timedelta
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import update
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.models.alert import Alert, AlertStatus, alert_transactions
+from app.models.archived_alert import ArchivedAlert
+from app.models.case import Case
+from app.services.alert_archive import AlertArchiver, archive_closed_alerts, restore_alerts
+
+ADMIN_KEY = "test-admin-key"
+
+
+def _close(db: Session, alerts, days_ago: int = 100) -> None:
+    """Close alerts as of ``days_ago`` days (updated_at set explicitly, bypassing onupdate)."""
+    db.execute(
+        update(Alert)
+        .where(Alert.id.in_([alert.id for alert in alerts]))
+        .values(status=AlertStatus.CLOSED, updated_at=datetime.utcnow() - timedelta(days=days_ago))
+    )
+    db.commit()
+
+
+def _archive(db: Session, days: int = 90, batch_size: int = 1000) -> int:
+    return archive_closed_alerts(db, datetime.utcnow() - timedelta(days=days), batch_size)
+
+
+@pytest.fixture
+def archived_alert(db_session: Session, sample_alert: Alert) -> Alert:
+    """The sample alert, linked to its transaction, closed 100 days ago and archived."""
+    db_session.execute(alert_transactions.insert().values(
+        alert_id=sample_alert.id, transaction_id=sample_alert.transaction_id
+    ))
+    db_session.commit()
+    alert_id = sample_alert.id
+    _close(db_session, [sample_alert])
+    assert _archive(db_session) == 1
+    return db_session.get(ArchivedAlert, alert_id)
+
+
+class TestArchival:
+    """Test suite for moving closed alerts to the archive."""
+
+    def test_archives_old_closed_alerts_only(self, db_session: Session, multiple_alerts):
+        """Only alerts closed before the cutoff move; open and recently closed ones stay hot."""
+        ids = [alert.id for alert in multiple_alerts]
+        _close(db_session, multiple_alerts[:3])
+        _close(db_session, multiple_alerts[3:5], days_ago=10)
+
+        assert _archive(db_session, batch_size=2) == 3  # Two batches
+        assert db_session.query(Alert).count() == 7
+        assert {row.id for row in db_session.query(ArchivedAlert)} == set(ids[:3])
+        assert _archive(db_session) == 0
+
+    def test_alerts_in_cases_stay_hot(self, db_session: Session, sample_alert: Alert):
+        """Alerts attached to a case are not archived."""
+        db_session.add(Case(alerts=[sample_alert]))
+        db_session.commit()
+        _close(db_session, [sample_alert])
+
+        assert _archive(db_session) == 0
+        assert db_session.query(Alert).count() == 1
+
+    def test_payload_round_trip(self, db_session: Session, archived_alert: ArchivedAlert, sample_transaction):
+        """The compressed payload keeps reasons, SHAP values, rules and linked transactions."""
+        assert db_session.query(Alert).count() == 0
+        assert db_session.query(alert_transactions).count() == 0
+        assert archived_alert.ml_reason_codes == ["high_ml_score", "amount_exceeds_threshold"]
+        assert archived_alert.shap_values[0] == {"feature": "amount_zscore", "value": 0.45}
+        assert [rule["rule_id"] for rule in archived_alert.rules_triggered] == ["R001"]
+        assert archived_alert.linked_transaction_ids == [sample_transaction.id]
+
+    def test_restore(self, db_session: Session, archived_alert: ArchivedAlert, sample_transaction):
+        """Restoring recreates the hot row and its transaction links."""
+        alert_id = archived_alert.id
+        assert restore_alerts(db_session, [alert_id]) == 1
+        db_session.commit()
+
+        alert = db_session.get(Alert, alert_id)
+        assert alert.status == AlertStatus.CLOSED
+        assert alert.rules_count == 1
+        assert alert.linked_transaction_ids == [sample_transaction.id]
+        assert db_session.query(ArchivedAlert).count() == 0
+
+    def test_archiver_disabled(self, db_session: Session):
+        """ALERT_ARCHIVE_AFTER_DAYS=0 disables archival."""
+        archiver = AlertArchiver(lambda: db_session, after_days=0)
+        assert not archiver.enabled
+        assert archiver.run_once() == 0
+
+
+class TestUnifiedReads:
+    """Test suite for reading hot and archived alerts through the alert API."""
+
+    def test_list_includes_archive(self, client: TestClient, db_session: Session, multiple_alerts):
+        """Unfiltered and closed-status lists page over both tables."""
+        _close(db_session, multiple_alerts[:4])
+        assert _archive(db_session) == 4
+
+        data = client.get("/api/alerts", params={"page_size": 6}).json()["data"]
+        assert data["total"] == 10
+        page2 = client.get("/api/alerts", params={"page_size": 6, "page": 2}).json()["data"]
+        assert len({item["id"] for item in data["items"] + page2["items"]}) == 10
+
+        closed = client.get("/api/alerts", params={"status": "closed"}).json()["data"]
+        assert closed["total"] == 6  # Four archived, two closed by the fixture still hot
+        assert sum(item["archived"] for item in closed["items"]) == 4
+
+        scores = [item["ml_score"] for item in client.get(
+            "/api/alerts", params={"sort_by": "ml_score", "sort_desc": False}
+        ).json()["data"]["items"]]
+        assert scores == sorted(scores)
+
+    def test_queue_reads_hot_table_only(self, client: TestClient, db_session: Session, multiple_alerts):
+        """A status filter without closed never returns archived alerts."""
+        _close(db_session, multiple_alerts[:4])
+        _archive(db_session)
+
+        data = client.get("/api/alerts", params={"status": ["new", "in_review"]}).json()["data"]
+        assert data["total"] == 2
+        assert not any(item["archived"] for item in data["items"])
+
+    def test_detail_of_archived_alert(self, client: TestClient, archived_alert: ArchivedAlert):
+        """The detail endpoint falls back to the archive."""
+        response = client.get(f"/api/alerts/{archived_alert.id}")
+        assert response.status_code == 200
+        data = response.json()["data"]
+        assert data["archived"] is True
+        assert data["status"] == "closed"
+        assert data["rules_triggered"][0]["rule_id"] == "R001"
+        assert data["transaction"]["nameOrig"] == "C1234567890"
+
+    def test_update_restores(self, client: TestClient, db_session: Session, archived_alert: ArchivedAlert):
+        """Reopening an archived alert moves it back to the hot table."""
+        alert_id = archived_alert.id
+        response = client.patch(f"/api/alerts/{alert_id}", json={"status": "in_review"})
+        assert response.status_code == 200
+        assert response.json()["data"]["archived"] is False
+        assert db_session.query(ArchivedAlert).count() == 0
+        assert db_session.get(Alert, alert_id).status == AlertStatus.IN_REVIEW
+
+    def test_bulk_update_restores(self, client: TestClient, db_session: Session, archived_alert: ArchivedAlert):
+        """Bulk updates reach archived alerts too."""
+        response = client.post("/api/alerts/bulk-update", json={
+            "alert_ids": [str(archived_alert.id)], "assigned_to": "analyst",
+        })
+        assert response.json()["data"]["updated_count"] == 1
+        assert db_session.query(Alert).one().assigned_to == "analyst"
+
+
+class TestArchiveAdminAPI:
+    """Test suite for /api/admin/archive."""
+
+    def test_run_and_status(self, client: TestClient, db_session: Session, multiple_alerts, monkeypatch):
+        """Running the archiver on demand reports what moved."""
+        monkeypatch.setattr(settings, "ADMIN_API_KEY", ADMIN_KEY)
+        archiver = AlertArchiver(lambda: db_session, after_days=90)
+        monkeypatch.setattr("app.api.admin.get_alert_archiver", lambda: archiver)
+        monkeypatch.setattr(db_session, "close", lambda: None)
+        _close(db_session, multiple_alerts[:2])
+
+        headers = {"X-Admin-Token": ADMIN_KEY}
+        assert client.post("/api/admin/archive", headers=headers).json()["data"]["archived"] == 2
+        data = client.get("/api/admin/archive", headers=headers).json()["data"]
+        assert data["hot_alerts"] == 8
+        assert data["archived_alerts"] == 2
+        assert data["archiver"]["last_archived"] == 2
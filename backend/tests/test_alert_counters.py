@@ -0,0 +1,115 @@
+"""Test cases for the materialized dashboard counters."""
+
+from datetime import datetime, timedelta
+
+from fastapi.testclient import TestClient
+from sqlalchemy import text, update
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.models.alert import Alert, AlertStatus
+from app.services.alert_archive import archive_closed_alerts
+from app.services.alert_counters import AlertCounters
+
+ADMIN_KEY = "test-admin-key"
+
+
+def _assert_consistent(db: Session) -> None:
+    """Stored counters equal a fresh recount."""
+    stored = {
+        (dimension, value): count
+        for dimension, value, count in db.execute(text("SELECT dimension, value, count FROM alert_counters"))
+        if count
+    }
+    assert stored == dict(AlertCounters.actual_counts(db))
+
+
+class TestCountersOnWrite:
+    """Test suite for counters maintained by alert writes."""
+
+    def test_created_alerts_counted(self, db_session: Session, multiple_alerts):
+        """Alerts added through the ORM are counted in the same flush."""
+        summary = AlertCounters.summary(db_session)
+        assert summary["total"] == 10
+        assert summary["by_status"] == {status.value: 2 for status in AlertStatus}
+        assert summary["unassigned"] == 10
+        assert sum(summary["by_priority"].values()) == sum(summary["by_risk_band"].values()) == 10
+        _assert_consistent(db_session)
+
+    def test_update_moves_counts(self, client: TestClient, db_session: Session, sample_alert: Alert):
+        """Status and assignee changes move one count between values."""
+        client.patch(f"/api/alerts/{sample_alert.id}", json={"status": "in_review", "assigned_to": "alice"})
+        summary = client.get("/api/alerts/summary").json()["data"]
+        assert summary["by_status"]["new"] == 0
+        assert summary["by_status"]["in_review"] == 1
+        assert summary["by_assignee"] == {"alice": 1}
+        assert summary["unassigned"] == 0
+
+        client.patch(f"/api/alerts/{sample_alert.id}", json={"assigned_to": "bob"})
+        assert client.get("/api/alerts/summary").json()["data"]["by_assignee"] == {"bob": 1}
+        _assert_consistent(db_session)
+
+    def test_bulk_update(self, client: TestClient, db_session: Session, multiple_alerts):
+        """Bulk updates adjust counters for every row they change."""
+        ids = [str(alert.id) for alert in multiple_alerts[:6]]
+        client.post("/api/alerts/bulk-update", json={"alert_ids": ids, "status": "escalated", "priority": "critical"})
+        client.post("/api/alerts/bulk-update", json={"alert_ids": ids[:2], "assigned_to": "carol"})
+
+        summary = client.get("/api/alerts/summary").json()["data"]
+        assert summary["by_status"]["escalated"] == 7  # Six updated plus one already escalated
+        assert summary["by_assignee"] == {"carol": 2}
+        _assert_consistent(db_session)
+
+    def test_ingestion_and_merges(self, client: TestClient, db_session: Session):
+        """Alerts raised and merged by ingestion keep the counters exact."""
+        transfer = {"step": 1, "type": "TRANSFER", "amount": 250_000.0, "nameOrig": "C1", "nameDest": "C2"}
+        for step in (1, 2):
+            client.post("/api/transactions", json={**transfer, "step": step})
+        client.post("/api/transactions", json={**transfer, "nameOrig": "C3"})
+
+        assert client.get("/api/alerts/summary").json()["data"]["total"] == db_session.query(Alert).count() == 2
+        _assert_consistent(db_session)
+
+    def test_archival_keeps_counts(self, db_session: Session, multiple_alerts):
+        """Archived alerts are still counted."""
+        db_session.execute(
+            update(Alert).where(Alert.status == AlertStatus.CLOSED)
+            .values(updated_at=datetime.utcnow() - timedelta(days=100))
+        )
+        db_session.commit()
+        before = AlertCounters.summary(db_session)
+
+        assert archive_closed_alerts(db_session, datetime.utcnow() - timedelta(days=90)) == 2
+        assert AlertCounters.summary(db_session) == before
+        _assert_consistent(db_session)
+
+    def test_summary_is_one_query(self, client: TestClient, multiple_alerts, max_queries):
+        """The summary reads only the counters table."""
+        with max_queries(1):
+            client.get("/api/alerts/summary")
+
+
+class TestReconciliation:
+    """Test suite for correcting counter drift."""
+
+    def test_reconcile_fixes_drift(self, db_session: Session, multiple_alerts):
+        """Writes that bypass the ORM drift the counters until reconciled."""
+        db_session.execute(text("UPDATE alerts SET assigned_to = 'dave'"))  # Raw SQL: no counter update
+        db_session.execute(text("UPDATE alert_counters SET count = count + 5 WHERE dimension = 'status' AND value = 'new'"))
+        db_session.commit()
+
+        drift = AlertCounters.reconcile(db_session)
+        assert drift["status"] == {"new": 5}
+        assert drift["assignee"] == {"": 10, "dave": -10}
+        assert AlertCounters.summary(db_session)["by_assignee"] == {"dave": 10}
+        assert AlertCounters.reconcile(db_session) == {}
+
+    def test_admin_reconcile(self, client: TestClient, db_session: Session, multiple_alerts, monkeypatch):
+        """POST /api/admin/counters/reconcile reports and corrects drift."""
+        monkeypatch.setattr(settings, "ADMIN_API_KEY", ADMIN_KEY)
+        db_session.execute(text("DELETE FROM alert_counters"))
+        db_session.commit()
+
+        data = client.post("/api/admin/counters/reconcile", headers={"X-Admin-Token": ADMIN_KEY}).json()["data"]
+        assert data["drift"]["status"] == {status.value: -2 for status in AlertStatus}
+        assert data["summary"]["total"] == 10
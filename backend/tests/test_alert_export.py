@@ -0,0 +1,151 @@
+"""Test cases for the streaming alert export."""
+
+import csv
+import gzip
+import io
+import json
+from datetime import datetime, timedelta
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import update
+from sqlalchemy.orm import Session
+
+from app.models.alert import Alert, AlertStatus, alert_transactions
+from app.services.alert_archive import archive_closed_alerts
+from app.services.alert_export import (
+    CSV_FIELDS,
+    decode_cursor,
+    encode_cursor,
+    iter_alert_records,
+    stream_alert_export,
+)
+from scripts.export_alerts import export
+
+BASE = datetime(2026, 3, 1)
+
+
+@pytest.fixture
+def dated_alerts(db_session: Session, multiple_alerts) -> list:
+    """The ten alerts created in pairs two days apart from BASE (pairs share a timestamp, to test ties)."""
+    for i, alert in enumerate(multiple_alerts):
+        alert.created_at = BASE + timedelta(days=i // 2 * 2)
+    db_session.commit()
+    return sorted(multiple_alerts, key=lambda alert: (alert.created_at, alert.id.hex))
+
+
+def _jsonl(client: TestClient, **params) -> list:
+    response = client.get("/api/alerts/export", params={"format": "jsonl", **params})
+    assert response.status_code == 200
+    return [json.loads(line) for line in response.text.splitlines()]
+
+
+class TestExportRecords:
+    """Test suite for reading alerts in export order."""
+
+    def test_oldest_first_with_transactions(self, db_session: Session, dated_alerts):
+        """Records follow (created_at, id) and carry the primary transaction."""
+        records = list(iter_alert_records(db_session, batch_size=3))
+        assert [record["alert_id"] for record in records] == [str(alert.id) for alert in dated_alerts]
+        first = records[0]
+        assert first["transactions"][0]["transaction_id"] == str(dated_alerts[0].transaction_id)
+        assert first["transactions"][0]["amount"] > 0
+        assert first["ml_reason_codes"] == ["high_ml_score"]
+
+    def test_date_range(self, db_session: Session, dated_alerts):
+        """created_from is inclusive and created_to exclusive."""
+        records = list(iter_alert_records(db_session, BASE + timedelta(days=2), BASE + timedelta(days=6)))
+        assert len(records) == 4
+
+    def test_resume_after_cursor(self, db_session: Session, dated_alerts):
+        """Resuming from any cursor continues exactly after that alert, ties included."""
+        full = [record["alert_id"] for record in iter_alert_records(db_session)]
+        for position in (0, 2, 3, 9):
+            cursor = decode_cursor(encode_cursor(dated_alerts[position].created_at, dated_alerts[position].id))
+            resumed = [record["alert_id"] for record in iter_alert_records(db_session, after=cursor, batch_size=2)]
+            assert resumed == full[position + 1:]
+
+    def test_includes_archive_and_linked(self, db_session: Session, dated_alerts, sample_transaction):
+        """Archived alerts are exported with the transactions coalesced into them."""
+        alert_id, primary_id = dated_alerts[0].id, dated_alerts[0].transaction_id
+        db_session.execute(alert_transactions.insert(), [
+            {"alert_id": alert_id, "transaction_id": primary_id},
+            {"alert_id": alert_id, "transaction_id": sample_transaction.id},
+        ])
+        db_session.execute(
+            update(Alert).where(Alert.id == alert_id)
+            .values(status=AlertStatus.CLOSED, updated_at=datetime.utcnow() - timedelta(days=100))
+        )
+        db_session.commit()
+        assert archive_closed_alerts(db_session, datetime.utcnow() - timedelta(days=90)) == 1
+
+        record = next(iter_alert_records(db_session))
+        assert record["archived"] is True
+        assert [tx["transaction_id"] for tx in record["transactions"]] == [
+            str(primary_id), str(sample_transaction.id),
+        ]
+
+    def test_bounded_queries_per_batch(self, db_session: Session, dated_alerts, max_queries):
+        """Each batch costs a fixed number of lookups, not one per alert."""
+        with max_queries(1 + 3 * 2):  # Key cursor, then alerts, links and transactions per batch
+            assert len(list(iter_alert_records(db_session, batch_size=5))) == 10
+
+    def test_stream_is_lazy(self, db_session: Session, dated_alerts, max_queries):
+        """Nothing is read until the first chunk is requested."""
+        with max_queries(0):
+            chunks = stream_alert_export(db_session, fmt="csv")
+        assert b"alert_id" in next(chunks)
+
+
+class TestExportAPI:
+    """Test suite for GET /api/alerts/export."""
+
+    def test_csv(self, client: TestClient, dated_alerts):
+        """CSV has a header and one row per alert transaction."""
+        response = client.get("/api/alerts/export")
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/csv")
+        assert 'filename="alerts.csv"' in response.headers["content-disposition"]
+
+        rows = list(csv.DictReader(io.StringIO(response.text)))
+        assert list(rows[0]) == CSV_FIELDS
+        assert [row["alert_id"] for row in rows] == [str(alert.id) for alert in dated_alerts]
+        assert rows[0]["type"] == "TRANSFER"
+
+    def test_jsonl_gzip(self, client: TestClient, dated_alerts):
+        """gzip=true compresses on the fly; the payload is valid gzip JSON Lines."""
+        response = client.get("/api/alerts/export", params={"format": "jsonl", "gzip": True})
+        assert response.headers["content-type"] == "application/gzip"
+        lines = gzip.decompress(response.content).decode().splitlines()
+        assert len(lines) == 10
+        assert json.loads(lines[0])["transactions"][0]["nameOrig"].startswith("C")
+
+    def test_resume(self, client: TestClient, dated_alerts):
+        """An interrupted export resumes from the last cursor received."""
+        full = _jsonl(client)
+        resumed = _jsonl(client, cursor=full[3]["cursor"])
+        assert resumed == full[4:]
+
+    def test_invalid_cursor(self, client: TestClient, dated_alerts):
+        """A malformed cursor is rejected before streaming starts."""
+        response = client.get("/api/alerts/export", params={"cursor": "not-a-cursor"})
+        assert response.status_code == 400
+
+    def test_date_filter(self, client: TestClient, dated_alerts):
+        """Date range parameters bound the export."""
+        records = _jsonl(client, created_from=(BASE + timedelta(days=8)).isoformat())
+        assert len(records) == 2
+
+
+class TestExportCLI:
+    """Test suite for scripts/export_alerts.py."""
+
+    def test_writes_gzip_file(self, db_session: Session, dated_alerts, tmp_path, monkeypatch):
+        """The CLI streams to a file, compressing when the name ends in .gz."""
+        monkeypatch.setattr("app.database.SessionLocal", lambda: db_session)
+        monkeypatch.setattr(db_session, "close", lambda: None)
+        output = tmp_path / "alerts.jsonl.gz"
+
+        written = export(str(output), fmt="jsonl")
+        assert written == output.stat().st_size
+        assert len(gzip.decompress(output.read_bytes()).splitlines()) == 10
@@ -0,0 +1,101 @@
+"""Test cases for compact alert payload storage."""
+
+import json
+import struct
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from app.models.alert import Alert
+from app.services.feature_engine import FEATURE_NAMES
+from app.services.rules import RULES
+from app.utils.alert_payload import (
+    RULE_IDS,
+    SHAP_FEATURES,
+    decode_reason_codes,
+    decode_rules,
+    decode_shap,
+    encode_reason_codes,
+    encode_rules,
+    encode_shap,
+    rule_count,
+)
+
+SHAP = [
+    {"feature": "amount_zscore", "value": 0.45},
+    {"feature": "hour_of_day", "value": 0.12},
+    {"feature": "tx_count_24h", "value": -0.08},
+]
+
+
+class TestAlertPayloadCodec:
+    """Test suite for the rule/reason/SHAP encodings."""
+
+    def test_rules_bitmask(self):
+        """Rules round-trip through a bitmask in catalogue order."""
+        mask = encode_rules([RULES["R004"], "R001"])
+        assert mask == 0b1001
+        assert [rule["rule_id"] for rule in decode_rules(mask)] == ["R001", "R004"]
+        assert rule_count(mask) == 2
+        assert set(RULE_IDS) == set(RULES)
+
+    def test_reason_codes(self):
+        """Reason codes are one byte each, deduplicated in order."""
+        data = encode_reason_codes(["new_recipient", "high_ml_score", "new_recipient"])
+        assert len(data) == 2
+        assert decode_reason_codes(data) == ["new_recipient", "high_ml_score"]
+
+    def test_shap_fixed_width(self):
+        """SHAP values are a float32 per catalogue slot, decoded largest first."""
+        data = encode_shap(SHAP)
+        assert len(data) == 4 * len(SHAP_FEATURES)
+        assert decode_shap(data) == SHAP
+        assert encode_shap(None) is None and decode_shap(None) is None
+        # Arrays written before the catalogue grew still decode
+        assert decode_shap(struct.pack("<2f", float("nan"), 0.5)) == [{"feature": "amount_zscore", "value": 0.5}]
+        assert SHAP_FEATURES[:len(FEATURE_NAMES)] == FEATURE_NAMES
+
+    def test_unknown_entries_rejected(self):
+        """Values outside the catalogues fail loudly instead of being lost."""
+        with pytest.raises(ValueError, match="rule id"):
+            encode_rules(["R999"])
+        with pytest.raises(ValueError, match="reason code"):
+            encode_reason_codes(["made_up"])
+        with pytest.raises(ValueError, match="SHAP feature"):
+            encode_shap([{"feature": "made_up", "value": 1.0}])
+
+
+class TestCompactAlertStorage:
+    """Test suite for Alert rows using the compact columns."""
+
+    def test_properties_round_trip(self, sample_alert: Alert, db_session: Session):
+        """The JSON-shaped properties read back what was written."""
+        db_session.expire_all()
+        alert = db_session.get(Alert, sample_alert.id)
+        assert alert.ml_reason_codes == ["high_ml_score", "amount_exceeds_threshold"]
+        assert alert.rules_triggered == [RULES["R001"]]
+        assert alert.rules_count == 1
+        assert alert.shap_values[0] == {"feature": "amount_zscore", "value": 0.45}
+
+    def test_row_smaller_than_json(self, sample_alert: Alert, db_session: Session):
+        """Stored payload bytes are a fraction of the JSON they replace."""
+        stored = db_session.execute(text(
+            "SELECT length(reason_code_ids) + length(shap) + 8 FROM alerts"
+        )).scalar()
+        as_json = sum(len(json.dumps(value)) for value in (
+            sample_alert.ml_reason_codes, sample_alert.shap_values, sample_alert.rules_triggered
+        ))
+        assert stored * 2 < as_json
+
+    def test_detail_decodes_list_counts(self, client: TestClient, sample_alert: Alert):
+        """The detail view returns decoded payloads; the list view only counts rules."""
+        detail = client.get(f"/api/alerts/{sample_alert.id}").json()["data"]
+        assert detail["rules_triggered"][0]["rule_id"] == "R001"
+        assert detail["ml_reason_codes"] == ["high_ml_score", "amount_exceeds_threshold"]
+        assert {item["feature"] for item in detail["shap_values"]} == {"amount_zscore", "new_counterparty_7d"}
+
+        item = client.get("/api/alerts").json()["data"]["items"][0]
+        assert item["rules_count"] == 1
+        assert "rules_triggered" not in item
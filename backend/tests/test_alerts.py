@@ -1,6 +1,5 @@
 """Test cases for alert endpoints."""
 
-import pytest
 from fastapi.testclient import TestClient
 
 from app.models.alert import AlertStatus, AlertPriority
@@ -25,10 +24,6 @@ class TestAlertEndpoints:
         assert "message" in data
         assert "docs" in data
     
-    # Alert CRUD tests will be added after implementing the alert router
-    # Placeholder tests below:
-    
-    @pytest.mark.skip(reason="Alert router not yet implemented")
     def test_list_alerts(self, client: TestClient, multiple_alerts):
         """Test listing alerts with pagination."""
         response = client.get("/api/alerts?page=1&page_size=5")
@@ -38,7 +33,6 @@ class TestAlertEndpoints:
         assert len(data["data"]["items"]) <= 5
         assert "total" in data["data"]
     
-    @pytest.mark.skip(reason="Alert router not yet implemented")
     def test_get_alert_detail(self, client: TestClient, sample_alert):
         """Test getting alert details."""
         response = client.get(f"/api/alerts/{sample_alert.id}")
@@ -49,7 +43,6 @@ class TestAlertEndpoints:
         assert "ml_score" in data["data"]
         assert "shap_values" in data["data"]
     
-    @pytest.mark.skip(reason="Alert router not yet implemented")
     def test_update_alert_status(self, client: TestClient, sample_alert):
         """Test updating alert status."""
         response = client.patch(
@@ -61,7 +54,6 @@ class TestAlertEndpoints:
         assert data["data"]["status"] == "in_review"
         assert data["data"]["notes"] == "Investigating"
     
-    @pytest.mark.skip(reason="Alert router not yet implemented")
     def test_filter_alerts_by_status(self, client: TestClient, multiple_alerts):
         """Test filtering alerts by status."""
         response = client.get("/api/alerts?status=new")
@@ -70,7 +62,6 @@ class TestAlertEndpoints:
         items = data["data"]["items"]
         assert all(item["status"] == "new" for item in items)
     
-    @pytest.mark.skip(reason="Alert router not yet implemented")
     def test_filter_alerts_by_priority(self, client: TestClient, multiple_alerts):
         """Test filtering alerts by priority."""
         response = client.get("/api/alerts?priority=critical&priority=high")
@@ -79,7 +70,6 @@ class TestAlertEndpoints:
         items = data["data"]["items"]
         assert all(item["priority"] in ["critical", "high"] for item in items)
     
-    @pytest.mark.skip(reason="Alert router not yet implemented")
     def test_bulk_update_alerts(self, client: TestClient, multiple_alerts):
         """Test bulk updating multiple alerts."""
         alert_ids = [str(alert.id) for alert in multiple_alerts[:3]]
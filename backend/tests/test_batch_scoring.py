@@ -0,0 +1,240 @@
+"""Test cases for the pipelined batch scoring of transaction files."""
+
+import io
+import threading
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.models.alert import Alert, alert_transactions
+from app.models.entity import EntityAggregate
+from app.models.transaction import Transaction
+from app.services.batch_scoring import STAGES, BatchScoringError, score_file
+from app.services.feature_engine import FeatureEngine, get_feature_engine
+from app.services.rules import evaluate_rules
+from app.services.scoring import get_champion
+from app.services.transaction_service import TransactionService
+from scripts.score_file import score
+
+HEADER = "step,type,amount,nameOrig,nameDest,oldbalanceOrg,newbalanceOrig,isFraud,isFlaggedFraud"
+
+ROWS = [
+    "1,PAYMENT,9839.64,C1231006815,M1979787155,170136.0,160296.36,0,0",
+    "1,TRANSFER,250000.0,C1305486145,C553264065,250000.0,0.0,1,0",
+    "1,CASH-OUT,250000.0,C1305486145,C38997010,0.0,0.0,1,0",
+    "2,PAYMENT,1864.28,C1666544295,M2044282225,21249.0,19384.72,0,0",
+    "2,DEBIT,5337.77,C712410124,C195600860,41720.0,36382.23,0,0",
+    "3,CASH_IN,120.0,C1231006815,C9999999999,160296.36,160416.36,0,0",
+    "3,TRANSFER,310000.0,C1900366749,C997608398,310000.0,0.0,1,1",
+]
+
+
+def _csv(rows=ROWS) -> bytes:
+    return ("\n".join([HEADER, *rows]) + "\n").encode()
+
+
+def _count(db: Session, model) -> int:
+    return db.scalar(select(func.count()).select_from(model))
+
+
+class TestBatchPipeline:
+    """Test suite for score_file."""
+
+    def test_scores_and_stores_file(self, db_session: Session):
+        """Every valid row is stored with its aggregates and rule or score alerts."""
+        report = score_file(db_session, io.BytesIO(_csv()), chunk_size=2, queue_size=1)
+
+        assert (report.rows_read, report.rows_stored, report.rows_rejected) == (7, 7, 0)
+        assert _count(db_session, Transaction) == 7
+        assert _count(db_session, EntityAggregate) == 12  # Distinct accounts
+        assert report.model_version == get_champion().version
+
+        rules = {rule["rule_id"] for alert in db_session.query(Alert) for rule in alert.rules_triggered}
+        assert {"R001", "R004"} <= rules
+        assert report.alerts_created == _count(db_session, Alert)
+
+    def test_matches_live_scoring(self, db_session: Session):
+        """Alerts are raised for exactly the rows ingestion would alert on."""
+        score_file(db_session, io.BytesIO(_csv()), chunk_size=3)
+
+        engine = FeatureEngine()
+        rows = [row.split(",") for row in ROWS]
+        features = [
+            engine.compute(int(step), tx_type.replace("-", "_"), float(amount), orig, dest)
+            for step, tx_type, amount, orig, dest, *_ in rows
+        ]
+        scores = get_champion().score(features)
+        expected = {
+            (row[3], row[4])
+            for row, values, value in zip(rows, features, scores)
+            if evaluate_rules(values) or value >= settings.ALERT_SCORE_THRESHOLD
+        }
+        alerted = set(db_session.execute(
+            select(Transaction.nameOrig, Transaction.nameDest)
+            .join(alert_transactions, alert_transactions.c.transaction_id == Transaction.id)
+        ))
+        assert alerted == expected
+
+    def test_stage_report(self, db_session: Session):
+        """Each stage reports chunks, rows and busy time; the busiest is the bottleneck."""
+        report = score_file(db_session, io.BytesIO(_csv()), chunk_size=3)
+
+        assert [stage.name for stage in report.stages] == list(STAGES)
+        for stage in report.stages:
+            assert (stage.chunks, stage.rows) == (3, 7)
+            assert stage.busy_seconds > 0 and stage.rows_per_second > 0
+        assert report.bottleneck == max(report.stages, key=lambda stage: stage.busy_seconds).name
+
+    def test_rejects_invalid_rows(self, db_session: Session):
+        """Invalid rows are skipped with their line and reason; the rest are stored."""
+        rows = ROWS[:2] + [
+            "1,REFUND,10.0,C1,C2,0,0,0,0",
+            "0,PAYMENT,10.0,C1,C2,0,0,0,0",
+            "1,PAYMENT,-1,C1,C2,0,0,0,0",
+            "1,PAYMENT,10.0,,C2,0,0,0,0",
+        ] + ROWS[2:]
+        report = score_file(db_session, io.BytesIO(_csv(rows)), chunk_size=4)
+
+        assert (report.rows_read, report.rows_stored, report.rows_rejected) == (11, 7, 4)
+        assert [(error.line, error.reason.split()[0]) for error in report.errors] == [
+            (4, "type"), (5, "step"), (6, "amount"), (7, "nameOrig"),
+        ]
+
+    def test_malformed_files(self, db_session: Session):
+        """Missing columns, empty files and unordered steps are errors."""
+        with pytest.raises(BatchScoringError, match="nameDest") as error:
+            score_file(db_session, io.BytesIO(b"step,type,amount,nameOrig\n1,PAYMENT,1.0,C1\n"))
+        assert isinstance(error.value.cause, ValueError)
+        with pytest.raises(BatchScoringError):
+            score_file(db_session, io.BytesIO(b""))
+        with pytest.raises(BatchScoringError, match="line 3") as error:
+            score_file(db_session, io.BytesIO(_csv([ROWS[3], ROWS[0]])))
+        assert (error.value.report.rows_stored, error.value.report.resume_line) == (0, 2)
+
+    def test_failure_keeps_earlier_chunks(self, db_session: Session):
+        """A failing chunk stops the pipeline; chunks ahead of it are stored and reported."""
+        rows = ROWS[:4] + ["2,PAYMENT,1.0,C1,C2,0,0,0,0", "1,PAYMENT,1.0,C1,C2,0,0,0,0"]
+        with pytest.raises(BatchScoringError, match="ordered by step") as error:
+            score_file(db_session, io.BytesIO(_csv(rows)), chunk_size=2, queue_size=1)
+
+        report = error.value.report
+        assert _count(db_session, Transaction) == report.rows_stored == 4
+        assert (report.last_line_stored, report.resume_line) == (5, 6)
+        assert not [thread for thread in threading.enumerate() if thread.name.startswith("batch-scoring")]
+
+    def test_resume_after_failure(self, db_session: Session, monkeypatch):
+        """Resuming at resume_line stores the rest once, with the features of an uninterrupted run."""
+        store_scored = TransactionService.store_scored
+        calls = []
+
+        def fail_second_chunk(*args, **kwargs):
+            calls.append(1)
+            if len(calls) == 2:
+                raise RuntimeError("disk full")
+            return store_scored(*args, **kwargs)
+
+        with monkeypatch.context() as patch:
+            patch.setattr("app.services.batch_scoring.TransactionService.store_scored", fail_second_chunk)
+            with pytest.raises(BatchScoringError, match="disk full") as error:
+                score_file(db_session, io.BytesIO(_csv()), chunk_size=3, queue_size=1)
+        assert error.value.report.resume_line == 5
+
+        report = score_file(db_session, io.BytesIO(_csv()), chunk_size=3, first_line=error.value.report.resume_line)
+        assert (report.rows_read, report.rows_stored, report.last_line_stored) == (4, 4, 8)
+        assert _count(db_session, Transaction) == 7
+
+        # The failed chunk was computed ahead of the failure but only recorded once, on resume
+        features = get_feature_engine().compute(2, "PAYMENT", 1.0, "C1666544295", "M1", update=False)
+        assert features["velocity_1h"] == 1
+
+    def test_start_line_numbers(self, db_session: Session):
+        """Rejected rows keep their file line numbers when scoring starts mid-file."""
+        rows = ROWS[:2] + ["2,PAYMENT,abc,C1,C2,0,0,0,0"] + ROWS[3:]
+        report = score_file(db_session, io.BytesIO(_csv(rows)), first_line=3)
+
+        assert (report.rows_read, report.rows_stored) == (6, 5)
+        assert report.errors[0].line == 4
+
+    def test_store_failure_stops_upstream(self, db_session: Session, monkeypatch):
+        """An error in the last stage is raised without leaving stages blocked on full queues."""
+        def fail(*args, **kwargs):
+            raise RuntimeError("disk full")
+
+        monkeypatch.setattr("app.services.batch_scoring.TransactionService.store_scored", fail)
+        with pytest.raises(BatchScoringError, match="disk full"):
+            score_file(db_session, io.BytesIO(_csv(ROWS * 4)), chunk_size=1, queue_size=1)
+        assert not [thread for thread in threading.enumerate() if thread.name.startswith("batch-scoring")]
+
+
+class TestUploadAPI:
+    """Test suite for POST /api/transactions/upload."""
+
+    def _upload(self, client: TestClient, data: bytes):
+        return client.post("/api/transactions/upload", files={"file": ("transactions.csv", data, "text/csv")})
+
+    def test_upload(self, client: TestClient, db_session: Session):
+        """The upload is scored and the report lists every stage and the bottleneck."""
+        response = self._upload(client, _csv())
+        assert response.status_code == 201
+
+        data = response.json()["data"]
+        assert data["rows_stored"] == 7
+        assert [stage["name"] for stage in data["stages"]] == list(STAGES)
+        assert data["bottleneck"] in STAGES
+        assert data["alerts_created"] > 0
+
+    def test_rejected_rows_reported(self, client: TestClient, db_session: Session):
+        """Rejected rows come back with line numbers and reasons."""
+        data = self._upload(client, _csv(ROWS + ["4,PAYMENT,abc,C1,C2,0,0,0,0"])).json()["data"]
+        assert data["rows_rejected"] == 1
+        assert data["errors"] == [{"line": 9, "reason": "amount must be a number >= 0"}]
+
+    def test_size_limit(self, client: TestClient, db_session: Session, monkeypatch):
+        """Files over MAX_UPLOAD_SIZE_MB are refused before parsing."""
+        monkeypatch.setattr(settings, "MAX_UPLOAD_SIZE_MB", 0)
+        response = self._upload(client, _csv())
+        assert response.status_code == 413
+        assert _count(db_session, Transaction) == 0
+
+    def test_malformed_file(self, client: TestClient, db_session: Session):
+        """A file without the required columns is a client error."""
+        response = self._upload(client, b"step,type\n1,PAYMENT\n")
+        assert response.status_code == 400
+        assert "Missing required columns" in response.json()["detail"]["message"]
+
+    def test_partial_report_and_resume(self, client: TestClient, db_session: Session, monkeypatch):
+        """A failure part-way reports what was stored; start_line carries on from there."""
+        monkeypatch.setattr(settings, "BATCH_SCORING_CHUNK_SIZE", 2)
+        response = self._upload(client, _csv(ROWS + ["1,PAYMENT,1.0,C1,C2,0,0,0,0"]))
+        assert response.status_code == 400
+        report = response.json()["detail"]["report"]
+        assert (report["rows_stored"], report["last_line_stored"], report["resume_line"]) == (6, 7, 8)
+
+        fixed = ROWS + ["4,PAYMENT,1.0,C1,C2,0,0,0,0"]
+        response = client.post(
+            "/api/transactions/upload",
+            params={"start_line": report["resume_line"]},
+            files={"file": ("transactions.csv", _csv(fixed), "text/csv")},
+        )
+        assert response.status_code == 201
+        assert response.json()["data"]["rows_stored"] == 2
+        assert _count(db_session, Transaction) == 8
+
+
+class TestScoreFileCLI:
+    """Test suite for scripts/score_file.py."""
+
+    def test_scores_file_from_disk(self, db_session: Session, tmp_path, monkeypatch):
+        """The CLI scores a file by path, with no upload size limit."""
+        monkeypatch.setattr("app.database.SessionLocal", lambda: db_session)
+        monkeypatch.setattr(db_session, "close", lambda: None)
+        monkeypatch.setattr(settings, "MAX_UPLOAD_SIZE_MB", 0)
+        path = tmp_path / "transactions.csv"
+        path.write_bytes(_csv())
+
+        report = score(str(path), chunk_size=5)
+        assert report.rows_stored == 7
+        assert _count(db_session, Transaction) == 7
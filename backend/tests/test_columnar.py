@@ -0,0 +1,86 @@
+"""Test cases for Parquet/Arrow transaction storage."""
+
+import pytest
+
+pa = pytest.importorskip("pyarrow")
+
+from app.utils.columnar import (
+    PARTITION_COLUMN,
+    convert_csv_to_parquet,
+    load_transactions_frame,
+    read_transactions,
+    step_to_day,
+)
+
+CSV_HEADER = (
+    "step,type,amount,nameOrig,oldbalanceOrg,newbalanceOrig,"
+    "nameDest,oldbalanceDest,newbalanceDest,isFraud,isFlaggedFraud\n"
+)
+
+
+@pytest.fixture
+def transactions_csv(tmp_path):
+    """Write a small PaySim-style CSV spanning three days."""
+    rows = [
+        "1,PAYMENT,9839.64,C1231006815,170136.0,160296.36,M1979787155,0.0,0.0,0,0",
+        "1,TRANSFER,181.0,C1305486145,181.0,0.0,C553264065,0.0,0.0,1,0",
+        "24,CASH_OUT,181.0,C840083671,181.0,0.0,C38997010,21182.0,0.0,1,0",
+        "25,PAYMENT,11668.14,C2048537720,41554.0,29885.86,M1230701703,0.0,0.0,0,0",
+        "49,TRANSFER,250000.0,C1231006815,300000.0,50000.0,C553264065,0.0,0.0,0,1",
+    ]
+    path = tmp_path / "transactions.csv"
+    path.write_text(CSV_HEADER + "\n".join(rows) + "\n")
+    return path
+
+
+@pytest.fixture
+def dataset_dir(tmp_path, transactions_csv):
+    """Convert the sample CSV to a Parquet dataset."""
+    output = tmp_path / "parquet"
+    convert_csv_to_parquet(str(transactions_csv), str(output))
+    return output
+
+
+class TestColumnarStorage:
+    """Test suite for CSV → Parquet conversion and reads."""
+
+    def test_step_to_day(self):
+        """Steps map to 24-hour partitions starting at day 1."""
+        assert step_to_day(1) == 1
+        assert step_to_day(24) == 1
+        assert step_to_day(25) == 2
+        assert step_to_day(744) == 31
+
+    def test_convert_partitions_by_day(self, transactions_csv, tmp_path):
+        """Conversion writes one hive partition per day."""
+        output = tmp_path / "parquet"
+        stats = convert_csv_to_parquet(str(transactions_csv), str(output))
+
+        assert stats["rows"] == 5
+        partitions = sorted(p.name for p in output.iterdir())
+        assert partitions == [f"{PARTITION_COLUMN}=1", f"{PARTITION_COLUMN}=2", f"{PARTITION_COLUMN}=3"]
+
+    def test_read_returns_dictionary_columns(self, dataset_dir):
+        """String columns are read back dictionary-encoded."""
+        table = read_transactions(str(dataset_dir))
+
+        assert table.num_rows == 5
+        assert PARTITION_COLUMN not in table.column_names
+        for name in ("type", "nameOrig", "nameDest"):
+            assert pa.types.is_dictionary(table.schema.field(name).type)
+
+    def test_read_step_range(self, dataset_dir):
+        """Step bounds prune partitions and filter rows."""
+        table = read_transactions(str(dataset_dir), columns=["step", "amount"], min_step=24, max_step=25)
+
+        assert sorted(table.column("step").to_pylist()) == [24, 25]
+        assert table.column_names == ["step", "amount"]
+
+    def test_load_frame_uses_categoricals(self, dataset_dir):
+        """pandas frames carry categorical account ids and typed labels."""
+        df = load_transactions_frame(str(dataset_dir))
+
+        assert str(df["nameOrig"].dtype) == "category"
+        assert str(df["type"].dtype) == "category"
+        assert df["isFraud"].sum() == 2
+        assert df["amount"].max() == 250000.0
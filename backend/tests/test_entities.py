@@ -0,0 +1,244 @@
+"""Test cases for entity interning and profiles."""
+
+from datetime import datetime, timedelta
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import update
+from sqlalchemy.orm import Session
+
+from app.models.alert import Alert, AlertStatus
+from app.models.case import Case, case_alerts
+from app.models.entity import Entity, EntityAggregate
+from app.models.transaction import Transaction, TransactionType
+from app.services.alert_archive import archive_closed_alerts
+from app.services.entity_dictionary import EntityDictionary, get_entity_dictionary
+from app.services.entity_service import EntityService, merge_counterparties, top_counterparties
+from app.utils.cache import LRUCache
+
+
+class TestLRUCache:
+    """Test suite for the bounded LRU cache."""
+
+    def test_evicts_least_recently_used(self):
+        """The oldest untouched entry is evicted first."""
+        cache = LRUCache(maxsize=2)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        cache.get("a")
+        cache.put("c", 3)
+
+        assert "a" in cache
+        assert "b" not in cache
+        assert cache.evictions == 1
+
+    def test_hit_rate(self):
+        """Hits and misses are counted."""
+        cache = LRUCache(maxsize=10)
+        cache.put("a", 1)
+        cache.get("a")
+        cache.get("missing")
+
+        assert cache.hit_rate == 0.5
+
+    def test_rejects_non_positive_size(self):
+        """A cache must hold at least one entry."""
+        with pytest.raises(ValueError):
+            LRUCache(maxsize=0)
+
+
+class TestEntityDictionary:
+    """Test suite for EntityDictionary."""
+
+    def test_intern_assigns_dense_ids(self, db_session: Session):
+        """New names get sequential ids; repeats reuse them."""
+        entities = EntityDictionary(cache_size=100)
+        ids = entities.intern_many(db_session, ["C1", "C2", "C1", "M1"])
+        db_session.commit()
+
+        assert ids[0] == ids[2]
+        assert sorted(set(ids)) == [1, 2, 3]
+        assert db_session.query(Entity).count() == 3
+
+    def test_lookup_does_not_create(self, db_session: Session):
+        """lookup() returns None for unknown names."""
+        entities = EntityDictionary(cache_size=100)
+
+        assert entities.lookup(db_session, "C404") is None
+        assert db_session.query(Entity).count() == 0
+
+    def test_ids_survive_cache_eviction(self, db_session: Session):
+        """Evicted names are reloaded from the entities table."""
+        entities = EntityDictionary(cache_size=1)
+        first = entities.intern(db_session, "C1")
+        entities.intern(db_session, "C2")
+        db_session.commit()
+
+        assert entities.intern(db_session, "C1") == first
+        assert entities.name_of(db_session, first) == "C1"
+
+    def test_shared_table_across_dictionaries(self, db_session: Session):
+        """Separate processes (dictionaries) agree on ids via the table."""
+        first = EntityDictionary(cache_size=10).intern(db_session, "C1231006815")
+        db_session.commit()
+
+        assert EntityDictionary(cache_size=10).lookup(db_session, "C1231006815") == first
+
+    def test_cache_hits(self, db_session: Session):
+        """Repeated lookups are served from the in-process cache."""
+        entities = EntityDictionary(cache_size=10)
+        entities.intern(db_session, "C1")
+        entities.intern(db_session, "C1")
+
+        assert entities.stats()["ids"]["hits"] >= 1
+
+
+def _ingest(db_session: Session, rows: list) -> list:
+    """Insert (step, type, amount, nameOrig, nameDest, isFraud) rows like the loader."""
+    entities = get_entity_dictionary()
+    transactions = []
+    for step, tx_type, amount, orig, dest, is_fraud in rows:
+        orig_id, dest_id = entities.intern_many(db_session, [orig, dest])
+        tx = Transaction(
+            step=step,
+            type=tx_type,
+            amount=amount,
+            nameOrig=orig,
+            nameDest=dest,
+            orig_id=orig_id,
+            dest_id=dest_id,
+            isFraud=is_fraud,
+        )
+        db_session.add(tx)
+        transactions.append(tx)
+    EntityService.update_aggregates(db_session, transactions)
+    db_session.commit()
+    return transactions
+
+
+class TestEntityProfiles:
+    """Test suite for precomputed entity profiles."""
+
+    def test_batches_accumulate(self, db_session: Session):
+        """Aggregates from separate batches add up."""
+        _ingest(db_session, [(1, TransactionType.TRANSFER, 1000.0, "C1", "C9", False)])
+        _ingest(db_session, [
+            (5, TransactionType.CASH_OUT, 500.0, "C1", "C8", True),
+            (7, TransactionType.TRANSFER, 250.0, "C2", "C1", False),
+        ])
+
+        profile = EntityService.get_profile(db_session, "C1")
+        assert profile.role == "both"
+        assert profile.total_transactions == 3
+        assert profile.total_amount == 1750.0
+        assert profile.sent_count == 2
+        assert profile.fraud_transactions == 1
+        assert (profile.first_step, profile.last_step) == (1, 7)
+        assert {t.type: t.count for t in profile.transaction_types} == {"CASH_OUT": 1, "TRANSFER": 2}
+
+    def test_top_counterparties(self, db_session: Session):
+        """Counterparties are ranked by transaction count."""
+        rows = [(i, TransactionType.PAYMENT, 10.0, f"C{i % 3}", "M1", False) for i in range(1, 10)]
+        rows += [(10, TransactionType.PAYMENT, 10.0, "C0", "M1", False)]
+        _ingest(db_session, rows)
+
+        profile = EntityService.get_profile(db_session, "M1", top_n=2)
+        assert profile.role == "receiver"
+        assert [c.entity for c in profile.top_counterparties] == ["C0", "C1"]
+        assert profile.top_counterparties[0].count == 4
+
+    def test_counterparty_names_in_one_query(self, db_session: Session, max_queries):
+        """Counterparty names missing from the cache are fetched with one bulk lookup."""
+        _ingest(db_session, [(i, TransactionType.PAYMENT, 10.0, f"C{i}", "M1", False) for i in range(1, 6)])
+        get_entity_dictionary().clear()
+
+        with max_queries(3):  # Name → id, aggregate, counterparty names
+            profile = EntityService.get_profile(db_session, "M1")
+        assert {c.entity for c in profile.top_counterparties} == {"C1", "C2", "C3", "C4", "C5"}
+
+    def test_folds_onto_current_row(self, db_session: Session):
+        """Deltas are merged onto the row as stored, not a stale copy held by the session."""
+        tx = _ingest(db_session, [(1, TransactionType.TRANSFER, 100.0, "C1", "C2", False)])[0]
+        stale = db_session.get(EntityAggregate, tx.orig_id)
+        db_session.execute(
+            update(EntityAggregate)
+            .where(EntityAggregate.entity_id == tx.orig_id)
+            .values(sent_count=EntityAggregate.sent_count + 1, type_counts={"TRANSFER": 2})
+            .execution_options(synchronize_session=False)
+        )
+        assert stale.sent_count == 1
+
+        _ingest(db_session, [(2, TransactionType.TRANSFER, 50.0, "C1", "C3", False)])
+        profile = EntityService.get_profile(db_session, "C1")
+        assert profile.sent_count == 3
+        assert {t.type: t.count for t in profile.transaction_types} == {"TRANSFER": 3}
+
+    def test_counterparty_summary_is_bounded(self):
+        """Space-Saving keeps heavy hitters within capacity."""
+        counters = merge_counterparties({}, {"1": [100, 1000.0]}, capacity=3)
+        for key in range(2, 50):
+            counters = merge_counterparties(counters, {str(key): [1, 1.0]}, capacity=3)
+
+        assert len(counters) == 3
+        assert top_counterparties(counters, 1)[0][0] == 1
+
+    def test_record_history(self, db_session: Session):
+        """Alert counters increment once per alert."""
+        tx = _ingest(db_session, [(1, TransactionType.TRANSFER, 1.0, "C1", "C2", False)])[0]
+        EntityService.record_history(db_session, [tx.orig_id, tx.orig_id, tx.dest_id], alerts=1)
+        db_session.commit()
+
+        assert EntityService.get_profile(db_session, "C1").prior_alerts == 2
+        assert EntityService.get_profile(db_session, "C2").prior_alerts == 1
+
+    def test_profile_endpoint(self, client: TestClient, db_session: Session):
+        """GET /api/entities/{id} serves the profile."""
+        _ingest(db_session, [(1, TransactionType.TRANSFER, 99.5, "C1231006815", "C2", False)])
+
+        response = client.get("/api/entities/C1231006815")
+        assert response.status_code == 200
+        data = response.json()
+        assert data["status"] == "success"
+        assert data["data"]["total_amount"] == 99.5
+        assert data["data"]["top_counterparties"][0]["entity"] == "C2"
+
+    def test_ingested_alerts_in_history(self, client: TestClient, db_session: Session):
+        """Alerts raised on ingest count once per parent alert towards the sender's profile."""
+        transfers = [
+            {"step": step, "type": "TRANSFER", "amount": 250_000.0, "nameOrig": "C1", "nameDest": f"C9{i}"}
+            for i, step in enumerate([1, 1, 2, 30])
+        ]
+        response = client.post("/api/transactions/batch", json={"transactions": transfers})
+        assert response.json()["data"]["alerts_created"] == 2
+
+        assert client.get("/api/entities/C1").json()["data"]["prior_alerts"] == 2
+        assert client.get("/api/entities/C90").json()["data"]["prior_alerts"] == 0
+
+    def test_rebuild_recounts_history(self, client: TestClient, db_session: Session):
+        """Rebuilding recounts alerts (hot and archived) and cases per sender."""
+        transfers = [
+            {"step": step, "type": "TRANSFER", "amount": 250_000.0, "nameOrig": "C1", "nameDest": "C2"}
+            for step in (1, 30)
+        ]
+        client.post("/api/transactions/batch", json={"transactions": transfers})
+        first, second = db_session.query(Alert).order_by(Alert.first_step).all()
+        case = Case()
+        db_session.add(case)
+        db_session.flush()
+        db_session.execute(case_alerts.insert().values(case_id=case.id, alert_id=first.id))
+        second.status = AlertStatus.CLOSED
+        second.updated_at = datetime.utcnow() - timedelta(days=365)
+        db_session.commit()
+        assert archive_closed_alerts(db_session, datetime.utcnow()) == 1
+
+        EntityService.rebuild_aggregates(db_session)
+        db_session.commit()
+
+        profile = EntityService.get_profile(db_session, "C1")
+        assert (profile.total_transactions, profile.prior_alerts, profile.prior_cases) == (2, 2, 1)
+        assert EntityService.get_profile(db_session, "C2").prior_alerts == 0
+
+    def test_profile_endpoint_not_found(self, client: TestClient):
+        """Unknown entities return 404."""
+        response = client.get("/api/entities/C404")
+        assert response.status_code == 404
@@ -0,0 +1,269 @@
+"""Test cases for the sliding-window feature engine."""
+
+import pytest
+from sqlalchemy.exc import OperationalError
+
+from app.models.transaction import TransactionType
+from app.schemas.transaction import TransactionCreate
+from app.services.feature_cache import FeatureCache, MemoryFeatureBackend, WindowSummary, make_backend
+from app.services.feature_engine import FEATURE_NAMES, FeatureEngine, get_feature_engine
+from app.services.transaction_service import TransactionService
+
+
+class TestFeatureEngine:
+    """Test suite for FeatureEngine."""
+
+    def test_first_transaction(self):
+        """A sender's first transaction has no history."""
+        features = FeatureEngine().compute(1, TransactionType.PAYMENT, 100.0, "C1", "M1")
+
+        assert list(features) == FEATURE_NAMES
+        assert features["velocity_1h"] == 0
+        assert features["amount_zscore"] == 0
+        assert features["new_counterparty_7d"] == 1
+
+    def test_velocity_and_counterparty(self):
+        """Same-step transactions count toward velocity; repeat receivers are not new."""
+        engine = FeatureEngine()
+        engine.compute(5, "PAYMENT", 10.0, "C1", "M1")
+        engine.compute(5, "PAYMENT", 10.0, "C1", "M2")
+
+        features = engine.compute(5, "PAYMENT", 10.0, "C1", "M1")
+        assert features["velocity_1h"] == 2
+        assert features["new_counterparty_7d"] == 0
+
+        later = engine.compute(5 + 168, "PAYMENT", 10.0, "C1", "M1")
+        assert later["velocity_1h"] == 0
+        assert later["new_counterparty_7d"] == 1
+
+    def test_amount_zscore(self):
+        """Amounts are scored against the sender's 24-step history."""
+        engine = FeatureEngine()
+        for amount in (100.0, 200.0, 300.0):
+            engine.compute(1, "PAYMENT", amount, "C1", "M1")
+
+        features = engine.compute(2, "PAYMENT", 600.0, "C1", "M1")
+        assert features["amount_zscore"] == pytest.approx((600 - 200) / (20000 / 3) ** 0.5, rel=1e-5)
+
+    def test_rules(self):
+        """High-value transfers and transfer → cash-out sequences are flagged."""
+        engine = FeatureEngine()
+        transfer = engine.compute(10, TransactionType.TRANSFER, 250_000.0, "C1", "C2")
+        cashout = engine.compute(12, "CASH-OUT", 250_000.0, "C1", "M1")
+        late = engine.compute(20, "CASH_OUT", 1.0, "C1", "M1")
+
+        assert transfer["high_value_transfer_rule"] == 1
+        assert cashout["cashout_sequence_2h"] == 1
+        assert cashout["high_value_transfer_rule"] == 0
+        assert late["cashout_sequence_2h"] == 0
+
+    def test_preview_does_not_update(self):
+        """update=False computes without recording the transaction."""
+        engine = FeatureEngine()
+        engine.compute(1, "PAYMENT", 10.0, "C1", "M1", update=False)
+        assert len(engine) == 0
+
+    def test_evict_before(self):
+        """Senders with only stale history are dropped."""
+        engine = FeatureEngine(window_steps=24)
+        engine.compute(1, "PAYMENT", 10.0, "C1", "M1")
+        engine.compute(20, "PAYMENT", 10.0, "C2", "M1")
+
+        assert engine.evict_before(30) == 1
+        assert len(engine) == 1
+
+    def test_evicts_as_steps_advance(self):
+        """Recording a later step drops senders whose whole history fell out of the window."""
+        engine = FeatureEngine(window_steps=24)
+        engine.compute(1, "PAYMENT", 10.0, "C1", "M1")
+        engine.compute(10, "PAYMENT", 10.0, "C2", "M1")
+        engine.compute(20, "PAYMENT", 10.0, "C1", "M1")
+        assert len(engine) == 2
+
+        engine.compute(34, "PAYMENT", 10.0, "C3", "M1")
+        assert sorted(engine._history) == ["C1", "C3"]
+        engine.compute(44, "PAYMENT", 10.0, "C3", "M1", update=False)
+        assert len(engine) == 2  # Previews record nothing, so evict nothing
+        engine.compute(44, "PAYMENT", 10.0, "C3", "M1")
+        assert sorted(engine._history) == ["C3"]
+
+
+class TestFeatureStaging:
+    """Test suite for staged feature computation (record only after commit)."""
+
+    def test_staged_rows_see_each_other(self):
+        """Rows staged under one token, across calls, count toward later rows before being recorded."""
+        engine = FeatureEngine()
+        rows = [(1, "PAYMENT", 10.0, "C1", "M1"), (1, "PAYMENT", 10.0, "C1", "M2")]
+        engine.compute_staged(rows[:1], "batch")
+        features = engine.compute_staged(rows[1:], "batch")[0]
+
+        assert features["velocity_1h"] == 1
+        assert len(engine) == 0
+
+        engine.record(rows, "batch")
+        assert len(engine) == 1
+        assert not engine._staging
+        assert engine.compute(1, "PAYMENT", 10.0, "C1", "M1")["velocity_1h"] == 2
+
+    def test_discard(self):
+        """Discarded rows never reach the windows."""
+        engine = FeatureEngine(cache=FeatureCache())
+        engine.compute_staged([(1, "TRANSFER", 250_000.0, "C1", "C2")], "failed")
+        engine.discard("failed")
+
+        features = engine.compute(2, "CASH_OUT", 250_000.0, "C1", "M1", update=False)
+        assert features["cashout_sequence_2h"] == 0
+        assert len(engine) == 0
+
+    def test_failed_ingest_not_counted(self, db_session, monkeypatch):
+        """A batch whose commit fails leaves the windows as they were, so its retry scores the same."""
+        batch = [
+            TransactionCreate(step=1, type="TRANSFER", amount=250_000.0, nameOrig="C_RETRY", nameDest="C2"),
+            TransactionCreate(step=1, type="CASH_OUT", amount=250_000.0, nameOrig="C_RETRY", nameDest="M1"),
+        ]
+
+        def fail():
+            raise OperationalError("COMMIT", {}, Exception("database is locked"))
+
+        with monkeypatch.context() as patch:
+            patch.setattr(db_session, "commit", fail)
+            with pytest.raises(OperationalError):
+                TransactionService.ingest(db_session, batch)
+        engine = get_feature_engine()
+        assert "C_RETRY" not in engine._history and not engine._staging
+
+        result = TransactionService.ingest(db_session, batch)
+        assert [values["velocity_1h"] for values in result.features] == [0, 1]
+
+
+def _random_rows(n: int, seed: int = 7):
+    """Step-ordered rows over a few hot senders, with some out-of-order steps."""
+    import random
+
+    rng = random.Random(seed)
+    rows = []
+    for i in range(n):
+        step = i // 40 + (rng.random() < 0.05) * rng.randint(-3, 0)
+        rows.append((
+            max(step, 1),
+            rng.choice(["PAYMENT", "TRANSFER", "CASH_OUT"]),
+            rng.choice([50.0, 500.0, 250_000.0, rng.random() * 1_000]),
+            f"C{rng.randint(1, 8)}",
+            f"M{rng.randint(1, 20)}",
+        ))
+    return rows
+
+
+class TestFeatureCache:
+    """Test suite for the (sender, step) feature cache."""
+
+    def test_matches_uncached_engine(self):
+        """Cached features equal uncached ones, including previews and late steps."""
+        plain = FeatureEngine()
+        cached = FeatureEngine(cache=FeatureCache(maxsize=4, ttl_steps=2, backend=MemoryFeatureBackend()))
+        for i, row in enumerate(_random_rows(3_000)):
+            update = i % 5 != 0
+            assert cached.compute(*row, update=update) == plain.compute(*row, update=update)
+
+        stats = cached.cache.stats()
+        assert stats["local"]["hits"] > 0
+        assert stats["local"]["evictions"] > 0
+        assert stats["shared"]["hits"] > 0
+
+    def test_burst_skips_scan(self, monkeypatch):
+        """A hot sender's burst in one step scans its history once."""
+        engine = FeatureEngine(cache=FeatureCache())
+        scans = []
+        scan = engine._scan
+        monkeypatch.setattr(engine, "_scan", lambda *args: scans.append(args) or scan(*args))
+
+        for _ in range(50):
+            engine.compute(1, "TRANSFER", 300_000.0, "C1", "C2")
+        features = engine.compute(1, "PAYMENT", 10.0, "C1", "C2")
+
+        assert len(scans) == 1
+        assert features["velocity_1h"] == 50
+        assert features["new_counterparty_7d"] == 0
+
+    def test_invalidated_by_new_transaction(self):
+        """Recording a transaction drops the sender's other cached steps in both tiers."""
+        backend = MemoryFeatureBackend()
+        cache = FeatureCache(backend=backend)
+        engine = FeatureEngine(cache=cache)
+        engine.compute(1, "PAYMENT", 10.0, "C1", "M1")
+        engine.compute(3, "PAYMENT", 10.0, "C1", "M2", update=False)
+        assert cache.get("C1", 3) is not None
+
+        engine.compute(2, "PAYMENT", 10.0, "C1", "M3")
+        assert cache.get("C1", 3) is None
+        assert cache.get("C1", 2).dests == {"M1", "M3"}
+        assert engine.compute(3, "PAYMENT", 10.0, "C1", "M3", update=False)["velocity_1h"] == 0
+
+    def test_step_ttl(self):
+        """Summaries older than ttl_steps behind the newest cached step expire."""
+        cache = FeatureCache(ttl_steps=1)
+        for step in (1, 2, 3):
+            cache.put("C1", step, WindowSummary())
+        assert cache.get("C1", 1) is None
+        assert cache.get("C1", 2) is not None
+
+    def test_shared_tier_fills_local(self):
+        """A local miss is served from the shared tier and cached locally."""
+        backend = MemoryFeatureBackend()
+        writer = FeatureCache(backend=backend)
+        writer.put("C1", 5, WindowSummary(2, [1.0, 2.0], True, {"M1"}))
+        assert len(backend) == 0  # Queued until flushed
+        writer.flush()
+
+        cache = FeatureCache(backend=backend)
+        assert cache.get("C1", 5) is None
+        cache.install(cache.fetch([("C1", 5)]))
+        summary = cache.get("C1", 5)
+        assert (summary.velocity, summary.amounts, summary.dests) == (2, [1.0, 2.0], {"M1"})
+        assert cache.fetch([("C1", 5)]) is None  # Already local
+        assert cache.stats()["shared"]["hits"] == 1
+        assert cache.stats()["local"]["hits"] == 1
+
+    def test_shared_io_outside_engine_lock(self):
+        """The engine reads and writes the shared tier without holding its lock, with an expiry."""
+        engine = None
+
+        class Backend(MemoryFeatureBackend):
+            def __init__(self):
+                super().__init__()
+                self.ttls = []
+
+            def get_many(self, keys):
+                assert not engine._lock.locked()
+                return super().get_many(keys)
+
+            def write_many(self, writes, ttl_seconds=None):
+                assert not engine._lock.locked()
+                self.ttls.append(ttl_seconds)
+                super().write_many(writes, ttl_seconds)
+
+        backend = Backend()
+        engine = FeatureEngine(cache=FeatureCache(backend=backend, shared_ttl_seconds=3600))
+        for row in _random_rows(200):
+            engine.compute(*row)
+        assert len(backend) > 0
+        assert set(backend.ttls) == {3600}
+
+    def test_fetch_racing_a_write_not_installed(self):
+        """Shared data read before a sender's write is not installed over it."""
+        backend = MemoryFeatureBackend()
+        writer = FeatureCache(backend=backend)
+        writer.put("C1", 5, WindowSummary(1))
+        writer.flush()
+
+        cache = FeatureCache(backend=backend)
+        fetched = cache.fetch([("C1", 5)])
+        cache.invalidate("C1")
+        cache.install(fetched)
+        assert cache.get("C1", 5) is None
+
+    def test_unknown_backend(self):
+        """Unsupported FEATURE_CACHE_BACKEND values are rejected."""
+        with pytest.raises(ValueError):
+            make_backend("memcached://localhost")
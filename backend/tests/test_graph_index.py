@@ -0,0 +1,126 @@
+"""Test cases for the in-memory transaction graph."""
+
+import time
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+
+from app.models.transaction import Transaction, TransactionType
+from app.services.entity_dictionary import get_entity_dictionary
+from app.services.graph_index import TransactionGraph
+
+
+@pytest.fixture
+def graph() -> TransactionGraph:
+    """Mule-ring shaped graph: 1,2,3 → 10 → 20 and an unrelated 30 → 31."""
+    graph = TransactionGraph()
+    graph.add_edge(1, 10, step=1, amount=100.0)
+    graph.add_edge(2, 10, step=2, amount=100.0)
+    graph.add_edge(3, 10, step=9, amount=100.0)
+    graph.add_edge(10, 20, step=3, amount=290.0)
+    graph.add_edge(30, 31, step=4, amount=5.0)
+    return graph
+
+
+class TestTransactionGraph:
+    """Test suite for TransactionGraph."""
+
+    def test_fan_in_and_fan_out(self, graph: TransactionGraph):
+        """Degrees count distinct counterparties."""
+        graph.add_edge(1, 10, step=5)
+        assert graph.fan_in(10) == 3
+        assert graph.fan_out(1) == 1
+        assert graph.fan_in(10, min_step=1, max_step=2) == 2
+
+    def test_expand_incoming(self, graph: TransactionGraph):
+        """Two hops back from the receiver reach every sender."""
+        assert graph.expand(20, hops=2, direction="in") == {20: 0, 10: 1, 1: 2, 2: 2, 3: 2}
+
+    def test_expand_with_step_window(self, graph: TransactionGraph):
+        """Edges outside the window are not followed."""
+        reached = graph.expand(10, hops=1, direction="in", max_step=5)
+        assert set(reached) == {10, 1, 2}
+
+    def test_expand_max_nodes(self, graph: TransactionGraph):
+        """Expansion stops at the node cap."""
+        assert len(graph.expand(10, hops=3, max_nodes=2)) == 2
+
+    def test_invalid_direction(self, graph: TransactionGraph):
+        """Unknown directions are rejected."""
+        with pytest.raises(ValueError):
+            graph.neighbors(10, direction="sideways")
+
+    def test_out_of_order_edges_stay_sorted(self, graph: TransactionGraph):
+        """Late edges are inserted in step order."""
+        graph.add_edge(10, 21, step=1)
+        assert [edge[0] for edge in graph.edges(10, "out")] == [1, 3]
+
+    def test_connected_components(self, graph: TransactionGraph):
+        """Components are returned largest first."""
+        components = graph.connected_components()
+        assert components == [{1, 2, 3, 10, 20}, {30, 31}]
+        assert graph.connected_components(min_step=4, max_step=4) == [{30, 31}]
+
+    def test_evict_before(self, graph: TransactionGraph):
+        """Old edges are dropped from both directions."""
+        assert graph.evict_before(3) == 2
+        assert graph.edge_count == 3
+        assert graph.fan_in(10) == 1
+
+    def test_window_evicts_on_add(self):
+        """Adding transactions that advance the newest step drops edges older than the window."""
+        graph = TransactionGraph(window_steps=5)
+        graph.add_transactions([
+            Transaction(orig_id=1, dest_id=10, step=1, amount=1.0),
+            Transaction(orig_id=2, dest_id=10, step=4, amount=1.0),
+        ])
+        assert graph.edge_count == 2
+
+        graph.add_transactions([Transaction(orig_id=3, dest_id=10, step=6, amount=1.0)])
+        assert graph.edge_count == 2
+        assert graph.neighbors(10, "in") == {2, 3}
+
+    def test_two_hop_query_on_hub_is_fast(self):
+        """A 2-hop expansion around a busy account stays in milliseconds."""
+        graph = TransactionGraph()
+        for sender in range(1, 5001):
+            graph.add_edge(sender, 0, step=sender % 744 + 1)
+            graph.add_edge(sender + 10_000, sender, step=sender % 744 + 1)
+
+        started = time.perf_counter()
+        reached = graph.expand(0, hops=2, direction="in", max_nodes=20_000)
+        elapsed = time.perf_counter() - started
+
+        assert len(reached) == 10_001
+        assert elapsed < 0.5
+
+
+class TestEntityNetworkEndpoint:
+    """Test suite for GET /api/entities/{id}/network."""
+
+    def test_network_endpoint(self, client: TestClient, db_session: Session):
+        """The graph is built from transactions on first use."""
+        entities = get_entity_dictionary()
+        for step, orig, dest in [(1, "C1", "C10"), (2, "C2", "C10"), (3, "C10", "C20")]:
+            orig_id, dest_id = entities.intern_many(db_session, [orig, dest])
+            db_session.add(Transaction(
+                step=step,
+                type=TransactionType.TRANSFER,
+                amount=100.0,
+                nameOrig=orig,
+                nameDest=dest,
+                orig_id=orig_id,
+                dest_id=dest_id,
+            ))
+        db_session.commit()
+
+        response = client.get("/api/entities/C20/network?hops=2&direction=in")
+        assert response.status_code == 200
+        data = response.json()["data"]
+        assert data["fan_in"] == 1
+        assert {(n["entity"], n["hops"]) for n in data["nodes"]} == {("C10", 1), ("C1", 2), ("C2", 2)}
+
+    def test_network_unknown_entity(self, client: TestClient):
+        """Unknown entities return 404."""
+        assert client.get("/api/entities/C404/network").status_code == 404
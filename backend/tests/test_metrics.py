@@ -0,0 +1,83 @@
+"""Test cases for request metrics and structured logging."""
+
+import json
+import logging
+import sys
+
+from fastapi.testclient import TestClient
+
+from app.utils.logging_config import JsonFormatter
+from app.utils.metrics import REGISTRY
+
+
+def _sample(name: str, labels: dict) -> float:
+    return REGISTRY.get_sample_value(name, labels) or 0.0
+
+
+class TestMetricsEndpoint:
+    """Test suite for the metrics middleware and /metrics."""
+
+    def test_route_latency_and_queries(self, client: TestClient, sample_alert):
+        """Requests are recorded under their route template with SQL counts."""
+        route = "/api/alerts/{alert_id}"
+        before = _sample("http_request_duration_seconds_count", {"method": "GET", "route": route, "status": "200"})
+        queries_before = _sample("db_queries_per_request_sum", {"route": route})
+
+        assert client.get(f"/api/alerts/{sample_alert.id}").status_code == 200
+
+        after = _sample("http_request_duration_seconds_count", {"method": "GET", "route": route, "status": "200"})
+        assert after == before + 1
+        assert _sample("db_queries_per_request_sum", {"route": route}) > queries_before
+
+    def test_unmatched_routes_share_a_label(self, client: TestClient):
+        """Unknown paths do not create one series per URL."""
+        client.get("/no/such/path/123")
+        assert _sample(
+            "http_request_duration_seconds_count", {"method": "GET", "route": "unmatched", "status": "404"}
+        ) >= 1
+
+    def test_prometheus_text_format(self, client: TestClient):
+        """/metrics serves the Prometheus exposition format."""
+        client.get("/health")
+        response = client.get("/metrics")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/plain")
+        assert "http_request_duration_seconds_bucket" in response.text
+        assert "http_requests_in_progress" in response.text
+        assert "db_queries_total" in response.text
+
+    def test_ingest_batch_size_recorded(self, client: TestClient):
+        """Ingestion batches are observed in scoring_batch_size."""
+        before = _sample("scoring_batch_size_count", {"stage": "ingest"})
+        client.post("/api/transactions/batch", json={"transactions": [
+            {"step": 1, "type": "PAYMENT", "amount": 1.0, "nameOrig": "C1", "nameDest": "M1"},
+            {"step": 1, "type": "PAYMENT", "amount": 2.0, "nameOrig": "C2", "nameDest": "M1"},
+        ]})
+        assert _sample("scoring_batch_size_count", {"stage": "ingest"}) == before + 1
+
+
+class TestJsonFormatter:
+    """Test suite for structured log output."""
+
+    def test_one_json_object_with_extras(self):
+        """Records become single-line JSON including extra fields."""
+        record = logging.LogRecord("app", logging.INFO, __file__, 1, "Scored %s", ("tx-1",), None)
+        record.alert_id = "a-1"
+
+        payload = json.loads(JsonFormatter().format(record))
+
+        assert payload["level"] == "INFO"
+        assert payload["logger"] == "app"
+        assert payload["message"] == "Scored tx-1"
+        assert payload["alert_id"] == "a-1"
+
+    def test_exceptions_included(self):
+        """Exception tracebacks are carried in exc_info."""
+        try:
+            raise ValueError("boom")
+        except ValueError:
+            record = logging.LogRecord("app", logging.ERROR, __file__, 1, "failed", (), sys.exc_info())
+
+        payload = json.loads(JsonFormatter().format(record))
+        assert "ValueError: boom" in payload["exc_info"]
@@ -0,0 +1,208 @@
+"""Test cases for Alembic migrations and the startup schema check."""
+
+from datetime import datetime
+
+import pytest
+from alembic import command
+from alembic.autogenerate import compare_metadata
+from alembic.migration import MigrationContext
+from alembic.script import ScriptDirectory
+from sqlalchemy import JSON, DateTime, Float, String, column, create_engine, inspect, select, table, text
+
+from app.database import Base
+from app.models.search import include_in_autogenerate
+from app.utils.alert_payload import decode_reason_codes, decode_shap
+from app.utils.schema import (
+    BASELINE_REVISION,
+    SCHEMA_REVISION,
+    SchemaVersionError,
+    alembic_config,
+    current_revision,
+    upgrade_database,
+    verify_schema,
+)
+
+
+@pytest.fixture
+def scratch_engine(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'migrations.db'}")
+    yield engine
+    engine.dispose()
+
+
+class TestMigrations:
+    """Test suite for the versioned migrations."""
+
+    def test_head_matches_code(self, scratch_engine):
+        """SCHEMA_REVISION is the single Alembic head."""
+        script = ScriptDirectory.from_config(alembic_config(scratch_engine))
+        assert script.get_heads() == [SCHEMA_REVISION]
+
+    @pytest.mark.filterwarnings("ignore:Skipped unsupported reflection of expression-based index")
+    def test_upgrade_matches_models(self, scratch_engine):
+        """Migrating an empty database yields the models' schema."""
+        upgrade_database(scratch_engine)
+        assert current_revision(scratch_engine) == SCHEMA_REVISION
+
+        with scratch_engine.connect() as conn:
+            context = MigrationContext.configure(
+                conn, opts={"compare_type": False, "include_name": include_in_autogenerate}
+            )
+            assert compare_metadata(context, Base.metadata) == []
+
+    def test_adopts_create_all_database(self, scratch_engine):
+        """A pre-migration database is stamped at the baseline, then upgraded."""
+        # Baseline tables without version tracking, as create_all used to leave them
+        upgrade_database(scratch_engine, BASELINE_REVISION)
+        with scratch_engine.begin() as conn:
+            conn.execute(text("DROP TABLE alembic_version"))
+
+        upgrade_database(scratch_engine)
+
+        indexes = {ix["name"] for ix in inspect(scratch_engine).get_indexes("alerts")}
+        assert "ix_alerts_status_created_at" in indexes
+        assert current_revision(scratch_engine) == SCHEMA_REVISION
+
+    def test_compacts_alert_payloads(self, scratch_engine):
+        """0006 converts JSON payloads to compact columns and back on downgrade."""
+        upgrade_database(scratch_engine, "0005")
+        legacy = table(
+            "alerts",
+            column("id", String()), column("transaction_id", String()),
+            column("status", String()), column("priority", String()),
+            column("ml_score", Float()), column("ml_risk_band", String()),
+            column("ml_reason_codes", JSON()), column("shap_values", JSON()),
+            column("rules_triggered", JSON()),
+            column("created_at", DateTime()), column("updated_at", DateTime()),
+        )
+        now = datetime.utcnow()
+        with scratch_engine.begin() as conn:
+            conn.execute(legacy.insert(), [
+                {
+                    "id": f"{i:032x}", "transaction_id": f"{i:032x}", "status": "NEW", "priority": "HIGH",
+                    "ml_score": 0.8, "ml_risk_band": "HIGH",
+                    "ml_reason_codes": ["high_ml_score", "retired_code"],
+                    "shap_values": [{"feature": "amount_zscore", "value": 0.45}] if i else None,
+                    "rules_triggered": [{"rule_id": "R004"}, {"rule_id": "R001"}],
+                    "created_at": now, "updated_at": now,
+                }
+                for i in range(3)
+            ])
+
+        upgrade_database(scratch_engine)
+        with scratch_engine.connect() as conn:
+            rows = conn.execute(text("SELECT rules_mask, reason_code_ids, shap FROM alerts ORDER BY id")).all()
+        assert [row[0] for row in rows] == [0b1001] * 3
+        assert decode_reason_codes(rows[1][1]) == ["high_ml_score"]
+        assert rows[0][2] is None
+        assert decode_shap(rows[1][2]) == [{"feature": "amount_zscore", "value": 0.45}]
+
+        command.downgrade(alembic_config(scratch_engine), "0005")
+        with scratch_engine.connect() as conn:
+            restored = conn.execute(select(legacy.c.rules_triggered, legacy.c.ml_reason_codes)).first()
+        assert [rule["rule_id"] for rule in restored[0]] == ["R001", "R004"]
+        assert restored[1] == ["high_ml_score"]
+
+    def test_backfills_alert_counters(self, scratch_engine):
+        """0008 seeds the dashboard counters from hot and archived alerts."""
+        upgrade_database(scratch_engine, "0007")
+        now = datetime.utcnow()
+        row = {
+            "transaction_id": "0" * 32, "priority": "HIGH", "ml_score": 0.8, "ml_risk_band": "HIGH",
+            "created_at": now, "updated_at": now,
+        }
+        with scratch_engine.begin() as conn:
+            conn.execute(text(
+                "INSERT INTO alerts (id, transaction_id, status, priority, ml_score, ml_risk_band, "
+                "reason_code_ids, assigned_to, created_at, updated_at) VALUES "
+                "(:id, :transaction_id, :status, :priority, :ml_score, :ml_risk_band, x'', "
+                ":assigned_to, :created_at, :updated_at)"
+            ), [
+                {**row, "id": "1" * 32, "status": "NEW", "assigned_to": None},
+                {**row, "id": "2" * 32, "status": "IN_REVIEW", "assigned_to": "analyst"},
+            ])
+            conn.execute(text(
+                "INSERT INTO alerts_archive (id, transaction_id, status, priority, ml_score, ml_risk_band, "
+                "created_at, updated_at, archived_at, payload) VALUES "
+                "(:id, :transaction_id, 'CLOSED', :priority, :ml_score, :ml_risk_band, "
+                ":created_at, :updated_at, :created_at, x'')"
+            ), {**row, "id": "3" * 32})
+
+        upgrade_database(scratch_engine)
+        with scratch_engine.connect() as conn:
+            counters = {(d, v): c for d, v, c in conn.execute(text("SELECT dimension, value, count FROM alert_counters"))}
+        assert counters == {
+            ("status", "new"): 1, ("status", "in_review"): 1, ("status", "closed"): 1,
+            ("priority", "high"): 3, ("risk_band", "high"): 3,
+            ("assignee", ""): 2, ("assignee", "analyst"): 1,
+        }
+
+    def test_indexes_existing_rows_for_search(self, scratch_engine):
+        """0009 builds the search indexes over rows written before it."""
+        upgrade_database(scratch_engine, "0008")
+        with scratch_engine.begin() as conn:
+            conn.execute(text("INSERT INTO entities (name, created_at) VALUES ('C1231006815', :now)"),
+                         {"now": datetime.utcnow()})
+
+        upgrade_database(scratch_engine)
+        with scratch_engine.connect() as conn:
+            found = conn.execute(text("SELECT rowid FROM entity_names_fts WHERE entity_names_fts MATCH '1006'")).all()
+        assert len(found) == 1
+
+        command.downgrade(alembic_config(scratch_engine), "0008")
+        assert "entity_names_fts" not in inspect(scratch_engine).get_table_names()
+
+    def test_rekeys_notes_index(self, scratch_engine):
+        """0010 keys existing notes on search_id and numbers new alerts after them."""
+        upgrade_database(scratch_engine, "0009")
+        now = datetime.utcnow()
+        with scratch_engine.begin() as conn:
+            conn.execute(text(
+                "INSERT INTO alerts (id, transaction_id, status, priority, ml_score, ml_risk_band, "
+                "reason_code_ids, notes, created_at, updated_at) VALUES "
+                "(:id, :transaction_id, 'NEW', 'HIGH', 0.8, 'HIGH', x'', :notes, :now, :now)"
+            ), [
+                {"id": "a" * 32, "transaction_id": "0" * 32, "notes": "mule account", "now": now},
+                {"id": "b" * 32, "transaction_id": "0" * 32, "notes": "velocity burst", "now": now},
+            ])
+
+        upgrade_database(scratch_engine)
+        match = (
+            "SELECT a.id FROM alert_notes_fts JOIN alerts AS a ON a.search_id = alert_notes_fts.rowid "
+            "WHERE alert_notes_fts MATCH :query"
+        )
+        with scratch_engine.begin() as conn:
+            conn.execute(text(
+                "INSERT INTO alerts (id, transaction_id, status, priority, ml_score, ml_risk_band, "
+                "reason_code_ids, notes, created_at, updated_at) VALUES "
+                "(:id, :transaction_id, 'NEW', 'HIGH', 0.8, 'HIGH', x'', 'second mule', :now, :now)"
+            ), {"id": "c" * 32, "transaction_id": "0" * 32, "now": now})
+            assert conn.execute(text("SELECT search_id FROM alerts WHERE id = :id"), {"id": "c" * 32}).scalar() == 3
+            assert set(conn.execute(text(match), {"query": "mule"}).scalars()) == {"a" * 32, "c" * 32}
+
+        command.downgrade(alembic_config(scratch_engine), "0009")
+        columns = {c["name"] for c in inspect(scratch_engine).get_columns("alerts")}
+        assert "search_id" not in columns
+        with scratch_engine.connect() as conn:
+            found = conn.execute(text("SELECT rowid FROM alert_notes_fts WHERE alert_notes_fts MATCH 'mule'")).all()
+        assert len(found) == 2
+
+
+class TestSchemaCheck:
+    """Test suite for the startup schema-version check."""
+
+    def test_unversioned_database_fails(self, scratch_engine):
+        """No alembic_version table → refuse to start."""
+        with pytest.raises(SchemaVersionError, match="not versioned"):
+            verify_schema(scratch_engine)
+
+    def test_stale_revision_fails(self, scratch_engine):
+        """A database behind the code is reported with both revisions."""
+        upgrade_database(scratch_engine, "0001")
+        with pytest.raises(SchemaVersionError, match=f"0001, code expects {SCHEMA_REVISION}"):
+            verify_schema(scratch_engine)
+
+    def test_current_revision_passes(self, scratch_engine):
+        """An up-to-date database passes with one query."""
+        upgrade_database(scratch_engine)
+        assert verify_schema(scratch_engine) == SCHEMA_REVISION
@@ -0,0 +1,213 @@
+"""Test cases for the versioned model registry and hot model swaps."""
+
+import json
+import threading
+import time
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+
+from app.api import admin
+from app.config import settings
+from app.models.alert import Alert
+from app.services import model_registry, model_store
+from app.services.model_registry import ModelManager, ModelRegistry, UnknownModelVersionError
+from app.services.scoring import MockModel
+
+ADMIN_KEY = "test-admin-key"
+
+
+def _load_fake_artifact(path):
+    """Stand-in for joblib: artifacts are JSON with the mock model's bias (and an optional delay)."""
+    spec = json.loads(open(path).read())
+    if spec.get("fail"):
+        raise ValueError("corrupt artifact")
+    time.sleep(spec.get("load_seconds", 0))
+    return MockModel(bias=spec["bias"])
+
+
+@pytest.fixture
+def registry(tmp_path, monkeypatch):
+    """A registry with v1 and v2 and fake (JSON) artifacts."""
+    monkeypatch.setattr(settings, "USE_MOCK_SCORING", False)
+    monkeypatch.setattr(model_store, "load_artifact", _load_fake_artifact)
+    registry = ModelRegistry(str(tmp_path / "registry"))
+    for version, spec in [("v1", {"bias": -4.0}), ("v2", {"bias": 2.0})]:
+        artifact = tmp_path / f"{version}.json"
+        artifact.write_text(json.dumps(spec))
+        registry.register(version, str(artifact), {"auc": 0.9})
+    return registry
+
+
+@pytest.fixture
+def manager(registry, monkeypatch):
+    """A manager on the test registry, used by ingestion and the admin API."""
+    manager = ModelManager(registry)
+    monkeypatch.setattr(model_registry, "get_model_manager", lambda: manager)
+    monkeypatch.setattr(admin, "get_model_manager", lambda: manager)
+    yield manager
+    manager.stop()
+
+
+def _register(registry: ModelRegistry, tmp_path, version: str, spec: dict) -> None:
+    artifact = tmp_path / f"{version}.json"
+    artifact.write_text(json.dumps(spec))
+    registry.register(version, str(artifact))
+
+
+class TestModelRegistry:
+    """Test suite for ModelRegistry."""
+
+    def test_versions_and_active(self, registry: ModelRegistry):
+        """Versions list with metadata; the newest is active until CURRENT says otherwise."""
+        versions = registry.versions()
+        assert [v["version"] for v in versions] == ["v1", "v2"]
+        assert versions[0]["auc"] == 0.9
+        assert registry.active() == "v2"
+
+        registry.activate("v1")
+        assert registry.active() == "v1"
+        assert (registry.root / "CURRENT").read_text().strip() == "v1"
+
+    def test_unknown_version(self, registry: ModelRegistry):
+        """Unknown or path-like versions are rejected."""
+        with pytest.raises(UnknownModelVersionError):
+            registry.activate("v9")
+        with pytest.raises(UnknownModelVersionError):
+            registry.path("../v1")
+
+    def test_empty_registry(self, tmp_path):
+        """A missing directory is an empty registry."""
+        assert ModelRegistry(str(tmp_path / "missing")).active() is None
+
+
+class TestModelManager:
+    """Test suite for hot champion swaps."""
+
+    def test_initial_load_and_reload(self, manager: ModelManager, registry: ModelRegistry):
+        """The active version loads first; reload warms and swaps to another."""
+        registry.activate("v1")
+        assert manager.champion.version == "v1"
+
+        scorer = manager.reload("v2")
+        assert manager.champion is scorer
+        assert scorer.version == "v2"
+        assert manager.warm_ms is not None
+        assert manager.reload("v2") is scorer  # Already the champion
+
+    def test_champion_serves_while_loading(self, manager: ModelManager, registry: ModelRegistry, tmp_path):
+        """A slow load happens in the background; the old champion keeps scoring meanwhile."""
+        registry.activate("v1")
+        old = manager.champion
+        _register(registry, tmp_path, "v3", {"bias": 1.0, "load_seconds": 0.5})
+
+        thread = manager.activate("v3")
+        started = time.perf_counter()
+        assert manager.champion is old
+        assert old.score([{}]) == MockModel(bias=-4.0).score_features([{}])
+        assert time.perf_counter() - started < 0.2
+
+        with pytest.raises(RuntimeError):
+            manager.activate("v2")  # One load at a time
+        thread.join()
+        assert manager.champion.version == "v3"
+        assert manager.status()["loading"] is None
+
+    def test_failed_load_keeps_champion(self, manager: ModelManager, registry: ModelRegistry, tmp_path):
+        """A broken artifact leaves the current champion in place."""
+        registry.activate("v1")
+        assert manager.champion.version == "v1"
+        _register(registry, tmp_path, "bad", {"fail": True})
+
+        with pytest.raises(ValueError):
+            manager.reload("bad")
+        assert manager.champion.version == "v1"
+        assert "corrupt artifact" in manager.status()["last_error"]
+
+    def test_failed_activate_keeps_current(self, manager: ModelManager, registry: ModelRegistry, tmp_path):
+        """CURRENT only moves once the new version has loaded and warmed."""
+        registry.activate("v1")
+        assert manager.champion.version == "v1"
+        _register(registry, tmp_path, "bad", {"fail": True})
+
+        manager.activate("bad").join()
+        assert registry.active() == "v1"
+        assert manager.champion.version == "v1"
+        assert manager.status()["loading"] is None
+
+        manager.activate("v2").join()
+        assert registry.active() == "v2"
+        assert manager.champion.version == "v2"
+
+    def test_watcher_follows_registry(self, manager: ModelManager, registry: ModelRegistry):
+        """Activating a version in the registry (e.g. from another worker) reloads this one."""
+        registry.activate("v1")
+        assert manager.champion.version == "v1"
+        manager.watch(0.02)
+
+        registry.activate("v2")
+        deadline = time.monotonic() + 5
+        while manager.champion.version != "v2" and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert manager.champion.version == "v2"
+
+    def test_mock_scoring_ignores_registry(self, registry: ModelRegistry, monkeypatch):
+        """With USE_MOCK_SCORING the mock model is used and reloads are refused."""
+        monkeypatch.setattr(settings, "USE_MOCK_SCORING", True)
+        manager = ModelManager(registry)
+        assert manager.champion.version == "mock-v1"
+        with pytest.raises(RuntimeError):
+            manager.reload("v2")
+
+
+class TestModelVersionOnAlerts:
+    """Test suite for recording the scoring model on alerts."""
+
+    def test_alert_records_model_version(self, client: TestClient, db_session: Session, manager, registry):
+        """Alerts carry the version that produced ml_score, before and after a swap."""
+        registry.activate("v1")
+        transfer = {"step": 1, "type": "TRANSFER", "amount": 250_000.0, "nameOrig": "C1", "nameDest": "C2"}
+        client.post("/api/transactions", json=transfer)
+        alert = db_session.query(Alert).one()
+        assert alert.model_version == "v1"
+
+        manager.reload("v2")
+        client.post("/api/transactions", json={**transfer, "step": 2})
+        db_session.refresh(alert)
+        assert alert.model_version == "v2"  # Higher score from v2 replaced the parent's
+
+        detail = client.get(f"/api/alerts/{alert.id}").json()["data"]
+        assert detail["model_version"] == "v2"
+
+
+class TestModelAdminAPI:
+    """Test suite for /api/admin/models."""
+
+    @pytest.fixture(autouse=True)
+    def admin_key(self, monkeypatch):
+        monkeypatch.setattr(settings, "ADMIN_API_KEY", ADMIN_KEY)
+
+    def test_list_and_activate(self, client: TestClient, manager: ModelManager, registry: ModelRegistry):
+        """Activation answers 202 and the swap completes in the background."""
+        headers = {"X-Admin-Token": ADMIN_KEY}
+        registry.activate("v1")
+        manager.load_initial()
+
+        data = client.get("/api/admin/models", headers=headers).json()["data"]
+        assert data["active"] == "v1"
+        assert data["champion"]["version"] == "v1"
+        assert [v["version"] for v in data["versions"]] == ["v1", "v2"]
+
+        response = client.post("/api/admin/models/v2/activate", headers=headers)
+        assert response.status_code == 202
+        for thread in threading.enumerate():
+            if thread.name == "model-reload":
+                thread.join()
+        assert manager.champion.version == "v2"
+        assert registry.active() == "v2"
+
+    def test_activate_unknown(self, client: TestClient, manager: ModelManager):
+        """Unknown versions are 404."""
+        response = client.post("/api/admin/models/v9/activate", headers={"X-Admin-Token": ADMIN_KEY})
+        assert response.status_code == 404
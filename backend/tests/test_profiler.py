@@ -0,0 +1,106 @@
+"""Test cases for the sampling profiler and per-request cProfile capture."""
+
+import threading
+import time
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.config import settings
+from app.utils.profiler import ProfilingMiddleware, SamplingProfiler
+
+ADMIN_KEY = "test-admin-key"
+
+
+def _busy_loop(stop: threading.Event) -> None:
+    while not stop.is_set():
+        sum(range(1000))
+
+
+@pytest.fixture
+def admin_key(monkeypatch):
+    monkeypatch.setattr(settings, "ADMIN_API_KEY", ADMIN_KEY)
+    return {"X-Admin-Token": ADMIN_KEY}
+
+
+class TestSamplingProfiler:
+    """Test suite for SamplingProfiler."""
+
+    def test_collapsed_stacks_include_hot_function(self):
+        """A busy thread shows up in the collapsed stacks."""
+        stop = threading.Event()
+        worker = threading.Thread(target=_busy_loop, args=(stop,), name="busy")
+        worker.start()
+        try:
+            profiler = SamplingProfiler(interval=0.001).run(0.2)
+        finally:
+            stop.set()
+            worker.join()
+
+        assert profiler.samples > 10
+        lines = profiler.collapsed().splitlines()
+        busy = [line for line in lines if line.startswith("thread:busy;") and "_busy_loop" in line]
+        assert busy
+        assert all(line.rsplit(" ", 1)[1].isdigit() for line in lines)
+        assert any("_busy_loop" in fn for fn, _, _ in profiler.top_functions())
+
+    def test_one_profile_at_a_time(self):
+        """A second concurrent profile is refused."""
+        first = threading.Thread(target=SamplingProfiler().run, args=(0.3,))
+        first.start()
+        time.sleep(0.05)
+        try:
+            with pytest.raises(RuntimeError):
+                SamplingProfiler().run(0.01)
+        finally:
+            first.join()
+
+
+class TestAdminProfilingEndpoints:
+    """Test suite for /api/admin profiling endpoints."""
+
+    def test_requires_admin_token(self, client: TestClient, admin_key):
+        """Admin endpoints reject missing or wrong tokens."""
+        assert client.get("/api/admin/profile?seconds=0.1").status_code == 403
+        assert client.get("/api/admin/profile?seconds=0.1", headers={"X-Admin-Token": "nope"}).status_code == 403
+
+    def test_disabled_without_key(self, client: TestClient):
+        """With ADMIN_API_KEY unset every token is refused."""
+        assert client.get("/api/admin/profiles", headers={"X-Admin-Token": ""}).status_code == 403
+
+    def test_sample_profile(self, client: TestClient, admin_key):
+        """Collapsed output is a downloadable text file; json lists hot functions."""
+        response = client.get("/api/admin/profile?seconds=0.1", headers=admin_key)
+        assert response.status_code == 200
+        assert "profile.collapsed" in response.headers["content-disposition"]
+
+        response = client.get("/api/admin/profile?seconds=0.1&format=json", headers=admin_key)
+        assert response.json()["data"]["samples"] > 0
+
+    def test_request_cprofile_capture(self, client: TestClient, admin_key):
+        """X-Profile captures the request and returns its profile id."""
+        response = client.get("/health", headers={**admin_key, "X-Profile": "1"})
+        profile_id = response.headers["x-profile-id"]
+
+        text = client.get(f"/api/admin/profiles/{profile_id}", headers=admin_key)
+        assert "function calls" in text.text
+
+        binary = client.get(f"/api/admin/profiles/{profile_id}?format=pstats", headers=admin_key)
+        assert binary.headers["content-type"] == "application/octet-stream"
+
+        listed = client.get("/api/admin/profiles", headers=admin_key).json()["data"]
+        assert listed[0]["id"] == profile_id
+
+    def test_one_request_capture_at_a_time(self, client: TestClient, admin_key):
+        """A profiled request while another capture runs is refused with 409."""
+        with ProfilingMiddleware._lock:
+            response = client.get("/health", headers={**admin_key, "X-Profile": "1"})
+        assert response.status_code == 409
+        assert "x-profile-id" not in response.headers
+
+        assert client.get("/health", headers={**admin_key, "X-Profile": "1"}).headers["x-profile-id"]
+
+    def test_profile_header_ignored_without_token(self, client: TestClient, admin_key):
+        """Non-admins cannot trigger profiling."""
+        response = client.get("/health", headers={"X-Profile": "1"})
+        assert "x-profile-id" not in response.headers
@@ -0,0 +1,73 @@
+"""Test cases for the slow-query log and N+1 detector."""
+
+import logging
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import Session
+
+from app.models.alert import Alert
+from app.utils.query_diagnostics import (
+    NPlusOneError,
+    QueryDiagnostics,
+    TooManyQueriesError,
+    statement_shape,
+    track_queries,
+)
+
+
+class TestStatementShape:
+    """Test suite for statement normalization."""
+
+    def test_literals_and_in_lists_collapse(self):
+        """Statements differing only in values share a shape."""
+        a = statement_shape("SELECT * FROM alerts WHERE id IN (?, ?, ?) AND score > 0.5")
+        b = statement_shape("SELECT *  FROM alerts WHERE id IN (?) AND score > 0.9")
+        assert a == b
+        assert statement_shape("SELECT 'x'") == "SELECT ?"
+
+
+class TestNPlusOneDetection:
+    """Test suite for per-request repeated statement detection."""
+
+    def test_lazy_loads_raise(self, db_session: Session, multiple_alerts):
+        """Lazy-loading Alert.transaction in a loop is reported as N+1."""
+        db_session.expire_all()
+
+        with pytest.raises(NPlusOneError, match="repeated 10 times"):
+            with track_queries("test"):
+                for alert in db_session.query(Alert).all():
+                    alert.transaction.amount
+
+    def test_eager_loading_is_clean(self, client: TestClient, multiple_alerts, max_queries):
+        """The alert list eager-loads transactions within a small query budget."""
+        with max_queries(3):
+            response = client.get("/api/alerts?page_size=10")
+        assert response.status_code == 200
+        assert len(response.json()["data"]["items"]) == 10
+
+    def test_query_budget_exceeded(self, db_session: Session, multiple_alerts, max_queries):
+        """max_queries fails with the offending statement shapes listed."""
+        db_session.expire_all()
+        with pytest.raises(TooManyQueriesError, match="queries issued"):
+            with max_queries(2):
+                for alert in db_session.query(Alert).limit(5).all():
+                    alert.transaction.amount
+
+
+class TestSlowQueryLog:
+    """Test suite for slow statement logging."""
+
+    def test_slow_select_logged_with_plan(self, caplog):
+        """Statements over the threshold are logged with their EXPLAIN plan."""
+        engine = create_engine("sqlite://")
+        QueryDiagnostics(slow_query_ms=0).install(engine)
+        with engine.connect() as conn:
+            conn.execute(text("CREATE TABLE t (id INTEGER PRIMARY KEY, v INTEGER)"))
+            with caplog.at_level(logging.WARNING, logger="app.sql"):
+                conn.execute(text("SELECT * FROM t WHERE v = :v"), {"v": 1})
+
+        records = [r for r in caplog.records if r.getMessage().startswith("Slow query")]
+        assert records
+        assert "SCAN" in records[-1].plan
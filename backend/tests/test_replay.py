@@ -0,0 +1,128 @@
+"""Test cases for transaction ingestion and the replay load generator."""
+
+import asyncio
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+
+from app.models.transaction import Transaction, TransactionType
+from app.utils.histogram import LatencyHistogram
+from scripts.replay_transactions import batched, replay, schedule
+
+
+def _rows(steps):
+    return [
+        {"step": step, "type": "PAYMENT", "amount": 10.0, "nameOrig": f"C{i}", "nameDest": "M1"}
+        for i, step in enumerate(steps)
+    ]
+
+
+class TestLatencyHistogram:
+    """Test suite for LatencyHistogram."""
+
+    def test_percentiles_within_precision(self):
+        """Percentiles are accurate to the bucket precision."""
+        hist = LatencyHistogram()
+        hist.record_many(i / 1000 for i in range(1, 1001))  # 1ms..1000ms
+
+        assert hist.count == 1000
+        assert hist.percentile(50) == pytest.approx(0.5, rel=0.02)
+        assert hist.percentile(99) == pytest.approx(0.99, rel=0.02)
+        assert hist.percentile(100) == pytest.approx(1.0)
+
+    def test_empty_and_merge(self):
+        """Empty histograms report zeros; merges add counts."""
+        a, b = LatencyHistogram(), LatencyHistogram()
+        assert a.percentile(99) == 0.0
+        a.record(0.01)
+        b.record(0.02)
+        a.merge(b)
+        assert a.count == 2
+        assert a.max == 0.02
+
+
+class TestReplaySchedule:
+    """Test suite for deterministic time compression."""
+
+    def test_rows_spread_within_step(self):
+        """Rows in a step are evenly spaced across the compressed step."""
+        offsets = [offset for offset, _ in schedule(_rows([1, 1, 2, 4]), speedup=3600)]
+        assert offsets == [0.0, 0.5, 1.0, 3.0]
+
+    def test_schedule_is_reproducible(self):
+        """The same input and speedup always give the same schedule."""
+        rows = _rows([1, 1, 1, 2, 2, 3])
+        assert list(schedule(rows, speedup=60)) == list(schedule(rows, speedup=60))
+
+    def test_as_fast_as_possible(self):
+        """speedup=0 sends everything immediately."""
+        assert {offset for offset, _ in schedule(_rows([1, 5, 9]), speedup=0)} == {0.0}
+
+    def test_unordered_steps_rejected(self):
+        """Input must be ordered by step."""
+        with pytest.raises(ValueError):
+            list(schedule(_rows([2, 1]), speedup=1))
+
+    def test_batches_use_first_row_offset(self):
+        """Micro-batches go out at their first row's offset."""
+        batches = list(batched(schedule(_rows([1, 1, 1]), speedup=3600), batch_size=2))
+        assert [(offset, len(rows)) for offset, rows in batches] == [(0.0, 2), (pytest.approx(2 / 3), 1)]
+
+
+class TestReplay:
+    """Test suite for the async replay driver."""
+
+    def test_reports_throughput_errors_and_latency(self):
+        """Failures are counted by type and latency percentiles are reported."""
+        calls = []
+
+        async def send(batch):
+            calls.append(len(batch))
+            if len(calls) % 4 == 0:
+                raise ConnectionError("boom")
+            await asyncio.sleep(0.001)
+
+        batches = batched(schedule(_rows([1] * 20), speedup=0), batch_size=2)
+        report = asyncio.run(replay(batches, send, concurrency=4))
+
+        assert report["requests"] == 10
+        assert report["rows"] == 20
+        assert report["errors"] == {"ConnectionError": 2}
+        assert report["error_rate"] == 0.2
+        assert report["rows_ok"] == 16
+        assert report["latency"]["count"] == 10
+        assert report["latency"]["p999_ms"] >= report["latency"]["p50_ms"]
+
+
+class TestTransactionIngestion:
+    """Test suite for POST /api/transactions."""
+
+    def test_ingest_single(self, client: TestClient, db_session: Session):
+        """A workplan-shaped payload is stored with interned ids."""
+        response = client.post("/api/transactions", json={
+            "eventId": "e1",
+            "step": 370,
+            "type": "CASH-OUT",
+            "amount": 250000.0,
+            "nameOrig": "C1234567890",
+            "nameDest": "C9876543210",
+            "timestamp": "2026-02-10T15:45:00Z",
+        })
+        assert response.status_code == 201
+        assert response.json()["data"]["ingested"] == 1
+
+        tx = db_session.query(Transaction).one()
+        assert tx.type == TransactionType.CASH_OUT
+        assert tx.orig_id is not None and tx.dest_id is not None
+
+    def test_ingest_batch(self, client: TestClient, db_session: Session):
+        """Micro-batches are stored in one request."""
+        response = client.post("/api/transactions/batch", json={"transactions": _rows([1, 1, 2])})
+        assert response.status_code == 201
+        assert db_session.query(Transaction).count() == 3
+
+    def test_ingest_validation(self, client: TestClient):
+        """Invalid types and negative amounts are rejected."""
+        bad = {"step": 1, "type": "WIRE", "amount": -1, "nameOrig": "C1", "nameDest": "C2"}
+        assert client.post("/api/transactions", json=bad).status_code == 422
@@ -0,0 +1,200 @@
+"""Test cases for full-text search over alert notes and account names."""
+
+from datetime import datetime, timedelta
+
+from fastapi.testclient import TestClient
+from sqlalchemy import text, update
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.models.alert import Alert, AlertStatus
+from app.services.alert_archive import archive_closed_alerts, restore_alerts
+from app.services.entity_dictionary import get_entity_dictionary
+from app.services.search import SearchService
+
+ADMIN_KEY = "test-admin-key"
+
+NOTES = [
+    "Customer structured deposits below the reporting threshold",
+    "Possible mule account; funds cashed out within the hour",
+    "Structuring pattern confirmed, escalated to compliance",
+    "False positive: payroll transfer",
+]
+
+
+def _add_notes(db: Session, alerts) -> None:
+    for alert, notes in zip(alerts, NOTES):
+        alert.notes = notes
+    db.commit()
+
+
+def _search(client: TestClient, path: str, **params) -> dict:
+    response = client.get(f"/api/search/{path}", params=params)
+    assert response.status_code == 200
+    return response.json()["data"]
+
+
+class TestAlertNoteSearch:
+    """Test suite for GET /api/search/alerts."""
+
+    def test_ranked_matches_with_snippets(self, client: TestClient, db_session: Session, multiple_alerts):
+        """Stemmed words match, best match first, with the terms marked in the snippet."""
+        _add_notes(db_session, multiple_alerts)
+
+        data = _search(client, "alerts", q="structuring")
+        assert data["total"] == 2
+        ids = {item["alert"]["id"] for item in data["items"]}
+        assert ids == {str(multiple_alerts[0].id), str(multiple_alerts[2].id)}
+        assert data["items"][0]["score"] >= data["items"][1]["score"]
+        assert all("[structur" in item["snippet"].lower() for item in data["items"])
+
+    def test_all_words_and_prefix(self, client: TestClient, db_session: Session, multiple_alerts):
+        """Every word must match and the last one matches as a prefix."""
+        _add_notes(db_session, multiple_alerts)
+
+        assert _search(client, "alerts", q="mule cash")["total"] == 1
+        assert _search(client, "alerts", q="mule payroll")["total"] == 0
+        assert _search(client, "alerts", q='"; ;')["total"] == 0  # No words: nothing to match
+
+    def test_index_follows_writes(self, client: TestClient, db_session: Session, sample_alert: Alert):
+        """Edited notes are reindexed in the same transaction."""
+        client.patch(f"/api/alerts/{sample_alert.id}", json={"notes": "Velocity burst from new device"})
+        assert _search(client, "alerts", q="device")["total"] == 1
+
+        client.patch(f"/api/alerts/{sample_alert.id}", json={"notes": "Reviewed, account takeover"})
+        assert _search(client, "alerts", q="device")["total"] == 0
+        assert _search(client, "alerts", q="takeover")["items"][0]["alert"]["id"] == str(sample_alert.id)
+
+    def test_archived_alerts_leave_index(self, db_session: Session, sample_alert: Alert):
+        """Archiving removes an alert from the index; restoring puts it back."""
+        alert_id = sample_alert.id
+        sample_alert.notes = "Dormant account reactivated"
+        db_session.commit()
+        db_session.execute(
+            update(Alert).values(status=AlertStatus.CLOSED, updated_at=datetime.utcnow() - timedelta(days=100))
+        )
+        db_session.commit()
+
+        assert archive_closed_alerts(db_session, datetime.utcnow() - timedelta(days=90)) == 1
+        assert SearchService.search_alert_notes(db_session, "dormant")[1] == 0
+
+        restore_alerts(db_session, [alert_id])
+        db_session.commit()
+        hits, total, _ = SearchService.search_alert_notes(db_session, "dormant")
+        assert total == 1 and hits[0][0].id == alert_id
+
+    def test_pagination_and_cap(self, db_session: Session, multiple_alerts):
+        """Pages split the ranked matches; totals stop at max_matches."""
+        for alert in multiple_alerts:
+            alert.notes = "Reviewed by analyst"
+        db_session.commit()
+
+        first, total, truncated = SearchService.search_alert_notes(db_session, "analyst", page_size=4)
+        second, _, _ = SearchService.search_alert_notes(db_session, "analyst", page=2, page_size=4)
+        assert (total, truncated) == (10, False)
+        assert len(first) == len(second) == 4
+        assert not {hit[0].id for hit in first} & {hit[0].id for hit in second}
+
+        assert SearchService.search_alert_notes(db_session, "analyst", max_matches=5)[1:] == (5, True)
+
+    def test_query_budget(self, client: TestClient, db_session: Session, multiple_alerts, max_queries):
+        """Count, ranked page and alert load: three queries whatever the page size."""
+        _add_notes(db_session, multiple_alerts)
+        with max_queries(3):
+            _search(client, "alerts", q="account")
+
+
+class TestAccountSearch:
+    """Test suite for GET /api/search/accounts."""
+
+    def _ingest(self, client: TestClient) -> None:
+        for step, (orig, dest) in enumerate([
+            ("C1231006815", "M1979787155"),
+            ("C1231006815", "C2310000000"),
+            ("C12310", "C9990001231"),
+            ("C5550000000", "M1231006815"),
+        ], start=1):
+            client.post("/api/transactions", json={
+                "step": step, "type": "TRANSFER", "amount": 1000.0, "nameOrig": orig, "nameDest": dest,
+            })
+
+    def test_substring_ranking(self, client: TestClient, db_session: Session):
+        """Exact, then prefix, then substring matches; each by name."""
+        self._ingest(client)
+
+        data = _search(client, "accounts", q="C12310")
+        assert [(item["name"], item["match"]) for item in data["items"]] == [
+            ("C12310", "exact"),
+            ("C1231006815", "prefix"),
+        ]
+
+        names = [item["name"] for item in _search(client, "accounts", q="231")["items"]]
+        assert names == ["C12310", "C1231006815", "C2310000000", "C9990001231", "M1231006815"]
+
+    def test_case_insensitive_with_profile_counts(self, client: TestClient, db_session: Session):
+        """Lower-case queries match and each account carries its profile counts."""
+        self._ingest(client)
+
+        data = _search(client, "accounts", q="m1979")
+        assert data["total"] == 1
+        match = data["items"][0]
+        assert match["name"] == "M1979787155"
+        assert match["is_merchant"] is True
+        assert match["total_transactions"] == 1
+
+    def test_short_queries_match_prefixes(self, client: TestClient, db_session: Session):
+        """Below three characters only name prefixes match, in either case."""
+        self._ingest(client)
+
+        assert {item["name"] for item in _search(client, "accounts", q="M1")["items"]} == {
+            "M1979787155", "M1231006815",
+        }
+        assert {item["name"] for item in _search(client, "accounts", q="m1")["items"]} == {
+            "M1979787155", "M1231006815",
+        }
+        assert _search(client, "accounts", q="99")["total"] == 0
+
+    def test_pagination_and_cap(self, db_session: Session):
+        """Pages cover the ranked matches; totals stop at max_matches."""
+        get_entity_dictionary().intern_many(db_session, [f"C7{i:09d}" for i in range(30)])
+        db_session.commit()
+
+        first, total, truncated = SearchService.search_accounts(db_session, "C7", page_size=20)
+        second, _, _ = SearchService.search_accounts(db_session, "C7", page=2, page_size=20)
+        assert (total, truncated) == (30, False)
+        assert len(first) == 20 and len(second) == 10
+        assert first[0].name == "C7000000000"
+
+        assert SearchService.search_accounts(db_session, "000", max_matches=10)[1:] == (10, True)
+
+
+class TestSearchIndexMaintenance:
+    """Test suite for rebuilding the search indexes."""
+
+    def test_rebuild(self, client: TestClient, db_session: Session, sample_alert: Alert, monkeypatch):
+        """POST /api/admin/search/rebuild repopulates a damaged index."""
+        monkeypatch.setattr(settings, "ADMIN_API_KEY", ADMIN_KEY)
+        sample_alert.notes = "Smurfing across agents"
+        db_session.commit()
+        db_session.execute(text("INSERT INTO alert_notes_fts(alert_notes_fts) VALUES ('delete-all')"))
+        db_session.commit()
+        assert _search(client, "alerts", q="smurfing")["total"] == 0
+
+        response = client.post("/api/admin/search/rebuild", headers={"X-Admin-Token": ADMIN_KEY})
+        assert response.json()["data"]["rebuilt"] is True
+        assert _search(client, "alerts", q="smurfing")["total"] == 1
+
+    def test_survives_vacuum(self, client: TestClient, db_session: Session, multiple_alerts):
+        """VACUUM compacting the alerts table leaves notes pointing at their own alerts."""
+        _add_notes(db_session, multiple_alerts)
+        for alert in multiple_alerts[:2]:
+            db_session.delete(alert)
+        db_session.commit()
+        db_session.connection().exec_driver_sql("VACUUM")
+
+        data = _search(client, "alerts", q="payroll")
+        assert [item["alert"]["id"] for item in data["items"]] == [str(multiple_alerts[3].id)]
+
+        multiple_alerts[2].notes = "Payroll batch reviewed"
+        db_session.commit()
+        assert _search(client, "alerts", q="payroll")["total"] == 2
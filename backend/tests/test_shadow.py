@@ -0,0 +1,164 @@
+"""Test cases for champion/challenger shadow scoring."""
+
+import threading
+import time
+import uuid
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+
+from app.api import admin
+from app.config import settings
+from app.models.alert import AlertPriority, RiskBand
+from app.models.shadow_score import ShadowScore
+from app.services import transaction_service
+from app.services.scoring import MockModel, ModelScorer, alert_priority, risk_band
+from app.services.shadow import ShadowBatch, ShadowScorer
+from tests.conftest import TestSessionLocal
+
+ADMIN_KEY = "test-admin-key"
+
+
+class BlockingScorer(ModelScorer):
+    """Challenger that waits until released (a challenger falling behind)."""
+
+    def __init__(self):
+        super().__init__(MockModel("slow-v2"), "slow-v2")
+        self.started = threading.Event()
+        self.release = threading.Event()
+
+    def score(self, features):
+        self.started.set()
+        self.release.wait(5)
+        return super().score(features)
+
+
+def _transfer(step: int, sender: str, amount: float = 250_000.0, fraud: bool = False) -> dict:
+    return {
+        "step": step, "type": "TRANSFER", "amount": amount,
+        "nameOrig": sender, "nameDest": f"C9{step}", "isFraud": fraud,
+    }
+
+
+def _batch(n: int) -> ShadowBatch:
+    return ShadowBatch([uuid.uuid4() for _ in range(n)], [1] * n, [{}] * n, [0.1] * n)
+
+
+@pytest.fixture
+def shadow(monkeypatch, db_session: Session):
+    """A running shadow scorer with a mock challenger, used by ingestion."""
+    challenger = ModelScorer(MockModel("mock-v2", bias=-3.0), "mock-v2")
+    scorer = ShadowScorer(TestSessionLocal, queue_size=10, challenger=challenger)
+    monkeypatch.setattr(transaction_service, "get_shadow_scorer", lambda: scorer)
+    monkeypatch.setattr(admin, "get_shadow_scorer", lambda: scorer)
+    scorer.start()
+    yield scorer
+    scorer.stop()
+
+
+class TestShadowScorer:
+    """Test suite for the background challenger."""
+
+    def test_scores_written(self, client: TestClient, db_session: Session, shadow: ShadowScorer):
+        """Every ingested transaction gets a challenger score next to the champion's."""
+        response = client.post("/api/transactions/batch", json={
+            "transactions": [_transfer(1, f"C{i}") for i in range(20)]
+        })
+        data = response.json()["data"]
+        shadow.join()
+
+        rows = {row.transaction_id: row for row in db_session.query(ShadowScore).all()}
+        assert len(rows) == 20
+        for tx_id, score in zip(data["ids"], data["scores"]):
+            row = rows[uuid.UUID(tx_id)]
+            assert row.model_version == "mock-v2"
+            assert row.champion_score == score
+            assert row.challenger_score > row.champion_score  # Smaller bias
+        assert shadow.stats["scored"] == 1
+
+    def test_sheds_when_behind(self, db_session: Session):
+        """A full queue sheds new batches instead of blocking the caller."""
+        challenger = BlockingScorer()
+        scorer = ShadowScorer(TestSessionLocal, queue_size=1, challenger=challenger)
+        scorer.start()
+        try:
+            assert scorer.submit(_batch(3))
+            assert challenger.started.wait(5)
+            assert scorer.submit(_batch(3))  # Queued behind the blocked batch
+
+            started = time.perf_counter()
+            assert not scorer.submit(_batch(3))
+            assert time.perf_counter() - started < 0.1
+            assert scorer.stats["shed"] == 1
+            assert scorer.stats["shed_rows"] == 3
+        finally:
+            challenger.release.set()
+            scorer.stop()
+        assert db_session.query(ShadowScore).count() == 6
+
+    def test_champion_not_blocked(self, client: TestClient, monkeypatch, db_session: Session):
+        """Ingestion answers while the challenger is stuck; surplus batches are shed."""
+        challenger = BlockingScorer()
+        scorer = ShadowScorer(TestSessionLocal, queue_size=1, challenger=challenger)
+        monkeypatch.setattr(transaction_service, "get_shadow_scorer", lambda: scorer)
+        scorer.start()
+        try:
+            for step in range(1, 5):
+                response = client.post("/api/transactions", json=_transfer(step, "C1", 10.0))
+                assert response.status_code == 201
+            assert scorer.stats["shed"] >= 2
+        finally:
+            challenger.release.set()
+            scorer.stop()
+
+    def test_disabled_without_challenger(self):
+        """Nothing is queued until a challenger is loaded and the worker runs."""
+        scorer = ShadowScorer(TestSessionLocal)
+        assert not scorer.enabled
+        assert not scorer.submit(_batch(1))
+
+
+class TestShadowComparison:
+    """Test suite for GET /api/admin/shadow."""
+
+    def test_compare_models(self, client: TestClient, monkeypatch, shadow: ShadowScorer):
+        """Agreement, score difference and precision/recall per challenger version."""
+        monkeypatch.setattr(settings, "ADMIN_API_KEY", ADMIN_KEY)
+        client.post("/api/transactions/batch", json={"transactions": [
+            _transfer(1, "C1", 900_000.0, fraud=True),
+            _transfer(1, "C2", 10.0),
+            _transfer(1, "C3", 20.0),
+        ]})
+        shadow.join()
+
+        response = client.get(
+            "/api/admin/shadow", params={"threshold": 0.5}, headers={"X-Admin-Token": ADMIN_KEY}
+        )
+        assert response.status_code == 200
+        data = response.json()["data"]
+        assert data["shadow"]["enabled"]
+        assert data["champion_version"] == "mock-v1"
+
+        (model,) = data["models"]
+        assert model["model_version"] == "mock-v2"
+        assert (model["transactions"], model["fraud"]) == (3, 1)
+        assert 0 < model["mean_abs_diff"] < 1
+        assert 0 <= model["agreement"] <= 1
+        assert model["challenger"]["recall"] >= model["champion"]["recall"]
+
+    def test_requires_admin(self, client: TestClient):
+        """The comparison is admin-only."""
+        assert client.get("/api/admin/shadow").status_code == 403
+
+
+class TestScoring:
+    """Test suite for score → band/priority mapping."""
+
+    def test_bands_and_priority(self):
+        """Rule hits are at least HIGH and CRITICAL with a high score."""
+        assert risk_band(0.95) == RiskBand.CRITICAL
+        assert risk_band(0.1) == RiskBand.LOW
+        assert alert_priority(0.1, rules_triggered=True) == AlertPriority.HIGH
+        assert alert_priority(0.72, rules_triggered=True) == AlertPriority.CRITICAL
+        assert alert_priority(0.8, rules_triggered=False) == AlertPriority.HIGH
@@ -0,0 +1,195 @@
+"""Test cases for account sharding across workers."""
+
+import os
+import random
+import stat
+import subprocess
+import sys
+from collections import Counter
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+from app.cluster import prepare_shard_channel
+from app.config import settings
+from app.services import graph_index, sharding
+from app.services.feature_engine import FeatureEngine
+from app.services.graph_index import TransactionGraph
+from app.services.sharding import (
+    ShardRouter,
+    ShardSetupError,
+    ShardUnavailableError,
+    ensure_private_dir,
+    shard_of,
+)
+
+AUTHKEY = b"test-cluster-key"
+
+TYPES = ["PAYMENT", "TRANSFER", "CASH_OUT", "CASH_IN", "DEBIT"]
+
+
+def _rows(n: int = 400, senders: int = 40, seed: int = 7):
+    rng = random.Random(seed)
+    return [
+        (
+            1 + i // 20,
+            rng.choice(TYPES),
+            round(rng.uniform(1, 300_000), 2),
+            f"C{rng.randrange(senders)}",
+            f"M{rng.randrange(senders)}",
+        )
+        for i in range(n)
+    ]
+
+
+@pytest.fixture
+def cluster(tmp_path):
+    """Three in-process shard routers talking over Unix sockets."""
+    routers = [ShardRouter(index=i, count=3, socket_dir=str(tmp_path), authkey=AUTHKEY) for i in range(3)]
+    for router in routers:
+        router.serve()
+    yield routers
+    for router in routers:
+        router.close()
+
+
+class TestShardOf:
+    """Test suite for the account → shard mapping."""
+
+    def test_stable_across_processes(self):
+        """The same account maps to the same shard in a fresh interpreter."""
+        code = "from app.services.sharding import shard_of; print(shard_of('C1231006815', 8))"
+        output = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        ).stdout
+        assert int(output) == shard_of("C1231006815", 8)
+
+    def test_spreads_accounts(self):
+        """Accounts spread roughly evenly across shards."""
+        counts = Counter(shard_of(f"C{i}", 4) for i in range(10_000))
+        assert set(counts) == {0, 1, 2, 3}
+        assert min(counts.values()) > 2_000
+
+    def test_single_shard(self):
+        """One worker owns everything."""
+        assert shard_of("C1", 1) == 0
+
+
+class TestShardRouter:
+    """Test suite for ShardRouter."""
+
+    def test_matches_single_process(self, cluster):
+        """Features computed across shards equal one engine seeing everything."""
+        rows = _rows()
+        reference = FeatureEngine()
+        expected = [reference.compute(*row) for row in rows]
+
+        # Alternate the entry worker per batch, like a load balancer would
+        results = []
+        for start in range(0, len(rows), 50):
+            router, batch = cluster[start // 50 % 3], rows[start:start + 50]
+            results.extend(router.compute_many(batch, "batch"))
+            router.record_many(batch, "batch")
+
+        assert results == expected
+
+    def test_state_lives_on_owner(self, cluster):
+        """Each worker only holds history for the senders it owns."""
+        rows = _rows()
+        cluster[0].compute_many(rows, "batch")
+        cluster[0].record_many(rows, "batch")
+        for router in cluster:
+            assert len(router.engine) > 0
+            assert all(router.owns(name) for name in router.engine._history)
+
+    def test_discard_leaves_windows_untouched(self, cluster):
+        """A batch that is never stored leaves no state on any worker, so a retry sees the same windows."""
+        rows = _rows(100)
+        first = cluster[0].compute_many(rows, "failed")
+        cluster[0].discard("failed")
+
+        assert all(len(router.engine) == 0 and not router.engine._staging for router in cluster)
+        assert cluster[0].compute_many(rows, "retry") == first
+
+    def test_alerts_published_on_peers(self, cluster, monkeypatch):
+        """Committed alert events reach the broker of every other worker."""
+        published = []
+        monkeypatch.setattr(sharding, "get_alert_broker", lambda: SimpleNamespace(publish=published.append))
+        cluster[0].publish_alerts([{"event": "alert.created", "id": "a1"}])
+
+        assert published == [{"event": "alert.created", "id": "a1"}] * 2
+
+    def test_edges_published_on_peers(self, cluster, monkeypatch):
+        """Committed graph edges reach the graph of every other worker, if built."""
+        graph = TransactionGraph()
+        monkeypatch.setattr(graph_index, "_graph", graph)
+        cluster[0].publish_edges([(1, 2, 5, 10.0)])
+
+        assert graph.edge_count == 2  # Shards 1 and 2 share this process's graph
+        assert graph.neighbors(1) == {2}
+
+        monkeypatch.setattr(graph_index, "_graph", None)
+        cluster[0].publish_edges([(1, 2, 5, 10.0)])  # Not built: nothing to add
+
+    def test_misrouted_rows_rejected(self, cluster):
+        """A worker refuses rows for senders it does not own."""
+        foreign = next(f"C{i}" for i in range(100) if shard_of(f"C{i}", 3) == 2)
+        with pytest.raises(ShardUnavailableError, match="rejected"):
+            cluster[0]._call(1, "compute", None, [(1, "PAYMENT", 1.0, foreign, "M1")])
+
+    def test_unreachable_peer(self, tmp_path):
+        """A missing peer surfaces as ShardUnavailableError."""
+        router = ShardRouter(index=0, count=2, socket_dir=str(tmp_path), authkey=AUTHKEY)
+        foreign = next(f"C{i}" for i in range(100) if shard_of(f"C{i}", 2) == 1)
+        with pytest.raises(ShardUnavailableError, match="unavailable"):
+            router.compute_many([(1, "PAYMENT", 1.0, foreign, "M1")])
+
+    def test_wrong_authkey_rejected(self, cluster, tmp_path):
+        """A client without the cluster key is refused and the shard keeps serving."""
+        intruder = ShardRouter(index=0, count=3, socket_dir=str(tmp_path), authkey=b"guess")
+        with pytest.raises(ShardUnavailableError, match="unavailable"):
+            intruder._call(1, "publish", None, [])
+        assert cluster[0]._call(1, "publish", None, []) is None
+
+
+class TestShardChannelSetup:
+    """Test suite for the shard sockets' key and directory checks."""
+
+    def test_refuses_without_authkey(self, tmp_path):
+        """Serving pickled requests needs a cluster key."""
+        router = ShardRouter(index=0, count=2, socket_dir=str(tmp_path))
+        with pytest.raises(ShardSetupError, match="SHARD_AUTHKEY"):
+            router.serve()
+
+    def test_refuses_shared_directory(self, tmp_path):
+        """A socket directory other users can enter is not used."""
+        shared = tmp_path / "shards"
+        shared.mkdir(mode=0o777)
+        shared.chmod(0o777)
+        router = ShardRouter(index=0, count=2, socket_dir=str(shared), authkey=AUTHKEY)
+        with pytest.raises(ShardSetupError, match="accessible to other users"):
+            router.serve()
+        assert not list(shared.iterdir())
+
+    def test_creates_private_directory(self, tmp_path):
+        """A missing socket directory is created 0700."""
+        ensure_private_dir(str(tmp_path / "shards"))
+        assert stat.S_IMODE((tmp_path / "shards").stat().st_mode) == 0o700
+
+    def test_cluster_generates_key_and_directory(self, tmp_path, monkeypatch):
+        """The supervisor makes a fresh key and private directory and exports both."""
+        monkeypatch.setattr(settings, "SHARD_SOCKET_DIR", "")
+        monkeypatch.setattr(settings, "SHARD_AUTHKEY", "")
+        monkeypatch.setenv("XDG_RUNTIME_DIR", str(tmp_path))
+        monkeypatch.setenv("SHARD_SOCKET_DIR", "")
+        monkeypatch.setenv("SHARD_AUTHKEY", "")
+
+        assert prepare_shard_channel() is True
+        socket_dir = Path(settings.SHARD_SOCKET_DIR)
+        assert socket_dir.parent == tmp_path
+        assert stat.S_IMODE(socket_dir.stat().st_mode) == 0o700
+        assert len(settings.SHARD_AUTHKEY) == 64
+        assert (os.environ["SHARD_SOCKET_DIR"], os.environ["SHARD_AUTHKEY"]) == (
+            settings.SHARD_SOCKET_DIR, settings.SHARD_AUTHKEY,
+        )
@@ -0,0 +1,85 @@
+"""Test cases for startup cost, warm-up and readiness."""
+
+import asyncio
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.services.warmup import Warmup
+
+BACKEND_DIR = Path(__file__).parent.parent
+
+# Cumulative import time allowed for app.main (override for slow CI machines)
+IMPORT_TIME_BUDGET_MS = float(os.environ.get("IMPORT_TIME_BUDGET_MS", 3000))
+
+# Must load lazily or in warm-up, never at import
+HEAVY_MODULES = {"pandas", "numpy", "pyarrow", "sklearn", "xgboost", "lightgbm", "shap", "joblib"}
+
+
+@pytest.fixture(scope="module")
+def import_times():
+    """Module → cumulative import time (µs) from ``python -X importtime``."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import app.main"],
+        cwd=BACKEND_DIR,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "imported package" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        times[name.strip()] = int(cumulative)
+    return times
+
+
+class TestImportTime:
+    """Test suite for the import-time budget."""
+
+    def test_app_import_within_budget(self, import_times):
+        """Importing app.main stays under the budget."""
+        assert import_times["app.main"] / 1000 < IMPORT_TIME_BUDGET_MS
+
+    def test_heavy_modules_load_lazily(self, import_times):
+        """The data/scoring stack is not imported by app.main."""
+        loaded = {name.split(".")[0] for name in import_times}
+        assert not loaded & HEAVY_MODULES
+
+
+class TestReadiness:
+    """Test suite for liveness and readiness probes."""
+
+    def test_live_and_ready(self, client: TestClient):
+        """Liveness answers immediately; readiness once warm-up is done."""
+        assert client.get("/health/live").json() == {"status": "alive"}
+
+        deadline = time.monotonic() + 5
+        response = client.get("/health/ready")
+        while response.status_code != 200 and time.monotonic() < deadline:
+            time.sleep(0.02)
+            response = client.get("/health/ready")
+
+        assert response.status_code == 200
+        assert response.json()["tasks"]["database"]["state"] == "ready"
+        assert client.get("/health").json()["ready"] is True
+
+    def test_required_failure_blocks_readiness(self):
+        """A failed required task keeps the app unready; optional ones do not."""
+        warmup = Warmup()
+        warmup.register("optional", lambda: 1 / 0, required=False)
+        warmup.register("model", lambda: None)
+        asyncio.run(warmup.run())
+        assert warmup.ready
+        assert warmup.status()["optional"]["state"] == "failed"
+
+        warmup.register("explainer", lambda: 1 / 0)
+        asyncio.run(warmup.run())
+        assert not warmup.ready
+        assert "ZeroDivisionError" in warmup.status()["explainer"]["error"]
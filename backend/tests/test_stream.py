@@ -0,0 +1,152 @@
+"""Test cases for the real-time alert stream."""
+
+import asyncio
+
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+
+from app.models.alert import Alert, AlertPriority, AlertStatus, RiskBand
+from app.models.transaction import Transaction
+from app.schemas.alert import AlertFilter
+from app.services.alert_broker import AlertBroker, get_alert_broker, matches
+from app.api.stream import sse_events
+
+
+def _payload(**overrides) -> dict:
+    payload = {
+        "event": "alert.created",
+        "id": "a1",
+        "transaction_id": "t1",
+        "status": "new",
+        "priority": "critical",
+        "ml_score": 0.92,
+        "ml_risk_band": "critical",
+        "assigned_to": None,
+        "rules_count": 1,
+        "created_at": None,
+    }
+    payload.update(overrides)
+    return payload
+
+
+class TestAlertBroker:
+    """Test suite for AlertBroker."""
+
+    def test_filters_mirror_alert_filter(self):
+        """Priority, risk band, assignee and score filters are applied."""
+        assert matches(None, _payload())
+        assert matches(AlertFilter(priority=[AlertPriority.CRITICAL]), _payload())
+        assert not matches(AlertFilter(priority=[AlertPriority.LOW]), _payload())
+        assert not matches(AlertFilter(risk_band=[RiskBand.HIGH]), _payload())
+        assert not matches(AlertFilter(assigned_to="Alice Johnson"), _payload())
+        assert not matches(AlertFilter(min_score=0.95), _payload())
+
+    def test_fan_out_to_matching_subscribers(self):
+        """Each subscriber only receives events that match its filters."""
+
+        async def scenario():
+            broker = AlertBroker(buffer_size=10)
+            critical = broker.subscribe(AlertFilter(priority=[AlertPriority.CRITICAL]))
+            low = broker.subscribe(AlertFilter(priority=[AlertPriority.LOW]))
+
+            assert broker.publish(_payload()) == 1
+            received = await critical.get(timeout=1)
+            missed = await low.get(timeout=0.01)
+            return received, missed
+
+        received, missed = asyncio.run(scenario())
+        assert received["id"] == "a1"
+        assert missed is None
+
+    def test_slow_consumer_drops_oldest(self):
+        """A full buffer drops the oldest events and reports how many."""
+
+        async def scenario():
+            broker = AlertBroker(buffer_size=2)
+            subscription = broker.subscribe()
+            for i in range(5):
+                broker.publish(_payload(id=f"a{i}"))
+            await asyncio.sleep(0)
+            first = await subscription.get(timeout=1)
+            second = await subscription.get(timeout=1)
+            return subscription, first, second
+
+        subscription, first, second = asyncio.run(scenario())
+        assert subscription.dropped == 3
+        assert (first["id"], first["dropped"]) == ("a3", 3)
+        assert second["id"] == "a4" and "dropped" not in second
+
+    def test_subscriber_limit(self):
+        """Subscriptions beyond the limit are refused."""
+
+        async def scenario():
+            broker = AlertBroker(max_subscribers=1)
+            broker.subscribe()
+            broker.subscribe()
+
+        try:
+            asyncio.run(scenario())
+        except RuntimeError as e:
+            assert "Too many" in str(e)
+        else:
+            raise AssertionError("Expected RuntimeError")
+
+    def test_sse_encoding(self):
+        """SSE frames carry event name, id and JSON data; idle time yields heartbeats."""
+
+        async def scenario():
+            broker = AlertBroker()
+            subscription = broker.subscribe()
+            stream = sse_events(subscription, heartbeat_seconds=0.01)
+            frames = [await stream.__anext__(), await stream.__anext__()]
+            broker.publish(_payload())
+            frames.append(await stream.__anext__())
+            return frames
+
+        retry, heartbeat, frame = asyncio.run(scenario())
+        assert retry.startswith("retry:")
+        assert heartbeat == ": keep-alive\n\n"
+        assert frame.startswith("event: alert.created\nid: a1\ndata: {")
+
+
+class TestAlertStreamEndpoints:
+    """Test suite for the alert stream endpoints."""
+
+    def test_websocket_receives_committed_alert(
+        self, client: TestClient, db_session: Session, sample_transaction: Transaction
+    ):
+        """Committing a new alert pushes it to WebSocket subscribers."""
+        with client.websocket_connect("/api/stream/alerts/ws?priority=critical") as websocket:
+            alert = Alert(
+                transaction_id=sample_transaction.id,
+                status=AlertStatus.NEW,
+                priority=AlertPriority.CRITICAL,
+                ml_score=0.95,
+                ml_risk_band=RiskBand.CRITICAL,
+                ml_reason_codes=[],
+                rules_triggered=[],
+            )
+            db_session.add(alert)
+            db_session.commit()
+
+            message = websocket.receive_json()
+
+        assert message["event"] == "alert.created"
+        assert message["id"] == str(alert.id)
+        assert message["priority"] == "critical"
+
+    def test_rolled_back_alert_is_not_published(self, db_session: Session, sample_transaction: Transaction):
+        """Alerts from rolled-back transactions are never pushed."""
+        broker = get_alert_broker()
+        published = broker.published
+        db_session.add(Alert(
+            transaction_id=sample_transaction.id,
+            ml_score=0.5,
+            ml_risk_band=RiskBand.MEDIUM,
+            ml_reason_codes=[],
+            rules_triggered=[],
+        ))
+        db_session.flush()
+        db_session.rollback()
+
+        assert broker.published == published
@@ -0,0 +1,72 @@
+"""Test cases for the array-backed transaction store."""
+
+import numpy as np
+import pytest
+
+from app.utils.transaction_store import TRANSACTION_DTYPE, TYPE_CODES, TransactionStore
+
+
+@pytest.fixture
+def store() -> TransactionStore:
+    """Build a small store with one busy sender."""
+    return TransactionStore.from_arrays(
+        step=[3, 1, 1, 2, 5],
+        type=["TRANSFER", "PAYMENT", "CASH-OUT", "TRANSFER", "CASH_OUT"],
+        amount=[250000.0, 9839.64, 181.0, 1000.0, 250000.0],
+        name_orig=["C1", "C1", "C2", "C1", "C3"],
+        name_dest=["C9", "M1", "C9", "C3", "C9"],
+        is_fraud=[True, False, False, False, True],
+    )
+
+
+class TestTransactionStore:
+    """Test suite for TransactionStore."""
+
+    def test_compact_row_layout(self, store: TransactionStore):
+        """Rows use the fixed-width structured dtype."""
+        assert store.records.dtype == TRANSACTION_DTYPE
+        assert TRANSACTION_DTYPE.itemsize <= 24
+        assert len(store) == 5
+
+    def test_rows_sorted_by_step(self, store: TransactionStore):
+        """Rows are kept in step order."""
+        assert store.records["step"].tolist() == [1, 1, 2, 3, 5]
+
+    def test_account_interning(self, store: TransactionStore):
+        """Account names map to dense ids and back."""
+        assert store.num_accounts == 5
+        for name in ("C1", "C2", "C3", "C9", "M1"):
+            assert store.account_name(store.account_id(name)) == name
+        assert store.account_id("C404") == -1
+
+    def test_type_codes(self, store: TransactionStore):
+        """Hyphenated and underscored type names share a code."""
+        cash_out = store.records["type"] == TYPE_CODES["CASH_OUT"]
+        assert cash_out.sum() == 2
+
+    def test_sent_by_uses_csr_index(self, store: TransactionStore):
+        """Per-account rows are returned in step order."""
+        rows = store.sent_by("C1")
+        assert store.records["step"][rows].tolist() == [1, 2, 3]
+        assert store.records["amount"][store.received_by("C9")].sum() == 500181.0
+        assert len(store.sent_by("C404")) == 0
+
+    def test_degrees(self, store: TransactionStore):
+        """Degree arrays match the per-account slices."""
+        c1 = store.account_id("C1")
+        c9 = store.account_id("C9")
+        assert store.out_degree()[c1] == 3
+        assert store.in_degree()[c9] == 3
+
+    def test_step_slice(self, store: TransactionStore):
+        """Step ranges resolve to contiguous row positions."""
+        rows = store.step_slice(2, 3)
+        assert store.records["step"][rows].tolist() == [2, 3]
+
+    def test_save_and_mmap_load(self, store: TransactionStore, tmp_path):
+        """Saved stores reload memory-mapped with identical lookups."""
+        store.save(tmp_path / "store")
+        loaded = TransactionStore.load(tmp_path / "store")
+
+        assert isinstance(loaded.records, np.memmap)
+        assert loaded.to_dict(int(loaded.sent_by("C3")[0])) == store.to_dict(int(store.sent_by("C3")[0]))